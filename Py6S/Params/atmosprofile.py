@@ -15,7 +15,10 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+
 import dateutil.parser
+import numpy as np
 
 from Py6S.sixs_exceptions import ParameterError
 
@@ -38,134 +41,48 @@ class AtmosProfile:
         and date.
 
         Based on the table provided at https://www.nv5geospatialsoftware.com/docs/FLAASH.html
+
+        To pick the profiles for many latitudes and dates at once, use :meth:`FromLatitudesAndDates`.
         """
-        dt = dateutil.parser.parse(date, dayfirst=True)
-
-        rounded_lat = round(latitude, -1)
-
-        # Data from Table 2-2 in https://www.nv5geospatialsoftware.com/docs/FLAASH.html
-        SAW = cls.PredefinedType(cls.SubarcticWinter)
-        SAS = cls.PredefinedType(cls.SubarcticSummer)
-        MLS = cls.PredefinedType(cls.MidlatitudeSummer)
-        MLW = cls.PredefinedType(cls.MidlatitudeWinter)
-        T = cls.PredefinedType(cls.Tropical)
-
-        ap_JFMA = {
-            80: SAW,
-            70: SAW,
-            60: MLW,
-            50: MLW,
-            40: SAS,
-            30: MLS,
-            20: T,
-            10: T,
-            0: T,
-            -10: T,
-            -20: T,
-            -30: MLS,
-            -40: SAS,
-            -50: SAS,
-            -60: MLW,
-            -70: MLW,
-            -80: MLW,
-        }
-
-        ap_MJ = {
-            80: SAW,
-            70: MLW,
-            60: MLW,
-            50: SAS,
-            40: SAS,
-            30: MLS,
-            20: T,
-            10: T,
-            0: T,
-            -10: T,
-            -20: T,
-            -30: MLS,
-            -40: SAS,
-            -50: SAS,
-            -60: MLW,
-            -70: MLW,
-            -80: MLW,
-        }
-
-        ap_JA = {
-            80: MLW,
-            70: MLW,
-            60: SAS,
-            50: SAS,
-            40: MLS,
-            30: T,
-            20: T,
-            10: T,
-            0: T,
-            -10: T,
-            -20: MLS,
-            -30: MLS,
-            -40: SAS,
-            -50: MLW,
-            -60: MLW,
-            -70: MLW,
-            -80: SAW,
-        }
-
-        ap_SO = {
-            80: MLW,
-            70: MLW,
-            60: SAS,
-            50: SAS,
-            40: MLS,
-            30: T,
-            20: T,
-            10: T,
-            0: T,
-            -10: T,
-            -20: MLS,
-            -30: MLS,
-            -40: SAS,
-            -50: MLW,
-            -60: MLW,
-            -70: MLW,
-            -80: MLW,
-        }
-
-        ap_ND = {
-            80: SAW,
-            70: SAW,
-            60: MLW,
-            50: SAS,
-            40: SAS,
-            30: MLS,
-            20: T,
-            10: T,
-            0: T,
-            -10: T,
-            -20: T,
-            -30: MLS,
-            -40: SAS,
-            -50: SAS,
-            -60: MLW,
-            -70: MLW,
-            -80: MLW,
-        }
-
-        ap_dict = {
-            1: ap_JFMA,
-            2: ap_JFMA,
-            3: ap_JFMA,
-            4: ap_JFMA,
-            5: ap_MJ,
-            6: ap_MJ,
-            7: ap_JA,
-            8: ap_JA,
-            9: ap_SO,
-            10: ap_SO,
-            11: ap_ND,
-            12: ap_ND,
-        }
-
-        return ap_dict[dt.month][rounded_lat]
+        return cls.PredefinedType(cls.FromLatitudesAndDates(latitude, date).item())
+
+    @classmethod
+    def FromLatitudesAndDates(cls, latitudes, dates):
+        """Automatically pick the atmospheric profiles for many latitudes and dates at once, in the same way as
+        :meth:`FromLatitudeAndDate`.
+
+        The profiles are looked up in a precomputed table of month and latitude band, so this is fast enough to
+        use for every pixel (or block of pixels) of a large image. Latitudes are rounded to the nearest 10 degrees,
+        and latitudes further than 80 degrees from the equator use the profiles for 80 degrees.
+
+        Arguments:
+
+        * ``latitudes`` -- An array of latitudes (-90 to 90 degrees)
+        * ``dates`` -- An array of dates, given as a numpy ``datetime64`` array, or as strings (in almost any format,
+          favouring DD/MM/YY when dates are ambiguous, as for :meth:`FromLatitudeAndDate`) or ``datetime`` objects.
+          Note that this means a string such as ``"2015-01-10"`` is read as the 1st of October, so ISO format dates
+          are best given as a ``datetime64`` array.
+
+        The arguments are broadcast against each other, so many latitudes can be given with a single date.
+
+        Return value:
+
+        An array of the atmospheric profile types (one of the constants defined in this class) for each latitude
+        and date. Each can be set as ``s.atmos_profile`` with :meth:`PredefinedType`.
+
+        Example usage::
+
+          types = AtmosProfile.FromLatitudesAndDates([53, 12, -71], "2015-07-14")
+          s.atmos_profile = AtmosProfile.PredefinedType(types[0])
+
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        if not ((latitudes >= -90) & (latitudes <= 90)).all():
+            raise ParameterError("latitude", "Latitudes must be between -90 and 90 degrees")
+
+        bands = np.clip((80 - np.round(latitudes, -1)) // 10, 0, len(_LATITUDE_BANDS) - 1)
+
+        return _PROFILES_BY_MONTH_AND_LATITUDE[_months(dates) - 1, bands.astype(np.intp)]
 
     @classmethod
     def PredefinedType(cls, type):
@@ -241,3 +158,58 @@ class AtmosProfile:
             )
 
         return "7 User's data base profile\n" + result
+
+
+# The atmospheric profiles for each month and latitude band, from Table 2-2 in
+# https://www.nv5geospatialsoftware.com/docs/FLAASH.html
+_LATITUDE_BANDS = np.arange(80, -90, -10)
+
+_SAW = AtmosProfile.SubarcticWinter
+_SAS = AtmosProfile.SubarcticSummer
+_MLS = AtmosProfile.MidlatitudeSummer
+_MLW = AtmosProfile.MidlatitudeWinter
+_T = AtmosProfile.Tropical
+
+# Each row gives the profiles for the latitude bands from 80 to -80
+_JFMA = [_SAW, _SAW, _MLW, _MLW, _SAS, _MLS, _T, _T, _T, _T, _T, _MLS, _SAS, _SAS, _MLW, _MLW, _MLW]
+_MJ = [_SAW, _MLW, _MLW, _SAS, _SAS, _MLS, _T, _T, _T, _T, _T, _MLS, _SAS, _SAS, _MLW, _MLW, _MLW]
+_JA = [_MLW, _MLW, _SAS, _SAS, _MLS, _T, _T, _T, _T, _T, _MLS, _MLS, _SAS, _MLW, _MLW, _MLW, _SAW]
+_SO = [_MLW, _MLW, _SAS, _SAS, _MLS, _T, _T, _T, _T, _T, _MLS, _MLS, _SAS, _MLW, _MLW, _MLW, _MLW]
+_ND = [_SAW, _SAW, _MLW, _SAS, _SAS, _MLS, _T, _T, _T, _T, _T, _MLS, _SAS, _SAS, _MLW, _MLW, _MLW]
+
+_PROFILES_BY_MONTH_AND_LATITUDE = np.array(
+    [_JFMA, _JFMA, _JFMA, _JFMA, _MJ, _MJ, _JA, _JA, _SO, _SO, _ND, _ND], dtype=np.int64
+)
+
+
+def _months(dates):
+    """Gets the months (1-12) of an array of dates, given as datetime64 values, strings or datetime objects."""
+    if isinstance(dates, str):
+        return _parse_month(dates)
+
+    dates = np.asarray(dates)
+
+    if np.issubdtype(dates.dtype, np.datetime64):
+        return dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+    if dates.dtype.kind in "US":
+        # Many of the dates are often the same, so each different string is only parsed once
+        unique, inverse = np.unique(dates, return_inverse=True)
+        months = np.array([_parse_month(str(date)) for date in unique.ravel()], dtype=np.int64)
+        return months[inverse].reshape(dates.shape)
+
+    months = np.empty(dates.shape, dtype=np.int64)
+    for index, date in np.ndenumerate(dates):
+        if isinstance(date, str):
+            months[index] = _parse_month(date)
+        else:
+            months[index] = date.month
+    return months
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_month(date):
+    try:
+        return dateutil.parser.parse(date, dayfirst=True).month
+    except (ValueError, OverflowError):
+        raise ParameterError("date", "Could not interpret %r as a date" % date)
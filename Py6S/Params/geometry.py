@@ -19,6 +19,7 @@ import sys
 from datetime import timezone
 
 import dateutil.parser
+import numpy as np
 
 from ..sixs_exceptions import ParameterError
 
@@ -105,6 +106,147 @@ class Geometry:
             self.view_z = view_z
             self.view_a = view_a
 
+        @staticmethod
+        def solar_positions(lats, lons, datetimes):
+            """Calculates the solar zenith and azimuth angles for many locations and times at once.
+
+            The calculation uses the NOAA solar position equations, vectorised with numpy, so it is much faster than
+            calling :meth:`from_time_and_location` for each time and location. Between 1900 and 2100 the angles agree with
+            those from pysolar (as used by :meth:`from_time_and_location`) to within about 0.03 degrees in zenith, and to
+            within about 0.12 degrees in azimuth when the sun is above the horizon and more than 10 degrees from the zenith.
+            Closer to the zenith (or the nadir) the azimuth changes quickly with the position of the sun, so the azimuths can
+            differ by more, although the positions of the sun still agree to within about 0.03 degrees. The same correction
+            for atmospheric refraction is included.
+
+            Arguments:
+
+            * ``lats`` -- The latitudes of the locations, in degrees
+            * ``lons`` -- The longitudes of the locations, in degrees
+            * ``datetimes`` -- The date-times, in UTC. These can be given as a numpy ``datetime64`` array (or a pandas
+              ``DatetimeIndex``), or as a list of ISO format strings (eg. "2018-06-14 11:37") or ``datetime`` objects.
+              Date-times with a timezone are converted to UTC.
+
+            The arguments are broadcast against each other, so a single location can be given with many times, or
+            many locations with a single time.
+
+            Return value:
+
+            A tuple of arrays ``(solar_z, solar_a, day, month)``, each with the broadcast shape of the arguments
+
+            """
+            lats, lons, times = np.broadcast_arrays(
+                np.asarray(lats, dtype=np.float64),
+                np.asarray(lons, dtype=np.float64),
+                _datetime64_utc(datetimes),
+            )
+
+            # Julian day and Julian century (from the J2000 epoch)
+            days = (times - np.datetime64("1970-01-01", "ns")) / np.timedelta64(1, "D")
+            jc = (days + 2440587.5 - 2451545.0) / 36525.0
+
+            mean_long = np.radians((280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360)
+            mean_anom = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+            eccent = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+            centre = (
+                np.sin(mean_anom) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+                + np.sin(2 * mean_anom) * (0.019993 - 0.000101 * jc)
+                + np.sin(3 * mean_anom) * 0.000289
+            )
+            omega = np.radians(125.04 - 1934.136 * jc)
+            app_long = np.radians(
+                np.degrees(mean_long) + centre - 0.00569 - 0.00478 * np.sin(omega)
+            )
+
+            mean_obliq = (
+                23 + (26 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60) / 60
+            )
+            obliq = np.radians(mean_obliq + 0.00256 * np.cos(omega))
+            decl = np.arcsin(np.sin(obliq) * np.sin(app_long))
+
+            # Equation of time, in minutes
+            y = np.tan(obliq / 2) ** 2
+            eq_of_time = 4 * np.degrees(
+                y * np.sin(2 * mean_long)
+                - 2 * eccent * np.sin(mean_anom)
+                + 4 * eccent * y * np.sin(mean_anom) * np.cos(2 * mean_long)
+                - 0.5 * y**2 * np.sin(4 * mean_long)
+                - 1.25 * eccent**2 * np.sin(2 * mean_anom)
+            )
+
+            minutes = (days % 1) * 1440
+            true_solar_time = (minutes + eq_of_time + 4 * lons) % 1440
+            hour_angle = np.radians(true_solar_time / 4 - 180)
+
+            lat_rad = np.radians(lats)
+            cos_zenith = np.sin(lat_rad) * np.sin(decl) + np.cos(lat_rad) * np.cos(decl) * np.cos(
+                hour_angle
+            )
+            elevation = 90 - np.degrees(np.arccos(np.clip(cos_zenith, -1, 1)))
+
+            # Refraction correction as in the NREL SPA (and pysolar), for the standard pressure (mb) and
+            # temperature (K) used by pysolar
+            pressure = 1013.25
+            temperature = 288.15
+            with np.errstate(divide="ignore", invalid="ignore"):
+                refraction = (
+                    pressure
+                    / 1010.0
+                    * 283.0
+                    / temperature
+                    * 1.02
+                    / (60 * np.tan(np.radians(elevation + 10.3 / (elevation + 5.11))))
+                )
+            elevation = elevation + np.where(elevation >= -(0.26667 + 0.5667), refraction, 0)
+
+            # Azimuth measured clockwise from north
+            solar_a = (
+                np.degrees(
+                    np.arctan2(
+                        np.sin(hour_angle),
+                        np.cos(hour_angle) * np.sin(lat_rad) - np.tan(decl) * np.cos(lat_rad),
+                    )
+                )
+                + 180
+            ) % 360
+
+            month_start = times.astype("datetime64[M]")
+            month = month_start.astype(np.int64) % 12 + 1
+            day = (times.astype("datetime64[D]") - month_start).astype(np.int64) + 1
+
+            return 90.0 - elevation, solar_a, day, month
+
+        @classmethod
+        def from_times_and_locations(cls, lats, lons, datetimes, view_z=0, view_a=0):
+            """Creates user-defined geometries for many locations and times at once, with the solar angles calculated
+            by :meth:`solar_positions`.
+
+            Arguments:
+
+            * ``lats``, ``lons``, ``datetimes`` -- As for :meth:`solar_positions`
+            * ``view_z`` -- (Optional) The view zenith angle, or an array of view zenith angles (default 0)
+            * ``view_a`` -- (Optional) The view azimuth angle, or an array of view azimuth angles (default 0)
+
+            Return value:
+
+            A list of :class:`Geometry.User` instances, one for each element of the broadcast arguments (in the order
+            of the flattened arrays). These can be assigned to ``s.geometry`` or passed to :meth:`.ParameterSnapshot.run`.
+
+            """
+            solar_z, solar_a, day, month = cls.solar_positions(lats, lons, datetimes)
+            solar_z, solar_a, day, month, view_z, view_a = (
+                a.ravel().tolist()
+                for a in np.broadcast_arrays(solar_z, solar_a, day, month, view_z, view_a)
+            )
+
+            geometries = []
+            for values in zip(solar_z, solar_a, view_z, view_a, day, month):
+                g = cls()
+                g.solar_z, g.solar_a, g.view_z, g.view_a, g.day, g.month = values
+                geometries.append(g)
+
+            return geometries
+
     class Meteosat:
 
         """Stores parameters for a Meteosat geometry for 6S.
@@ -311,3 +453,32 @@ class Geometry:
                 self.longitude,
                 self.latitude,
             )
+
+
+def _datetime64_utc(datetimes):
+    """Converts date-times given as datetime64 values, ISO format strings or datetime objects to a datetime64 array in UTC."""
+    datetimes = np.asarray(datetimes)
+
+    if np.issubdtype(datetimes.dtype, np.datetime64):
+        return datetimes.astype("datetime64[ns]")
+
+    result = np.empty(datetimes.shape, dtype="datetime64[ns]")
+    for index, value in np.ndenumerate(datetimes):
+        if isinstance(value, str):
+            try:
+                value = dateutil.parser.isoparse(value)
+            except ValueError:
+                raise ParameterError(
+                    "datetime",
+                    "You must pass a date-time in ISO 8601 format - ie. YYYY-MM-DD HH:MM:SS",
+                )
+
+        if getattr(value, "tzinfo", None) is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+        try:
+            result[index] = np.datetime64(value, "ns")
+        except (TypeError, ValueError):
+            raise ParameterError("datetime", "Could not interpret %r as a date-time" % (value,))
+
+    return result
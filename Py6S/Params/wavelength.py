@@ -15,10 +15,63 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+import threading
+
 import numpy as np
 
 from .. import sixs_exceptions
 
+# The filter functions for the predefined wavelengths, stored as one array per constant in
+# PredefinedWavelengths. They are only read from the file when they are first used.
+_FILTERS_FILENAME = os.path.join(os.path.dirname(__file__), "predefined_wavelengths.npz")
+_filters = None
+_filters_lock = threading.Lock()
+
+
+def _load_filter(name):
+    """Loads the filter function for the predefined wavelength with the given name from the data file"""
+    global _filters
+
+    with _filters_lock:
+        if _filters is None:
+            _filters = np.load(_FILTERS_FILENAME)
+
+        return _filters[name]
+
+
+class _PredefinedWavelength(object):
+
+    """A predefined wavelength whose filter function is loaded from the data file the first time it is used.
+
+    Accessing it as an attribute of :class:`PredefinedWavelengths` gives a tuple of (ID, start wavelength,
+    end wavelength, filter function), exactly as if the tuple had been defined in the class itself.
+
+    """
+
+    def __init__(self, id, start_wavelength, end_wavelength):
+        self.id = id
+        self.start_wavelength = start_wavelength
+        self.end_wavelength = end_wavelength
+        self.name = None
+        self.value = None
+
+    def __set_name__(self, owner, name):
+        # Aliases (such as LANDSAT_OLI_PAN = LANDSAT_OLI_B8) use the name the filter was first defined with
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, instance, owner=None):
+        if self.value is None:
+            self.value = (
+                self.id,
+                self.start_wavelength,
+                self.end_wavelength,
+                _load_filter(self.name),
+            )
+
+        return self.value
+
 
 def Wavelength(start_wavelength, end_wavelength=None, filter=None):
     """Select one or more wavelengths for the 6S simulation.
@@ -136,560 +189,33 @@ class PredefinedWavelengths:
     MIN_ALLOWABLE_WAVELENGTH = 0.2
 
     # New predefined wavelengths that I've added to Py6S
-    # CONSTANT_NAME = (ID, Start Wavelength, End Wavelength, Filter Function)
+    # CONSTANT_NAME = _PredefinedWavelength(ID, Start Wavelength, End Wavelength)
+    # which gives (ID, Start Wavelength, End Wavelength, Filter Function) when accessed, with the
+    # filter function stored under CONSTANT_NAME in predefined_wavelengths.npz
     # Note: IDs must be > 1 for new predefined wavelengths
 
     # Landsat OLI
     # Taken from spreadsheet downloadable from http://landsat.gsfc.nasa.gov/?p=5779
     # Interpolated to 2.5nm intervals, as required by 6S
-    LANDSAT_OLI_B1 = (
-        1,
-        0.427,
-        0.457,
-        np.array(
-            [
-                7.30000000e-05,
-                2.52450000e-03,
-                2.47670000e-02,
-                3.85985000e-01,
-                9.08749000e-01,
-                9.80591500e-01,
-                9.86713000e-01,
-                9.96568500e-01,
-                9.82780000e-01,
-                8.25707000e-01,
-                2.26412000e-01,
-                2.55700000e-02,
-                2.41400000e-03,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B2 = (
-        2,
-        0.436,
-        0.526,
-        np.array(
-            [
-                1.00000000e-05,
-                1.79000000e-04,
-                4.55000000e-04,
-                1.63350000e-03,
-                6.86900000e-03,
-                4.28880000e-02,
-                2.71370000e-01,
-                7.90740500e-01,
-                9.03034000e-01,
-                9.04677500e-01,
-                8.89667000e-01,
-                8.79232000e-01,
-                8.79688000e-01,
-                8.89796500e-01,
-                8.48533000e-01,
-                8.36270500e-01,
-                8.68497000e-01,
-                9.11461500e-01,
-                9.31726000e-01,
-                9.54896500e-01,
-                9.56424000e-01,
-                9.83834000e-01,
-                9.89469000e-01,
-                9.68066500e-01,
-                9.88729000e-01,
-                9.61057500e-01,
-                9.66125000e-01,
-                9.82077000e-01,
-                9.63135000e-01,
-                9.98249000e-01,
-                8.44893000e-01,
-                1.19533500e-01,
-                5.32800000e-03,
-                1.32850000e-03,
-                5.16000000e-04,
-                1.17000000e-04,
-                2.30000000e-05,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B3 = (
-        3,
-        0.512,
-        0.610,
-        np.array(
-            [
-                -4.60000000e-05,
-                1.78500000e-04,
-                6.48000000e-04,
-                1.57400000e-03,
-                3.44600000e-03,
-                8.73250000e-03,
-                2.55130000e-02,
-                9.69975000e-02,
-                3.53885000e-01,
-                8.03215000e-01,
-                9.54627000e-01,
-                9.60271500e-01,
-                9.69873000e-01,
-                9.69833500e-01,
-                9.77001000e-01,
-                9.95392000e-01,
-                9.82642000e-01,
-                9.71423000e-01,
-                9.46245000e-01,
-                9.62786000e-01,
-                9.66447000e-01,
-                9.64176500e-01,
-                9.83397000e-01,
-                9.70875500e-01,
-                9.78208000e-01,
-                9.77182500e-01,
-                9.69181000e-01,
-                9.81277000e-01,
-                9.68886000e-01,
-                9.80432000e-01,
-                9.04478000e-01,
-                6.05139000e-01,
-                1.90467000e-01,
-                2.47350000e-02,
-                2.57400000e-03,
-                2.39500000e-04,
-                0,
-                0,
-                0,
-                0,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B4 = (
-        4,
-        0.625,
-        0.690,
-        np.array(
-            [
-                -3.42000000e-04,
-                1.37250000e-03,
-                7.19700000e-03,
-                4.86465000e-02,
-                2.99778000e-01,
-                8.34958000e-01,
-                9.50823000e-01,
-                9.57268000e-01,
-                9.84173000e-01,
-                9.83172500e-01,
-                9.59441000e-01,
-                9.54442500e-01,
-                9.81688000e-01,
-                9.88501500e-01,
-                9.76960000e-01,
-                9.88942000e-01,
-                9.80678000e-01,
-                9.66466000e-01,
-                9.66928000e-01,
-                7.29107000e-01,
-                1.23946000e-01,
-                1.25175000e-02,
-                1.40200000e-03,
-                0,
-                0,
-                0,
-                0,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B5 = (
-        5,
-        0.829,
-        0.899,
-        np.array(
-            [
-                0,
-                7.50000000e-05,
-                3.14000000e-04,
-                8.52500000e-04,
-                2.10700000e-03,
-                5.90150000e-03,
-                1.73460000e-02,
-                6.62770000e-02,
-                2.49733000e-01,
-                6.63830000e-01,
-                9.60215000e-01,
-                9.76869500e-01,
-                1.00000000e00,
-                9.78334000e-01,
-                9.57357000e-01,
-                9.50103000e-01,
-                9.48450000e-01,
-                9.53355500e-01,
-                9.69821000e-01,
-                8.39899500e-01,
-                4.48364000e-01,
-                1.37481000e-01,
-                3.45320000e-02,
-                1.00205000e-02,
-                2.94400000e-03,
-                9.67500000e-04,
-                2.41000000e-04,
-                1.55000000e-05,
-                0,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B6 = (
-        6,
-        1.515,
-        1.695,
-        np.array(
-            [
-                0,
-                2.00000000e-04,
-                4.66000000e-04,
-                8.45000000e-04,
-                1.36900000e-03,
-                2.01550000e-03,
-                2.88100000e-03,
-                4.02150000e-03,
-                5.52800000e-03,
-                7.88900000e-03,
-                1.09890000e-02,
-                1.52755000e-02,
-                2.18310000e-02,
-                3.25615000e-02,
-                4.78640000e-02,
-                7.09490000e-02,
-                1.01893000e-01,
-                1.50884500e-01,
-                2.20261000e-01,
-                3.10649000e-01,
-                4.21470000e-01,
-                5.52234000e-01,
-                6.76683000e-01,
-                7.71509000e-01,
-                8.54065000e-01,
-                8.95823500e-01,
-                9.13009000e-01,
-                9.25058000e-01,
-                9.26413000e-01,
-                9.23818000e-01,
-                9.22828000e-01,
-                9.22408500e-01,
-                9.26605000e-01,
-                9.43438000e-01,
-                9.46175000e-01,
-                9.47297500e-01,
-                9.52859000e-01,
-                9.51358500e-01,
-                9.59047000e-01,
-                9.59191500e-01,
-                9.61470000e-01,
-                9.60494000e-01,
-                9.64703000e-01,
-                9.69951500e-01,
-                9.76906000e-01,
-                9.81271500e-01,
-                9.88609000e-01,
-                9.99010500e-01,
-                9.99642000e-01,
-                9.89828000e-01,
-                9.67125000e-01,
-                9.26719000e-01,
-                8.40967000e-01,
-                7.23103000e-01,
-                5.73232000e-01,
-                4.22998000e-01,
-                2.91752000e-01,
-                1.95988000e-01,
-                1.28463000e-01,
-                8.28380000e-02,
-                5.27520000e-02,
-                3.45655000e-02,
-                2.25040000e-02,
-                1.47195000e-02,
-                9.58700000e-03,
-                6.39600000e-03,
-                4.25700000e-03,
-                2.79800000e-03,
-                1.78100000e-03,
-                1.14200000e-03,
-                6.77000000e-04,
-                3.55000000e-04,
-                1.12000000e-04,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B7 = (
-        7,
-        2.037,
-        2.354,
-        np.array(
-            [
-                0,
-                1.07000000e-04,
-                2.40000000e-04,
-                3.99000000e-04,
-                5.99000000e-04,
-                8.80500000e-04,
-                1.22200000e-03,
-                1.64550000e-03,
-                2.18700000e-03,
-                2.85300000e-03,
-                3.73300000e-03,
-                4.88200000e-03,
-                6.33700000e-03,
-                8.44950000e-03,
-                1.10050000e-02,
-                1.42985000e-02,
-                1.88990000e-02,
-                2.45090000e-02,
-                3.20710000e-02,
-                4.28190000e-02,
-                5.64290000e-02,
-                7.48955000e-02,
-                1.00640000e-01,
-                1.36480000e-01,
-                1.79714000e-01,
-                2.40483000e-01,
-                3.11347000e-01,
-                3.94832500e-01,
-                4.88816000e-01,
-                5.73971000e-01,
-                6.63067000e-01,
-                7.39406500e-01,
-                7.92667000e-01,
-                8.41172500e-01,
-                8.67845000e-01,
-                8.86269000e-01,
-                9.06527000e-01,
-                9.14538000e-01,
-                9.29693000e-01,
-                9.38975000e-01,
-                9.42952000e-01,
-                9.44181000e-01,
-                9.48776000e-01,
-                9.49521500e-01,
-                9.56635000e-01,
-                9.48258500e-01,
-                9.50874000e-01,
-                9.47049500e-01,
-                9.57717000e-01,
-                9.47095000e-01,
-                9.51641000e-01,
-                9.46800000e-01,
-                9.40311000e-01,
-                9.46466500e-01,
-                9.38737000e-01,
-                9.44439000e-01,
-                9.44482000e-01,
-                9.50472000e-01,
-                9.39939000e-01,
-                9.37156500e-01,
-                9.38955000e-01,
-                9.28123500e-01,
-                9.30508000e-01,
-                9.30946000e-01,
-                9.36472000e-01,
-                9.34327500e-01,
-                9.46217000e-01,
-                9.53826000e-01,
-                9.63135000e-01,
-                9.63944000e-01,
-                9.62905000e-01,
-                9.61607000e-01,
-                9.57814000e-01,
-                9.55657500e-01,
-                9.51706000e-01,
-                9.60275500e-01,
-                9.47696000e-01,
-                9.59807000e-01,
-                9.55750000e-01,
-                9.56607500e-01,
-                9.66786000e-01,
-                9.62823000e-01,
-                9.77637000e-01,
-                9.83457500e-01,
-                9.85056000e-01,
-                9.98627000e-01,
-                9.92469000e-01,
-                9.97947000e-01,
-                9.97261000e-01,
-                9.89437000e-01,
-                9.86037000e-01,
-                9.81280000e-01,
-                9.72794000e-01,
-                9.76369500e-01,
-                9.74409000e-01,
-                9.63698500e-01,
-                9.55095000e-01,
-                9.51391500e-01,
-                9.22405000e-01,
-                8.89264000e-01,
-                8.23876000e-01,
-                7.21272500e-01,
-                6.02539000e-01,
-                4.77695500e-01,
-                3.55569000e-01,
-                2.61452500e-01,
-                1.86151000e-01,
-                1.31725000e-01,
-                9.20290000e-02,
-                6.49895000e-02,
-                4.63320000e-02,
-                3.34235000e-02,
-                2.40000000e-02,
-                1.76250000e-02,
-                1.29300000e-02,
-                9.55700000e-03,
-                7.08800000e-03,
-                5.33100000e-03,
-                3.90300000e-03,
-                2.83800000e-03,
-                2.04700000e-03,
-                1.44950000e-03,
-                9.74000000e-04,
-                6.20000000e-04,
-                3.20000000e-04,
-                7.35000000e-05,
-                0,
-                0,
-            ]
-        ),
-    )
-
-    LANDSAT_OLI_B8 = (
-        8,
-        0.488,
-        0.691,
-        np.array(
-            [
-                2.16000000e-04,
-                1.30000000e-03,
-                3.84100000e-03,
-                1.22590000e-02,
-                4.27230000e-02,
-                1.60137500e-01,
-                4.72496000e-01,
-                7.45412500e-01,
-                8.31881000e-01,
-                8.55321500e-01,
-                8.59640000e-01,
-                8.57696000e-01,
-                8.58455000e-01,
-                8.58301000e-01,
-                8.50183000e-01,
-                8.58223500e-01,
-                8.61508000e-01,
-                8.57683500e-01,
-                8.79249000e-01,
-                8.91710500e-01,
-                9.06294000e-01,
-                9.12867000e-01,
-                9.02939000e-01,
-                9.20739500e-01,
-                9.13020000e-01,
-                8.85650500e-01,
-                8.79443000e-01,
-                8.74179000e-01,
-                8.75361000e-01,
-                8.91665000e-01,
-                8.74097000e-01,
-                8.86888500e-01,
-                9.03528000e-01,
-                9.10950500e-01,
-                9.13190000e-01,
-                9.20178000e-01,
-                9.24431000e-01,
-                9.29809500e-01,
-                9.48863000e-01,
-                9.40543000e-01,
-                9.45674000e-01,
-                9.39380000e-01,
-                9.46659000e-01,
-                9.34044500e-01,
-                9.40838000e-01,
-                9.58039500e-01,
-                9.68241000e-01,
-                9.66480500e-01,
-                9.57232000e-01,
-                9.47675500e-01,
-                9.52465000e-01,
-                9.57481500e-01,
-                9.64158000e-01,
-                9.67366000e-01,
-                9.77026000e-01,
-                9.76029500e-01,
-                9.69583000e-01,
-                9.72807000e-01,
-                9.65780000e-01,
-                9.66738000e-01,
-                9.72067000e-01,
-                9.79346500e-01,
-                9.71123000e-01,
-                9.53377000e-01,
-                9.63851000e-01,
-                9.67101500e-01,
-                9.70613000e-01,
-                9.79974500e-01,
-                9.88302000e-01,
-                9.91753000e-01,
-                1.00000000e00,
-                9.98476000e-01,
-                9.92555000e-01,
-                9.85811500e-01,
-                9.13945000e-01,
-                5.24376500e-01,
-                1.67313000e-01,
-                4.61755000e-02,
-                1.51780000e-02,
-                6.70950000e-03,
-                3.22000000e-03,
-                1.21200000e-03,
-            ]
-        ),
-    )
+    LANDSAT_OLI_B1 = _PredefinedWavelength(1, 0.427, 0.457)
+
+    LANDSAT_OLI_B2 = _PredefinedWavelength(2, 0.436, 0.526)
+
+    LANDSAT_OLI_B3 = _PredefinedWavelength(3, 0.512, 0.610)
+
+    LANDSAT_OLI_B4 = _PredefinedWavelength(4, 0.625, 0.690)
+
+    LANDSAT_OLI_B5 = _PredefinedWavelength(5, 0.829, 0.899)
+
+    LANDSAT_OLI_B6 = _PredefinedWavelength(6, 1.515, 1.695)
+
+    LANDSAT_OLI_B7 = _PredefinedWavelength(7, 2.037, 2.354)
+
+    LANDSAT_OLI_B8 = _PredefinedWavelength(8, 0.488, 0.691)
 
     LANDSAT_OLI_PAN = LANDSAT_OLI_B8
 
-    LANDSAT_OLI_B9 = (
-        9,
-        1.340,
-        1.407,
-        np.array(
-            [
-                0,
-                2.57500000e-04,
-                6.47000000e-04,
-                1.27400000e-03,
-                2.31800000e-03,
-                4.70450000e-03,
-                1.11240000e-02,
-                3.45385000e-02,
-                1.15351000e-01,
-                3.86681500e-01,
-                7.72118000e-01,
-                9.00941500e-01,
-                9.31247000e-01,
-                9.91687000e-01,
-                1.00000000e00,
-                9.77080500e-01,
-                8.71343000e-01,
-                6.54888000e-01,
-                2.97920000e-01,
-                8.96145000e-02,
-                2.60840000e-02,
-                8.30650000e-03,
-                2.78000000e-03,
-                1.11900000e-03,
-                2.20000000e-04,
-                0,
-                0,
-                0,
-            ]
-        ),
-    )
+    LANDSAT_OLI_B9 = _PredefinedWavelength(9, 1.340, 1.407)
 
     # RapidEye
     # Taken from http://blackbridge.com/rapideye/upload/Spectral_Response_Curves.pdf
@@ -1008,2315 +534,183 @@ class PredefinedWavelengths:
 
     # Sentinel-2A MSI spectral response functions
     # Taken from https://earth.esa.int/web/sentinel/user-guides/sentinel-2-msi/document-library/-/asset_publisher/Wk0TKajiISaR/content/sentinel-2a-spectral-responses
-    S2A_MSI_01 = (
-        53,
-        0.4120,
-        0.4570,
-        np.array(
-            [
-                0.00177574,
-                0.00357067,
-                0.00378029,
-                0.00162485,
-                0.00125044,
-                0.00109536,
-                0.00182373,
-                0.01670008,
-                0.32387506,
-                0.73834764,
-                0.80862387,
-                0.83917843,
-                0.88731097,
-                0.99114075,
-                0.93596338,
-                0.8379525,
-                0.61417422,
-                0.08388263,
-                0.0,
-            ]
-        ),
-    )
-
-    S2A_MSI_02 = (
-        54,
-        0.4390,
-        0.5340,
-        np.array(
-            [
-                0.01031543,
-                0.02550952,
-                0.02269349,
-                0.01904007,
-                0.02130721,
-                0.01793204,
-                0.01924643,
-                0.0574268,
-                0.32799225,
-                0.73148173,
-                0.75668081,
-                0.77382288,
-                0.86179176,
-                0.9192643,
-                0.90035366,
-                0.87919289,
-                0.90695544,
-                0.94165397,
-                0.8860231,
-                0.79745698,
-                0.77209054,
-                0.82911115,
-                0.92793997,
-                0.96755782,
-                0.95832003,
-                0.95438995,
-                0.9770514,
-                0.96669894,
-                0.90190134,
-                0.83341648,
-                0.82057639,
-                0.89259188,
-                0.99163699,
-                0.9474343,
-                0.50395858,
-                0.14371473,
-                0.04207746,
-                0.00849869,
-                0.0,
-            ]
-        ),
-    )
-
-    S2A_MSI_03 = (
-        55,
-        0.5380,
-        0.5830,
-        np.array(
-            [
-                0.01448181,
-                0.11395589,
-                0.55322279,
-                0.87331261,
-                0.92572845,
-                0.8767134,
-                0.8387572,
-                0.87529183,
-                0.96017974,
-                0.9993004,
-                0.94522089,
-                0.83711029,
-                0.76460653,
-                0.755965,
-                0.79890086,
-                0.79383741,
-                0.40397555,
-                0.07754079,
-                0.00108588,
-            ]
-        ),
-    )
-
-    S2A_MSI_04 = (
-        56,
-        0.6460,
-        0.6860,
-        np.array(
-            [
-                0.00141521,
-                0.25369897,
-                0.94485805,
-                0.99703154,
-                0.99052772,
-                0.90975472,
-                0.77345952,
-                0.7712748,
-                0.83612975,
-                0.89873936,
-                0.95042063,
-                0.95976475,
-                0.95527459,
-                0.81958553,
-                0.22960399,
-                0.01516159,
-                0.0,
-            ]
-        ),
-    )
-
-    S2A_MSI_05 = (
-        57,
-        0.6950,
-        0.7150,
-        np.array(
-            [
-                2.83578563e-02,
-                5.77459223e-01,
-                9.98895232e-01,
-                9.88670233e-01,
-                9.48473886e-01,
-                8.94935856e-01,
-                7.90753191e-01,
-                1.60051275e-01,
-                2.74780199e-15,
-            ]
-        ),
-    )
-
-    S2A_MSI_06 = (
-        58,
-        0.7310,
-        0.7510,
-        np.array(
-            [
-                0.00171088,
-                0.45264387,
-                0.90232877,
-                0.9520792,
-                0.9770217,
-                0.99440139,
-                0.90126739,
-                0.11597958,
-                0.0,
-            ]
-        ),
-    )
-
-    S2A_MSI_07 = (
-        59,
-        0.7690,
-        0.7990,
-        np.array(
-            [
-                4.58986862e-04,
-                1.08907239e-01,
-                6.36854532e-01,
-                9.80612493e-01,
-                1.00000000e00,
-                8.95890946e-01,
-                7.94076736e-01,
-                8.11671368e-01,
-                8.20118286e-01,
-                6.54111768e-01,
-                2.30888169e-01,
-                1.62639307e-02,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S2A_MSI_08 = (
-        60,
-        0.7600,
-        0.9075,
-        np.array(
-            [
-                6.72586786e-04,
-                0.00000000e00,
-                0.00000000e00,
-                0.00000000e00,
-                0.00000000e00,
-                1.44779746e-04,
-                1.75239146e-02,
-                6.81427309e-02,
-                1.95910652e-01,
-                5.03477951e-01,
-                8.03038519e-01,
-                9.70893721e-01,
-                9.88406528e-01,
-                9.39513050e-01,
-                9.53957178e-01,
-                9.82554949e-01,
-                9.83911811e-01,
-                9.77666900e-01,
-                9.87645575e-01,
-                9.83475703e-01,
-                9.57210894e-01,
-                9.06465733e-01,
-                8.51603307e-01,
-                7.91559886e-01,
-                7.49627707e-01,
-                7.26753218e-01,
-                7.25638556e-01,
-                7.19227875e-01,
-                7.08269542e-01,
-                7.00091470e-01,
-                7.18240007e-01,
-                7.58295756e-01,
-                7.96838100e-01,
-                8.03464289e-01,
-                7.89203043e-01,
-                7.58190619e-01,
-                7.22623995e-01,
-                6.74426662e-01,
-                6.30051247e-01,
-                5.96192744e-01,
-                5.71365058e-01,
-                5.49016706e-01,
-                5.35102151e-01,
-                5.30005852e-01,
-                5.32114628e-01,
-                5.32889818e-01,
-                5.30510552e-01,
-                5.31251103e-01,
-                5.42353442e-01,
-                5.57670949e-01,
-                5.48219844e-01,
-                4.92873763e-01,
-                4.27984659e-01,
-                4.00632204e-01,
-                4.20865558e-01,
-                4.07967544e-01,
-                2.57205092e-01,
-                9.34112378e-02,
-                2.59315420e-02,
-                1.97162898e-03,
-            ]
-        ),
-    )
-
-    S2A_MSI_8A = (
-        61,
-        0.8370,
-        0.8820,
-        np.array(
-            [
-                3.00966201e-04,
-                0.00000000e00,
-                0.00000000e00,
-                0.00000000e00,
-                1.57217434e-03,
-                1.97345125e-02,
-                1.07797093e-01,
-                5.03542566e-01,
-                9.32244502e-01,
-                9.75417653e-01,
-                9.76078281e-01,
-                9.88891962e-01,
-                9.99846733e-01,
-                9.95645780e-01,
-                9.96407621e-01,
-                6.15518275e-01,
-                1.12212459e-01,
-                1.67962607e-02,
-                1.08051589e-15,
-            ]
-        ),
-    )
-
-    S2A_MSI_09 = (
-        62,
-        0.9320,
-        0.9595,
-        np.array(
-            [
-                0.01662953,
-                0.28176774,
-                0.87454114,
-                0.97842462,
-                1.0,
-                0.98646234,
-                0.99428313,
-                0.9642169,
-                0.92240308,
-                0.58699885,
-                0.06534121,
-                0.0,
-            ]
-        ),
-    )
-
-    S2A_MSI_10 = (
-        63,
-        1.3370,
-        1.4120,
-        np.array(
-            [
-                2.38032000e-04,
-                2.95805000e-05,
-                1.09542000e-04,
-                1.50071000e-04,
-                3.71868000e-04,
-                8.73727500e-04,
-                3.73628100e-03,
-                3.17506340e-02,
-                2.00854803e-01,
-                5.84484875e-01,
-                8.61210463e-01,
-                9.52070852e-01,
-                9.81720971e-01,
-                9.94644797e-01,
-                1.00000000e00,
-                9.93502876e-01,
-                9.78085355e-01,
-                9.54744576e-01,
-                9.15013686e-01,
-                8.49689704e-01,
-                6.55300550e-01,
-                2.85381533e-01,
-                6.83716420e-02,
-                9.59380350e-03,
-                1.12529200e-03,
-                2.63485500e-04,
-                1.96998000e-04,
-                5.54815000e-05,
-                5.61960000e-05,
-                7.65570000e-05,
-                2.54510000e-05,
-            ]
-        ),
-    )
-
-    S2A_MSI_11 = (
-        64,
-        1.5390,
-        1.6840,
-        np.array(
-            [
-                6.93400000e-06,
-                1.81645000e-05,
-                9.07460000e-05,
-                3.65801000e-04,
-                6.62261000e-04,
-                1.42506250e-03,
-                3.56747000e-03,
-                1.04731085e-02,
-                2.77806180e-02,
-                6.48974280e-02,
-                1.35475748e-01,
-                2.89005843e-01,
-                5.37634456e-01,
-                7.79371857e-01,
-                8.79668577e-01,
-                8.90257398e-01,
-                9.06630520e-01,
-                9.30950552e-01,
-                9.47506732e-01,
-                9.55341795e-01,
-                9.60687866e-01,
-                9.66988645e-01,
-                9.73379886e-01,
-                9.79229624e-01,
-                9.80912334e-01,
-                9.80974468e-01,
-                9.81066319e-01,
-                9.86464474e-01,
-                9.92015684e-01,
-                9.91470684e-01,
-                9.83502057e-01,
-                9.74371426e-01,
-                9.67709002e-01,
-                9.65949699e-01,
-                9.69869577e-01,
-                9.81077488e-01,
-                9.91875079e-01,
-                9.98077305e-01,
-                9.99234469e-01,
-                9.99420043e-01,
-                1.00000000e00,
-                9.94156469e-01,
-                9.78569228e-01,
-                9.57091545e-01,
-                9.41712152e-01,
-                9.31801621e-01,
-                8.80597830e-01,
-                6.92504394e-01,
-                4.26963072e-01,
-                1.99127837e-01,
-                7.24778960e-02,
-                2.43795985e-02,
-                9.31685100e-03,
-                4.13662100e-03,
-                1.95831500e-03,
-                7.76503500e-04,
-                1.59180000e-04,
-                2.89595000e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S2A_MSI_12 = (
-        65,
-        2.0780,
-        2.3205,
-        np.array(
-            [
-                6.39264000e-04,
-                3.44108750e-03,
-                7.65982600e-03,
-                8.92000050e-03,
-                1.09721780e-02,
-                1.41907265e-02,
-                1.97803200e-02,
-                3.04417690e-02,
-                4.88826620e-02,
-                8.18549335e-02,
-                1.36902990e-01,
-                2.23166080e-01,
-                3.27177957e-01,
-                4.26390454e-01,
-                5.03106894e-01,
-                5.50302429e-01,
-                5.79029932e-01,
-                6.04436146e-01,
-                6.34282516e-01,
-                6.71876803e-01,
-                7.11964139e-01,
-                7.49353252e-01,
-                7.85580740e-01,
-                8.14689405e-01,
-                8.36721896e-01,
-                8.52179769e-01,
-                8.56174190e-01,
-                8.60495823e-01,
-                8.65138808e-01,
-                8.71999165e-01,
-                8.82438825e-01,
-                8.91349430e-01,
-                8.99896619e-01,
-                9.05177679e-01,
-                9.05502587e-01,
-                9.04432342e-01,
-                9.02760831e-01,
-                9.02703264e-01,
-                9.05315323e-01,
-                9.09107627e-01,
-                9.15584774e-01,
-                9.22819789e-01,
-                9.29740263e-01,
-                9.35024139e-01,
-                9.37641167e-01,
-                9.39046421e-01,
-                9.43259037e-01,
-                9.41374377e-01,
-                9.36660033e-01,
-                9.29951119e-01,
-                9.15482617e-01,
-                9.07788182e-01,
-                9.11168883e-01,
-                9.21729901e-01,
-                9.19489205e-01,
-                9.26129478e-01,
-                9.36769555e-01,
-                9.49002300e-01,
-                9.57046915e-01,
-                9.63698163e-01,
-                9.66647037e-01,
-                9.65150671e-01,
-                9.61698492e-01,
-                9.56233764e-01,
-                9.52731790e-01,
-                9.51938341e-01,
-                9.54056643e-01,
-                9.62430392e-01,
-                9.72691041e-01,
-                9.85021423e-01,
-                9.93982826e-01,
-                9.99376452e-01,
-                9.99151921e-01,
-                9.91784832e-01,
-                9.76212761e-01,
-                9.53391519e-01,
-                9.27724853e-01,
-                8.99933858e-01,
-                8.68647160e-01,
-                8.33317814e-01,
-                7.91866591e-01,
-                7.34726119e-01,
-                6.51282733e-01,
-                5.43500424e-01,
-                4.29259293e-01,
-                3.21385902e-01,
-                2.27703987e-01,
-                1.56384870e-01,
-                1.08237331e-01,
-                7.69315535e-02,
-                5.49854480e-02,
-                4.07311725e-02,
-                3.19988480e-02,
-                2.64975445e-02,
-                2.16716920e-02,
-                1.36598615e-02,
-                6.51060100e-03,
-                1.03255350e-03,
-            ]
-        ),
-    )
+    S2A_MSI_01 = _PredefinedWavelength(53, 0.4120, 0.4570)
+
+    S2A_MSI_02 = _PredefinedWavelength(54, 0.4390, 0.5340)
+
+    S2A_MSI_03 = _PredefinedWavelength(55, 0.5380, 0.5830)
+
+    S2A_MSI_04 = _PredefinedWavelength(56, 0.6460, 0.6860)
+
+    S2A_MSI_05 = _PredefinedWavelength(57, 0.6950, 0.7150)
+
+    S2A_MSI_06 = _PredefinedWavelength(58, 0.7310, 0.7510)
+
+    S2A_MSI_07 = _PredefinedWavelength(59, 0.7690, 0.7990)
+
+    S2A_MSI_08 = _PredefinedWavelength(60, 0.7600, 0.9075)
+
+    S2A_MSI_8A = _PredefinedWavelength(61, 0.8370, 0.8820)
+
+    S2A_MSI_09 = _PredefinedWavelength(62, 0.9320, 0.9595)
+
+    S2A_MSI_10 = _PredefinedWavelength(63, 1.3370, 1.4120)
+
+    S2A_MSI_11 = _PredefinedWavelength(64, 1.5390, 1.6840)
+
+    S2A_MSI_12 = _PredefinedWavelength(65, 2.0780, 2.3205)
 
     # Sentinel-3A OLCI spectral response functions
     # changed to center at the max value of each
     # band rsr from https://sentinel.esa.int/web/sentinel/technical-guides/sentinel-3-olci/olci-instrument/spectral-response-function-data
     # the mean dataset
-    S3A_OLCI_01 = (
-        66,
-        0.3850,
-        0.4125,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.44698925e-03,
-                3.90075197e-01,
-                6.64325016e-01,
-                7.79951131e-01,
-                9.02794193e-01,
-                9.59328741e-01,
-                9.98980457e-01,
-                2.15052943e-01,
-                6.91049895e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_02 = (
-        67,
-        0.4000,
-        0.4225,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                5.67130629e-03,
-                7.80520608e-01,
-                9.92336528e-01,
-                9.98163685e-01,
-                9.64577067e-01,
-                1.62142192e-01,
-                3.65144365e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_03 = (
-        68,
-        0.4300,
-        0.4525,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                8.82327515e-05,
-                2.50507297e-01,
-                9.84845256e-01,
-                9.98648197e-01,
-                9.95748807e-01,
-                7.25352741e-01,
-                3.29665330e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_04 = (
-        69,
-        0.4775,
-        0.5000,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                8.88119025e-05,
-                2.58959751e-01,
-                9.67644787e-01,
-                9.78045026e-01,
-                9.96403711e-01,
-                7.45344017e-01,
-                3.57228954e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_05 = (
-        70,
-        0.4975,
-        0.5200,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                9.03196596e-05,
-                2.61921725e-01,
-                9.68992890e-01,
-                9.86484682e-01,
-                9.97900957e-01,
-                7.26184125e-01,
-                3.04349960e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_06 = (
-        71,
-        0.5475,
-        0.5700,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                9.12138310e-05,
-                2.71055434e-01,
-                9.85744910e-01,
-                9.93709995e-01,
-                9.99188281e-01,
-                7.36202217e-01,
-                3.20926544e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_07 = (
-        72,
-        0.6075,
-        0.6300,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                9.50077324e-05,
-                2.77317100e-01,
-                9.76962724e-01,
-                9.87228638e-01,
-                9.97972350e-01,
-                6.98892119e-01,
-                2.26772837e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_08 = (
-        73,
-        0.6525,
-        0.6750,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.70652583e-04,
-                3.53389797e-01,
-                9.80447862e-01,
-                9.91507321e-01,
-                9.97394347e-01,
-                6.44129999e-01,
-                1.36300229e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_09 = (
-        74,
-        0.6625,
-        0.6825,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.66013218e-04,
-                3.54497132e-01,
-                9.91183060e-01,
-                9.96152868e-01,
-                6.60733265e-01,
-                1.52801384e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_10 = (
-        75,
-        0.6700,
-        0.6900,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.38022478e-04,
-                3.33541643e-01,
-                9.85871946e-01,
-                9.97184790e-01,
-                6.83203266e-01,
-                1.78238692e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_11 = (
-        76,
-        0.6950,
-        0.7175,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.29485319e-07,
-                1.33565896e-02,
-                8.95928951e-01,
-                9.96556200e-01,
-                9.97534770e-01,
-                9.86969653e-01,
-                1.02877809e-01,
-                6.99836795e-06,
-            ]
-        ),
-    )
-
-    S3A_OLCI_12 = (
-        77,
-        0.7425,
-        0.7625,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                5.73078846e-05,
-                2.62775426e-01,
-                9.96285919e-01,
-                9.94959949e-01,
-                7.44938946e-01,
-                2.43649259e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_13 = (
-        78,
-        0.7550,
-        0.7700,
-        np.array(
-            [
-                0.00000000e00,
-                4.89582545e-05,
-                2.62646899e-01,
-                8.24031122e-01,
-                3.06534953e-03,
-                0.00000000e00,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_14 = (
-        79,
-        0.7575,
-        0.7725,
-        np.array(
-            [
-                0.00000000e00,
-                4.38488689e-05,
-                2.43677851e-01,
-                9.97014247e-01,
-                1.17088589e-01,
-                7.61572220e-06,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_15 = (
-        80,
-        0.7600,
-        0.7750,
-        np.array(
-            [
-                0.00000000e00,
-                5.87943065e-08,
-                1.02946446e-02,
-                9.49694946e-01,
-                1.19850202e-01,
-                7.39186874e-06,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_16 = (
-        81,
-        0.7625,
-        0.7900,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                4.54725243e-08,
-                8.66502455e-03,
-                8.54786953e-01,
-                9.76876743e-01,
-                9.86449152e-01,
-                9.97465390e-01,
-                9.97967879e-01,
-                9.87477514e-01,
-                1.31193176e-01,
-                9.42330409e-06,
-            ]
-        ),
-    )
-
-    S3A_OLCI_17 = (
-        82,
-        0.8475,
-        0.8800,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.98596616e-05,
-                1.94106940e-01,
-                9.98422526e-01,
-                9.92162445e-01,
-                9.82368240e-01,
-                9.72067967e-01,
-                9.59774999e-01,
-                9.47635726e-01,
-                9.35168865e-01,
-                7.55614274e-01,
-                3.37197717e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_18 = (
-        83,
-        0.8725,
-        0.8950,
-        np.array(
-            [
-                0.00000000e00,
-                1.20008056e-08,
-                4.44776154e-03,
-                8.44464399e-01,
-                9.95280744e-01,
-                9.81079588e-01,
-                9.61809761e-01,
-                1.58916299e-01,
-                1.48886924e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_19 = (
-        84,
-        0.8875,
-        0.9100,
-        np.array(
-            [
-                0.00000000e00,
-                1.21562504e-08,
-                4.26317347e-03,
-                8.40394746e-01,
-                9.94028495e-01,
-                9.76434111e-01,
-                9.53033360e-01,
-                1.61291816e-01,
-                1.75069782e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_20 = (
-        85,
-        0.9225,
-        0.9550,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                4.38829991e-03,
-                8.39806175e-01,
-                9.85099657e-01,
-                9.48581070e-01,
-                9.12425617e-01,
-                8.77435250e-01,
-                8.52489956e-01,
-                8.32325676e-01,
-                8.08894612e-01,
-                1.56714011e-01,
-                3.28157749e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3A_OLCI_21 = (
-        86,
-        0.9925,
-        1.0450,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                5.95267671e-03,
-                8.29963638e-01,
-                9.76125513e-01,
-                9.17196169e-01,
-                8.59092046e-01,
-                8.01654231e-01,
-                7.43763056e-01,
-                6.86917212e-01,
-                6.30841661e-01,
-                5.78254852e-01,
-                5.46055402e-01,
-                5.16377240e-01,
-                4.87388894e-01,
-                4.59188029e-01,
-                4.31652996e-01,
-                4.04096076e-01,
-                3.73472735e-01,
-                6.44893266e-02,
-                8.19798435e-05,
-                0.00000000e00,
-            ]
-        ),
-    )
+    S3A_OLCI_01 = _PredefinedWavelength(66, 0.3850, 0.4125)
+
+    S3A_OLCI_02 = _PredefinedWavelength(67, 0.4000, 0.4225)
+
+    S3A_OLCI_03 = _PredefinedWavelength(68, 0.4300, 0.4525)
+
+    S3A_OLCI_04 = _PredefinedWavelength(69, 0.4775, 0.5000)
+
+    S3A_OLCI_05 = _PredefinedWavelength(70, 0.4975, 0.5200)
+
+    S3A_OLCI_06 = _PredefinedWavelength(71, 0.5475, 0.5700)
+
+    S3A_OLCI_07 = _PredefinedWavelength(72, 0.6075, 0.6300)
+
+    S3A_OLCI_08 = _PredefinedWavelength(73, 0.6525, 0.6750)
+
+    S3A_OLCI_09 = _PredefinedWavelength(74, 0.6625, 0.6825)
+
+    S3A_OLCI_10 = _PredefinedWavelength(75, 0.6700, 0.6900)
+
+    S3A_OLCI_11 = _PredefinedWavelength(76, 0.6950, 0.7175)
+
+    S3A_OLCI_12 = _PredefinedWavelength(77, 0.7425, 0.7625)
+
+    S3A_OLCI_13 = _PredefinedWavelength(78, 0.7550, 0.7700)
+
+    S3A_OLCI_14 = _PredefinedWavelength(79, 0.7575, 0.7725)
+
+    S3A_OLCI_15 = _PredefinedWavelength(80, 0.7600, 0.7750)
+
+    S3A_OLCI_16 = _PredefinedWavelength(81, 0.7625, 0.7900)
+
+    S3A_OLCI_17 = _PredefinedWavelength(82, 0.8475, 0.8800)
+
+    S3A_OLCI_18 = _PredefinedWavelength(83, 0.8725, 0.8950)
+
+    S3A_OLCI_19 = _PredefinedWavelength(84, 0.8875, 0.9100)
+
+    S3A_OLCI_20 = _PredefinedWavelength(85, 0.9225, 0.9550)
+
+    S3A_OLCI_21 = _PredefinedWavelength(86, 0.9925, 1.0450)
     # Sentinel-3A SLSTR spectral response functions
     # (PREFLIGHT)
     # Code used to create these things in
     # https://github.com/jgomezdans/sentinel_SRF
 
-    S3A_SLSTR_01 = (
-        87,
-        0.54000,
-        0.57000,
-        np.array(
-            [
-                0.01463,
-                0.14031,
-                0.57941,
-                0.95383,
-                0.99927,
-                0.98361,
-                0.98065,
-                0.99224,
-                0.86356,
-                0.74371,
-                0.25806,
-                0.05162,
-                0.00906,
-            ]
-        ),
-    )
-
-    S3A_SLSTR_02 = (
-        88,
-        0.64500,
-        0.67500,
-        np.array(
-            [
-                0.00868,
-                0.10051,
-                0.54166,
-                0.94638,
-                0.97952,
-                0.99970,
-                0.99593,
-                0.98108,
-                0.98249,
-                0.81191,
-                0.28596,
-                0.03422,
-                0.00557,
-            ]
-        ),
-    )
-
-    S3A_SLSTR_03 = (
-        89,
-        0.85250,
-        0.88500,
-        np.array(
-            [
-                0.01457,
-                0.09982,
-                0.45901,
-                0.94725,
-                0.99882,
-                0.99531,
-                0.97779,
-                0.89514,
-                0.91546,
-                0.92751,
-                0.67702,
-                0.17794,
-                0.02665,
-                0.00552,
-            ]
-        ),
-    )
-
-    S3A_SLSTR_04 = (
-        90,
-        1.36250,
-        1.39000,
-        np.array(
-            [
-                0.08117,
-                0.62916,
-                0.97652,
-                0.96779,
-                0.98766,
-                0.99534,
-                0.99847,
-                0.99996,
-                0.95454,
-                0.51479,
-                0.08519,
-                0.00576,
-            ]
-        ),
-    )
-
-    S3A_SLSTR_05 = (
-        91,
-        1.56500,
-        1.66250,
-        np.array(
-            [
-                0.00951,
-                0.02064,
-                0.04194,
-                0.08240,
-                0.16215,
-                0.30042,
-                0.49672,
-                0.70549,
-                0.85567,
-                0.93327,
-                0.96306,
-                0.97290,
-                0.97634,
-                0.98050,
-                0.98407,
-                0.98816,
-                0.99064,
-                0.99422,
-                0.99715,
-                0.99887,
-                0.99974,
-                0.99874,
-                0.99389,
-                0.98591,
-                0.97221,
-                0.95534,
-                0.93706,
-                0.92338,
-                0.92452,
-                0.93923,
-                0.95034,
-                0.89146,
-                0.68978,
-                0.41600,
-                0.21213,
-                0.10306,
-                0.05085,
-                0.02604,
-                0.01343,
-                0.00755,
-            ]
-        ),
-    )
-
-    S3A_SLSTR_06 = (
-        92,
-        2.21750,
-        2.29750,
-        np.array(
-            [
-                0.01257,
-                0.03348,
-                0.07603,
-                0.15844,
-                0.30026,
-                0.50042,
-                0.71448,
-                0.87789,
-                0.95880,
-                0.97991,
-                0.97956,
-                0.97917,
-                0.98339,
-                0.98979,
-                0.99621,
-                0.99969,
-                0.99941,
-                0.99572,
-                0.99031,
-                0.98586,
-                0.98433,
-                0.98171,
-                0.96554,
-                0.91002,
-                0.78868,
-                0.60765,
-                0.41211,
-                0.25045,
-                0.14086,
-                0.07530,
-                0.03827,
-                0.01809,
-                0.00721,
-            ]
-        ),
-    )
+    S3A_SLSTR_01 = _PredefinedWavelength(87, 0.54000, 0.57000)
+
+    S3A_SLSTR_02 = _PredefinedWavelength(88, 0.64500, 0.67500)
+
+    S3A_SLSTR_03 = _PredefinedWavelength(89, 0.85250, 0.88500)
+
+    S3A_SLSTR_04 = _PredefinedWavelength(90, 1.36250, 1.39000)
+
+    S3A_SLSTR_05 = _PredefinedWavelength(91, 1.56500, 1.66250)
+
+    S3A_SLSTR_06 = _PredefinedWavelength(92, 2.21750, 2.29750)
 
     # Sentinel-2B MSI spectral response functions
     # Taken from https://earth.esa.int/web/sentinel/user-guides/sentinel-2-msi/document-library/-/asset_publisher/Wk0TKajiISaR/content/sentinel-2a-spectral-responses
-    S2B_MSI_01 = (
-        93,
-        0.4110,
-        0.4585,
-        np.array(
-            [
-                6.79779800e-03,
-                5.38819850e-03,
-                7.13011000e-03,
-                5.32861200e-03,
-                6.21707000e-04,
-                4.19444050e-03,
-                2.58671000e-03,
-                8.79308600e-03,
-                1.88722410e-01,
-                7.88710046e-01,
-                8.81448354e-01,
-                9.26045092e-01,
-                9.50410310e-01,
-                9.84288926e-01,
-                9.76368067e-01,
-                9.38960136e-01,
-                8.09016274e-01,
-                2.07646870e-01,
-                8.93513100e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S2B_MSI_02 = (
-        94,
-        0.4380,
-        0.5330,
-        np.array(
-            [
-                0.00189331,
-                0.01708433,
-                0.01544887,
-                0.0138867,
-                0.01450069,
-                0.01344492,
-                0.01471763,
-                0.0430435,
-                0.25226095,
-                0.71496001,
-                0.8320771,
-                0.85144357,
-                0.90569382,
-                0.9338208,
-                0.91662274,
-                0.90050851,
-                0.92085944,
-                0.91341249,
-                0.88735796,
-                0.85194722,
-                0.85792477,
-                0.91177803,
-                0.96940661,
-                0.99966032,
-                0.98416305,
-                0.97523217,
-                0.95355824,
-                0.917184,
-                0.8922514,
-                0.89550827,
-                0.9246363,
-                0.96267905,
-                0.99679122,
-                0.97030435,
-                0.7360636,
-                0.26382961,
-                0.07513881,
-                0.02364449,
-                0.0,
-            ]
-        ),
-    )
-
-    S2B_MSI_03 = (
-        95,
-        0.5360,
-        0.5835,
-        np.array(
-            [
-                0.00184908,
-                0.05892162,
-                0.33349948,
-                0.86269252,
-                0.94917532,
-                0.92057652,
-                0.90085865,
-                0.93279058,
-                0.98347041,
-                0.99597786,
-                0.95115183,
-                0.88000476,
-                0.83920859,
-                0.83301579,
-                0.86656355,
-                0.86381757,
-                0.67746396,
-                0.18777902,
-                0.02572436,
-                0.0,
-            ]
-        ),
-    )
-
-    S2B_MSI_04 = (
-        96,
-        0.6460,
-        0.6860,
-        np.array(
-            [
-                5.09031200e-03,
-                2.29151295e-01,
-                8.10967523e-01,
-                9.23442650e-01,
-                9.02005739e-01,
-                8.99869183e-01,
-                9.06886173e-01,
-                9.34405970e-01,
-                9.66908428e-01,
-                9.95809639e-01,
-                9.94046577e-01,
-                9.63150260e-01,
-                9.25809770e-01,
-                7.68490499e-01,
-                2.76900547e-01,
-                1.86252340e-02,
-                7.44413212e-16,
-            ]
-        ),
-    )
-
-    S2B_MSI_05 = (
-        97,
-        0.6940,
-        0.7140,
-        np.array(
-            [
-                0.01047183,
-                0.38095721,
-                0.96844659,
-                0.99754666,
-                0.9794087,
-                0.95094835,
-                0.89455748,
-                0.34237254,
-                0.00243694,
-            ]
-        ),
-    )
-
-    S2B_MSI_06 = (
-        98,
-        0.7300,
-        0.7500,
-        np.array(
-            [
-                0.01743381,
-                0.58418185,
-                0.91641661,
-                0.93978171,
-                0.97855276,
-                0.99997792,
-                0.81917496,
-                0.05197745,
-                0.0,
-            ]
-        ),
-    )
-
-    S2B_MSI_07 = (
-        99,
-        0.7660,
-        0.7960,
-        np.array(
-            [
-                0.01028203,
-                0.1849904,
-                0.73021678,
-                0.96816857,
-                0.96492559,
-                0.99902331,
-                0.96569621,
-                0.91842469,
-                0.85951719,
-                0.72377841,
-                0.23625194,
-                0.00734482,
-                0.0,
-            ]
-        ),
-    )
-
-    S2B_MSI_08 = (
-        100,
-        0.7740,
-        0.9090,
-        np.array(
-            [
-                3.86696000e-04,
-                2.25160330e-02,
-                8.62638800e-02,
-                3.41768486e-01,
-                8.03109115e-01,
-                9.42316692e-01,
-                9.63880684e-01,
-                9.93998947e-01,
-                9.98257939e-01,
-                9.86097031e-01,
-                9.58222106e-01,
-                9.45610993e-01,
-                9.46461415e-01,
-                9.22310559e-01,
-                8.73037871e-01,
-                8.30374120e-01,
-                8.10955964e-01,
-                7.87625180e-01,
-                7.54167357e-01,
-                7.23279542e-01,
-                7.18941021e-01,
-                7.44267400e-01,
-                7.69900245e-01,
-                7.83440215e-01,
-                7.81644143e-01,
-                7.81572121e-01,
-                7.80064535e-01,
-                7.67703381e-01,
-                7.43324604e-01,
-                7.17699319e-01,
-                6.88575227e-01,
-                6.50641275e-01,
-                6.14005803e-01,
-                5.91537372e-01,
-                5.82889219e-01,
-                5.77470921e-01,
-                5.72399696e-01,
-                5.70158326e-01,
-                5.72213154e-01,
-                5.78703807e-01,
-                5.78302049e-01,
-                5.65806515e-01,
-                5.49385012e-01,
-                5.42215679e-01,
-                5.37997281e-01,
-                5.13924174e-01,
-                4.69610434e-01,
-                4.44484344e-01,
-                4.47532506e-01,
-                3.93848039e-01,
-                2.35014942e-01,
-                1.02922870e-01,
-                3.80060080e-02,
-                1.04894310e-02,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S2B_MSI_8A = (
-        101,
-        0.8480,
-        0.8805,
-        np.array(
-            [
-                1.66175100e-03,
-                5.28325840e-02,
-                3.45506138e-01,
-                8.66965557e-01,
-                9.87241334e-01,
-                9.99376033e-01,
-                9.94482469e-01,
-                9.81491925e-01,
-                9.72818786e-01,
-                9.50032949e-01,
-                7.78588669e-01,
-                2.81014567e-01,
-                3.33933370e-02,
-                8.12020000e-04,
-            ]
-        ),
-    )
-
-    S2B_MSI_09 = (
-        102,
-        0.9300,
-        0.9575,
-        np.array(
-            [
-                0.01212112,
-                0.2550252,
-                0.83734232,
-                0.94936094,
-                0.99744452,
-                0.980285,
-                0.97377663,
-                0.9278809,
-                0.85513588,
-                0.62111363,
-                0.09480081,
-                0.00171671,
-            ]
-        ),
-    )
-
-    S2B_MSI_10 = (
-        103,
-        1.3390,
-        1.4165,
-        np.array(
-            [
-                2.45190000e-05,
-                1.06782500e-04,
-                9.93550000e-05,
-                1.74974500e-04,
-                3.22212000e-04,
-                4.58060500e-04,
-                2.18105000e-03,
-                1.89617750e-02,
-                1.11412066e-01,
-                3.87289252e-01,
-                7.70430827e-01,
-                9.59359012e-01,
-                9.93032255e-01,
-                9.99720196e-01,
-                9.90856204e-01,
-                9.73640319e-01,
-                9.57577366e-01,
-                9.43105961e-01,
-                9.36274454e-01,
-                9.23628129e-01,
-                8.31894981e-01,
-                5.67223531e-01,
-                2.13253720e-01,
-                3.33423315e-02,
-                3.16376500e-03,
-                6.91521500e-04,
-                1.94334000e-04,
-                2.03841500e-04,
-                1.54509000e-04,
-                1.61088500e-04,
-                1.19559000e-04,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S2B_MSI_11 = (
-        104,
-        1.5380,
-        1.6805,
-        np.array(
-            [
-                1.15000000e-05,
-                1.25332000e-04,
-                3.43776000e-04,
-                7.36988500e-04,
-                1.42877600e-03,
-                3.17141100e-03,
-                7.57268400e-03,
-                2.19172390e-02,
-                6.29047140e-02,
-                1.70251784e-01,
-                3.80879812e-01,
-                6.60381371e-01,
-                8.69866550e-01,
-                9.55250846e-01,
-                9.77057349e-01,
-                9.76114190e-01,
-                9.71480798e-01,
-                9.69396227e-01,
-                9.72736269e-01,
-                9.79977731e-01,
-                9.84837133e-01,
-                9.83646395e-01,
-                9.79391949e-01,
-                9.75827865e-01,
-                9.76805245e-01,
-                9.83603737e-01,
-                9.92331977e-01,
-                9.95900604e-01,
-                9.92101664e-01,
-                9.83005073e-01,
-                9.73545660e-01,
-                9.70486171e-01,
-                9.75244492e-01,
-                9.85528272e-01,
-                9.96435703e-01,
-                9.99518223e-01,
-                9.93293536e-01,
-                9.83975876e-01,
-                9.79473331e-01,
-                9.84232683e-01,
-                9.91723341e-01,
-                9.85747311e-01,
-                9.53186779e-01,
-                8.96044076e-01,
-                8.50889881e-01,
-                8.45236530e-01,
-                8.40540222e-01,
-                7.13618196e-01,
-                4.57566037e-01,
-                2.16596874e-01,
-                7.35127680e-02,
-                2.38199245e-02,
-                8.78944000e-03,
-                3.97113050e-03,
-                1.99073900e-03,
-                9.53045500e-04,
-                2.81204000e-04,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S2B_MSI_12 = (
-        105,
-        2.0650,
-        2.3050,
-        np.array(
-            [
-                2.27567000e-04,
-                2.33818100e-03,
-                5.92493500e-03,
-                9.50674450e-03,
-                1.45934790e-02,
-                2.32456505e-02,
-                3.72344570e-02,
-                6.31897490e-02,
-                1.10694417e-01,
-                1.93831191e-01,
-                3.17227795e-01,
-                4.86127891e-01,
-                6.72128213e-01,
-                8.14294745e-01,
-                8.86329697e-01,
-                9.01154288e-01,
-                8.92352598e-01,
-                8.83263626e-01,
-                8.82697820e-01,
-                8.95818268e-01,
-                9.12841006e-01,
-                9.30003885e-01,
-                9.43377038e-01,
-                9.47987900e-01,
-                9.48111791e-01,
-                9.45498813e-01,
-                9.41894052e-01,
-                9.43759006e-01,
-                9.46212496e-01,
-                9.48440897e-01,
-                9.50676414e-01,
-                9.51929392e-01,
-                9.52552047e-01,
-                9.52808031e-01,
-                9.53779111e-01,
-                9.55188146e-01,
-                9.57986198e-01,
-                9.60932208e-01,
-                9.64122014e-01,
-                9.62929248e-01,
-                9.60730243e-01,
-                9.57674768e-01,
-                9.53076144e-01,
-                9.55447935e-01,
-                9.55356546e-01,
-                9.52789244e-01,
-                9.48594073e-01,
-                9.48422211e-01,
-                9.46620434e-01,
-                9.42809458e-01,
-                9.38918576e-01,
-                9.44765225e-01,
-                9.48481875e-01,
-                9.51379486e-01,
-                9.55262594e-01,
-                9.50105202e-01,
-                9.49712169e-01,
-                9.57395090e-01,
-                9.73886163e-01,
-                9.68734909e-01,
-                9.67555279e-01,
-                9.68732559e-01,
-                9.69967732e-01,
-                9.67903993e-01,
-                9.65459532e-01,
-                9.62297699e-01,
-                9.59368085e-01,
-                9.61002221e-01,
-                9.63700810e-01,
-                9.65931017e-01,
-                9.68868150e-01,
-                9.73363783e-01,
-                9.77203216e-01,
-                9.80985309e-01,
-                9.83336508e-01,
-                9.87941136e-01,
-                9.93184480e-01,
-                9.97493542e-01,
-                1.00000000e00,
-                9.93179265e-01,
-                9.68715091e-01,
-                9.15824428e-01,
-                8.31947776e-01,
-                7.09102747e-01,
-                5.64024643e-01,
-                4.25931844e-01,
-                3.09839746e-01,
-                2.18177603e-01,
-                1.49356419e-01,
-                1.04215226e-01,
-                7.40635240e-02,
-                5.28513985e-02,
-                3.79860860e-02,
-                2.70345635e-02,
-                1.38379210e-02,
-                2.64583650e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
+    S2B_MSI_01 = _PredefinedWavelength(93, 0.4110, 0.4585)
+
+    S2B_MSI_02 = _PredefinedWavelength(94, 0.4380, 0.5330)
+
+    S2B_MSI_03 = _PredefinedWavelength(95, 0.5360, 0.5835)
+
+    S2B_MSI_04 = _PredefinedWavelength(96, 0.6460, 0.6860)
+
+    S2B_MSI_05 = _PredefinedWavelength(97, 0.6940, 0.7140)
+
+    S2B_MSI_06 = _PredefinedWavelength(98, 0.7300, 0.7500)
+
+    S2B_MSI_07 = _PredefinedWavelength(99, 0.7660, 0.7960)
+
+    S2B_MSI_08 = _PredefinedWavelength(100, 0.7740, 0.9090)
+
+    S2B_MSI_8A = _PredefinedWavelength(101, 0.8480, 0.8805)
+
+    S2B_MSI_09 = _PredefinedWavelength(102, 0.9300, 0.9575)
+
+    S2B_MSI_10 = _PredefinedWavelength(103, 1.3390, 1.4165)
+
+    S2B_MSI_11 = _PredefinedWavelength(104, 1.5380, 1.6805)
+
+    S2B_MSI_12 = _PredefinedWavelength(105, 2.0650, 2.3050)
 
     # Sentinel-3B OLCI spectral response functions
     # changed to center at the max value of each
     # band rsr from https://sentinel.esa.int/web/sentinel/technical-guides/sentinel-3-olci/olci-instrument/spectral-response-function-data
     # the mean dataset
-    S3B_OLCI_01 = (
-        106,
-        0.3850,
-        0.4125,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                9.34810332e-05,
-                3.01161089e-01,
-                5.79783356e-01,
-                7.28688965e-01,
-                8.90776697e-01,
-                9.53314424e-01,
-                9.97316285e-01,
-                2.06989277e-01,
-                4.47201260e-06,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_02 = (
-        107,
-        0.4000,
-        0.4225,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.19249516e-03,
-                7.79853543e-01,
-                9.87822759e-01,
-                9.98838473e-01,
-                9.87925591e-01,
-                1.65533011e-01,
-                3.38914146e-06,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_03 = (
-        108,
-        0.4300,
-        0.4525,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                9.30282695e-06,
-                2.06052543e-01,
-                9.98428589e-01,
-                9.97182974e-01,
-                9.85843591e-01,
-                7.51246618e-01,
-                1.85549607e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_04 = (
-        109,
-        0.4775,
-        0.5000,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                4.06074021e-05,
-                2.85736497e-01,
-                9.80498411e-01,
-                9.87358384e-01,
-                9.97301845e-01,
-                7.10387496e-01,
-                1.51227169e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_05 = (
-        110,
-        0.4975,
-        0.5200,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                4.63640882e-05,
-                2.88108060e-01,
-                9.70176583e-01,
-                9.82820364e-01,
-                9.96720776e-01,
-                7.03952046e-01,
-                1.49862288e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_06 = (
-        111,
-        0.5475,
-        0.5700,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                5.04591202e-05,
-                3.02121393e-01,
-                9.87815717e-01,
-                9.94139281e-01,
-                9.99052182e-01,
-                6.99925598e-01,
-                1.38906899e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_07 = (
-        112,
-        0.6075,
-        0.6300,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                5.24770401e-05,
-                3.28445148e-01,
-                9.78249177e-01,
-                9.86453480e-01,
-                9.96904960e-01,
-                6.37481108e-01,
-                6.57750246e-04,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_08 = (
-        113,
-        0.6525,
-        0.6750,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.02038317e-04,
-                4.23731626e-01,
-                9.80510445e-01,
-                9.89802816e-01,
-                9.95992727e-01,
-                5.64721221e-01,
-                2.87047474e-04,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_09 = (
-        114,
-        0.6650,
-        0.6850,
-        np.array(
-            [
-                0.00000000e00,
-                1.01088488e-04,
-                4.30582345e-01,
-                9.90586594e-01,
-                9.95627137e-01,
-                5.70430795e-01,
-                2.99212934e-04,
-                0.00000000e00,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_10 = (
-        115,
-        0.6700,
-        0.6900,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                9.20443879e-05,
-                4.24395382e-01,
-                9.93044213e-01,
-                9.96732724e-01,
-                5.87914764e-01,
-                3.33714303e-04,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_11 = (
-        116,
-        0.6950,
-        0.7175,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                2.27527154e-08,
-                1.43013420e-02,
-                9.30039754e-01,
-                9.89869809e-01,
-                9.95153682e-01,
-                9.85467850e-01,
-                6.04404649e-02,
-                4.07944824e-07,
-            ]
-        ),
-    )
-
-    S3B_OLCI_12 = (
-        117,
-        0.7425,
-        0.7625,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                3.32680058e-05,
-                3.35481137e-01,
-                9.96134240e-01,
-                9.95335488e-01,
-                6.74603784e-01,
-                5.81641718e-04,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_13 = (
-        118,
-        0.7550,
-        0.7700,
-        np.array(
-            [
-                0.00000000e00,
-                2.85560325e-05,
-                3.35218844e-01,
-                7.33046075e-01,
-                6.97655972e-04,
-                0.00000000e00,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_14 = (
-        119,
-        0.7550,
-        0.7725,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                2.51718059e-05,
-                3.10743254e-01,
-                9.93217466e-01,
-                7.62547197e-02,
-                6.40188179e-07,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_15 = (
-        120,
-        0.7600,
-        0.7750,
-        np.array(
-            [
-                0.00000000e00,
-                9.44449935e-09,
-                9.67829515e-03,
-                9.72499368e-01,
-                8.17682936e-02,
-                7.17736029e-07,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_16 = (
-        121,
-        0.7650,
-        0.7925,
-        np.array(
-            [
-                0.00000000e00,
-                8.64377579e-09,
-                8.84274122e-03,
-                9.17740240e-01,
-                9.96150751e-01,
-                9.96332905e-01,
-                9.96195066e-01,
-                9.94333040e-01,
-                9.83695296e-01,
-                8.05458528e-02,
-                7.66316013e-07,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_17 = (
-        122,
-        0.8475,
-        0.8800,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                1.47858085e-05,
-                2.54914009e-01,
-                9.99170692e-01,
-                9.92365948e-01,
-                9.84295400e-01,
-                9.75537469e-01,
-                9.62032596e-01,
-                9.47783211e-01,
-                9.33310423e-01,
-                6.88572549e-01,
-                1.08104259e-03,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_18 = (
-        123,
-        0.8700,
-        0.8925,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                5.01495276e-09,
-                6.26933249e-03,
-                9.02104161e-01,
-                9.91985752e-01,
-                9.75609451e-01,
-                9.53379357e-01,
-                1.00137591e-01,
-                1.48780466e-06,
-            ]
-        ),
-    )
-
-    S3B_OLCI_19 = (
-        124,
-        0.8850,
-        0.9075,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                4.91117993e-09,
-                6.14792354e-03,
-                9.01922678e-01,
-                9.90850645e-01,
-                9.72235276e-01,
-                9.44141158e-01,
-                1.00942430e-01,
-                1.52794114e-06,
-            ]
-        ),
-    )
-
-    S3B_OLCI_20 = (
-        125,
-        0.9225,
-        0.9550,
-        np.array(
-            [
-                0.00000000e00,
-                3.42848643e-09,
-                5.17534750e-03,
-                8.95989159e-01,
-                9.82463232e-01,
-                9.47765152e-01,
-                9.13370826e-01,
-                8.80142365e-01,
-                8.52126137e-01,
-                8.28556200e-01,
-                8.01942644e-01,
-                1.01521422e-01,
-                1.74331314e-06,
-                0.00000000e00,
-            ]
-        ),
-    )
-
-    S3B_OLCI_21 = (
-        126,
-        0.9925,
-        1.0450,
-        np.array(
-            [
-                0.00000000e00,
-                0.00000000e00,
-                2.16191906e-03,
-                8.62689484e-01,
-                9.74315053e-01,
-                9.15567438e-01,
-                8.57471704e-01,
-                7.98987260e-01,
-                7.41776209e-01,
-                6.85363224e-01,
-                6.29509263e-01,
-                5.76679778e-01,
-                5.44270496e-01,
-                5.14648842e-01,
-                4.85713953e-01,
-                4.57540874e-01,
-                4.29559156e-01,
-                4.02004281e-01,
-                3.74596536e-01,
-                4.46248175e-02,
-                4.02350000e-07,
-                0.00000000e00,
-            ]
-        ),
-    )
+    S3B_OLCI_01 = _PredefinedWavelength(106, 0.3850, 0.4125)
+
+    S3B_OLCI_02 = _PredefinedWavelength(107, 0.4000, 0.4225)
+
+    S3B_OLCI_03 = _PredefinedWavelength(108, 0.4300, 0.4525)
+
+    S3B_OLCI_04 = _PredefinedWavelength(109, 0.4775, 0.5000)
+
+    S3B_OLCI_05 = _PredefinedWavelength(110, 0.4975, 0.5200)
+
+    S3B_OLCI_06 = _PredefinedWavelength(111, 0.5475, 0.5700)
+
+    S3B_OLCI_07 = _PredefinedWavelength(112, 0.6075, 0.6300)
+
+    S3B_OLCI_08 = _PredefinedWavelength(113, 0.6525, 0.6750)
+
+    S3B_OLCI_09 = _PredefinedWavelength(114, 0.6650, 0.6850)
+
+    S3B_OLCI_10 = _PredefinedWavelength(115, 0.6700, 0.6900)
+
+    S3B_OLCI_11 = _PredefinedWavelength(116, 0.6950, 0.7175)
+
+    S3B_OLCI_12 = _PredefinedWavelength(117, 0.7425, 0.7625)
+
+    S3B_OLCI_13 = _PredefinedWavelength(118, 0.7550, 0.7700)
+
+    S3B_OLCI_14 = _PredefinedWavelength(119, 0.7550, 0.7725)
+
+    S3B_OLCI_15 = _PredefinedWavelength(120, 0.7600, 0.7750)
+
+    S3B_OLCI_16 = _PredefinedWavelength(121, 0.7650, 0.7925)
+
+    S3B_OLCI_17 = _PredefinedWavelength(122, 0.8475, 0.8800)
+
+    S3B_OLCI_18 = _PredefinedWavelength(123, 0.8700, 0.8925)
+
+    S3B_OLCI_19 = _PredefinedWavelength(124, 0.8850, 0.9075)
+
+    S3B_OLCI_20 = _PredefinedWavelength(125, 0.9225, 0.9550)
+
+    S3B_OLCI_21 = _PredefinedWavelength(126, 0.9925, 1.0450)
 
     # Sentinel-3B SLSTR spectral response functions
     # (PREFLIGHT)
     # Code used to create these things in
     # https://github.com/jgomezdans/sentinel_SRF
-    S3B_SLSTR_01 = (
-        114,
-        0.54250,
-        0.57000,
-        np.array(
-            [
-                0.01206,
-                0.27425,
-                0.80178,
-                0.93965,
-                0.95802,
-                0.96983,
-                0.98111,
-                0.93155,
-                0.98239,
-                0.51100,
-                0.12423,
-                0.01377,
-            ]
-        ),
-    )
-
-    S3B_SLSTR_02 = (
-        115,
-        0.645000,
-        0.67500,
-        np.array(
-            [
-                0.00923,
-                0.03648,
-                0.39244,
-                0.98581,
-                0.98523,
-                0.99845,
-                0.98163,
-                0.94989,
-                0.92945,
-                0.88710,
-                0.46271,
-                0.05538,
-                0.00904,
-            ]
-        ),
-    )
-
-    S3B_SLSTR_03 = (
-        116,
-        0.84750,
-        0.887500,
-        np.array(
-            [
-                0.00812,
-                0.00967,
-                0.02361,
-                0.10105,
-                0.58329,
-                0.96260,
-                0.96818,
-                0.94752,
-                0.89536,
-                0.96613,
-                0.98339,
-                0.99422,
-                0.63677,
-                0.12622,
-                0.02013,
-                0.00702,
-                0.00674,
-            ]
-        ),
-    )
-
-    S3B_SLSTR_04 = (
-        117,
-        1.36250,
-        1.39000,
-        np.array(
-            [
-                0.06640,
-                0.55261,
-                0.98999,
-                0.97825,
-                0.99820,
-                0.99424,
-                0.99060,
-                0.99198,
-                0.96408,
-                0.59000,
-                0.11305,
-                0.01122,
-            ]
-        ),
-    )
-
-    S3B_SLSTR_05 = (
-        118,
-        1.56500,
-        1.65750,
-        np.array(
-            [
-                0.01293,
-                0.03096,
-                0.06178,
-                0.12220,
-                0.23370,
-                0.40437,
-                0.61348,
-                0.80127,
-                0.91617,
-                0.97052,
-                0.98583,
-                0.99257,
-                0.99218,
-                0.99289,
-                0.99469,
-                0.99441,
-                0.99995,
-                0.99743,
-                0.99660,
-                0.99717,
-                0.99956,
-                0.99335,
-                0.98563,
-                0.97131,
-                0.95391,
-                0.93399,
-                0.91583,
-                0.90968,
-                0.91672,
-                0.93473,
-                0.92294,
-                0.79910,
-                0.54450,
-                0.29666,
-                0.14590,
-                0.06893,
-                0.03427,
-                0.01641,
-            ]
-        ),
-    )
-
-    S3B_SLSTR_06 = (
-        119,
-        2.21750,
-        2.29250,
-        np.array(
-            [
-                0.01990,
-                0.05259,
-                0.12066,
-                0.25159,
-                0.45970,
-                0.70491,
-                0.89585,
-                0.98337,
-                1.00001,
-                0.99366,
-                0.98682,
-                0.98293,
-                0.98233,
-                0.98105,
-                0.97767,
-                0.97383,
-                0.97063,
-                0.96946,
-                0.97025,
-                0.97293,
-                0.97185,
-                0.94923,
-                0.87905,
-                0.74452,
-                0.56139,
-                0.37587,
-                0.22824,
-                0.12957,
-                0.07039,
-                0.03621,
-                0.01760,
-            ]
-        ),
-    )
+    S3B_SLSTR_01 = _PredefinedWavelength(114, 0.54250, 0.57000)
+
+    S3B_SLSTR_02 = _PredefinedWavelength(115, 0.645000, 0.67500)
+
+    S3B_SLSTR_03 = _PredefinedWavelength(116, 0.84750, 0.887500)
+
+    S3B_SLSTR_04 = _PredefinedWavelength(117, 1.36250, 1.39000)
+
+    S3B_SLSTR_05 = _PredefinedWavelength(118, 1.56500, 1.65750)
+
+    S3B_SLSTR_06 = _PredefinedWavelength(119, 2.21750, 2.29250)
 
     # Redefined MODIS TERRA and AQUA bands to a more accurate spectral
     # sampling actually measured from each satellite
@@ -3326,1502 +720,83 @@ class PredefinedWavelengths:
     # * AQUA: http://oceancolor.gsfc.nasa.gov/DOCS/RSR/HMODISA_RSRs.txt
     # And the code that creates the bands is available here:
     # https://gist.github.com/jgomezdans/0cd6fc1537e5a76e5d3971ad167badd6
-    ACCURATE_MODIS_TERRA_1 = (
-        20,
-        0.61500,
-        0.68000,
-        np.array(
-            [
-                0.02807,
-                0.14457,
-                0.37699,
-                0.63749,
-                0.76990,
-                0.78074,
-                0.78695,
-                0.79042,
-                0.79757,
-                0.81003,
-                0.82398,
-                0.83735,
-                0.85865,
-                0.89204,
-                0.91952,
-                0.96325,
-                0.99380,
-                0.99782,
-                0.95684,
-                0.83402,
-                0.72271,
-                0.57700,
-                0.39879,
-                0.22151,
-                0.09847,
-                0.04423,
-                0.01564,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_2 = (
-        21,
-        0.82000,
-        0.89750,
-        np.array(
-            [
-                0.01046,
-                0.02323,
-                0.04527,
-                0.08294,
-                0.13231,
-                0.20333,
-                0.29725,
-                0.45232,
-                0.64668,
-                0.82575,
-                0.96775,
-                0.99464,
-                0.98512,
-                0.97220,
-                0.96665,
-                0.96893,
-                0.96614,
-                0.98157,
-                0.98110,
-                0.96206,
-                0.91074,
-                0.79448,
-                0.63300,
-                0.40130,
-                0.20118,
-                0.10805,
-                0.05918,
-                0.04157,
-                0.03105,
-                0.02474,
-                0.01912,
-                0.01369,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_3 = (
-        22,
-        0.45250,
-        0.48000,
-        np.array(
-            [
-                0.02715,
-                0.19656,
-                0.66544,
-                0.98628,
-                0.93702,
-                0.85392,
-                0.87385,
-                0.92127,
-                0.85865,
-                0.59029,
-                0.21396,
-                0.02998,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_4 = (
-        23,
-        0.54000,
-        0.56750,
-        np.array(
-            [
-                0.04011,
-                0.24383,
-                0.65195,
-                0.94575,
-                0.99606,
-                0.99064,
-                0.98572,
-                0.97833,
-                0.93210,
-                0.70581,
-                0.31567,
-                0.05180,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_5 = (
-        24,
-        1.21500,
-        1.27000,
-        np.array(
-            [
-                0.01581,
-                0.03020,
-                0.05587,
-                0.10725,
-                0.19486,
-                0.33641,
-                0.50475,
-                0.70053,
-                0.84740,
-                0.94598,
-                0.98540,
-                0.99393,
-                0.97463,
-                0.88957,
-                0.76061,
-                0.56817,
-                0.34327,
-                0.20250,
-                0.10511,
-                0.05389,
-                0.03478,
-                0.01910,
-                0.01206,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_6 = (
-        25,
-        1.59750,
-        1.66000,
-        np.array(
-            [
-                0.01510,
-                0.02596,
-                0.04589,
-                0.08177,
-                0.14737,
-                0.25125,
-                0.39260,
-                0.55170,
-                0.72028,
-                0.88082,
-                0.98416,
-                0.99335,
-                0.97750,
-                0.96290,
-                0.92923,
-                0.86426,
-                0.74879,
-                0.60357,
-                0.45702,
-                0.33580,
-                0.22364,
-                0.11741,
-                0.06227,
-                0.04009,
-                0.02624,
-                0.01373,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_7 = (
-        26,
-        2.06000,
-        2.17500,
-        np.array(
-            [
-                0.01090,
-                0.01563,
-                0.02103,
-                0.03128,
-                0.04292,
-                0.06585,
-                0.09211,
-                0.14750,
-                0.21146,
-                0.31098,
-                0.42048,
-                0.54758,
-                0.67979,
-                0.79133,
-                0.89692,
-                0.94566,
-                0.97822,
-                0.99110,
-                0.99837,
-                0.96789,
-                0.92654,
-                0.89933,
-                0.87611,
-                0.84122,
-                0.80300,
-                0.76182,
-                0.71977,
-                0.68366,
-                0.64921,
-                0.61062,
-                0.57081,
-                0.53225,
-                0.49405,
-                0.44690,
-                0.39718,
-                0.34026,
-                0.28131,
-                0.22290,
-                0.16465,
-                0.12282,
-                0.08566,
-                0.06288,
-                0.04430,
-                0.03179,
-                0.02100,
-                0.01462,
-                0.01036,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_8 = (
-        27,
-        0.40000,
-        0.42250,
-        np.array(
-            [
-                0.01396,
-                0.13170,
-                0.59932,
-                0.67268,
-                0.79013,
-                0.48200,
-                0.89280,
-                0.82045,
-                0.24315,
-                0.03272,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_9 = (
-        28,
-        0.43500,
-        0.45000,
-        np.array(
-            [
-                0.11465,
-                0.52805,
-                0.94626,
-                0.99552,
-                0.91925,
-                0.37027,
-                0.03831,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_10 = (
-        29,
-        0.47750,
-        0.49500,
-        np.array(
-            [
-                0.01416,
-                0.15956,
-                0.66826,
-                0.94806,
-                0.99412,
-                0.95485,
-                0.46874,
-                0.02232,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_11 = (
-        30,
-        0.52000,
-        0.54000,
-        np.array(
-            [
-                0.01480,
-                0.24145,
-                0.76250,
-                0.97399,
-                0.99901,
-                0.90343,
-                0.63643,
-                0.18019,
-                0.01435,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_12 = (
-        31,
-        0.53750,
-        0.55500,
-        np.array(
-            [
-                0.01470,
-                0.17968,
-                0.64797,
-                0.98082,
-                0.99460,
-                0.86391,
-                0.42490,
-                0.04215,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_13 = (
-        32,
-        0.65750,
-        0.67500,
-        np.array(
-            [
-                0.06338,
-                0.37724,
-                0.81862,
-                0.99604,
-                0.88368,
-                0.62629,
-                0.25126,
-                0.01371,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_14 = (
-        33,
-        0.66750,
-        0.68750,
-        np.array(
-            [
-                0.05618,
-                0.27689,
-                0.68142,
-                0.97341,
-                0.98489,
-                0.86696,
-                0.53632,
-                0.14128,
-                0.01578,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_15 = (
-        34,
-        0.73750,
-        0.75500,
-        np.array(
-            [
-                0.04077,
-                0.23050,
-                0.62169,
-                0.94550,
-                0.97978,
-                0.75860,
-                0.35374,
-                0.05302,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_TERRA_16 = (
-        35,
-        0.85250,
-        0.88000,
-        np.array(
-            [
-                0.02770,
-                0.11693,
-                0.34382,
-                0.66672,
-                0.91719,
-                0.99906,
-                0.98123,
-                0.91350,
-                0.70598,
-                0.41804,
-                0.10558,
-                0.02056,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_1 = (
-        36,
-        0.61500,
-        0.68000,
-        np.array(
-            [
-                0.02807,
-                0.14457,
-                0.37699,
-                0.63749,
-                0.76990,
-                0.78074,
-                0.78695,
-                0.79042,
-                0.79757,
-                0.81003,
-                0.82398,
-                0.83735,
-                0.85865,
-                0.89204,
-                0.91952,
-                0.96325,
-                0.99380,
-                0.99782,
-                0.95684,
-                0.83402,
-                0.72271,
-                0.57700,
-                0.39879,
-                0.22151,
-                0.09847,
-                0.04423,
-                0.01564,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_2 = (
-        37,
-        0.82000,
-        0.89750,
-        np.array(
-            [
-                0.01046,
-                0.02323,
-                0.04527,
-                0.08294,
-                0.13231,
-                0.20333,
-                0.29725,
-                0.45232,
-                0.64668,
-                0.82575,
-                0.96775,
-                0.99464,
-                0.98512,
-                0.97220,
-                0.96665,
-                0.96893,
-                0.96614,
-                0.98157,
-                0.98110,
-                0.96206,
-                0.91074,
-                0.79448,
-                0.63300,
-                0.40130,
-                0.20118,
-                0.10805,
-                0.05918,
-                0.04157,
-                0.03105,
-                0.02474,
-                0.01912,
-                0.01369,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_3 = (
-        38,
-        0.45250,
-        0.48000,
-        np.array(
-            [
-                0.02715,
-                0.19656,
-                0.66544,
-                0.98628,
-                0.93702,
-                0.85392,
-                0.87385,
-                0.92127,
-                0.85865,
-                0.59029,
-                0.21396,
-                0.02998,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_4 = (
-        39,
-        0.54000,
-        0.56750,
-        np.array(
-            [
-                0.04011,
-                0.24383,
-                0.65195,
-                0.94575,
-                0.99606,
-                0.99064,
-                0.98572,
-                0.97833,
-                0.93210,
-                0.70581,
-                0.31567,
-                0.05180,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_5 = (
-        40,
-        1.21500,
-        1.27000,
-        np.array(
-            [
-                0.01581,
-                0.03020,
-                0.05587,
-                0.10725,
-                0.19486,
-                0.33641,
-                0.50475,
-                0.70053,
-                0.84740,
-                0.94598,
-                0.98540,
-                0.99393,
-                0.97463,
-                0.88957,
-                0.76061,
-                0.56817,
-                0.34327,
-                0.20250,
-                0.10511,
-                0.05389,
-                0.03478,
-                0.01910,
-                0.01206,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_6 = (
-        41,
-        1.59750,
-        1.66000,
-        np.array(
-            [
-                0.01510,
-                0.02596,
-                0.04589,
-                0.08177,
-                0.14737,
-                0.25125,
-                0.39260,
-                0.55170,
-                0.72028,
-                0.88082,
-                0.98416,
-                0.99335,
-                0.97750,
-                0.96290,
-                0.92923,
-                0.86426,
-                0.74879,
-                0.60357,
-                0.45702,
-                0.33580,
-                0.22364,
-                0.11741,
-                0.06227,
-                0.04009,
-                0.02624,
-                0.01373,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_7 = (
-        42,
-        2.06000,
-        2.17500,
-        np.array(
-            [
-                0.01090,
-                0.01563,
-                0.02103,
-                0.03128,
-                0.04292,
-                0.06585,
-                0.09211,
-                0.14750,
-                0.21146,
-                0.31098,
-                0.42048,
-                0.54758,
-                0.67979,
-                0.79133,
-                0.89692,
-                0.94566,
-                0.97822,
-                0.99110,
-                0.99837,
-                0.96789,
-                0.92654,
-                0.89933,
-                0.87611,
-                0.84122,
-                0.80300,
-                0.76182,
-                0.71977,
-                0.68366,
-                0.64921,
-                0.61062,
-                0.57081,
-                0.53225,
-                0.49405,
-                0.44690,
-                0.39718,
-                0.34026,
-                0.28131,
-                0.22290,
-                0.16465,
-                0.12282,
-                0.08566,
-                0.06288,
-                0.04430,
-                0.03179,
-                0.02100,
-                0.01462,
-                0.01036,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_8 = (
-        43,
-        0.40250,
-        0.4225,
-        np.array(
-            [
-                0.08730698,
-                0.5009796,
-                0.62325783,
-                0.73623119,
-                0.52280358,
-                0.83059659,
-                0.91752085,
-                0.32830619,
-                0.0332021,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_9 = (
-        44,
-        0.43250,
-        0.45000,
-        np.array(
-            [
-                0.01902,
-                0.09698,
-                0.51329,
-                0.92505,
-                0.99995,
-                0.94153,
-                0.39117,
-                0.03671,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_10 = (
-        45,
-        0.47750,
-        0.49500,
-        np.array(
-            [
-                0.01964,
-                0.09723,
-                0.58592,
-                0.96018,
-                0.98957,
-                0.98879,
-                0.59678,
-                0.03983,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_11 = (
-        46,
-        0.52000,
-        0.54000,
-        np.array(
-            [
-                0.01215,
-                0.19041,
-                0.68607,
-                0.98495,
-                0.99800,
-                0.93087,
-                0.70338,
-                0.25414,
-                0.02052,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_12 = (
-        47,
-        0.53750,
-        0.55500,
-        np.array(
-            [
-                0.02111,
-                0.16232,
-                0.57148,
-                0.97131,
-                0.99150,
-                0.87360,
-                0.50867,
-                0.07715,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_13 = (
-        48,
-        0.65750,
-        0.67500,
-        np.array(
-            [
-                0.04175,
-                0.32634,
-                0.79150,
-                0.99988,
-                0.89403,
-                0.68671,
-                0.28090,
-                0.01440,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_14 = (
-        49,
-        0.66750,
-        0.68750,
-        np.array(
-            [
-                0.03422,
-                0.18745,
-                0.58587,
-                0.93366,
-                0.99127,
-                0.93329,
-                0.62790,
-                0.22864,
-                0.02571,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_15 = (
-        50,
-        0.73500,
-        0.75500,
-        np.array(
-            [
-                0.01266,
-                0.02854,
-                0.19037,
-                0.58331,
-                0.92908,
-                0.99234,
-                0.77888,
-                0.37822,
-                0.05551,
-            ]
-        ),
-    )
-
-    ACCURATE_MODIS_AQUA_16 = (
-        51,
-        0.85250,
-        0.88000,
-        np.array(
-            [
-                0.01859,
-                0.08363,
-                0.28236,
-                0.59771,
-                0.87955,
-                0.99942,
-                0.97670,
-                0.94504,
-                0.75962,
-                0.47919,
-                0.14822,
-                0.02755,
-            ]
-        ),
-    )
+    ACCURATE_MODIS_TERRA_1 = _PredefinedWavelength(20, 0.61500, 0.68000)
+
+    ACCURATE_MODIS_TERRA_2 = _PredefinedWavelength(21, 0.82000, 0.89750)
+
+    ACCURATE_MODIS_TERRA_3 = _PredefinedWavelength(22, 0.45250, 0.48000)
+
+    ACCURATE_MODIS_TERRA_4 = _PredefinedWavelength(23, 0.54000, 0.56750)
+
+    ACCURATE_MODIS_TERRA_5 = _PredefinedWavelength(24, 1.21500, 1.27000)
+
+    ACCURATE_MODIS_TERRA_6 = _PredefinedWavelength(25, 1.59750, 1.66000)
+
+    ACCURATE_MODIS_TERRA_7 = _PredefinedWavelength(26, 2.06000, 2.17500)
+
+    ACCURATE_MODIS_TERRA_8 = _PredefinedWavelength(27, 0.40000, 0.42250)
+
+    ACCURATE_MODIS_TERRA_9 = _PredefinedWavelength(28, 0.43500, 0.45000)
+
+    ACCURATE_MODIS_TERRA_10 = _PredefinedWavelength(29, 0.47750, 0.49500)
+
+    ACCURATE_MODIS_TERRA_11 = _PredefinedWavelength(30, 0.52000, 0.54000)
+
+    ACCURATE_MODIS_TERRA_12 = _PredefinedWavelength(31, 0.53750, 0.55500)
+
+    ACCURATE_MODIS_TERRA_13 = _PredefinedWavelength(32, 0.65750, 0.67500)
+
+    ACCURATE_MODIS_TERRA_14 = _PredefinedWavelength(33, 0.66750, 0.68750)
+
+    ACCURATE_MODIS_TERRA_15 = _PredefinedWavelength(34, 0.73750, 0.75500)
+
+    ACCURATE_MODIS_TERRA_16 = _PredefinedWavelength(35, 0.85250, 0.88000)
+
+    ACCURATE_MODIS_AQUA_1 = _PredefinedWavelength(36, 0.61500, 0.68000)
+
+    ACCURATE_MODIS_AQUA_2 = _PredefinedWavelength(37, 0.82000, 0.89750)
+
+    ACCURATE_MODIS_AQUA_3 = _PredefinedWavelength(38, 0.45250, 0.48000)
+
+    ACCURATE_MODIS_AQUA_4 = _PredefinedWavelength(39, 0.54000, 0.56750)
+
+    ACCURATE_MODIS_AQUA_5 = _PredefinedWavelength(40, 1.21500, 1.27000)
+
+    ACCURATE_MODIS_AQUA_6 = _PredefinedWavelength(41, 1.59750, 1.66000)
+
+    ACCURATE_MODIS_AQUA_7 = _PredefinedWavelength(42, 2.06000, 2.17500)
+
+    ACCURATE_MODIS_AQUA_8 = _PredefinedWavelength(43, 0.40250, 0.4225)
+
+    ACCURATE_MODIS_AQUA_9 = _PredefinedWavelength(44, 0.43250, 0.45000)
+
+    ACCURATE_MODIS_AQUA_10 = _PredefinedWavelength(45, 0.47750, 0.49500)
+
+    ACCURATE_MODIS_AQUA_11 = _PredefinedWavelength(46, 0.52000, 0.54000)
+
+    ACCURATE_MODIS_AQUA_12 = _PredefinedWavelength(47, 0.53750, 0.55500)
+
+    ACCURATE_MODIS_AQUA_13 = _PredefinedWavelength(48, 0.65750, 0.67500)
+
+    ACCURATE_MODIS_AQUA_14 = _PredefinedWavelength(49, 0.66750, 0.68750)
+
+    ACCURATE_MODIS_AQUA_15 = _PredefinedWavelength(50, 0.73500, 0.75500)
+
+    ACCURATE_MODIS_AQUA_16 = _PredefinedWavelength(51, 0.85250, 0.88000)
 
     # PROBAV_CAMERA_BAND
-    PROBAV_1_01 = (
-        127,
-        0.43250,
-        0.49000,
-        np.array(
-            [
-                0.00701,
-                0.01403,
-                0.29759,
-                0.76866,
-                0.85090,
-                0.85261,
-                0.86397,
-                0.86315,
-                0.87876,
-                0.89403,
-                0.90585,
-                0.91606,
-                0.86274,
-                0.87280,
-                0.89960,
-                0.92657,
-                0.90944,
-                0.91771,
-                0.92900,
-                0.95977,
-                0.98987,
-                0.93182,
-                0.23845,
-                0.01315,
-            ]
-        ),
-    )
-    PROBAV_2_01 = (
-        128,
-        0.43750,
-        0.49000,
-        np.array(
-            [
-                0.11753,
-                0.68816,
-                0.83312,
-                0.86384,
-                0.85535,
-                0.84936,
-                0.91241,
-                0.94894,
-                0.96350,
-                0.97903,
-                0.93099,
-                0.93834,
-                0.95654,
-                0.98125,
-                0.94097,
-                0.94453,
-                0.96126,
-                0.97506,
-                0.98012,
-                0.97479,
-                0.35092,
-                0.02275,
-            ]
-        ),
-    )
-    PROBAV_3_01 = (
-        129,
-        0.43250,
-        0.49000,
-        np.array(
-            [
-                0.00831,
-                0.01630,
-                0.26908,
-                0.75646,
-                0.84782,
-                0.85869,
-                0.87579,
-                0.87686,
-                0.92334,
-                0.94334,
-                0.97579,
-                0.98704,
-                0.92646,
-                0.93014,
-                0.95685,
-                0.97380,
-                0.94210,
-                0.94585,
-                0.95847,
-                0.97944,
-                0.99017,
-                0.94958,
-                0.26846,
-                0.01759,
-            ]
-        ),
-    )
-    PROBAV_1_02 = (
-        130,
-        0.61250,
-        0.70000,
-        np.array(
-            [
-                0.09219,
-                0.79037,
-                0.93792,
-                0.97300,
-                0.95793,
-                0.94941,
-                0.94262,
-                0.94200,
-                0.94969,
-                0.94499,
-                0.94095,
-                0.88377,
-                0.88352,
-                0.88640,
-                0.90464,
-                0.88917,
-                0.86092,
-                0.85622,
-                0.84943,
-                0.87536,
-                0.92689,
-                0.94288,
-                0.93296,
-                0.90110,
-                0.91734,
-                0.94771,
-                0.97572,
-                0.93463,
-                0.93636,
-                0.94238,
-                0.92302,
-                0.95991,
-                0.99355,
-                0.66343,
-                0.16410,
-                0.02510,
-            ]
-        ),
-    )
-    PROBAV_2_02 = (
-        131,
-        0.61250,
-        0.70250,
-        np.array(
-            [
-                0.05112,
-                0.63546,
-                0.94863,
-                0.99405,
-                0.98435,
-                0.98583,
-                0.97631,
-                0.97432,
-                0.99088,
-                0.99118,
-                0.97510,
-                0.94569,
-                0.92452,
-                0.93961,
-                0.94746,
-                0.92908,
-                0.91461,
-                0.88604,
-                0.88331,
-                0.90463,
-                0.94046,
-                0.96590,
-                0.95591,
-                0.91342,
-                0.91923,
-                0.94040,
-                0.95123,
-                0.94757,
-                0.93538,
-                0.93531,
-                0.92470,
-                0.95749,
-                0.98006,
-                0.65677,
-                0.16783,
-                0.02719,
-                0.00596,
-            ]
-        ),
-    )
-    PROBAV_3_02 = (
-        132,
-        0.61000,
-        0.70250,
-        np.array(
-            [
-                0.00693,
-                0.11182,
-                0.84741,
-                0.95372,
-                0.99692,
-                0.98211,
-                0.98042,
-                0.97529,
-                0.98737,
-                0.98246,
-                0.99340,
-                0.99401,
-                0.94669,
-                0.92033,
-                0.93551,
-                0.95167,
-                0.92947,
-                0.90131,
-                0.89177,
-                0.87599,
-                0.91253,
-                0.94400,
-                0.96551,
-                0.93722,
-                0.91432,
-                0.90637,
-                0.93886,
-                0.95319,
-                0.93674,
-                0.93029,
-                0.92951,
-                0.91037,
-                0.94481,
-                0.97393,
-                0.67624,
-                0.17566,
-                0.02900,
-                0.00671,
-            ]
-        ),
-    )
-    PROBAV_1_03 = (
-        133,
-        0.75750,
-        0.92250,
-        np.array(
-            [
-                0.00745,
-                0.01299,
-                0.02989,
-                0.07570,
-                0.18032,
-                0.38076,
-                0.67196,
-                0.90632,
-                0.99224,
-                0.98506,
-                0.97271,
-                0.96036,
-                0.95169,
-                0.94302,
-                0.93462,
-                0.92623,
-                0.91625,
-                0.90627,
-                0.90337,
-                0.90048,
-                0.89904,
-                0.89761,
-                0.88804,
-                0.87848,
-                0.87390,
-                0.86933,
-                0.86619,
-                0.86305,
-                0.85216,
-                0.84127,
-                0.83236,
-                0.82345,
-                0.81794,
-                0.81244,
-                0.80895,
-                0.80547,
-                0.79105,
-                0.77663,
-                0.76090,
-                0.74517,
-                0.74453,
-                0.74390,
-                0.72234,
-                0.70079,
-                0.68596,
-                0.67113,
-                0.65512,
-                0.63912,
-                0.62617,
-                0.61322,
-                0.60063,
-                0.58805,
-                0.58343,
-                0.57882,
-                0.56859,
-                0.55837,
-                0.53969,
-                0.52101,
-                0.50665,
-                0.49770,
-                0.48863,
-                0.47636,
-                0.42195,
-                0.28948,
-                0.13073,
-                0.04062,
-                0.01252,
-            ]
-        ),
-    )
-    PROBAV_2_03 = (
-        134,
-        0.75750,
-        0.92500,
-        np.array(
-            [
-                0.00675,
-                0.01079,
-                0.02156,
-                0.04730,
-                0.10797,
-                0.23157,
-                0.46667,
-                0.74601,
-                0.94127,
-                1.00000,
-                0.98746,
-                0.97493,
-                0.98095,
-                0.98698,
-                0.97258,
-                0.95819,
-                0.95082,
-                0.94345,
-                0.93537,
-                0.92730,
-                0.91901,
-                0.91072,
-                0.90696,
-                0.90321,
-                0.89724,
-                0.89127,
-                0.88293,
-                0.87458,
-                0.86800,
-                0.86141,
-                0.85505,
-                0.84869,
-                0.83384,
-                0.81899,
-                0.81435,
-                0.80971,
-                0.79835,
-                0.78699,
-                0.78169,
-                0.77639,
-                0.76419,
-                0.75199,
-                0.73214,
-                0.71230,
-                0.69639,
-                0.68048,
-                0.67196,
-                0.66344,
-                0.64948,
-                0.63552,
-                0.62135,
-                0.60718,
-                0.59919,
-                0.59120,
-                0.58136,
-                0.57152,
-                0.55307,
-                0.53462,
-                0.52212,
-                0.50539,
-                0.49683,
-                0.48331,
-                0.45572,
-                0.35616,
-                0.19922,
-                0.07619,
-                0.02540,
-                0.00794,
-            ]
-        ),
-    )
-    PROBAV_3_03 = (
-        135,
-        0.75750,
-        0.92250,
-        np.array(
-            [
-                0.01412,
-                0.02358,
-                0.04875,
-                0.11377,
-                0.24868,
-                0.48046,
-                0.76516,
-                0.95847,
-                0.99996,
-                0.97437,
-                0.96656,
-                0.95875,
-                0.94469,
-                0.93063,
-                0.92043,
-                0.91024,
-                0.90635,
-                0.90246,
-                0.90033,
-                0.89819,
-                0.88361,
-                0.86903,
-                0.86105,
-                0.85306,
-                0.84976,
-                0.84645,
-                0.83716,
-                0.82787,
-                0.82268,
-                0.81750,
-                0.80487,
-                0.79225,
-                0.78843,
-                0.78460,
-                0.78373,
-                0.78285,
-                0.76894,
-                0.75503,
-                0.75029,
-                0.74555,
-                0.73365,
-                0.72175,
-                0.70233,
-                0.68292,
-                0.67326,
-                0.66361,
-                0.65092,
-                0.63823,
-                0.62028,
-                0.60233,
-                0.59043,
-                0.57853,
-                0.57334,
-                0.56815,
-                0.55428,
-                0.54040,
-                0.52628,
-                0.51217,
-                0.49737,
-                0.48644,
-                0.48074,
-                0.46443,
-                0.38751,
-                0.24328,
-                0.09891,
-                0.02944,
-                0.00937,
-            ]
-        ),
-    )
-    PROBAV_1_04 = (
-        136,
-        1.53250,
-        1.67250,
-        np.array(
-            [
-                0.00534,
-                0.00696,
-                0.01016,
-                0.01336,
-                0.01887,
-                0.02438,
-                0.03556,
-                0.04675,
-                0.06724,
-                0.08774,
-                0.12937,
-                0.17099,
-                0.25417,
-                0.33734,
-                0.45779,
-                0.57823,
-                0.69640,
-                0.81458,
-                0.88284,
-                0.95110,
-                0.97094,
-                0.99078,
-                0.99461,
-                0.99845,
-                0.99841,
-                0.99838,
-                0.99286,
-                0.98735,
-                0.97800,
-                0.96866,
-                0.95989,
-                0.95112,
-                0.95260,
-                0.95408,
-                0.96743,
-                0.98078,
-                0.99039,
-                1.00000,
-                0.94894,
-                0.89787,
-                0.76385,
-                0.62983,
-                0.48925,
-                0.34868,
-                0.26464,
-                0.18059,
-                0.13647,
-                0.09235,
-                0.07131,
-                0.05027,
-                0.03929,
-                0.02830,
-                0.02209,
-                0.01588,
-                0.01235,
-                0.00882,
-                0.00660,
-            ]
-        ),
-    )
-    PROBAV_2_04 = (
-        137,
-        1.53250,
-        1.67250,
-        np.array(
-            [
-                0.00509,
-                0.00663,
-                0.00939,
-                0.01215,
-                0.01793,
-                0.02370,
-                0.03610,
-                0.04850,
-                0.07042,
-                0.09233,
-                0.13681,
-                0.18130,
-                0.26779,
-                0.35429,
-                0.47954,
-                0.60479,
-                0.72485,
-                0.84490,
-                0.90797,
-                0.97104,
-                0.98552,
-                1.00000,
-                0.99940,
-                0.99879,
-                0.99606,
-                0.99333,
-                0.98735,
-                0.98138,
-                0.97169,
-                0.96201,
-                0.95450,
-                0.94698,
-                0.94917,
-                0.95135,
-                0.96560,
-                0.97984,
-                0.98773,
-                0.99562,
-                0.93668,
-                0.87774,
-                0.73997,
-                0.60221,
-                0.46463,
-                0.32705,
-                0.24772,
-                0.16839,
-                0.12672,
-                0.08505,
-                0.06463,
-                0.04421,
-                0.03413,
-                0.02405,
-                0.01846,
-                0.01287,
-                0.01005,
-                0.00724,
-                0.00559,
-            ]
-        ),
-    )
-    PROBAV_3_04 = (
-        138,
-        1.53750,
-        1.66750,
-        np.array(
-            [
-                0.00743,
-                0.01027,
-                0.01657,
-                0.02287,
-                0.03624,
-                0.04961,
-                0.07428,
-                0.09896,
-                0.14959,
-                0.20021,
-                0.29657,
-                0.39293,
-                0.52013,
-                0.64734,
-                0.75301,
-                0.85867,
-                0.90658,
-                0.95449,
-                0.96447,
-                0.97445,
-                0.97526,
-                0.97606,
-                0.97496,
-                0.97385,
-                0.96927,
-                0.96469,
-                0.95776,
-                0.95082,
-                0.94890,
-                0.94698,
-                0.95556,
-                0.96413,
-                0.98207,
-                1.00000,
-                0.99839,
-                0.99678,
-                0.91467,
-                0.83256,
-                0.68482,
-                0.53707,
-                0.41053,
-                0.28399,
-                0.21417,
-                0.14435,
-                0.10815,
-                0.07194,
-                0.05424,
-                0.03654,
-                0.02704,
-                0.01755,
-                0.01287,
-                0.00819,
-                0.00619,
-            ]
-        ),
-    )
+    PROBAV_1_01 = _PredefinedWavelength(127, 0.43250, 0.49000)
+    PROBAV_2_01 = _PredefinedWavelength(128, 0.43750, 0.49000)
+    PROBAV_3_01 = _PredefinedWavelength(129, 0.43250, 0.49000)
+    PROBAV_1_02 = _PredefinedWavelength(130, 0.61250, 0.70000)
+    PROBAV_2_02 = _PredefinedWavelength(131, 0.61250, 0.70250)
+    PROBAV_3_02 = _PredefinedWavelength(132, 0.61000, 0.70250)
+    PROBAV_1_03 = _PredefinedWavelength(133, 0.75750, 0.92250)
+    PROBAV_2_03 = _PredefinedWavelength(134, 0.75750, 0.92500)
+    PROBAV_3_03 = _PredefinedWavelength(135, 0.75750, 0.92250)
+    PROBAV_1_04 = _PredefinedWavelength(136, 1.53250, 1.67250)
+    PROBAV_2_04 = _PredefinedWavelength(137, 1.53250, 1.67250)
+    PROBAV_3_04 = _PredefinedWavelength(138, 1.53750, 1.66750)
 
     # All of the original predefined wavelengths from 6S
     # CONSTANT_NAME = (ID for Constant, Start Wavelength, End Wavelength)
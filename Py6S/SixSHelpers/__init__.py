@@ -20,7 +20,16 @@
 from .aeronet import Aeronet
 from .all_angles import Angles
 from .all_wavelengths import Wavelengths
+from .lut import LookupTable
 from .radiosonde import Radiosonde
-from .spectra import Spectra
+from .spectra import Spectra, SpectralLibrary
 
-__all__ = ["Angles", "Wavelengths", "Radiosonde", "Aeronet", "Spectra"]
+__all__ = [
+    "Angles",
+    "Wavelengths",
+    "Radiosonde",
+    "Aeronet",
+    "Spectra",
+    "SpectralLibrary",
+    "LookupTable",
+]
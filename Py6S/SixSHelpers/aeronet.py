@@ -15,15 +15,55 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
+import hashlib
+import os
+import tempfile
+import threading
 import warnings
+import zipfile
+from datetime import timezone
 
 import dateutil.parser
 import numpy as np
-from scipy.interpolate import interp1d
 
 from ..Params import AeroProfile
 from ..sixs_exceptions import ParameterError
 
+# The 6S wavelengths at which the refractive indices of a sun photometer distribution are given
+_SIXS_WAVELENGTHS = np.array(
+    [
+        0.350,
+        0.400,
+        0.412,
+        0.443,
+        0.470,
+        0.488,
+        0.515,
+        0.550,
+        0.590,
+        0.633,
+        0.670,
+        0.694,
+        0.760,
+        0.860,
+        1.240,
+        1.536,
+        1.650,
+        1.950,
+        2.250,
+        3.750,
+    ]
+)
+
+# The parsed data of the most recently loaded AERONET files, keyed on the path, size and modification time of the file
+_PARSED_FILES_SIZE = 16
+_parsed_files = collections.OrderedDict()
+_parsed_files_lock = threading.Lock()
+
+# Changed whenever the format of the on-disk cache of parsed files changes
+_CACHE_VERSION = 1
+
 
 class Aeronet:
 
@@ -69,6 +109,10 @@ class Aeronet:
 
         The function will return ``s`` with the ``aero_profile`` and ``aot550`` fields filled in from the AERONET data.
 
+        The file is only parsed the first time it is used (see :meth:`load_aeronet_data`), so calling this function
+        again for other times is fast. To find the AERONET data for many times at once, use :meth:`load_aeronet_data`
+        and :meth:`AeronetData.match`.
+
         Notes:
 
         Beware, this function makes a number of assumptions and performs a number of possibly-inaccurate steps.
@@ -83,6 +127,75 @@ class Aeronet:
         from 550nm. In future versions this code will interpolate the AOT at 550nm using the Angstrom coefficent.
 
         """
+        data = cls.load_aeronet_data(filename)
+        aot550, aero_profiles = data.match([time])
+
+        s.aot550 = aot550[0]
+        s.aero_profile = aero_profiles[0]
+
+        return s
+
+    @classmethod
+    def load_aeronet_data(cls, filename, cache_dir=None):
+        """Loads an AERONET data file, so that the AOT and aerosol profile can be found for many times at once with
+        :meth:`AeronetData.match`.
+
+        The file must be of the type described for :meth:`import_aeronet_data`. It is only parsed the first time it is
+        loaded: the parsed data is kept in memory (for the most recently loaded files) and, if ``cache_dir`` is given,
+        stored on disk as uncompressed numpy arrays, which can be loaded much faster than the file can be parsed by
+        later Python sessions. The cached data is keyed on the path, size and modification time of the file, so is
+        parsed again if the file changes.
+
+        Example usage::
+
+          data = SixSHelpers.Aeronet.load_aeronet_data("070101_101231_Marambio.dubovik", cache_dir="aeronet_cache")
+          aot550, aero_profiles = data.match(["2008-02-22 12:00", "2008-02-23 16:30"])
+
+        Arguments:
+
+        * ``filename`` -- The filename of the AERONET file
+        * ``cache_dir`` -- (Optional) A directory to store the parsed data in
+
+        Return value:
+
+        An :class:`AeronetData` instance
+
+        """
+        try:
+            st = os.stat(filename)
+        except OSError:
+            raise ParameterError(
+                "AERONET file",
+                "Error reading AERONET file - does it exist and contain data?",
+            )
+
+        identity = "%s:%d:%d" % (os.path.abspath(filename), st.st_size, st.st_mtime_ns)
+
+        with _parsed_files_lock:
+            if identity in _parsed_files:
+                _parsed_files.move_to_end(identity)
+                return _parsed_files[identity]
+
+        data = None
+        if cache_dir is not None:
+            key = hashlib.sha256(("%d:%s" % (_CACHE_VERSION, identity)).encode("utf-8")).hexdigest()
+            cache_path = os.path.join(cache_dir, key + ".npz")
+            data = AeronetData._load(cache_path)
+
+        if data is None:
+            data = cls._parse(filename)
+            if cache_dir is not None:
+                data._save(cache_path)
+
+        with _parsed_files_lock:
+            _parsed_files[identity] = data
+            while len(_parsed_files) > _PARSED_FILES_SIZE:
+                _parsed_files.popitem(last=False)
+
+        return data
+
+    @classmethod
+    def _parse(cls, filename):
         try:
             import pandas
         except ImportError:
@@ -99,94 +212,67 @@ class Aeronet:
                 "Error reading AERONET file - does it exist and contain data?",
             )
 
-        # Parse the dates/times properly and set them up as the index
-        df["Date(dd-mm-yyyy)"] = df["Date(dd-mm-yyyy)"].apply(cls._to_iso_date)
-        df["timestamp"] = df.apply(
-            lambda s: pandas.to_datetime(s["Date(dd-mm-yyyy)"] + " " + s["Time(hh:mm:ss)"]),
-            axis=1,
-        )
-        df.index = pandas.DatetimeIndex(df.timestamp)
+        # The date is, bizarrely, given as dd:mm:yyyy
+        timestamps = pandas.to_datetime(
+            df["Date(dd-mm-yyyy)"] + " " + df["Time(hh:mm:ss)"], format="%d:%m:%Y %H:%M:%S"
+        ).to_numpy(dtype="datetime64[ns]")
 
-        given_time = dateutil.parser.parse(time, dayfirst=True)
-
-        df["timediffs"] = np.abs(df.timestamp - given_time).astype("timedelta64[ns]")
-
-        # Get the AOT data at the closest time that has AOT
-        # (may be closer to the given_time than the closest
-        # time that has full aerosol model information)
-        aot = cls._get_aot(df)
-        # print("AOT = %f" % aot)
+        aot_times, aot_values, aot_wavelength = cls._get_aot(df, timestamps)
 
         refr_ind, refi_ind, wvs, radii_ind, radii = cls._get_model_columns(df)
 
-        # Get the indices we're interested in from the main df
-        inds = refr_ind + refi_ind + radii_ind + [len(df.columns) - 1]
+        # Only use rows which have a full set of data for the aerosol model
+        model = df.iloc[:, refr_ind + refi_ind + radii_ind].to_numpy(dtype=np.float64)
+        rows = ~np.isnan(model).any(axis=1)
 
-        # and put them into a smaller df for just the aerosol-model-related components
-        model_df = df.iloc[:, inds]
-        # Get rid of rows which don't have a full set of data
-        model_df = model_df.dropna(axis=0, how="any")
-
-        if model_df.shape[0] == 0:
+        if not rows.any():
             raise ValueError("No non-NaN data for aerosol model available in AERONET file.")
 
-        # And get the closest to the given time
-        rowind = model_df.timediffs.idxmin()
-
-        # Extract this row as a series
-        ser = model_df.loc[rowind]
-        # Get the new relevant indices for this smaller df
-        refr_ind, refi_ind, wvs, radii_ind, radii = cls._get_model_columns(model_df)
+        model = model[rows]
+        refr = model[:, : len(refr_ind)]
+        refi = model[:, len(refr_ind) : len(refr_ind) + len(refi_ind)]
+        dvdlogr = model[:, len(refr_ind) + len(refi_ind) :]
 
+        # The real and imaginary parts of the refractive index are interpolated to the 6S wavelengths from the
+        # wavelengths given in the AERONET file, for every row at once. Outside the range of the AERONET
+        # wavelengths the values are extrapolated as the values at the nearest 6S wavelength inside the range.
         wvs = np.array(wvs) / 1000.0
+        order = np.argsort(wvs)
+        wvs = wvs[order]
 
-        # Interpolate both the real and imag parts of the refractive index
-        # at the 6S wavelengths from the wavelengths given in the AERONET file
-        sixs_wavelengths = [
-            0.350,
-            0.400,
-            0.412,
-            0.443,
-            0.470,
-            0.488,
-            0.515,
-            0.550,
-            0.590,
-            0.633,
-            0.670,
-            0.694,
-            0.760,
-            0.860,
-            1.240,
-            1.536,
-            1.650,
-            1.950,
-            2.250,
-            3.750,
-        ]
-
-        refr_values = ser[refr_ind]
-        f_interp_real = interp1d(wvs, refr_values, bounds_error=False)
-        final_refr = f_interp_real(sixs_wavelengths)
-        final_refr = pandas.Series(final_refr)
-        final_refr = final_refr.fillna(method="pad")
-        final_refr = final_refr.fillna(method="bfill")
-
-        refi_values = ser[refi_ind]
-        f_interp_imag = interp1d(wvs, refi_values, bounds_error=False)
-        final_refi = f_interp_imag(sixs_wavelengths)
-        final_refi = pandas.Series(final_refi)
-        final_refi = final_refi.fillna(method="pad")
-        final_refi = final_refi.fillna(method="bfill")
-
-        dvdlogr = ser[radii_ind]
-
-        s.aot550 = aot
-        s.aero_profile = AeroProfile.SunPhotometerDistribution(
-            radii, dvdlogr, final_refr, final_refi
-        )
+        if len(wvs) < 2:
+            raise ParameterError(
+                "AERONET file",
+                "The AERONET file must contain refractive indices at two or more wavelengths",
+            )
 
-        return s
+        inside = np.flatnonzero((_SIXS_WAVELENGTHS >= wvs[0]) & (_SIXS_WAVELENGTHS <= wvs[-1]))
+        if len(inside) == 0:
+            raise ParameterError(
+                "AERONET file",
+                "None of the wavelengths used by 6S are within the range of the wavelengths of the "
+                "refractive indices in the AERONET file",
+            )
+
+        x = _SIXS_WAVELENGTHS[np.clip(np.arange(len(_SIXS_WAVELENGTHS)), inside[0], inside[-1])]
+        hi = np.clip(np.searchsorted(wvs, x), 1, len(wvs) - 1)
+        lo = hi - 1
+
+        def interpolate(values):
+            values = values[:, order]
+            slope = (values[:, hi] - values[:, lo]) / (wvs[hi] - wvs[lo])
+            return slope * (x - wvs[lo]) + values[:, lo]
+
+        return AeronetData(
+            aot_times,
+            aot_values,
+            aot_wavelength,
+            timestamps[rows],
+            np.array(radii),
+            dvdlogr,
+            interpolate(refr),
+            interpolate(refi),
+        )
 
     @classmethod
     def _get_model_columns(cls, df):
@@ -214,55 +300,185 @@ class Aeronet:
         return refr_ind, refi_ind, wvs, radii_ind, radii
 
     @classmethod
-    def _to_iso_date(cls, s):
-        """Converts the date which is, bizarrely, given as dd:mm:yyyy to the ISO standard
-        of yyyy-mm-dd."""
-        spl = s.split(":")
-        spl.reverse()
-
-        return "-".join(spl)
-
-    @classmethod
-    def _get_aot(cls, df):
-        """Gets the AOT data from the AERONET dataset, choosing the AOT at the closest time
-        to the time requested, and choosing the AOT measurement at the wavelength closest
-        to 550nm."""
-        wvs = []
-        inds = []
-
-        for i, col in enumerate(df.columns):
-            if "AOT_" in col:
-                inds.append(i)
-
-        inds.append(len(df.columns) - 1)
-        inds = np.array(inds)
-
-        # Remove the columns for AOT wavelengths with no data
-        aot_df = df.iloc[:, inds]
-        aot_df = aot_df.dropna(axis=1, how="all")
-        aot_df = aot_df.dropna(axis=0, how="any")
+    def _get_aot(cls, df, timestamps):
+        """Gets the AOT data from the AERONET dataset, choosing the AOT measurement at the wavelength closest
+        to 550nm, and returns the times with AOT data, the AOTs at those times and the wavelength.
+        """
+        columns = [col for col in df.columns if "AOT_" in col]
+        aot = df[columns].to_numpy(dtype=np.float64)
+
+        # Remove the columns for AOT wavelengths with no data, and then the times without data
+        # for all of the remaining wavelengths
+        has_data = ~np.isnan(aot).all(axis=0)
+        aot = aot[:, has_data]
+        rows = ~np.isnan(aot).any(axis=1)
+
+        if not has_data.any() or not rows.any():
+            raise ValueError("No non-NaN AOT data available in AERONET file.")
+
+        wvs = np.array([int(col.replace("AOT_", "")) for col in columns])[has_data]
+        aot_col_index = np.abs(wvs - 550).argmin()
+
+        return timestamps[rows], aot[rows, aot_col_index], int(wvs[aot_col_index])
+
+
+class AeronetData(object):
+    """AERONET data loaded by :meth:`Aeronet.load_aeronet_data`, from which the AOT and aerosol profile closest in time
+    to many times can be found at once with :meth:`match`.
+
+    Attributes:
+
+    * ``aot_times`` -- A ``datetime64`` array of the times with AOT measurements
+    * ``aot_values`` -- The AOT measured at each of these times
+    * ``aot_wavelength`` -- The wavelength of the AOT measurements (in nm), which is the wavelength closest to 550nm
+      with measurements in the file
+    * ``model_times`` -- A ``datetime64`` array of the times with a full set of aerosol model data
+    * ``radii`` -- The radii of the particle size distribution (microns)
+    * ``dvdlogr`` -- A 2D array of the dV/d(logr) values for each radius (columns) at each time (rows)
+    * ``refr_real``, ``refr_imag`` -- 2D arrays of the real and imaginary parts of the refractive index at each of the
+      20 wavelengths used by 6S (columns), at each time (rows)
+
+    """
+
+    def __init__(
+        self,
+        aot_times,
+        aot_values,
+        aot_wavelength,
+        model_times,
+        radii,
+        dvdlogr,
+        refr_real,
+        refr_imag,
+    ):
+        # Sorted by time (keeping the order of the file for equal times), so that the closest times can be found
+        # with a binary search
+        order = np.argsort(aot_times, kind="stable")
+        self.aot_times = aot_times[order]
+        self.aot_values = aot_values[order]
+        self.aot_wavelength = aot_wavelength
+
+        order = np.argsort(model_times, kind="stable")
+        self.model_times = model_times[order]
+        self.radii = radii
+        self.dvdlogr = dvdlogr[order]
+        self.refr_real = refr_real[order]
+        self.refr_imag = refr_imag[order]
+
+        self._aero_profiles = {}
+
+    def match(self, times):
+        """Finds the AOT and aerosol profile closest in time to each of the given times.
+
+        The AOT and the aerosol profile are found separately, so the AOT may come from a measurement closer to the
+        time than the closest full set of aerosol model data (as these are only available from the less frequent
+        almucantar retrievals).
 
-        wvs = []
-        inds = []
-        for i, col in enumerate(aot_df.columns):
-            if "AOT_" in col:
-                wvs.append(int(col.replace("AOT_", "")))
-                inds.append(i)
+        Arguments:
 
-        wvs = np.array(wvs)
-        inds = np.array(inds)
+        * ``times`` -- A list of times, each given as a string in almost any format (as for
+          :meth:`Aeronet.import_aeronet_data`) or a ``datetime``, or a ``datetime64`` array. Times with a timezone
+          are converted to UTC, and times without one are assumed to be in UTC, as in the AERONET file.
 
-        wv_diffs = np.abs(wvs - 550)
+        Return value:
 
-        aot_col_index = wv_diffs.argmin()
+        A tuple containing an array of the AOTs, which can be set as ``s.aot550``, and a list of the aerosol profiles,
+        which can be set as ``s.aero_profile``.
 
-        if wv_diffs[aot_col_index] > 70:
+        """
+        if abs(self.aot_wavelength - 550) > 70:
             warnings.warn(
                 "Using AOT measured more than 70nm away from 550nm as nothing closer available - could cause inaccurate results."
             )
 
-        rowind = aot_df.timediffs.idxmin()
-
-        aot = aot_df.loc[rowind, aot_df.columns[aot_col_index]]
+        times = _to_datetime64(times)
+
+        aot550 = self.aot_values[_closest(self.aot_times, times)]
+
+        rows = _closest(self.model_times, times)
+        aero_profiles = []
+        for row in rows.tolist():
+            # Many times often match the same row, so each profile is only created once
+            if row not in self._aero_profiles:
+                self._aero_profiles[row] = AeroProfile.SunPhotometerDistribution(
+                    self.radii, self.dvdlogr[row], self.refr_real[row], self.refr_imag[row]
+                )
+            aero_profiles.append(self._aero_profiles[row])
+
+        return aot550, aero_profiles
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_aero_profiles"] = {}
+        return state
+
+    def _save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file and then rename it, so that other processes never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                aot_times=self.aot_times,
+                aot_values=self.aot_values,
+                aot_wavelength=self.aot_wavelength,
+                model_times=self.model_times,
+                radii=self.radii,
+                dvdlogr=self.dvdlogr,
+                refr_real=self.refr_real,
+                refr_imag=self.refr_imag,
+            )
+        os.replace(tmp_path, path)
 
-        return aot
+    @classmethod
+    def _load(cls, path):
+        try:
+            with np.load(path) as f:
+                return cls(
+                    f["aot_times"],
+                    f["aot_values"],
+                    int(f["aot_wavelength"]),
+                    f["model_times"],
+                    f["radii"],
+                    f["dvdlogr"],
+                    f["refr_real"],
+                    f["refr_imag"],
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # A corrupt file (eg. from a crash while writing), so parse the AERONET file again
+            return None
+
+
+def _to_datetime64(times):
+    times = np.asarray(times).ravel()
+
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype("datetime64[ns]")
+
+    result = np.empty(len(times), dtype="datetime64[ns]")
+    for i, time in enumerate(times):
+        if isinstance(time, str):
+            time = dateutil.parser.parse(time, dayfirst=True)
+
+        if getattr(time, "tzinfo", None) is not None:
+            time = time.astimezone(timezone.utc).replace(tzinfo=None)
+
+        result[i] = np.datetime64(time, "ns")
+
+    return result
+
+
+def _closest(sorted_times, times):
+    """Returns the indices of the times in ``sorted_times`` closest to each of ``times``, choosing the earlier
+    time when two are equally close."""
+    if len(sorted_times) == 1:
+        return np.zeros(len(times), dtype=np.intp)
+
+    right = np.clip(np.searchsorted(sorted_times, times), 1, len(sorted_times) - 1)
+    left = right - 1
+
+    use_left = (times - sorted_times[left]) <= (sorted_times[right] - times)
+    return np.where(use_left, left, right)
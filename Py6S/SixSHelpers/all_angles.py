@@ -15,18 +15,32 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
+import functools
 import itertools
-from multiprocessing.dummy import Pool
 
 import numpy as np
 
+from ..outputs import OutputsBatch
+from ..snapshot import ParameterSnapshot
 from ..sixs_exceptions import ParameterError
+from .executors import gather_async, get_executor, map_on_executor
 
 
 class Angles:
     @classmethod
-    def run360(cls, s, solar_or_view, na=36, nz=10, output_name=None, n=None):
+    def run360(
+        cls,
+        s,
+        solar_or_view,
+        na=36,
+        nz=10,
+        output_name=None,
+        n=None,
+        batch=False,
+        executor=None,
+        timeout=None,
+        errors="raise",
+    ):
         """Runs Py6S for lots of angles to produce a polar contour plot.
 
         The calls to 6S for each angle will be run in parallel, making this function far faster than simply
@@ -40,6 +54,14 @@ class Angles:
         * ``na`` -- (Optional) The number of azimuth angles to iterate over to generate the data for the plot (defaults to 36, giving data every 10 degrees)
         * ``nz`` -- (Optional) The number of zenith angles to iterate over to generate the data for the plot (defaults to 10, giving data every 10 degrees)
         * ``n`` -- (Optional) The number of threads to run in parallel. This defaults to the number of CPU cores in your system, and is unlikely to need changing.
+        * ``batch`` -- (Optional) If ``output_name`` is not set, return the results as a single :class:`.OutputsBatch` storing each output as
+          an array, rather than as an array of :class:`.Outputs` instances (default=False)
+        * ``executor`` -- (Optional) Where to run the simulations: ``'thread'`` (the default) for a pool of threads, ``'process'`` for a pool of
+          processes, or an existing :class:`concurrent.futures.Executor` instance such as a :class:`.WorkerPool` (which will be left running afterwards
+          so it can be re-used)
+        * ``timeout`` -- (Optional) The maximum time, in seconds, for all of the simulations to finish
+        * ``errors`` -- (Optional) Set to ``'return'`` to return the exception raised by each simulation which fails in place of its result, rather than
+          raising the first one (default='raise'). See :meth:`.Wavelengths.run_wavelengths`.
 
         For example::
 
@@ -55,44 +77,101 @@ class Angles:
         azimuths = np.linspace(0, 360, na)
         zeniths = np.linspace(0, 89, nz)
 
-        def f(args):
-            azimuth, zenith = args
-            s.outputs = None
-            a = copy.deepcopy(s)
-
-            if solar_or_view == "view":
-                a.geometry.view_a = azimuth
-                a.geometry.view_z = zenith
-            elif solar_or_view == "solar":
-                a.geometry.solar_a = azimuth
-                a.geometry.solar_z = zenith
-            else:
-                raise ParameterError(
-                    "all_angles",
-                    "You must choose to vary either the solar or view angle.",
-                )
+        if solar_or_view not in ("solar", "view"):
+            raise ParameterError(
+                "all_angles",
+                "You must choose to vary either the solar or view angle.",
+            )
 
-            a.run()
+        f = functools.partial(_run_angle, ParameterSnapshot(s), solar_or_view, output_name)
 
-            if output_name is None:
-                return a.outputs
-            else:
-                return getattr(a.outputs, output_name)
+        print("Running for many angles - this may take a long time")
+        results = map_on_executor(
+            f, itertools.product(azimuths, zeniths), executor, n, timeout, errors
+        )
 
-        # Run the map
-        if n is None:
-            pool = Pool()
-        else:
-            pool = Pool(n)
+        results = _angle_results(results, output_name, batch)
+
+        return (results, azimuths, zeniths, s.geometry.solar_a, s.geometry.solar_z)
+
+    @classmethod
+    def adaptive360(
+        cls,
+        s,
+        solar_or_view,
+        output_name,
+        na=73,
+        nz=90,
+        initial_na=13,
+        initial_nz=7,
+        tolerance=None,
+        n=None,
+        executor=None,
+    ):
+        """Runs Py6S for a grid of angles to produce a polar contour plot, as for :meth:`run360`, but only simulates the angles
+        needed to interpolate the output over the grid accurately.
+
+        The grid is first simulated at ``initial_na`` azimuths and ``initial_nz`` zeniths. Each cell of this coarse grid is then
+        checked by simulating the angles in the middle of its edges and at its centre: if these differ from the bilinear
+        interpolation of the corners of the cell by more than ``tolerance``, the cell is split into four and each of those is
+        checked in the same way. This continues until every cell passes (or can't be split any further), so many angles are only
+        simulated where the output changes sharply - such as near the hotspot or the sun glint - and the rest of the grid is
+        interpolated linearly from the simulated angles.
+
+        Each round of checks is run in parallel, as for :meth:`run360`.
+
+        Arguments:
+
+        * ``s``, ``solar_or_view`` -- As for :meth:`run360`
+        * ``output_name`` -- The name of the output to simulate, for example ``pixel_reflectance``
+        * ``na``, ``nz`` -- (Optional) The number of azimuth and zenith angles in the grid that is returned (defaults to 73 and 90, giving
+          data every 5 degrees of azimuth and every degree of zenith)
+        * ``initial_na``, ``initial_nz`` -- (Optional) The number of azimuth and zenith angles which are simulated first (defaults to 13 and 7)
+        * ``tolerance`` -- (Optional) The largest difference between the simulated output and the interpolated output which is
+          accepted without splitting a cell, in the units of the output. This defaults to 1% of the range of the output over the
+          angles simulated first.
+        * ``n``, ``executor`` -- As for :meth:`run360`
+
+        Return value:
+
+        The same as :meth:`run360` with ``output_name`` set, so it can be plotted with :meth:`plot360`.
+
+        For example::
+
+          data = SixSHelpers.Angles.adaptive360(s, 'view', 'pixel_reflectance')
+          SixSHelpers.Angles.plot360(data)
+        """
+        if solar_or_view not in ("solar", "view"):
+            raise ParameterError(
+                "all_angles",
+                "You must choose to vary either the solar or view angle.",
+            )
+
+        if not (2 <= initial_na <= na and 2 <= initial_nz <= nz):
+            raise ParameterError(
+                "initial_na",
+                "There must be at least two initial azimuths and zeniths, and no more than na and nz",
+            )
+
+        azimuths = np.linspace(0, 360, na)
+        zeniths = np.linspace(0, 89, nz)
+
+        f = functools.partial(_run_angle, ParameterSnapshot(s), solar_or_view, output_name)
+        pool, owned = get_executor(executor, n)
+
+        def simulate(indices):
+            return map_on_executor(f, [(azimuths[i], zeniths[j]) for i, j in indices], pool)
 
         print("Running for many angles - this may take a long time")
-        results = pool.map(f, itertools.product(azimuths, zeniths))
-        pool.close()
-        pool.join()
+        try:
+            values, simulated = _adaptive_grid(simulate, na, nz, initial_na, initial_nz, tolerance)
+        finally:
+            if owned:
+                pool.shutdown()
 
-        results = np.array(results)
+        print("Simulated %d of the %d angles" % (simulated, na * nz))
 
-        return (results, azimuths, zeniths, s.geometry.solar_a, s.geometry.solar_z)
+        return (values.ravel(), azimuths, zeniths, s.geometry.solar_a, s.geometry.solar_z)
 
     @classmethod
     def plot360(cls, data, output_name=None, show_sun=True, **kwargs):
@@ -112,7 +191,7 @@ class Angles:
 
         results, azimuths, zeniths, sa, sz = data
 
-        if not isinstance(results[0], float):
+        if isinstance(results, OutputsBatch) or not isinstance(results[0], float):
             # The results are not floats, so a float must be extracted from the output
             if output_name is None:
                 raise ParameterError(
@@ -182,14 +261,18 @@ class Angles:
     def extract_output(cls, results, output_name):
         """Extracts data for one particular SixS output from a list of SixS.Outputs instances.
 
-        Basically just a wrapper around a list comprehension.
+        Basically just a wrapper around a list comprehension - or, for an :class:`.OutputsBatch`, a lookup of the
+        column storing that output.
 
         Arguments:
 
-        * ``results`` -- A list of :class:`.SixS.Outputs` instances
+        * ``results`` -- A list of :class:`.SixS.Outputs` instances, or an :class:`.OutputsBatch`
         * ``output_name`` -- The name of the output to extract. This should be a string containing whatever is put after the `s.outputs` when printing the output, for example `'pixel_reflectance'`.
 
         """
+        if isinstance(results, OutputsBatch):
+            return results[output_name]
+
         results_output = [getattr(r, output_name) for r in results]
 
         return results_output
@@ -244,7 +327,9 @@ class Angles:
         return fig, ax, cax
 
     @classmethod
-    def run_principal_plane(cls, s, output_name=None, n=None):
+    def run_principal_plane(
+        cls, s, output_name=None, n=None, batch=False, executor=None, timeout=None, errors="raise"
+    ):
         """Runs the given 6S simulation to get the outputs for the solar principal plane.
 
         This function runs the simulation for all zenith angles in the azimuthal line of the sun. For example,
@@ -275,67 +360,102 @@ class Angles:
         * ``s`` -- A :class:`.SixS` instance configured with all of the parameters you want to run the simulation with
         * ``output_name`` -- (Optional) The output name to extract (eg. "pixel_reflectance") if the given data is provided as instances of the Outputs class
         * ``n`` -- (Optional) The number of threads to run in parallel. This defaults to the number of CPU cores in your system, and is unlikely to need changing.
+        * ``batch`` -- (Optional) If ``output_name`` is not set, return the results as a single :class:`.OutputsBatch` storing each output as
+          an array, rather than as an array of :class:`.Outputs` instances (default=False)
+        * ``executor``, ``timeout``, ``errors`` -- (Optional) As for :meth:`run360`
 
         Return values:
 
-        A tuple containing zenith angles and the corresponding values or Outputs instances (depending on the arguments given).
+        A tuple containing zenith angles and the corresponding values, Outputs instances or :class:`.OutputsBatch` (depending on the arguments given).
         The zenith angles returned have been modified so that the zenith angles on the 'sun-side' are positive, and those
         on the other side (ie. past the vertical) are negative, for ease of plotting.
 
         """
 
-        # Get the solar azimuth and zenith angles from the SixS instance
-        sa = s.geometry.solar_a
+        all_azimuths, all_zeniths, all_zeniths_for_return = _principal_plane_angles(
+            s.geometry.solar_a
+        )
+
+        f = functools.partial(_run_angle, ParameterSnapshot(s), "view", output_name)
+
+        print("Running for many angles - this may take a long time")
+        results = map_on_executor(f, zip(all_azimuths, all_zeniths), executor, n, timeout, errors)
+
+        return all_zeniths_for_return, _angle_results(results, output_name, batch)
+
+    @classmethod
+    async def angles360_async(
+        cls,
+        s,
+        solar_or_view,
+        na=36,
+        nz=10,
+        output_name=None,
+        limit=None,
+        batch=False,
+        timeout=None,
+        errors="raise",
+    ):
+        """Runs Py6S for lots of angles to produce a polar contour plot, as a coroutine for use with :mod:`asyncio`.
+
+        This works in the same way as :meth:`run360`, but the simulations are run with :meth:`.SixS.run_async` on the
+        running event loop rather than on a pool of threads or processes.
+
+        Arguments:
 
-        # Compute the angles in the principal plane
+        * ``s``, ``solar_or_view``, ``na``, ``nz``, ``output_name``, ``batch``, ``timeout``, ``errors`` -- As for :meth:`run360`
+        * ``limit`` -- (Optional) The maximum number of simulations to run at once. This defaults to the number of CPU cores in your system.
 
-        # Get the solar azimuth on the opposite side for the other half of the principal plane
-        opp_sa = (sa + 180) % 360
+        Return value:
 
-        # Calculate the first side (the solar zenith angle side)
-        first_side_z = np.arange(85, -5, -5)
-        first_side_a = np.repeat(sa, len(first_side_z))
+        As for :meth:`run360`, so the result can be plotted with :meth:`plot360`.
 
-        # Calculate the other side
-        temp = first_side_z[:-1]
-        second_side_z = temp[::-1]  # Reverse array
-        second_side_a = np.repeat(opp_sa, len(second_side_z))
+        """
+        azimuths = np.linspace(0, 360, na)
+        zeniths = np.linspace(0, 89, nz)
 
-        # Join the two sides together
-        all_zeniths = np.hstack((first_side_z, second_side_z))
-        all_zeniths_for_return = np.hstack((first_side_z, -1 * second_side_z))
-        all_azimuths = np.hstack((first_side_a, second_side_a))
+        if solar_or_view not in ("solar", "view"):
+            raise ParameterError(
+                "all_angles",
+                "You must choose to vary either the solar or view angle.",
+            )
 
-        def f(arg):
-            zenith, azimuth = arg
-            s.outputs = None
-            a = copy.deepcopy(s)
+        f = functools.partial(_run_angle_async, ParameterSnapshot(s), solar_or_view, output_name)
+        results = await gather_async(
+            f, itertools.product(azimuths, zeniths), limit, timeout, errors
+        )
 
-            a.geometry.view_z = zenith
-            a.geometry.view_a = azimuth
-            a.run()
+        results = _angle_results(results, output_name, batch)
 
-            if output_name is None:
-                return a.outputs
-            else:
-                return getattr(a.outputs, output_name)
+        return (results, azimuths, zeniths, s.geometry.solar_a, s.geometry.solar_z)
 
-        # Run the map
-        if n is None:
-            pool = Pool()
-        else:
-            pool = Pool(n)
+    @classmethod
+    async def principal_plane_async(
+        cls, s, output_name=None, limit=None, batch=False, timeout=None, errors="raise"
+    ):
+        """Runs the given 6S simulation to get the outputs for the solar principal plane, as a coroutine for use with :mod:`asyncio`.
 
-        print("Running for many angles - this may take a long time")
-        results = pool.map(f, zip(all_zeniths, all_azimuths))
-        pool.close()
-        pool.join()
+        This works in the same way as :meth:`run_principal_plane`, but the simulations are run with :meth:`.SixS.run_async` on
+        the running event loop rather than on a pool of threads or processes.
 
-        results = np.array(results)
+        Arguments:
 
-        results = np.array(results)
+        * ``s``, ``output_name``, ``batch``, ``timeout``, ``errors`` -- As for :meth:`run_principal_plane`
+        * ``limit`` -- (Optional) The maximum number of simulations to run at once. This defaults to the number of CPU cores in your system.
 
-        return all_zeniths_for_return, results
+        Return values:
+
+        As for :meth:`run_principal_plane`.
+
+        """
+        all_azimuths, all_zeniths, all_zeniths_for_return = _principal_plane_angles(
+            s.geometry.solar_a
+        )
+
+        f = functools.partial(_run_angle_async, ParameterSnapshot(s), "view", output_name)
+        results = await gather_async(f, zip(all_azimuths, all_zeniths), limit, timeout, errors)
+
+        return all_zeniths_for_return, _angle_results(results, output_name, batch)
 
     def plot_principal_plane(zeniths, values, y_axis_label):
         """Plot the results from a principal plane simulation (eg. a run of :meth:`.run_principal_plane`).
@@ -352,3 +472,146 @@ class Angles:
         xlabel("View zenith angle (degrees)")
         ylabel(y_axis_label)
         show()
+
+
+def _run_angle(snapshot, solar_or_view, output_name, angles):
+    """Runs the :class:`.ParameterSnapshot` ``snapshot`` with the solar or view azimuth and zenith angles set to ``angles``,
+    used by :meth:`Angles.run360` and :meth:`Angles.run_principal_plane`."""
+    outputs = snapshot.run(geometry=snapshot.geometry_with_angles(solar_or_view, *angles))
+
+    if output_name is None:
+        return outputs
+    else:
+        return getattr(outputs, output_name)
+
+
+async def _run_angle_async(snapshot, solar_or_view, output_name, semaphore, angles):
+    """Runs the :class:`.ParameterSnapshot` ``snapshot`` with the solar or view azimuth and zenith angles set to ``angles``
+    on the event loop, used by :meth:`Angles.angles360_async` and :meth:`Angles.principal_plane_async`.
+    """
+    geometry = snapshot.geometry_with_angles(solar_or_view, *angles)
+
+    async with semaphore:
+        outputs = await snapshot.run_async(geometry=geometry)
+
+    if output_name is None:
+        return outputs
+    else:
+        return getattr(outputs, output_name)
+
+
+def _adaptive_grid(func, na, nz, initial_na, initial_nz, tolerance):
+    """Samples the function ``func`` (which takes a list of (azimuth index, zenith index) tuples and returns a list of values)
+    adaptively over a grid of ``na`` by ``nz`` angles, as described for :meth:`Angles.adaptive360`. Returns the values
+    interpolated over the whole grid, and the number of angles which were sampled."""
+    from scipy.interpolate import griddata
+
+    values = {}
+
+    def sample(indices):
+        indices = [index for index in dict.fromkeys(indices) if index not in values]
+        if indices:
+            values.update(zip(indices, func(indices)))
+
+    a_indices = np.unique(np.round(np.linspace(0, na - 1, initial_na)).astype(int))
+    z_indices = np.unique(np.round(np.linspace(0, nz - 1, initial_nz)).astype(int))
+    sample([(int(i), int(j)) for i in a_indices for j in z_indices])
+
+    if tolerance is None:
+        initial_values = np.array(list(values.values()), dtype=np.float64)
+        tolerance = 0.01 * (initial_values.max() - initial_values.min())
+
+    # The cells still to be checked, as the indices of their first and last azimuths and zeniths
+    cells = [
+        (int(a0), int(a1), int(z0), int(z1))
+        for a0, a1 in zip(a_indices[:-1], a_indices[1:])
+        for z0, z1 in zip(z_indices[:-1], z_indices[1:])
+    ]
+
+    while cells:
+        cells = [cell for cell in cells if cell[1] - cell[0] > 1 or cell[3] - cell[2] > 1]
+        checks = [_cell_checks(cell) for cell in cells]
+        sample([index for cell_checks in checks for index in cell_checks])
+
+        new_cells = []
+        for (a0, a1, z0, z1), cell_checks in zip(cells, checks):
+            corners = np.array(
+                [values[(a0, z0)], values[(a0, z1)], values[(a1, z0)], values[(a1, z1)]]
+            )
+
+            for i, j in cell_checks:
+                # Bilinear interpolation from the corners of the cell
+                u = (i - a0) / (a1 - a0)
+                v = (j - z0) / (z1 - z0)
+                weights = np.array([(1 - u) * (1 - v), (1 - u) * v, u * (1 - v), u * v])
+
+                if abs(values[(i, j)] - np.dot(weights, corners)) > tolerance:
+                    new_cells.extend(_split_cell((a0, a1, z0, z1)))
+                    break
+
+        cells = new_cells
+
+    points = np.array(list(values))
+    grid_a, grid_z = np.meshgrid(np.arange(na), np.arange(nz), indexing="ij")
+    grid = griddata(
+        points, np.array(list(values.values()), dtype=np.float64), (grid_a, grid_z), method="linear"
+    )
+
+    return grid, len(values)
+
+
+def _cell_checks(cell):
+    """Gets the indices of the angles in the middle of the edges and at the centre of a cell, which are used to check
+    whether it needs to be split by :func:`_adaptive_grid`"""
+    a0, a1, z0, z1 = cell
+    am = (a0 + a1) // 2
+    zm = (z0 + z1) // 2
+    checks = [(am, z0), (am, z1), (a0, zm), (a1, zm), (am, zm)]
+    # Cells which are only one angle wide in one direction can only be checked (and split) in the other
+    return [
+        index
+        for index in dict.fromkeys(checks)
+        if index not in ((a0, z0), (a0, z1), (a1, z0), (a1, z1))
+    ]
+
+
+def _split_cell(cell):
+    """Splits a cell in half in each direction in which it can be split"""
+    a0, a1, z0, z1 = cell
+    a_splits = [(a0, (a0 + a1) // 2), ((a0 + a1) // 2, a1)] if a1 - a0 > 1 else [(a0, a1)]
+    z_splits = [(z0, (z0 + z1) // 2), ((z0 + z1) // 2, z1)] if z1 - z0 > 1 else [(z0, z1)]
+    return [(a[0], a[1], z[0], z[1]) for a in a_splits for z in z_splits]
+
+
+def _principal_plane_angles(sa):
+    """Calculates the view azimuth and zenith angles in the principal plane for the solar azimuth ``sa``,
+    used by :meth:`Angles.run_principal_plane`. The zenith angles are also returned in the form that they
+    are returned from that function."""
+    # Compute the angles in the principal plane
+
+    # Get the solar azimuth on the opposite side for the other half of the principal plane
+    opp_sa = (sa + 180) % 360
+
+    # Calculate the first side (the solar zenith angle side)
+    first_side_z = np.arange(85, -5, -5)
+    first_side_a = np.repeat(sa, len(first_side_z))
+
+    # Calculate the other side
+    temp = first_side_z[:-1]
+    second_side_z = temp[::-1]  # Reverse array
+    second_side_a = np.repeat(opp_sa, len(second_side_z))
+
+    # Join the two sides together
+    all_zeniths = np.hstack((first_side_z, second_side_z))
+    all_zeniths_for_return = np.hstack((first_side_z, -1 * second_side_z))
+    all_azimuths = np.hstack((first_side_a, second_side_a))
+
+    return all_azimuths, all_zeniths, all_zeniths_for_return
+
+
+def _angle_results(results, output_name, batch):
+    """Converts the results of running for each angle into an :class:`.OutputsBatch` or an array"""
+    if batch and output_name is None:
+        return OutputsBatch(results)
+    else:
+        return np.array(results)
@@ -15,20 +15,321 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
+import collections
+import functools
 import sys
 
 import numpy as np
 
+from Py6S.outputs import OutputsBatch
 from Py6S.Params import PredefinedWavelengths, Wavelength
+from Py6S.sixs_exceptions import ParameterError
+from Py6S.snapshot import ParameterSnapshot
+
+from .executors import gather_async, get_executor, imap_on_executor, map_on_executor
 
 
 class Wavelengths:
 
     """Helper functions for running the 6S model for a range of wavelengths, and plotting the result"""
 
+    # The predefined wavelengths of the bands of each sensor, as the names of the attributes of PredefinedWavelengths,
+    # for the run_* functions below (eg. run_landsat_tm for "landsat_tm") and for_sensors
+    SENSOR_BANDS = {
+        "landsat_tm": [
+            "LANDSAT_TM_B1",
+            "LANDSAT_TM_B2",
+            "LANDSAT_TM_B3",
+            "LANDSAT_TM_B4",
+            "LANDSAT_TM_B5",
+            "LANDSAT_TM_B7",
+        ],
+        "landsat_oli": [
+            "LANDSAT_OLI_B1",
+            "LANDSAT_OLI_B2",
+            "LANDSAT_OLI_B3",
+            "LANDSAT_OLI_B4",
+            "LANDSAT_OLI_B5",
+            "LANDSAT_OLI_B6",
+            "LANDSAT_OLI_B7",
+            "LANDSAT_OLI_B8",
+            "LANDSAT_OLI_B9",
+        ],
+        "landsat_etm": [
+            "LANDSAT_ETM_B1",
+            "LANDSAT_ETM_B2",
+            "LANDSAT_ETM_B3",
+            "LANDSAT_ETM_B4",
+            "LANDSAT_ETM_B5",
+            "LANDSAT_ETM_B7",
+        ],
+        "landsat_mss": ["LANDSAT_MSS_B1", "LANDSAT_MSS_B2", "LANDSAT_MSS_B3", "LANDSAT_MSS_B4"],
+        "s2a_msi": [
+            "S2A_MSI_01",
+            "S2A_MSI_02",
+            "S2A_MSI_03",
+            "S2A_MSI_04",
+            "S2A_MSI_05",
+            "S2A_MSI_06",
+            "S2A_MSI_07",
+            "S2A_MSI_08",
+            "S2A_MSI_8A",
+            "S2A_MSI_09",
+            "S2A_MSI_10",
+            "S2A_MSI_11",
+            "S2A_MSI_12",
+        ],
+        "s2b_msi": [
+            "S2B_MSI_01",
+            "S2B_MSI_02",
+            "S2B_MSI_03",
+            "S2B_MSI_04",
+            "S2B_MSI_05",
+            "S2B_MSI_06",
+            "S2B_MSI_07",
+            "S2B_MSI_08",
+            "S2B_MSI_8A",
+            "S2B_MSI_09",
+            "S2B_MSI_10",
+            "S2B_MSI_11",
+            "S2B_MSI_12",
+        ],
+        "s3a_olci": [
+            "S3A_OLCI_01",
+            "S3A_OLCI_02",
+            "S3A_OLCI_03",
+            "S3A_OLCI_04",
+            "S3A_OLCI_05",
+            "S3A_OLCI_06",
+            "S3A_OLCI_07",
+            "S3A_OLCI_08",
+            "S3A_OLCI_09",
+            "S3A_OLCI_10",
+            "S3A_OLCI_11",
+            "S3A_OLCI_12",
+            "S3A_OLCI_13",
+            "S3A_OLCI_14",
+            "S3A_OLCI_15",
+            "S3A_OLCI_16",
+            "S3A_OLCI_17",
+            "S3A_OLCI_18",
+            "S3A_OLCI_19",
+            "S3A_OLCI_20",
+            "S3A_OLCI_21",
+        ],
+        "s3a_slstr": [
+            "S3A_SLSTR_01",
+            "S3A_SLSTR_02",
+            "S3A_SLSTR_03",
+            "S3A_SLSTR_04",
+            "S3A_SLSTR_05",
+            "S3A_SLSTR_06",
+        ],
+        "s3b_olci": [
+            "S3B_OLCI_01",
+            "S3B_OLCI_02",
+            "S3B_OLCI_03",
+            "S3B_OLCI_04",
+            "S3B_OLCI_05",
+            "S3B_OLCI_06",
+            "S3B_OLCI_07",
+            "S3B_OLCI_08",
+            "S3B_OLCI_09",
+            "S3B_OLCI_10",
+            "S3B_OLCI_11",
+            "S3B_OLCI_12",
+            "S3B_OLCI_13",
+            "S3B_OLCI_14",
+            "S3B_OLCI_15",
+            "S3B_OLCI_16",
+            "S3B_OLCI_17",
+            "S3B_OLCI_18",
+            "S3B_OLCI_19",
+            "S3B_OLCI_20",
+            "S3B_OLCI_21",
+        ],
+        "s3b_slstr": [
+            "S3B_SLSTR_01",
+            "S3B_SLSTR_02",
+            "S3B_SLSTR_03",
+            "S3B_SLSTR_04",
+            "S3B_SLSTR_05",
+            "S3B_SLSTR_06",
+        ],
+        "meris": [
+            "MERIS_B1",
+            "MERIS_B2",
+            "MERIS_B3",
+            "MERIS_B4",
+            "MERIS_B5",
+            "MERIS_B6",
+            "MERIS_B7",
+            "MERIS_B9",
+            "MERIS_B10",
+            "MERIS_B11",
+            "MERIS_B12",
+            "MERIS_B8",
+            "MERIS_B13",
+            "MERIS_B14",
+            "MERIS_B15",
+        ],
+        "modis": [
+            "MODIS_B8",
+            "MODIS_B3",
+            "MODIS_B4",
+            "MODIS_B1",
+            "MODIS_B2",
+            "MODIS_B5",
+            "MODIS_B6",
+            "MODIS_B7",
+        ],
+        "aqua": [
+            "ACCURATE_MODIS_AQUA_1",
+            "ACCURATE_MODIS_AQUA_2",
+            "ACCURATE_MODIS_AQUA_3",
+            "ACCURATE_MODIS_AQUA_4",
+            "ACCURATE_MODIS_AQUA_5",
+            "ACCURATE_MODIS_AQUA_6",
+            "ACCURATE_MODIS_AQUA_7",
+            "ACCURATE_MODIS_AQUA_11",
+            "ACCURATE_MODIS_AQUA_12",
+            "ACCURATE_MODIS_AQUA_13",
+            "ACCURATE_MODIS_AQUA_14",
+            "ACCURATE_MODIS_AQUA_15",
+        ],
+        "terra": [
+            "ACCURATE_MODIS_TERRA_1",
+            "ACCURATE_MODIS_TERRA_2",
+            "ACCURATE_MODIS_TERRA_3",
+            "ACCURATE_MODIS_TERRA_4",
+            "ACCURATE_MODIS_TERRA_5",
+            "ACCURATE_MODIS_TERRA_6",
+            "ACCURATE_MODIS_TERRA_7",
+            "ACCURATE_MODIS_TERRA_11",
+            "ACCURATE_MODIS_TERRA_12",
+            "ACCURATE_MODIS_TERRA_13",
+            "ACCURATE_MODIS_TERRA_14",
+            "ACCURATE_MODIS_TERRA_15",
+        ],
+        "spot_hrv": ["SPOT_HRV1_B1", "SPOT_HRV1_B2", "SPOT_HRV1_B3"],
+        "spot_vgt": ["SPOT_VGT_B1", "SPOT_VGT_B2", "SPOT_VGT_B3", "SPOT_VGT_B4"],
+        "probav_1": ["PROBAV_1_01", "PROBAV_1_02", "PROBAV_1_03", "PROBAV_1_04"],
+        "probav_2": ["PROBAV_2_01", "PROBAV_2_02", "PROBAV_2_03", "PROBAV_2_04"],
+        "probav_3": ["PROBAV_3_01", "PROBAV_3_02", "PROBAV_3_03", "PROBAV_3_04"],
+        "polder": [
+            "POLDER_B1",
+            "POLDER_B2",
+            "POLDER_B3",
+            "POLDER_B4",
+            "POLDER_B5",
+            "POLDER_B6",
+            "POLDER_B7",
+            "POLDER_B8",
+        ],
+        "seawifs": [
+            "SEAWIFS_B1",
+            "SEAWIFS_B2",
+            "SEAWIFS_B3",
+            "SEAWIFS_B4",
+            "SEAWIFS_B5",
+            "SEAWIFS_B6",
+            "SEAWIFS_B7",
+            "SEAWIFS_B8",
+        ],
+        "aatsr": ["AATSR_B1", "AATSR_B2", "AATSR_B3", "AATSR_B4"],
+        "aster": [
+            "ASTER_B1",
+            "ASTER_B2",
+            "ASTER_B3N",
+            "ASTER_B3B",
+            "ASTER_B4",
+            "ASTER_B5",
+            "ASTER_B6",
+            "ASTER_B7",
+            "ASTER_B8",
+            "ASTER_B9",
+        ],
+        "viirs": [
+            "VIIRS_BM1",
+            "VIIRS_BM2",
+            "VIIRS_BM3",
+            "VIIRS_BM4",
+            "VIIRS_BI1",
+            "VIIRS_BM5",
+            "VIIRS_BM6",
+            "VIIRS_BM7",
+            "VIIRS_BM8",
+            "VIIRS_BM9",
+            "VIIRS_BM10",
+            "VIIRS_BM11",
+            "VIIRS_BM12",
+            "VIIRS_BI4",
+        ],
+        "er2_mas": [
+            "ER2_MAS_B1",
+            "ER2_MAS_B2",
+            "ER2_MAS_B3",
+            "ER2_MAS_B4",
+            "ER2_MAS_B5",
+            "ER2_MAS_B6",
+            "ER2_MAS_B7",
+        ],
+        "ali": [
+            "ALI_B1P",
+            "ALI_B1",
+            "ALI_B2",
+            "ALI_B3",
+            "ALI_B4",
+            "ALI_B4P",
+            "ALI_B5P",
+            "ALI_B5",
+            "ALI_B7",
+        ],
+        "gli": [
+            "GLI_B1",
+            "GLI_B2",
+            "GLI_B3",
+            "GLI_B4",
+            "GLI_B5",
+            "GLI_B6",
+            "GLI_B7",
+            "GLI_B8",
+            "GLI_B9",
+            "GLI_B10",
+            "GLI_B22",
+            "GLI_B11",
+            "GLI_B12",
+            "GLI_B13",
+            "GLI_B14",
+            "GLI_B15",
+            "GLI_B16",
+            "GLI_B17",
+            "GLI_B18",
+            "GLI_B23",
+            "GLI_B19",
+            "GLI_B24",
+            "GLI_B25",
+            "GLI_B26",
+            "GLI_B27",
+            "GLI_B28",
+            "GLI_B29",
+            "GLI_B30",
+        ],
+    }
+
     @classmethod
-    def run_wavelengths(cls, s, wavelengths, output_name=None, n=None, verbose=False):
+    def run_wavelengths(
+        cls,
+        s,
+        wavelengths,
+        output_name=None,
+        n=None,
+        verbose=False,
+        executor=None,
+        batch=False,
+        timeout=None,
+        errors="raise",
+    ):
         """Runs the given SixS parameterisation for each of the wavelengths given, optionally extracting a specific output.
 
         This function is used by all of the other wavelengths running functions, such as :method:`run_vnir`, and thus
@@ -44,11 +345,23 @@ class Wavelengths:
         * ``output_name`` -- (Optional) The output to extract from ``s.outputs``, as a string that could be placed after ``s.outputs.``, for example ``pixel_reflectance``
         * ``n`` -- (Optional) The number of threads to run in parallel. This defaults to the number of CPU cores in your system, and is unlikely to need changing.
         * ``verbose`` -- (Optional) Print wavelengths as Py6S is running (default=False)
+        * ``executor`` -- (Optional) Where to run the simulations: ``'thread'`` (the default) for a pool of threads, ``'process'`` for a pool of
+          processes, or an existing :class:`concurrent.futures.Executor` instance (which will be left running afterwards so it can be re-used).
+          A process pool allows the Python-side work of each run (writing the input file and parsing the output) to run on all CPU cores at once.
+        * ``batch`` -- (Optional) If ``output_name`` is not set, return the results as a single :class:`.OutputsBatch` storing each output as
+          an array, rather than as a list of :class:`SixS.Outputs` instances (default=False)
+        * ``timeout`` -- (Optional) The maximum time, in seconds, for all of the simulations to finish. Set the ``timeout`` attribute of ``s`` to limit the
+          time taken by each simulation.
+        * ``errors`` -- (Optional) Set to ``'return'`` to return the exception raised by each simulation which fails (or which is cancelled because the
+          simulations took longer than ``timeout``) in place of its result, rather than raising the first one (default='raise'). The remaining simulations
+          are cancelled when an exception is raised.
 
         Return value:
 
-        A tuple containing the wavelengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
-        or a list of values of the selected output if ``output_name`` is set.
+        A tuple containing the wavelengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances
+        (or an :class:`.OutputsBatch` if ``batch`` is set) if ``output_name`` is not set, or a list of values of the selected output if ``output_name`` is set.
+        If ``errors`` is ``'return'`` then the results of failed simulations are exceptions (or NaN in an :class:`.OutputsBatch`, with the exceptions in its
+        ``errors`` attribute).
 
         Example usage::
 
@@ -58,28 +371,14 @@ class Wavelengths:
           wavelengths, results = SixSHelpers.PredefinedWavelengths.run_wavelengths(s, np.arange(0.400, 0.500, 0.001), output_name='pixel_radiance')
           # Run for the first three Landsat TM bands
           wavelengths, results = SixSHelpers.PredefinedWavelengths.run_wavelengths(s, [PredefinedWavelengths.LANDSAT_TM_B1, PredefinedWavelengths.LANDSAT_TM_B2, PredefinedWavelengths.LANDSAT_TM_B3)
+          # Run on a pool of processes rather than threads
+          wavelengths, results = SixSHelpers.PredefinedWavelengths.run_wavelengths(s, np.arange(0.400, 0.500, 0.001), executor='process')
 
         """
-        # Create a function to be called by the map
-        def f(wv):
-            s.outputs = None
-            a = copy.deepcopy(s)
-            a.wavelength = Wavelength(wv)
-            if verbose:
-                print(wv)
-            a.run()
-            if output_name is None:
-                return a.outputs
-            else:
-                return cls.recursive_getattr(a.outputs, output_name)
-
-        # Run the map
-        from multiprocessing.dummy import Pool
-
-        if n is None:
-            pool = Pool()
-        else:
-            pool = Pool(n)
+        # The parameters are only rendered into an input file once, and each simulation only replaces the
+        # wavelength. The function to be called by the map must be defined at the module level
+        # so that it can be sent to other processes when using a process pool
+        f = functools.partial(_run_wavelength, ParameterSnapshot(s), output_name, verbose)
 
         if verbose:
             print("wavelengths pass:")
@@ -87,19 +386,282 @@ class Wavelengths:
             print(type(wavelengths))
 
         print("Running for many wavelengths - this may take a long time")
-        results = pool.map(f, wavelengths)
+        results = map_on_executor(f, wavelengths, executor, n, timeout, errors)
 
-        pool.close()
-        pool.join()
+        return _wavelength_results(wavelengths, results, output_name, batch)
 
-        try:
-            if len(wavelengths[0]) == 4:
-                cleaned_wavelengths = list(map(lambda x: x[:3], wavelengths))
-                return np.array(cleaned_wavelengths), np.array(results)
+    @classmethod
+    def iter_wavelengths(
+        cls,
+        s,
+        wavelengths,
+        output_name=None,
+        n=None,
+        executor=None,
+        ordered=True,
+        window=None,
+        errors="raise",
+    ):
+        """Runs the given SixS parameterisation for each of the wavelengths given, yielding each result as soon as it is available.
+
+        This works in the same way as :meth:`run_wavelengths`, but rather than returning all of the results once every simulation
+        has finished it is a generator, yielding a tuple of the wavelength and the result of each simulation as it finishes.
+        Only a limited number of simulations are run at once, and the wavelengths are only taken from ``wavelengths`` as they are
+        needed, so the memory used stays the same however many wavelengths there are, and the results can be processed (or written
+        to disk) while the other simulations are running.
+
+        Arguments:
+
+        * ``s``, ``wavelengths``, ``output_name``, ``n``, ``executor`` -- As for :meth:`run_wavelengths`. ``wavelengths`` can be any
+          iterable, including a generator.
+        * ``ordered`` -- (Optional) If True (the default), yield the results in the same order as ``wavelengths``. If False, yield the
+          results in the order that the simulations finish, which keeps all of the threads or processes busy even when some
+          simulations take longer than others.
+        * ``window`` -- (Optional) The maximum number of simulations running (or waiting to run) at once. This defaults to twice the
+          number of threads or processes.
+        * ``errors`` -- (Optional) Set to ``'return'`` to yield the exception raised by each simulation which fails in place of its
+          result, rather than raising it (default='raise'). The simulations which are still running are cancelled if an exception is
+          raised, or if the generator is closed early.
+
+        Example usage::
+
+          # Write the pixel radiance for every wavelength from 0.2 to 4.0 micrometers, with a spacing of 1nm, as each run finishes
+          with open("radiance.csv", "w") as f:
+              for wv, radiance in SixSHelpers.Wavelengths.iter_wavelengths(s, np.arange(0.2, 4.0, 0.001), output_name="pixel_radiance"):
+                  f.write("%f,%f\\n" % (wv, radiance))
+
+        """
+        f = functools.partial(_run_wavelength, ParameterSnapshot(s), output_name, False)
+
+        for wv, result in imap_on_executor(
+            f, wavelengths, executor, n, ordered=ordered, window=window, errors=errors
+        ):
+            # Don't return the filter function of predefined wavelengths, as for run_wavelengths
+            if isinstance(wv, tuple) and len(wv) == 4:
+                wv = wv[:3]
+
+            yield wv, result
+
+    @classmethod
+    async def wavelengths_async(
+        cls, s, wavelengths, output_name=None, limit=None, batch=False, timeout=None, errors="raise"
+    ):
+        """Runs the given SixS parameterisation for each of the wavelengths given, as a coroutine for use with :mod:`asyncio`.
+
+        This works in the same way as :meth:`run_wavelengths`, but the simulations are run with :meth:`.SixS.run_async` on the
+        running event loop rather than on a pool of threads or processes, so it can be used from asynchronous code without
+        blocking the event loop.
+
+        Arguments:
+
+        * ``s``, ``wavelengths``, ``output_name``, ``batch``, ``timeout``, ``errors`` -- As for :meth:`run_wavelengths`
+        * ``limit`` -- (Optional) The maximum number of simulations to run at once. This defaults to the number of CPU cores in your system.
+
+        Return value:
+
+        As for :meth:`run_wavelengths`.
+
+        Example usage::
+
+          wavelengths, results = await SixSHelpers.Wavelengths.wavelengths_async(s, np.arange(0.400, 0.500, 0.001), output_name='pixel_radiance')
+
+        """
+        f = functools.partial(_run_wavelength_async, ParameterSnapshot(s), output_name)
+        results = await gather_async(f, wavelengths, limit, timeout, errors)
+
+        return _wavelength_results(wavelengths, results, output_name, batch)
+
+    @classmethod
+    def for_sensors(
+        cls,
+        s,
+        sensors,
+        output_name=None,
+        n=None,
+        executor=None,
+        batch=False,
+        timeout=None,
+        errors="raise",
+    ):
+        """Runs the given SixS parameterisation for all of the bands of several sensors at once, optionally extracting a specific output.
+
+        This gives the same results as calling the function for each sensor (such as :meth:`run_landsat_oli`), but the simulations
+        for all of the sensors are run on one pool, and bands which are exactly the same in more than one sensor (such as the MODIS
+        bands which have the same filter function for ``aqua`` and ``terra``, or bands given more than once) are only simulated once.
+
+        Arguments:
+
+        * ``s`` -- A :class:`.SixS` instance with the parameters set as required
+        * ``sensors`` -- Either a list of the names of sensors (the keys of ``Wavelengths.SENSOR_BANDS``, which are the names of the
+          functions for each sensor without ``run_`` - for example ``['landsat_oli', 's2a_msi']``), or a dictionary mapping names
+          to lists of bands given as values from :class:`.PredefinedWavelengths`
+        * ``output_name``, ``n``, ``executor``, ``batch``, ``timeout``, ``errors`` -- As for :meth:`run_wavelengths`
+
+        Return value:
+
+        A dictionary mapping the name of each sensor to a tuple containing the centre wavelengths of its bands and the results of
+        the simulations, exactly as returned by the function for that sensor.
+
+        Example usage::
+
+          results = SixSHelpers.Wavelengths.for_sensors(s, ['landsat_oli', 's2a_msi', 's2b_msi'], output_name='apparent_radiance')
+          centre_wvs, radiances = results['s2a_msi']
+
+        """
+        if not isinstance(sensors, dict):
+            sensors = {name: cls._sensor_bands(name) for name in sensors}
+
+        # The distinct bands, keyed on the wavelength section of the input file (which includes the filter
+        # function), with the index of each in the list of bands to be simulated
+        distinct = collections.OrderedDict()
+        indices = {}
+        for name, bands in sensors.items():
+            indices[name] = [
+                distinct.setdefault(Wavelength(band)[0], (len(distinct), band))[0] for band in bands
+            ]
+
+        f = functools.partial(_run_wavelength, ParameterSnapshot(s), output_name, False)
+        results = map_on_executor(
+            f, [band for _, band in distinct.values()], executor, n, timeout, errors
+        )
+
+        sensor_results = {}
+        for name, bands in sensors.items():
+            wv, res = _wavelength_results(
+                bands, [results[i] for i in indices[name]], output_name, batch
+            )
+            sensor_results[name] = (list(map(cls.to_centre_wavelengths, wv)), res)
+
+        return sensor_results
+
+    @classmethod
+    def convolve_sensors(
+        cls,
+        s,
+        sensors,
+        output_name=None,
+        spacing=0.005,
+        n=None,
+        executor=None,
+        timeout=None,
+        errors="raise",
+    ):
+        """Simulates the bands of several sensors at once by running the given SixS parameterisation for a fine sweep of single
+        wavelengths covering all of the bands, and then convolving the results with the filter function of each band.
+
+        This gives an approximation to the results of :meth:`for_sensors`, and needs the same number of simulations however many
+        sensors (and bands) there are, so it is much quicker when there are many bands or many sensors covering the same
+        wavelengths. Use :meth:`convolution_accuracy` to see how close the approximation is for your parameters, and to choose the
+        ``spacing``.
+
+        The outputs of each band are weighted averages of the outputs at each wavelength of the sweep, weighted by the filter
+        function of the band and (for reflectances, transmittances and other outputs without units) by the solar spectrum, in the
+        same way as 6S does for a band. Radiances, irradiances and the solar spectrum are weighted by the filter function only,
+        and an ``int_solar_spectrum`` output is added, as for a band simulated by 6S.
+
+        Only bands with filter functions defined in :class:`.PredefinedWavelengths` can be convolved: the bands of some sensors
+        (such as Landsat TM and ETM) use filter functions which are built into 6S, and these raise a :class:`.ParameterError`.
+
+        Arguments:
+
+        * ``s``, ``sensors`` -- As for :meth:`for_sensors`
+        * ``output_name`` -- (Optional) The output to return for each band. If not set, all of the outputs are returned as an
+          :class:`.OutputsBatch`.
+        * ``spacing`` -- (Optional) The spacing between the wavelengths of the sweep, in um (default 0.005, which is 5nm). Only the
+          wavelengths within (or next to) one of the bands are simulated.
+        * ``n``, ``executor``, ``timeout``, ``errors`` -- As for :meth:`run_wavelengths`. If ``errors`` is ``'return'``, the
+          outputs of the bands which need a simulation which failed are NaN.
+
+        Return value:
+
+        A dictionary mapping the name of each sensor to a tuple containing the centre wavelengths of its bands and either a list of
+        values of the selected output for each band (if ``output_name`` is set), or an :class:`.OutputsBatch` with the outputs of
+        each band.
+
+        Example usage::
+
+          results = SixSHelpers.Wavelengths.convolve_sensors(s, ['s2a_msi', 's2b_msi', 'landsat_oli'], output_name='apparent_radiance')
+          centre_wvs, radiances = results['s2a_msi']
+
+        """
+        if not isinstance(sensors, dict):
+            sensors = {name: cls._sensor_bands(name) for name in sensors}
+
+        for name, bands in sensors.items():
+            for band in bands:
+                if len(band) != 4 or band[0] <= 0:
+                    raise ParameterError(
+                        "sensors",
+                        "The bands of %s can't be convolved, as their filter functions are built into 6S"
+                        % name,
+                    )
+
+        wavelengths = _convolution_wavelengths(
+            [band for bands in sensors.values() for band in bands], spacing
+        )
+
+        f = functools.partial(_run_wavelength, ParameterSnapshot(s), None, False)
+        batch = OutputsBatch(map_on_executor(f, wavelengths, executor, n, timeout, errors))
+
+        sensor_results = {}
+        for name, bands in sensors.items():
+            convolved = OutputsBatch.from_columns(_convolve(wavelengths, batch, bands))
+            centre_wvs = list(map(cls.to_centre_wavelengths, bands))
+
+            if output_name is None:
+                sensor_results[name] = (centre_wvs, convolved)
             else:
-                return np.array(wavelengths), np.array(results)
-        except Exception:
-            return np.array(wavelengths), np.array(results)
+                sensor_results[name] = (centre_wvs, convolved[output_name])
+
+        return sensor_results
+
+    @classmethod
+    def convolution_accuracy(
+        cls,
+        s,
+        sensors,
+        output_name="apparent_radiance",
+        spacing=0.005,
+        n=None,
+        executor=None,
+        timeout=None,
+    ):
+        """Compares the results of :meth:`convolve_sensors` with simulating each band with 6S (as :meth:`for_sensors` does), to
+        show how accurate the convolution is for the given parameters and spacing.
+
+        Arguments:
+
+        * ``s``, ``sensors``, ``spacing``, ``n``, ``executor``, ``timeout`` -- As for :meth:`convolve_sensors`
+        * ``output_name`` -- (Optional) The output to compare (default ``'apparent_radiance'``)
+
+        Return value:
+
+        A dictionary mapping the name of each sensor to a tuple containing the centre wavelengths of its bands, the convolved
+        values of the output, the values from simulating each band, and the relative difference between them (the convolved
+        value minus the simulated value, divided by the simulated value).
+
+        Example usage::
+
+          accuracy = SixSHelpers.Wavelengths.convolution_accuracy(s, ['s2a_msi'], spacing=0.01)
+          centre_wvs, convolved, simulated, difference = accuracy['s2a_msi']
+          print("Largest difference: %.2f%%" % (np.abs(difference).max() * 100))
+
+        """
+        convolved = cls.convolve_sensors(s, sensors, output_name, spacing, n, executor, timeout)
+        simulated = cls.for_sensors(s, sensors, output_name, n, executor, timeout=timeout)
+
+        accuracy = {}
+        for name in convolved:
+            centre_wvs, convolved_values = convolved[name]
+            simulated_values = np.asarray(simulated[name][1], dtype=np.float64)
+            accuracy[name] = (
+                centre_wvs,
+                convolved_values,
+                simulated_values,
+                (convolved_values - simulated_values) / simulated_values,
+            )
+
+        return accuracy
 
     @classmethod
     def run_vnir(cls, s, spacing=0.005, **kwargs):
@@ -158,6 +720,87 @@ class Wavelengths:
         wv = np.arange(0.2, 4.0, spacing)
         return cls.run_wavelengths(s, wv, **kwargs)
 
+    @classmethod
+    def adaptive_wavelengths(
+        cls,
+        s,
+        output_name,
+        start=0.2,
+        end=4.0,
+        initial_spacing=0.04,
+        min_spacing=0.001,
+        tolerance=None,
+        n=None,
+        executor=None,
+    ):
+        """Runs the given SixS parameterisation for a range of wavelengths, choosing the wavelengths to simulate adaptively, and
+        returns a spectrum of the given output interpolated to ``min_spacing``.
+
+        The range is first simulated every ``initial_spacing``, and each gap between the simulated wavelengths is then halved
+        (by simulating the wavelength in the middle of it) until the output varies linearly across it - to within ``tolerance`` -
+        or it is ``min_spacing`` wide. This gives a spectrum almost as accurate as simulating every ``min_spacing``, while only
+        using many simulations where the output changes sharply, such as the absorption bands in ``total_gaseous_transmittance``.
+
+        Each round of halving is run in parallel, as for :meth:`run_wavelengths`.
+
+        Arguments:
+
+        * ``s`` -- A :class:`.SixS` instance with the parameters set as required
+        * ``output_name`` -- The output to extract from ``s.outputs`` and use to choose the wavelengths, for example ``pixel_radiance``
+        * ``start``, ``end`` -- (Optional) The range of wavelengths, in um (default 0.2-4.0um)
+        * ``initial_spacing`` -- (Optional) The spacing of the wavelengths which are simulated first, in um (default 0.04)
+        * ``min_spacing`` -- (Optional) The smallest spacing between simulated wavelengths, in um, which is also the spacing of the
+          returned spectrum (default 0.001, which is 1nm)
+        * ``tolerance`` -- (Optional) The largest difference between the output in the middle of a gap and the linear interpolation
+          across it which is accepted without halving the gap, in the units of the output. This defaults to 1% of the range of
+          the output over the first wavelengths simulated.
+        * ``n``, ``executor`` -- As for :meth:`run_wavelengths`
+
+        Return value:
+
+        A tuple containing the wavelengths (every ``min_spacing`` from ``start`` to ``end``) and values of the interpolated
+        spectrum, and the wavelengths and values which were simulated.
+
+        Example usage::
+
+          wavelengths, values, simulated_wavelengths, simulated_values = SixSHelpers.Wavelengths.adaptive_wavelengths(
+              s, 'total_gaseous_transmittance', tolerance=0.005)
+          print("%d simulations" % len(simulated_wavelengths))
+
+        """
+        if not min_spacing <= initial_spacing <= end - start:
+            raise ParameterError(
+                "min_spacing",
+                "The minimum spacing must be no larger than the initial spacing, which must be no larger than the range",
+            )
+
+        f = functools.partial(_run_wavelength, ParameterSnapshot(s), output_name, False)
+        pool, owned = get_executor(executor, n)
+
+        try:
+            return _adaptive_sample(
+                lambda wavelengths: map_on_executor(f, wavelengths, pool),
+                start,
+                end,
+                initial_spacing,
+                min_spacing,
+                tolerance,
+            )
+        finally:
+            if owned:
+                pool.shutdown()
+
+    @classmethod
+    def _sensor_bands(cls, name):
+        """Gets the list of predefined wavelengths for the bands of the sensor with the given name in ``SENSOR_BANDS``"""
+        try:
+            return [getattr(PredefinedWavelengths, band) for band in cls.SENSOR_BANDS[name]]
+        except KeyError:
+            raise ParameterError(
+                "sensors",
+                "Unknown sensor %r. The sensors are: %s" % (name, ", ".join(cls.SENSOR_BANDS)),
+            )
+
     @classmethod
     def to_centre_wavelengths(cls, item):
         """Get centre wavelengths for a sensor from a list of the wavelength tuples.
@@ -184,14 +827,7 @@ class Wavelengths:
         or a list of values of the selected output if ``output_name`` is set.
         """
 
-        wv = [
-            PredefinedWavelengths.LANDSAT_TM_B1,
-            PredefinedWavelengths.LANDSAT_TM_B2,
-            PredefinedWavelengths.LANDSAT_TM_B3,
-            PredefinedWavelengths.LANDSAT_TM_B4,
-            PredefinedWavelengths.LANDSAT_TM_B5,
-            PredefinedWavelengths.LANDSAT_TM_B7,
-        ]
+        wv = cls._sensor_bands("landsat_tm")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -217,17 +853,7 @@ class Wavelengths:
         or a list of values of the selected output if ``output_name`` is set.
         """
 
-        wv = [
-            PredefinedWavelengths.LANDSAT_OLI_B1,
-            PredefinedWavelengths.LANDSAT_OLI_B2,
-            PredefinedWavelengths.LANDSAT_OLI_B3,
-            PredefinedWavelengths.LANDSAT_OLI_B4,
-            PredefinedWavelengths.LANDSAT_OLI_B5,
-            PredefinedWavelengths.LANDSAT_OLI_B6,
-            PredefinedWavelengths.LANDSAT_OLI_B7,
-            PredefinedWavelengths.LANDSAT_OLI_B8,
-            PredefinedWavelengths.LANDSAT_OLI_B9,
-        ]
+        wv = cls._sensor_bands("landsat_oli")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -252,14 +878,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.LANDSAT_ETM_B1,
-            PredefinedWavelengths.LANDSAT_ETM_B2,
-            PredefinedWavelengths.LANDSAT_ETM_B3,
-            PredefinedWavelengths.LANDSAT_ETM_B4,
-            PredefinedWavelengths.LANDSAT_ETM_B5,
-            PredefinedWavelengths.LANDSAT_ETM_B7,
-        ]
+        wv = cls._sensor_bands("landsat_etm")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -283,12 +902,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.LANDSAT_MSS_B1,
-            PredefinedWavelengths.LANDSAT_MSS_B2,
-            PredefinedWavelengths.LANDSAT_MSS_B3,
-            PredefinedWavelengths.LANDSAT_MSS_B4,
-        ]
+        wv = cls._sensor_bands("landsat_mss")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -312,21 +926,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.S2A_MSI_01,
-            PredefinedWavelengths.S2A_MSI_02,
-            PredefinedWavelengths.S2A_MSI_03,
-            PredefinedWavelengths.S2A_MSI_04,
-            PredefinedWavelengths.S2A_MSI_05,
-            PredefinedWavelengths.S2A_MSI_06,
-            PredefinedWavelengths.S2A_MSI_07,
-            PredefinedWavelengths.S2A_MSI_08,
-            PredefinedWavelengths.S2A_MSI_8A,
-            PredefinedWavelengths.S2A_MSI_09,
-            PredefinedWavelengths.S2A_MSI_10,
-            PredefinedWavelengths.S2A_MSI_11,
-            PredefinedWavelengths.S2A_MSI_12,
-        ]
+        wv = cls._sensor_bands("s2a_msi")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -351,21 +951,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.S2B_MSI_01,
-            PredefinedWavelengths.S2B_MSI_02,
-            PredefinedWavelengths.S2B_MSI_03,
-            PredefinedWavelengths.S2B_MSI_04,
-            PredefinedWavelengths.S2B_MSI_05,
-            PredefinedWavelengths.S2B_MSI_06,
-            PredefinedWavelengths.S2B_MSI_07,
-            PredefinedWavelengths.S2B_MSI_08,
-            PredefinedWavelengths.S2B_MSI_8A,
-            PredefinedWavelengths.S2B_MSI_09,
-            PredefinedWavelengths.S2B_MSI_10,
-            PredefinedWavelengths.S2B_MSI_11,
-            PredefinedWavelengths.S2B_MSI_12,
-        ]
+        wv = cls._sensor_bands("s2b_msi")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -390,29 +976,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.S3A_OLCI_01,
-            PredefinedWavelengths.S3A_OLCI_02,
-            PredefinedWavelengths.S3A_OLCI_03,
-            PredefinedWavelengths.S3A_OLCI_04,
-            PredefinedWavelengths.S3A_OLCI_05,
-            PredefinedWavelengths.S3A_OLCI_06,
-            PredefinedWavelengths.S3A_OLCI_07,
-            PredefinedWavelengths.S3A_OLCI_08,
-            PredefinedWavelengths.S3A_OLCI_09,
-            PredefinedWavelengths.S3A_OLCI_10,
-            PredefinedWavelengths.S3A_OLCI_11,
-            PredefinedWavelengths.S3A_OLCI_12,
-            PredefinedWavelengths.S3A_OLCI_13,
-            PredefinedWavelengths.S3A_OLCI_14,
-            PredefinedWavelengths.S3A_OLCI_15,
-            PredefinedWavelengths.S3A_OLCI_16,
-            PredefinedWavelengths.S3A_OLCI_17,
-            PredefinedWavelengths.S3A_OLCI_18,
-            PredefinedWavelengths.S3A_OLCI_19,
-            PredefinedWavelengths.S3A_OLCI_20,
-            PredefinedWavelengths.S3A_OLCI_21,
-        ]
+        wv = cls._sensor_bands("s3a_olci")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -437,14 +1001,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.S3A_SLSTR_01,
-            PredefinedWavelengths.S3A_SLSTR_02,
-            PredefinedWavelengths.S3A_SLSTR_03,
-            PredefinedWavelengths.S3A_SLSTR_04,
-            PredefinedWavelengths.S3A_SLSTR_05,
-            PredefinedWavelengths.S3A_SLSTR_06,
-        ]
+        wv = cls._sensor_bands("s3a_slstr")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -469,29 +1026,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.S3B_OLCI_01,
-            PredefinedWavelengths.S3B_OLCI_02,
-            PredefinedWavelengths.S3B_OLCI_03,
-            PredefinedWavelengths.S3B_OLCI_04,
-            PredefinedWavelengths.S3B_OLCI_05,
-            PredefinedWavelengths.S3B_OLCI_06,
-            PredefinedWavelengths.S3B_OLCI_07,
-            PredefinedWavelengths.S3B_OLCI_08,
-            PredefinedWavelengths.S3B_OLCI_09,
-            PredefinedWavelengths.S3B_OLCI_10,
-            PredefinedWavelengths.S3B_OLCI_11,
-            PredefinedWavelengths.S3B_OLCI_12,
-            PredefinedWavelengths.S3B_OLCI_13,
-            PredefinedWavelengths.S3B_OLCI_14,
-            PredefinedWavelengths.S3B_OLCI_15,
-            PredefinedWavelengths.S3B_OLCI_16,
-            PredefinedWavelengths.S3B_OLCI_17,
-            PredefinedWavelengths.S3B_OLCI_18,
-            PredefinedWavelengths.S3B_OLCI_19,
-            PredefinedWavelengths.S3B_OLCI_20,
-            PredefinedWavelengths.S3B_OLCI_21,
-        ]
+        wv = cls._sensor_bands("s3b_olci")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -516,14 +1051,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.S3B_SLSTR_01,
-            PredefinedWavelengths.S3B_SLSTR_02,
-            PredefinedWavelengths.S3B_SLSTR_03,
-            PredefinedWavelengths.S3B_SLSTR_04,
-            PredefinedWavelengths.S3B_SLSTR_05,
-            PredefinedWavelengths.S3B_SLSTR_06,
-        ]
+        wv = cls._sensor_bands("s3b_slstr")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -548,23 +1076,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.MERIS_B1,
-            PredefinedWavelengths.MERIS_B2,
-            PredefinedWavelengths.MERIS_B3,
-            PredefinedWavelengths.MERIS_B4,
-            PredefinedWavelengths.MERIS_B5,
-            PredefinedWavelengths.MERIS_B6,
-            PredefinedWavelengths.MERIS_B7,
-            PredefinedWavelengths.MERIS_B9,
-            PredefinedWavelengths.MERIS_B10,
-            PredefinedWavelengths.MERIS_B11,
-            PredefinedWavelengths.MERIS_B12,
-            PredefinedWavelengths.MERIS_B8,
-            PredefinedWavelengths.MERIS_B13,
-            PredefinedWavelengths.MERIS_B14,
-            PredefinedWavelengths.MERIS_B15,
-        ]
+        wv = cls._sensor_bands("meris")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -588,16 +1100,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.MODIS_B8,
-            PredefinedWavelengths.MODIS_B3,
-            PredefinedWavelengths.MODIS_B4,
-            PredefinedWavelengths.MODIS_B1,
-            PredefinedWavelengths.MODIS_B2,
-            PredefinedWavelengths.MODIS_B5,
-            PredefinedWavelengths.MODIS_B6,
-            PredefinedWavelengths.MODIS_B7,
-        ]
+        wv = cls._sensor_bands("modis")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -621,20 +1124,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_1,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_2,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_3,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_4,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_5,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_6,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_7,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_11,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_12,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_13,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_14,
-            PredefinedWavelengths.ACCURATE_MODIS_AQUA_15,
-        ]
+        wv = cls._sensor_bands("aqua")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -659,20 +1149,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_1,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_2,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_3,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_4,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_5,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_6,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_7,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_11,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_12,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_13,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_14,
-            PredefinedWavelengths.ACCURATE_MODIS_TERRA_15,
-        ]
+        wv = cls._sensor_bands("terra")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -697,11 +1174,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.SPOT_HRV1_B1,
-            PredefinedWavelengths.SPOT_HRV1_B2,
-            PredefinedWavelengths.SPOT_HRV1_B3,
-        ]
+        wv = cls._sensor_bands("spot_hrv")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -725,12 +1198,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.SPOT_VGT_B1,
-            PredefinedWavelengths.SPOT_VGT_B2,
-            PredefinedWavelengths.SPOT_VGT_B3,
-            PredefinedWavelengths.SPOT_VGT_B4,
-        ]
+        wv = cls._sensor_bands("spot_vgt")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -754,12 +1222,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.PROBAV_1_01,
-            PredefinedWavelengths.PROBAV_1_02,
-            PredefinedWavelengths.PROBAV_1_03,
-            PredefinedWavelengths.PROBAV_1_04,
-        ]
+        wv = cls._sensor_bands("probav_1")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -784,12 +1247,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.PROBAV_2_01,
-            PredefinedWavelengths.PROBAV_2_02,
-            PredefinedWavelengths.PROBAV_2_03,
-            PredefinedWavelengths.PROBAV_2_04,
-        ]
+        wv = cls._sensor_bands("probav_2")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -814,12 +1272,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.PROBAV_3_01,
-            PredefinedWavelengths.PROBAV_3_02,
-            PredefinedWavelengths.PROBAV_3_03,
-            PredefinedWavelengths.PROBAV_3_04,
-        ]
+        wv = cls._sensor_bands("probav_3")
 
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
@@ -844,16 +1297,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.POLDER_B1,
-            PredefinedWavelengths.POLDER_B2,
-            PredefinedWavelengths.POLDER_B3,
-            PredefinedWavelengths.POLDER_B4,
-            PredefinedWavelengths.POLDER_B5,
-            PredefinedWavelengths.POLDER_B6,
-            PredefinedWavelengths.POLDER_B7,
-            PredefinedWavelengths.POLDER_B8,
-        ]
+        wv = cls._sensor_bands("polder")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -877,16 +1321,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.SEAWIFS_B1,
-            PredefinedWavelengths.SEAWIFS_B2,
-            PredefinedWavelengths.SEAWIFS_B3,
-            PredefinedWavelengths.SEAWIFS_B4,
-            PredefinedWavelengths.SEAWIFS_B5,
-            PredefinedWavelengths.SEAWIFS_B6,
-            PredefinedWavelengths.SEAWIFS_B7,
-            PredefinedWavelengths.SEAWIFS_B8,
-        ]
+        wv = cls._sensor_bands("seawifs")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -910,12 +1345,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.AATSR_B1,
-            PredefinedWavelengths.AATSR_B2,
-            PredefinedWavelengths.AATSR_B3,
-            PredefinedWavelengths.AATSR_B4,
-        ]
+        wv = cls._sensor_bands("aatsr")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -939,18 +1369,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.ASTER_B1,
-            PredefinedWavelengths.ASTER_B2,
-            PredefinedWavelengths.ASTER_B3N,
-            PredefinedWavelengths.ASTER_B3B,
-            PredefinedWavelengths.ASTER_B4,
-            PredefinedWavelengths.ASTER_B5,
-            PredefinedWavelengths.ASTER_B6,
-            PredefinedWavelengths.ASTER_B7,
-            PredefinedWavelengths.ASTER_B8,
-            PredefinedWavelengths.ASTER_B9,
-        ]
+        wv = cls._sensor_bands("aster")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -974,22 +1393,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.VIIRS_BM1,
-            PredefinedWavelengths.VIIRS_BM2,
-            PredefinedWavelengths.VIIRS_BM3,
-            PredefinedWavelengths.VIIRS_BM4,
-            PredefinedWavelengths.VIIRS_BI1,
-            PredefinedWavelengths.VIIRS_BM5,
-            PredefinedWavelengths.VIIRS_BM6,
-            PredefinedWavelengths.VIIRS_BM7,
-            PredefinedWavelengths.VIIRS_BM8,
-            PredefinedWavelengths.VIIRS_BM9,
-            PredefinedWavelengths.VIIRS_BM10,
-            PredefinedWavelengths.VIIRS_BM11,
-            PredefinedWavelengths.VIIRS_BM12,
-            PredefinedWavelengths.VIIRS_BI4,
-        ]
+        wv = cls._sensor_bands("viirs")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -1013,15 +1417,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.ER2_MAS_B1,
-            PredefinedWavelengths.ER2_MAS_B2,
-            PredefinedWavelengths.ER2_MAS_B3,
-            PredefinedWavelengths.ER2_MAS_B4,
-            PredefinedWavelengths.ER2_MAS_B5,
-            PredefinedWavelengths.ER2_MAS_B6,
-            PredefinedWavelengths.ER2_MAS_B7,
-        ]
+        wv = cls._sensor_bands("er2_mas")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -1045,17 +1441,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.ALI_B1P,
-            PredefinedWavelengths.ALI_B1,
-            PredefinedWavelengths.ALI_B2,
-            PredefinedWavelengths.ALI_B3,
-            PredefinedWavelengths.ALI_B4,
-            PredefinedWavelengths.ALI_B4P,
-            PredefinedWavelengths.ALI_B5P,
-            PredefinedWavelengths.ALI_B5,
-            PredefinedWavelengths.ALI_B7,
-        ]
+        wv = cls._sensor_bands("ali")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -1079,36 +1465,7 @@ class Wavelengths:
         A tuple containing the centre wavlengths used for the run and the results of the simulations. The results will be a list of :class:`SixS.Outputs` instances if ``output_name`` is not set,
         or a list of values of the selected output if ``output_name`` is set.
         """
-        wv = [
-            PredefinedWavelengths.GLI_B1,
-            PredefinedWavelengths.GLI_B2,
-            PredefinedWavelengths.GLI_B3,
-            PredefinedWavelengths.GLI_B4,
-            PredefinedWavelengths.GLI_B5,
-            PredefinedWavelengths.GLI_B6,
-            PredefinedWavelengths.GLI_B7,
-            PredefinedWavelengths.GLI_B8,
-            PredefinedWavelengths.GLI_B9,
-            PredefinedWavelengths.GLI_B10,
-            PredefinedWavelengths.GLI_B22,
-            PredefinedWavelengths.GLI_B11,
-            PredefinedWavelengths.GLI_B12,
-            PredefinedWavelengths.GLI_B13,
-            PredefinedWavelengths.GLI_B14,
-            PredefinedWavelengths.GLI_B15,
-            PredefinedWavelengths.GLI_B16,
-            PredefinedWavelengths.GLI_B17,
-            PredefinedWavelengths.GLI_B18,
-            PredefinedWavelengths.GLI_B23,
-            PredefinedWavelengths.GLI_B19,
-            PredefinedWavelengths.GLI_B24,
-            PredefinedWavelengths.GLI_B25,
-            PredefinedWavelengths.GLI_B26,
-            PredefinedWavelengths.GLI_B27,
-            PredefinedWavelengths.GLI_B28,
-            PredefinedWavelengths.GLI_B29,
-            PredefinedWavelengths.GLI_B30,
-        ]
+        wv = cls._sensor_bands("gli")
         wv, res = cls.run_wavelengths(s, wv, **kwargs)
 
         centre_wvs = map(cls.to_centre_wavelengths, wv)
@@ -1131,14 +1488,18 @@ class Wavelengths:
     def extract_output(cls, results, output_name):
         """Extracts data for one particular SixS output from a list of SixS.Outputs instances.
 
-        Basically just a wrapper around a list comprehension.
+        Basically just a wrapper around a list comprehension - or, for an :class:`.OutputsBatch`, a lookup of the
+        column storing that output.
 
         Arguments:
 
-        * ``results`` -- A list of :class:`.SixS.Outputs` instances
+        * ``results`` -- A list of :class:`.SixS.Outputs` instances, or an :class:`.OutputsBatch`
         * ``output_name`` -- The name of the output to extract. This should be a string containing whatever is put after the `s.outputs` when printing the output, for example `'pixel_reflectance'`.
 
         """
+        if isinstance(results, OutputsBatch):
+            return results[output_name]
+
         results_output = [cls.recursive_getattr(r, output_name) for r in results]
 
         return results_output
@@ -1167,3 +1528,167 @@ class Wavelengths:
         xlabel("Wavelength ($\\mu m$)")
         ylabel(y_axis_label)
         show()
+
+
+def _run_wavelength(snapshot, output_name, verbose, wv):
+    """Runs the :class:`.ParameterSnapshot` ``snapshot`` for the wavelength ``wv``, used by :meth:`Wavelengths.run_wavelengths`."""
+    if verbose:
+        print(wv)
+
+    outputs = snapshot.run(wavelength=Wavelength(wv))
+
+    if output_name is None:
+        return outputs
+    else:
+        return Wavelengths.recursive_getattr(outputs, output_name)
+
+
+async def _run_wavelength_async(snapshot, output_name, semaphore, wv):
+    """Runs the :class:`.ParameterSnapshot` ``snapshot`` for the wavelength ``wv`` on the event loop, used by
+    :meth:`Wavelengths.wavelengths_async`."""
+    async with semaphore:
+        outputs = await snapshot.run_async(wavelength=Wavelength(wv))
+
+    if output_name is None:
+        return outputs
+    else:
+        return Wavelengths.recursive_getattr(outputs, output_name)
+
+
+def _adaptive_sample(func, start, end, initial_spacing, min_spacing, tolerance):
+    """Samples the function ``func`` (which takes a list of wavelengths and returns a list of values) adaptively, as described
+    for :meth:`Wavelengths.adaptive_wavelengths`."""
+    # Wavelengths are handled as integer numbers of min_spacing from the start, so that halving a gap always gives
+    # exactly the same wavelengths, however it is reached
+    total = int(round((end - start) / min_spacing))
+    step = max(int(round(initial_spacing / min_spacing)), 1)
+    indices = np.unique(np.append(np.arange(0, total, step), total))
+
+    def sample(new_indices):
+        values.update(zip(new_indices, func(list(start + new_indices * min_spacing))))
+
+    values = {}
+    sample(indices)
+
+    if tolerance is None:
+        initial_values = np.array([values[i] for i in indices], dtype=np.float64)
+        tolerance = 0.01 * (initial_values.max() - initial_values.min())
+
+    # The gaps which are still to be checked, as the indices of the wavelengths on either side
+    gaps = [(left, right) for left, right in zip(indices[:-1], indices[1:]) if right - left > 1]
+
+    while gaps:
+        middles = np.array([(left + right) // 2 for left, right in gaps])
+        sample(middles)
+
+        new_gaps = []
+        for (left, right), middle in zip(gaps, middles):
+            fraction = (middle - left) / (right - left)
+            linear = values[left] + (values[right] - values[left]) * fraction
+            if abs(values[middle] - linear) > tolerance:
+                new_gaps.extend(
+                    gap for gap in [(left, middle), (middle, right)] if gap[1] - gap[0] > 1
+                )
+        gaps = new_gaps
+
+    sampled = np.array(sorted(values))
+    sampled_wavelengths = start + sampled * min_spacing
+    sampled_values = np.array([values[i] for i in sampled], dtype=np.float64)
+
+    wavelengths = start + np.arange(total + 1) * min_spacing
+    return (
+        wavelengths,
+        np.interp(wavelengths, sampled_wavelengths, sampled_values),
+        sampled_wavelengths,
+        sampled_values,
+    )
+
+
+def _convolution_wavelengths(bands, spacing):
+    """Gets the wavelengths of the sweep used by :meth:`Wavelengths.convolve_sensors` for the given bands: the wavelengths
+    at the given spacing which are within one of the bands, plus one on either side of each band."""
+    starts = np.array([band[1] for band in bands])
+    ends = np.array([band[2] for band in bands])
+
+    wavelengths = np.arange(starts.min() - spacing, ends.max() + 1.5 * spacing, spacing)
+
+    needed = np.zeros(len(wavelengths), dtype=bool)
+    for start, end in zip(starts, ends):
+        needed |= (wavelengths > start - 2 * spacing) & (wavelengths < end + 2 * spacing)
+
+    wavelengths = np.clip(
+        wavelengths[needed],
+        PredefinedWavelengths.MIN_ALLOWABLE_WAVELENGTH,
+        PredefinedWavelengths.MAX_ALLOWABLE_WAVELENGTH,
+    )
+
+    return np.unique(np.round(wavelengths, 6))
+
+
+def _solar_weighted(output_name):
+    """Whether the output with the given name is weighted by the solar spectrum (as well as the filter function) when
+    convolving it with the filter function of a band"""
+    if output_name.startswith("percent_"):
+        return True
+    return "radiance" not in output_name and output_name != "solar_spectrum"
+
+
+def _convolve(wavelengths, batch, bands):
+    """Convolves the outputs in ``batch``, from simulations for each of ``wavelengths``, with the filter functions of
+    ``bands``, returning a dictionary mapping the name of each output to an array of its values for each band.
+    """
+    names = list(batch.keys())
+    values = np.column_stack([batch[name] for name in names])
+    solar_weighted = np.array([_solar_weighted(name) for name in names])
+
+    # A failed simulation only makes the outputs of the bands which use it NaN
+    failed = np.isnan(values)
+    values = np.where(failed, 0.0, values)
+
+    results = np.empty((len(bands), len(names)))
+    int_solar_spectrum = np.empty(len(bands))
+
+    for i, (_, start, end, band_filter) in enumerate(bands):
+        band_filter = np.asarray(band_filter, dtype=np.float64)
+        filter_wavelengths = start + 0.0025 * np.arange(len(band_filter))
+
+        # The outputs at each wavelength of the filter function are linearly interpolated from the two nearest
+        # wavelengths of the sweep, so each band is a weighted sum of the outputs of the sweep
+        upper = np.clip(np.searchsorted(wavelengths, filter_wavelengths), 1, len(wavelengths) - 1)
+        lower = upper - 1
+        t = (filter_wavelengths - wavelengths[lower]) / (wavelengths[upper] - wavelengths[lower])
+
+        solar = batch["solar_spectrum"][lower] * (1 - t) + batch["solar_spectrum"][upper] * t
+        int_solar_spectrum[i] = np.sum(band_filter * solar) * 0.0025
+
+        for weighted, point_weights in [(False, band_filter), (True, band_filter * solar)]:
+            point_weights = point_weights / point_weights.sum()
+            weights = np.zeros(len(wavelengths))
+            np.add.at(weights, lower, point_weights * (1 - t))
+            np.add.at(weights, upper, point_weights * t)
+
+            columns = solar_weighted == weighted
+            results[i, columns] = weights @ values[:, columns]
+            results[i, columns & ((weights != 0) @ failed)] = np.nan
+
+    columns = {name: results[:, j] for j, name in enumerate(names)}
+    columns["int_solar_spectrum"] = int_solar_spectrum
+    return columns
+
+
+def _wavelength_results(wavelengths, results, output_name, batch):
+    """Converts the results of running for each of the given wavelengths into the values returned by
+    :meth:`Wavelengths.run_wavelengths`."""
+    if batch and output_name is None:
+        results = OutputsBatch(results)
+    else:
+        results = np.array(results)
+
+    try:
+        if len(wavelengths[0]) == 4:
+            cleaned_wavelengths = list(map(lambda x: x[:3], wavelengths))
+            return np.array(cleaned_wavelengths), results
+        else:
+            return np.array(wavelengths), results
+    except Exception:
+        return np.array(wavelengths), results
@@ -0,0 +1,306 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Functions for choosing the executor used to run many 6S simulations in parallel"""
+
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from ..sixs_exceptions import Error, ExecutionCancelledError, ExecutionTimeoutError, ParameterError
+from ..workers import Cancellation, run_cancellable
+
+
+def get_executor(executor=None, n=None):
+    """Gets an executor to run the 6S simulations on.
+
+    Arguments:
+
+    * ``executor`` -- (Optional) Either ``'thread'`` (the default) to run the simulations on a pool of threads,
+      ``'process'`` to run them on a pool of processes, or an existing :class:`concurrent.futures.Executor` instance
+      (such as a :class:`.WorkerPool`)
+    * ``n`` -- (Optional) The number of threads or processes to create. This defaults to the number of CPU cores
+      in your system, and is ignored if an existing executor is given.
+
+    Return value:
+
+    A tuple containing the executor and a boolean stating whether the executor was created by this function,
+    and therefore should be shut down by the caller once it has finished with it.
+
+    """
+    if isinstance(executor, Executor):
+        return executor, False
+
+    if n is None:
+        n = os.cpu_count() or 1
+
+    if executor is None or executor == "thread":
+        return ThreadPoolExecutor(n), True
+    elif executor == "process":
+        return ProcessPoolExecutor(n), True
+    else:
+        raise ParameterError(
+            "executor",
+            "The executor must be 'thread', 'process' or an instance of concurrent.futures.Executor",
+        )
+
+
+def map_on_executor(func, iterable, executor=None, n=None, timeout=None, errors="raise"):
+    """Maps ``func`` over ``iterable`` using the executor chosen by :func:`get_executor`, returning a list of the results
+    in the same order as ``iterable``.
+
+    Executors created by this function are shut down before it returns; executors passed in are left running so
+    that they can be re-used.
+
+    If one of the calls fails (and ``errors`` is ``'raise'``), or the calls take longer than ``timeout``, then the
+    calls which haven't started yet are cancelled. On a pool of threads (including a :class:`.WorkerPool`) the 6S
+    processes which are still running are killed as well; on a pool of processes they are left to finish.
+
+    Arguments:
+
+    * ``func``, ``iterable``, ``executor``, ``n`` -- As described above and for :func:`get_executor`
+    * ``timeout`` -- (Optional) The maximum time, in seconds, for all of the calls to finish
+    * ``errors`` -- (Optional) What to do when a call raises one of the Py6S exceptions: ``'raise'`` (the default) to
+      raise it, or ``'return'`` to put the exception in the list of results in place of the result of that call.
+      If the calls take longer than ``timeout`` then the results of the unfinished calls are
+      :class:`.ExecutionCancelledError` instances.
+
+    May raise an :class:`.ExecutionTimeoutError` if ``errors`` is ``'raise'`` and the calls take longer than ``timeout``.
+
+    """
+    if errors not in ("raise", "return"):
+        raise ParameterError("errors", "errors must be 'raise' or 'return'")
+
+    pool, owned = get_executor(executor, n)
+    cancellation = Cancellation()
+
+    # Runs on other processes can't be killed from here, as the cancellation can't be shared with them
+    if not isinstance(pool, ProcessPoolExecutor):
+        func = functools.partial(run_cancellable, cancellation, func)
+
+    futures = []
+    try:
+        for item in iterable:
+            futures.append(pool.submit(func, item))
+
+        # When raising errors, stop waiting as soon as any of the calls fails
+        done, not_done = concurrent.futures.wait(
+            futures,
+            timeout,
+            (
+                concurrent.futures.FIRST_EXCEPTION
+                if errors == "raise"
+                else concurrent.futures.ALL_COMPLETED
+            ),
+        )
+
+        if not_done:
+            _cancel(futures, cancellation)
+
+        if errors == "raise":
+            # Raise the first error, rather than the errors of the runs which were cancelled because of it
+            for future in futures:
+                if future in done and future.exception() is not None:
+                    raise future.exception()
+
+            if not_done:
+                raise ExecutionTimeoutError(
+                    "The 6S runs did not finish within %g seconds." % timeout, timeout
+                )
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except concurrent.futures.CancelledError:
+                results.append(ExecutionCancelledError("The 6S run was cancelled."))
+            except Error as e:
+                if errors == "raise":
+                    raise
+                results.append(e)
+
+        return results
+    except BaseException:
+        # Including KeyboardInterrupt, so that interrupting a batch doesn't leave it running
+        _cancel(futures, cancellation)
+        raise
+    finally:
+        if owned:
+            pool.shutdown(wait=not cancellation.cancelled)
+
+
+def _cancel(futures, cancellation):
+    for future in futures:
+        future.cancel()
+    cancellation.cancel()
+
+
+def imap_on_executor(
+    func, iterable, executor=None, n=None, ordered=True, window=None, errors="raise"
+):
+    """Maps ``func`` over ``iterable`` using the executor chosen by :func:`get_executor`, yielding a tuple of each item
+    and its result as soon as it is available.
+
+    Only ``window`` calls are submitted to the executor at once, and items are only taken from ``iterable`` as
+    calls finish, so the memory used stays the same however many items there are. If the generator is closed
+    (or garbage collected) before it has finished, the calls which are still running are cancelled in the same
+    way as :func:`map_on_executor`.
+
+    Arguments:
+
+    * ``func``, ``iterable``, ``executor``, ``n`` -- As described above and for :func:`get_executor`
+    * ``ordered`` -- (Optional) If True (the default), yield the results in the same order as ``iterable``. If False, yield
+      each result as soon as its call finishes.
+    * ``window`` -- (Optional) The maximum number of calls running (or waiting to run) at once. This defaults to twice the
+      number of threads or processes.
+    * ``errors`` -- (Optional) As for :func:`map_on_executor`
+
+    """
+    if errors not in ("raise", "return"):
+        raise ParameterError("errors", "errors must be 'raise' or 'return'")
+
+    if n is None:
+        n = os.cpu_count() or 1
+
+    if window is None:
+        window = 2 * getattr(executor, "_max_workers", n)
+    elif window < 1:
+        raise ParameterError("window", "The window must be at least 1")
+
+    pool, owned = get_executor(executor, n)
+    cancellation = Cancellation()
+
+    if not isinstance(pool, ProcessPoolExecutor):
+        func = functools.partial(run_cancellable, cancellation, func)
+
+    items = iter(iterable)
+    # The submitted calls, in the order their items were taken from the iterable
+    running = collections.OrderedDict()
+
+    try:
+        while True:
+            for item in itertools.islice(items, window - len(running)):
+                running[pool.submit(func, item)] = item
+
+            if not running:
+                break
+
+            if ordered:
+                future = next(iter(running))
+            else:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                future = next(f for f in running if f in done)
+
+            item = running.pop(future)
+
+            try:
+                result = future.result()
+            except Error as e:
+                if errors == "raise":
+                    raise
+                result = e
+
+            yield item, result
+    finally:
+        # Cancel any calls which are still running if the generator is stopped early
+        if running:
+            _cancel(running, cancellation)
+
+        if owned:
+            pool.shutdown(wait=not cancellation.cancelled)
+
+
+async def gather_async(func, iterable, limit=None, timeout=None, errors="raise"):
+    """Runs the coroutine function ``func`` for each item of ``iterable`` concurrently on the running :mod:`asyncio`
+    event loop, returning a list of the results in the same order as ``iterable``.
+
+    ``func`` is called as ``func(semaphore, item)``, and should hold the :class:`asyncio.Semaphore` while it is
+    working, so that only ``limit`` of the calls run at once. The other calls wait for the semaphore without using
+    a thread (or much memory) each, so thousands of calls can be given at once.
+
+    If one of the calls fails (and ``errors`` is ``'raise'``), the calls take longer than ``timeout``, or the task
+    awaiting this coroutine is cancelled, then the calls which haven't finished are cancelled, killing their 6S processes.
+
+    Arguments:
+
+    * ``func``, ``iterable`` -- As described above
+    * ``limit`` -- (Optional) The maximum number of calls to run at once. This defaults to the number of CPU cores in your system.
+    * ``timeout``, ``errors`` -- (Optional) As for :func:`map_on_executor`
+
+    """
+    import asyncio
+
+    if errors not in ("raise", "return"):
+        raise ParameterError("errors", "errors must be 'raise' or 'return'")
+
+    if limit is None:
+        limit = os.cpu_count() or 1
+
+    semaphore = asyncio.Semaphore(limit)
+    tasks = [asyncio.ensure_future(func(semaphore, item)) for item in iterable]
+
+    if not tasks:
+        return []
+
+    try:
+        done, pending = await asyncio.wait(
+            tasks,
+            timeout=timeout,
+            return_when=asyncio.FIRST_EXCEPTION if errors == "raise" else asyncio.ALL_COMPLETED,
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    # Wait for the cancelled calls to finish, so that their 6S processes have been killed
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+    # Get the exception from every failed call, so that asyncio doesn't warn that they weren't retrieved
+    failures = [task for task in tasks if not task.cancelled() and task.exception() is not None]
+
+    if errors == "raise":
+        # Raise the first error, rather than the errors of the calls which were cancelled because of it
+        for task in failures:
+            if task in done:
+                raise task.exception()
+
+        if pending:
+            raise ExecutionTimeoutError(
+                "The 6S runs did not finish within %g seconds." % timeout, timeout
+            )
+
+    results = []
+    for task in tasks:
+        if task.cancelled():
+            results.append(ExecutionCancelledError("The 6S run was cancelled."))
+        elif task.exception() is None:
+            results.append(task.result())
+        elif isinstance(task.exception(), Error):
+            results.append(task.exception())
+        else:
+            raise task.exception()
+
+    return results
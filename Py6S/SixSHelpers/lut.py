@@ -0,0 +1,748 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Creation of lookup tables of 6S outputs, by running 6S for every combination of a set of parameter values"""
+
+import copy
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from ..Params import PredefinedWavelengths, Wavelength
+from ..Params.wavelength import _PredefinedWavelength
+from ..sixs_exceptions import ParameterError
+from ..snapshot import ParameterSnapshot
+from .all_wavelengths import Wavelengths
+from .executors import get_executor, map_on_executor
+
+
+class LookupTable(object):
+    """A lookup table of 6S outputs, stored as N-dimensional arrays with one named axis for each parameter varied.
+
+    Lookup tables are created by running 6S for every combination of the given parameter values with :meth:`create`,
+    and can be saved to (and loaded from) a single compressed file with :meth:`save` and :meth:`load`. Outputs can be
+    interpolated from the lookup table for whole images at once with :meth:`interpolate`, and images of radiance can be
+    atmospherically corrected with :meth:`atmospheric_correction`.
+
+    Attributes:
+
+    * ``axes`` -- A list of the names of the axes, which are the names of the parameters varied (for example ``geometry.solar_z``)
+    * ``coords`` -- A dictionary mapping each axis name to an array of the parameter values along that axis. Numerical parameter
+      values are stored as floats, and any others (such as predefined wavelengths) as strings describing each value
+    * ``outputs`` -- A dictionary mapping each output name (for example ``pixel_radiance``) to an array of that output, with one
+      dimension for each axis
+
+    Example usage::
+
+      s = SixS()
+      lut = SixSHelpers.LookupTable.create(
+          s,
+          {"geometry.solar_z": [0, 20, 40, 60], "aot550": [0.05, 0.1, 0.2, 0.4]},
+          ["pixel_radiance", "transmittance_total_scattering.downward"],
+      )
+      lut["pixel_radiance"][2, 1]  # The pixel radiance for a solar zenith angle of 40 and AOT of 0.1
+      lut.save("lut.npz")
+
+    """
+
+    def __init__(self, axes, outputs):
+        """Initialises the lookup table from existing data.
+
+        Arguments:
+
+        * ``axes`` -- A list of (name, coordinates) pairs, one for each axis
+        * ``outputs`` -- A dictionary mapping output names to arrays, whose shape must match the lengths of the axes
+
+        """
+        self.axes = [name for name, _ in axes]
+        self.coords = dict((name, np.asarray(coords)) for name, coords in axes)
+        self.outputs = dict((name, np.asarray(values)) for name, values in outputs.items())
+
+        for name, values in self.outputs.items():
+            if values.shape != self.shape:
+                raise ParameterError(
+                    "outputs",
+                    "The shape of the %s output %s doesn't match the shape of the axes %s"
+                    % (name, values.shape, self.shape),
+                )
+
+    @property
+    def shape(self):
+        return tuple(len(self.coords[name]) for name in self.axes)
+
+    def __getitem__(self, output_name):
+        """Gets the array storing the given output"""
+        return self.outputs[output_name]
+
+    def __repr__(self):
+        return "LookupTable(axes=%s, shape=%s, outputs=%s)" % (
+            self.axes,
+            self.shape,
+            sorted(self.outputs),
+        )
+
+    @classmethod
+    def create(
+        cls,
+        s,
+        params,
+        output_names,
+        setters=None,
+        checkpoint=None,
+        n=None,
+        executor=None,
+        block_size=256,
+        timeout=None,
+        errors="raise",
+    ):
+        """Creates a lookup table by running the given SixS parameterisation for every combination of the given parameter values.
+
+        The runs are performed in parallel, in blocks of ``block_size`` runs. If a ``checkpoint`` directory is given then the results of each
+        block are written to it as soon as the block has finished, and calling this function again with the same arguments will carry on from
+        where it left off - for example after a crash, or after being interrupted.
+
+        Arguments:
+
+        * ``s`` -- A :class:`.SixS` instance with the parameters that are not varied set as required
+        * ``params`` -- A dictionary mapping parameters to the values to use for them. The parameters are given as the attribute path after ``s.``,
+          for example ``aot550`` or ``geometry.solar_z``. The axes of the lookup table will be in the same order as this dictionary.
+        * ``output_names`` -- A list of the outputs to store, each given as the string that could be placed after ``s.outputs.``, for example
+          ``pixel_radiance`` or ``transmittance_water.downward``
+        * ``setters`` -- (Optional) A dictionary mapping parameter names to functions that set that parameter, for parameters that aren't simply attributes.
+          Each function is called as ``setter(s, value)``. For example, ``{"water": lambda s, v: setattr(s, "atmos_profile", AtmosProfile.UserWaterAndOzone(v, 0.3))}``.
+          The ``wavelength`` parameter is set with :meth:`.Wavelength` by default, so it can be given as wavelengths in micrometres or as
+          predefined wavelengths such as ``PredefinedWavelengths.LANDSAT_OLI_B1``. Each run is given a shallow copy of ``s``, so setters must
+          assign new objects (as in the example) rather than changing the objects stored in ``s``, which are shared between the runs.
+        * ``checkpoint`` -- (Optional) A directory to store the partially completed lookup table in, so that it can be resumed. A checkpoint
+          is only resumed with the same parameters, outputs and setters (identified by their qualified names) that it was created with.
+        * ``n`` -- (Optional) The number of threads or processes to run in parallel. This defaults to the number of CPU cores in your system.
+        * ``executor`` -- (Optional) Where to run the simulations: ``'thread'`` (the default), ``'process'`` or an existing
+          :class:`concurrent.futures.Executor` instance, as for :meth:`.Wavelengths.run_wavelengths`. Setter functions must be defined
+          at the top level of a module (not as lambdas) to be used with a pool of processes.
+        * ``block_size`` -- (Optional) The number of runs to perform between each write to the ``checkpoint`` directory
+        * ``timeout`` -- (Optional) The maximum time, in seconds, for all of the runs to finish. Set the ``timeout`` attribute of ``s`` to limit the
+          time taken by each run.
+        * ``errors`` -- (Optional) Set to ``'return'`` to store NaN for each run which fails (or which is cancelled because the runs took longer than
+          ``timeout``) rather than raising the first exception (default='raise'). These runs aren't marked as done in the ``checkpoint`` directory,
+          so they are run again when the lookup table is resumed.
+
+        Return value:
+
+        A :class:`LookupTable` instance
+
+        """
+        if errors not in ("raise", "return"):
+            raise ParameterError("errors", "errors must be 'raise' or 'return'")
+
+        names = list(params.keys())
+        values = [list(params[name]) for name in names]
+        axes = [(name, _axis_coordinates(v)) for name, v in zip(names, values)]
+        shape = tuple(len(v) for v in values)
+        output_names = list(output_names)
+
+        all_setters = {"wavelength": _set_wavelength}
+        if setters is not None:
+            all_setters.update(setters)
+
+        # A private copy of s, so that the outputs of s can be cleared (so that they aren't copied to every
+        # simulation) without changing s itself
+        s = copy.copy(s)
+        s.outputs = None
+
+        if checkpoint is None:
+            done = np.zeros(shape, dtype=bool)
+            outputs = [np.full(shape, np.nan) for name in output_names]
+        else:
+            done, outputs = _open_checkpoint(checkpoint, s, axes, output_names, all_setters)
+
+        todo = np.flatnonzero(~done.reshape(-1))
+
+        if all(_snapshot_parameter(name) and name not in (setters or {}) for name in names):
+            # The sections of the input file which aren't varied are only rendered once
+            f = functools.partial(
+                _run_lut_snapshot_point, ParameterSnapshot(s), s.geometry, names, output_names
+            )
+        else:
+            f = functools.partial(_run_lut_point, s, names, all_setters, output_names)
+
+        print(
+            "Running for %d parameter combinations (%d already completed) - this may take a long time"
+            % (done.size, done.size - len(todo))
+        )
+
+        pool, owned = get_executor(executor, n)
+
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        try:
+            for start in range(0, len(todo), block_size):
+                block = todo[start : start + block_size]
+                points = []
+                for index in zip(*np.unravel_index(block, shape)):
+                    points.append(tuple(v[i] for v, i in zip(values, index)))
+
+                if timeout is not None:
+                    timeout = max(deadline - time.monotonic(), 0)
+
+                results = np.full((len(block), len(output_names)), np.nan)
+                succeeded = np.ones(len(block), dtype=bool)
+                for i, result in enumerate(map_on_executor(f, points, pool, n, timeout, errors)):
+                    if isinstance(result, Exception):
+                        succeeded[i] = False
+                    else:
+                        results[i] = result
+
+                # The outputs are written before the runs are marked as done, so that
+                # runs are never marked as done without their outputs being stored
+                for i, output in enumerate(outputs):
+                    output.reshape(-1)[block] = results[:, i]
+                    if checkpoint is not None:
+                        output.flush()
+
+                done.reshape(-1)[block[succeeded]] = True
+                if checkpoint is not None:
+                    done.flush()
+        finally:
+            if owned:
+                pool.shutdown()
+
+        return cls(
+            axes, dict((name, np.array(output)) for name, output in zip(output_names, outputs))
+        )
+
+    def interpolate(
+        self,
+        params,
+        output_names=None,
+        chunk_size=65536,
+        bounds_error=True,
+        fill_value=np.nan,
+        out=None,
+    ):
+        """Interpolates outputs from the lookup table at many points at once, such as the parameters of every pixel in an image.
+
+        Numerical axes are interpolated linearly (so the interpolation is bilinear, trilinear, and so on, depending on the number of axes).
+        Axes with string coordinates, such as predefined wavelengths, are not interpolated: the points must be given as one of the strings, or as an
+        integer index along the axis.
+
+        Arguments:
+
+        * ``params`` -- A dictionary mapping axis names to the values to interpolate at, as arrays (or single values) which can be broadcast
+          against each other. Every axis with more than one value must be given.
+        * ``output_names`` -- (Optional) A list of the outputs to interpolate. Defaults to all of the outputs in the lookup table.
+        * ``chunk_size`` -- (Optional) The number of points to interpolate at once, which limits the memory used for large arrays
+        * ``bounds_error`` -- (Optional) If True (the default), raise a :class:`.ParameterError` if any point is outside the lookup table. If False,
+          points outside the lookup table are given ``fill_value``.
+        * ``fill_value`` -- (Optional) The value to give points outside the lookup table if ``bounds_error`` is False (default NaN)
+        * ``out`` -- (Optional) A dictionary mapping output names to arrays to store the results in. These can be memory-mapped arrays (such as
+          those created by :func:`numpy.lib.format.open_memmap`), so that - combined with memory-mapped parameter arrays - arrays larger than
+          the available memory can be processed.
+
+        Return value:
+
+        A dictionary mapping each output name to an array of the interpolated values, with the shape given by broadcasting the parameter arrays
+
+        Example usage::
+
+          res = lut.interpolate({"geometry.solar_z": solar_z_image, "aot550": aot_image}, ["coef_xa"])
+          xa = res["coef_xa"]
+
+        """
+        if output_names is None:
+            output_names = sorted(self.outputs)
+
+        shape, results, chunks = self._interpolate_chunks(
+            params, output_names, [], chunk_size, bounds_error, fill_value, out
+        )
+
+        for chunk, values, _ in chunks:
+            for i, name in enumerate(output_names):
+                results[name].reshape(-1)[chunk] = values[i]
+
+        return results
+
+    def atmospheric_correction(
+        self, radiance, params, chunk_size=65536, bounds_error=True, fill_value=np.nan, out=None
+    ):
+        """Atmospherically corrects radiances using the atmospheric correction coefficients interpolated from the lookup table.
+
+        The lookup table must contain the ``coef_xa``, ``coef_xb`` and ``coef_xc`` outputs (which are produced when ``s.atmos_corr`` is set
+        to one of the :class:`.AtmosCorr` options). The corrected reflectance is calculated as 6S does::
+
+          y = xa * radiance - xb
+          corrected_reflectance = y / (1 + xc * y)
+
+        Arguments:
+
+        * ``radiance`` -- An array of the radiances to correct (in W/m^2/sr/um), which can be broadcast against the parameter arrays
+        * ``params`` -- A dictionary mapping axis names to the values to interpolate at, as for :meth:`interpolate`
+        * ``chunk_size``, ``bounds_error``, ``fill_value`` and ``out`` -- (Optional) As for :meth:`interpolate`. ``out`` can also contain an
+          array for ``corrected_reflectance``.
+
+        Return value:
+
+        A dictionary containing arrays of ``coef_xa``, ``coef_xb``, ``coef_xc`` and ``corrected_reflectance``
+
+        Example usage::
+
+          res = lut.atmospheric_correction(
+              radiance_image, {"geometry.view_z": view_z_image, "aot550": aot_image, "wavelength": "LANDSAT_OLI_B2"}
+          )
+          reflectance_image = res["corrected_reflectance"]
+
+        """
+        output_names = ["coef_xa", "coef_xb", "coef_xc"]
+
+        shape, results, chunks = self._interpolate_chunks(
+            params, output_names, [radiance], chunk_size, bounds_error, fill_value, out
+        )
+
+        if out is not None and "corrected_reflectance" in out:
+            results["corrected_reflectance"] = out["corrected_reflectance"]
+        else:
+            results["corrected_reflectance"] = np.empty(shape)
+
+        for chunk, values, (chunk_radiance,) in chunks:
+            xa, xb, xc = values
+            y = xa * chunk_radiance - xb
+
+            for i, name in enumerate(output_names):
+                results[name].reshape(-1)[chunk] = values[i]
+            results["corrected_reflectance"].reshape(-1)[chunk] = y / (1.0 + xc * y)
+
+        return results
+
+    def _interpolate_chunks(
+        self, params, output_names, extra_arrays, chunk_size, bounds_error, fill_value, out
+    ):
+        # Sets up the interpolation, returning the shape of the points, the arrays to store the results in,
+        # and a generator giving the interpolated values for each chunk of the (flattened) points - along with
+        # the matching chunks of the extra arrays
+        for name in params:
+            if name not in self.coords:
+                raise ParameterError("params", "The lookup table has no axis called %s" % name)
+
+        for name in output_names:
+            if name not in self.outputs:
+                raise ParameterError(
+                    "output_names", "The lookup table has no output called %s" % name
+                )
+
+        for name in self.axes:
+            if name not in params and len(self.coords[name]) > 1:
+                raise ParameterError(
+                    "params", "Values must be given for the %s axis of the lookup table" % name
+                )
+
+        # Axes given a single value are interpolated once, before the rest of the interpolation,
+        # rather than for every point
+        fixed = dict((name, value) for name, value in params.items() if np.ndim(value) == 0)
+        names = [name for name in self.axes if name in params and name not in fixed]
+        arrays = [np.asarray(params[name]) for name in names] + [
+            np.asarray(a) for a in extra_arrays
+        ]
+        shape = np.broadcast_shapes(*[a.shape for a in arrays])
+        size = int(np.prod(shape))
+
+        # Each array is flattened, without copying it if possible. Single values are left as they are, as they
+        # work with every chunk, and other arrays that need broadcasting are broadcast and copied.
+        flat_arrays = []
+        for a in arrays:
+            if a.ndim == 0:
+                flat_arrays.append(a)
+            elif a.shape == shape:
+                flat_arrays.append(a.reshape(-1))
+            else:
+                flat_arrays.append(np.broadcast_to(a, shape).reshape(-1))
+
+        table, axes = self._interpolation_table(output_names, fixed, bounds_error, fill_value)
+
+        results = {}
+        for name in output_names:
+            if out is not None and name in out:
+                results[name] = out[name]
+            else:
+                results[name] = np.empty(shape)
+
+        if chunk_size is None:
+            chunk_size = max(size, 1)
+
+        def chunks():
+            for start in range(0, size, chunk_size):
+                chunk = slice(start, min(start + chunk_size, size))
+                chunk_arrays = [a if a.ndim == 0 else a[chunk] for a in flat_arrays]
+                points = dict(zip(names, chunk_arrays))
+                values = _interpolate(
+                    table,
+                    axes,
+                    points,
+                    chunk.stop - chunk.start,
+                    bounds_error,
+                    fill_value,
+                )
+                yield chunk, values, chunk_arrays[len(names) :]
+
+        return shape, results, chunks()
+
+    def _interpolation_table(self, output_names, fixed, bounds_error, fill_value):
+        # Stacks the outputs into a single table, with each output stored in a separate contiguous row to make
+        # gathering the values quick. Any axes with decreasing coordinates are flipped so that all numerical axes
+        # are increasing, and axes with a fixed value are interpolated at that value.
+        table = np.stack([self.outputs[name] for name in output_names]).astype(np.float64)
+
+        axes = []
+        for i, name in enumerate(self.axes):
+            coords = self.coords[name]
+            categorical = coords.dtype.kind in "US"
+            axis = i + 1
+
+            if not categorical:
+                coords = coords.astype(np.float64)
+                if len(coords) > 1 and coords[0] > coords[-1]:
+                    coords = coords[::-1]
+                    table = np.flip(table, axis=axis)
+
+                if np.any(np.diff(coords) <= 0):
+                    raise ParameterError(
+                        "coords", "The coordinates of the %s axis must be strictly monotonic" % name
+                    )
+
+            if name in fixed:
+                value = fixed[name]
+
+                if categorical:
+                    index, valid = _categorical_index(coords, value)
+                    table = np.take(table, [index], axis=axis)
+                elif len(coords) == 1:
+                    valid = value == coords[0]
+                else:
+                    valid = coords[0] <= value <= coords[-1]
+                    index = min(
+                        max(np.searchsorted(coords, value, side="right") - 1, 0), len(coords) - 2
+                    )
+                    weight = (value - coords[index]) / (coords[index + 1] - coords[index])
+                    table = (1.0 - weight) * np.take(table, [index], axis=axis) + weight * np.take(
+                        table, [index + 1], axis=axis
+                    )
+
+                if not valid:
+                    if bounds_error:
+                        raise _out_of_bounds_error(name, coords, categorical, 1)
+                    table = np.full_like(table, fill_value)
+
+                coords = coords[:1]
+
+            axes.append((name, coords, categorical))
+
+        table = np.ascontiguousarray(table)
+        return table.reshape(len(output_names), -1), axes
+
+    def save(self, filename):
+        """Saves the lookup table to a single compressed NumPy (``.npz``) file, which can be loaded with :meth:`load`."""
+        arrays = {}
+        for i, name in enumerate(self.axes):
+            arrays["axis_%d" % i] = self.coords[name]
+
+        output_names = sorted(self.outputs)
+        for i, name in enumerate(output_names):
+            arrays["output_%d" % i] = self.outputs[name]
+
+        metadata = {"axes": self.axes, "outputs": output_names}
+        arrays["metadata"] = np.array(json.dumps(metadata))
+
+        np.savez_compressed(filename, **arrays)
+
+    @classmethod
+    def load(cls, filename):
+        """Loads a lookup table saved with :meth:`save`."""
+        with np.load(filename) as f:
+            metadata = json.loads(str(f["metadata"]))
+            axes = [(name, f["axis_%d" % i]) for i, name in enumerate(metadata["axes"])]
+            outputs = dict((name, f["output_%d" % i]) for i, name in enumerate(metadata["outputs"]))
+
+        return cls(axes, outputs)
+
+
+def _set_parameter(s, path, value, copy_path=False):
+    """Sets the parameter of ``s`` at the given attribute path, such as ``geometry.solar_z``. If ``copy_path`` is True
+    then each object along the path (such as ``s.geometry``) is replaced by a shallow copy before it is changed, so
+    that objects shared with other SixS instances are left unchanged."""
+    parts = path.split(".")
+
+    obj = s
+    for part in parts[:-1]:
+        child = getattr(obj, part)
+        if copy_path:
+            child = copy.copy(child)
+            setattr(obj, part, child)
+        obj = child
+
+    setattr(obj, parts[-1], value)
+
+
+def _set_wavelength(s, value):
+    s.wavelength = Wavelength(value)
+
+
+def _run_lut_point(s, names, setters, output_names, values):
+    """Runs a copy of the SixS instance ``s`` with the given parameter values, returning the requested outputs.
+    Used by :meth:`LookupTable.create`, and defined at the module level so it can be used with a pool of processes.
+    """
+    # A shallow copy, sharing the parameters of s (such as spectra and aerosol profiles) rather than copying them
+    # for every run. Only the objects along the path of each parameter which is set are copied.
+    a = copy.copy(s)
+
+    for name, value in zip(names, values):
+        if name in setters:
+            setters[name](a, value)
+        else:
+            _set_parameter(a, name, value, copy_path=True)
+
+    a.run()
+
+    return [Wavelengths.recursive_getattr(a.outputs, name) for name in output_names]
+
+
+def _snapshot_parameter(name):
+    """Whether the given parameter can be varied with a :class:`.ParameterSnapshot`, rather than copying the SixS instance"""
+    return name in ("wavelength", "aot550") or (
+        name.startswith("geometry.") and name.count(".") == 1
+    )
+
+
+def _run_lut_snapshot_point(snapshot, geometry, names, output_names, values):
+    """Runs the snapshot with the given values of the wavelength, AOT and geometry attributes, returning the requested
+    outputs. Used by :meth:`LookupTable.create` when only these parameters are varied."""
+    params = {}
+
+    for name, value in zip(names, values):
+        if name == "wavelength":
+            params["wavelength"] = Wavelength(value)
+        elif name == "aot550":
+            params["aot550"] = value
+        else:
+            if "geometry" not in params:
+                params["geometry"] = copy.copy(geometry)
+            setattr(params["geometry"], name.split(".")[1], value)
+
+    outputs = snapshot.run(**params)
+
+    return [Wavelengths.recursive_getattr(outputs, name) for name in output_names]
+
+
+def _axis_coordinates(values):
+    """Gets the coordinates to store for an axis: the values themselves if they are numbers, otherwise strings describing them"""
+    try:
+        coords = np.asarray(values, dtype=np.float64)
+        if coords.ndim == 1:
+            return coords
+    except (TypeError, ValueError):
+        pass
+
+    # Predefined wavelengths are described by their names, rather than by their (very long) values. The names
+    # are found from the class dictionary, so that the filter functions which haven't been used yet aren't loaded.
+    # A predefined wavelength can only be given as a value once it has been loaded, so the others aren't needed.
+    names = {}
+    for name, attribute in vars(PredefinedWavelengths).items():
+        if isinstance(attribute, _PredefinedWavelength) and attribute.value is not None:
+            names.setdefault(id(attribute.value), name)
+
+    coords = [names.get(id(value), str(value)) for value in values]
+
+    seen = set()
+    for coord in coords:
+        if coord in seen:
+            raise ParameterError(
+                "params",
+                "The values of an axis must be different, but more than one of them is described as %s"
+                % coord,
+            )
+        seen.add(coord)
+
+    return np.array(coords)
+
+
+def _interpolate(table, axes, points, size, bounds_error, fill_value):
+    """Interpolates the table (with one row for each output, and a column for each grid point in C order) at the
+    given points, returning an array with a row for each output. Used by :meth:`LookupTable.interpolate`.
+    """
+    base = np.zeros(size, dtype=np.intp)
+    valid = np.ones(size, dtype=bool)
+    # The offset into the table and the weight for each of the grid points around each point
+    corners = [(0, None)]
+
+    stride = 1
+    for name, coords, categorical in reversed(axes):
+        n = len(coords)
+
+        if name not in points:
+            # An axis with a single value
+            pass
+        elif categorical:
+            index, in_bounds = _categorical_index(coords, points[name])
+            base += index * stride
+            valid &= in_bounds
+        elif n == 1:
+            valid &= points[name] == coords[0]
+        else:
+            x = np.broadcast_to(points[name], (size,))
+            spacing = coords[1] - coords[0]
+            if np.allclose(np.diff(coords), spacing):
+                # For evenly-spaced coordinates the grid cell can be calculated directly, which is much quicker than searching
+                index = np.floor((x - coords[0]) / spacing)
+                index = np.clip(np.nan_to_num(index), 0, n - 2).astype(np.intp)
+            else:
+                index = np.clip(np.searchsorted(coords, x, side="right") - 1, 0, n - 2)
+            lower = coords[index]
+            weight = (x - lower) / (coords[index + 1] - lower)
+            valid &= (x >= coords[0]) & (x <= coords[-1])
+            base += index * stride
+
+            new_corners = []
+            for offset, corner_weight in corners:
+                if corner_weight is None:
+                    new_corners.append((offset, 1.0 - weight))
+                    new_corners.append((offset + stride, weight))
+                else:
+                    # corner_weight * (1 - weight), calculated in place
+                    upper_weight = corner_weight * weight
+                    corner_weight -= upper_weight
+                    new_corners.append((offset, corner_weight))
+                    new_corners.append((offset + stride, upper_weight))
+            corners = new_corners
+
+        if bounds_error and not np.all(valid):
+            raise _out_of_bounds_error(name, coords, categorical, np.count_nonzero(~valid))
+
+        stride *= n
+
+    # Each output is gathered separately from its own row of the table, which is much faster than
+    # gathering all of the outputs at each grid point at once, and the temporary arrays are re-used
+    result = np.zeros((table.shape[0], size))
+    index = np.empty(size, dtype=np.intp)
+    values = np.empty(size)
+
+    for offset, weight in corners:
+        np.add(base, offset, out=index)
+        for i in range(table.shape[0]):
+            np.take(table[i], index, out=values)
+            if weight is not None:
+                values *= weight
+            result[i] += values
+
+    if not np.all(valid):
+        result[:, ~valid] = fill_value
+
+    return result
+
+
+def _out_of_bounds_error(name, coords, categorical, count):
+    if categorical:
+        description = "one of %s" % ", ".join(coords)
+    else:
+        description = "between %g and %g" % (coords[0], coords[-1])
+
+    return ParameterError(
+        name,
+        "%d of the points are outside the lookup table: values of %s must be %s"
+        % (count, name, description),
+    )
+
+
+def _categorical_index(coords, values):
+    # Gets the indices of the given values along an axis of strings. The values can be given either as
+    # strings or as integer indices along the axis.
+    values = np.asarray(values)
+    n = len(coords)
+
+    if values.dtype.kind in "US":
+        order = np.argsort(coords)
+        position = np.clip(np.searchsorted(coords[order], values), 0, n - 1)
+        index = order[position]
+        return index, coords[index] == values
+    else:
+        in_bounds = (values >= 0) & (values < n) & (values == np.round(values))
+        return np.where(in_bounds, values, 0).astype(np.intp), in_bounds
+
+
+def _qualified_name(f):
+    """Gets the qualified name of a function (or of the class of a callable object), such as ``Py6S.SixSHelpers.lut._set_wavelength``"""
+    if not hasattr(f, "__qualname__"):
+        f = type(f)
+
+    return "%s.%s" % (f.__module__, f.__qualname__)
+
+
+def _open_checkpoint(directory, s, axes, output_names, setters):
+    """Opens the arrays storing a partially completed lookup table in the given directory, creating them
+    if they don't exist yet. Returns the array recording which runs are done, and the output arrays.
+    """
+    shape = tuple(len(coords) for _, coords in axes)
+
+    # The metadata identifies the lookup table, so that a checkpoint is only resumed with the same arguments
+    metadata = {
+        "axes": [[name, coords.tolist()] for name, coords in axes],
+        "outputs": output_names,
+        "sixs": hashlib.sha256(s._create_input_file_contents().encode("utf-8")).hexdigest(),
+        "setters": [
+            _qualified_name(setters[name]) if name in setters else None for name, _ in axes
+        ],
+    }
+
+    metadata_filename = os.path.join(directory, "metadata.json")
+    done_filename = os.path.join(directory, "done.npy")
+    output_filenames = [
+        os.path.join(directory, "output_%d.npy" % i) for i in range(len(output_names))
+    ]
+
+    if os.path.exists(metadata_filename):
+        with open(metadata_filename) as f:
+            existing = json.load(f)
+
+        if existing != metadata:
+            raise ParameterError(
+                "checkpoint",
+                "The checkpoint directory %s contains a different lookup table. Use a different directory, or remove it to start again."
+                % directory,
+            )
+
+        done = np.lib.format.open_memmap(done_filename, mode="r+")
+        outputs = [np.lib.format.open_memmap(filename, mode="r+") for filename in output_filenames]
+    else:
+        os.makedirs(directory, exist_ok=True)
+
+        done = np.lib.format.open_memmap(done_filename, mode="w+", dtype=bool, shape=shape)
+        outputs = []
+        for filename in output_filenames:
+            output = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64, shape=shape)
+            output[...] = np.nan
+            outputs.append(output)
+
+        # The metadata is written last, and atomically, so that a crash while creating the
+        # arrays means they are created again rather than being used
+        fd, tmp_filename = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_filename, metadata_filename)
+
+    return done, outputs
@@ -15,15 +15,20 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import io
+import os
+import posixpath
 import re
 import sys
+import tarfile
+import zipfile
 
 import numpy as np
-from scipy.interpolate import interp1d
 
 from ..Params import AtmosProfile
 from ..sixs_exceptions import ParameterError
+from .executors import map_on_executor
 
 if sys.version_info[0] >= 3:
     import urllib.request as urllib
@@ -975,53 +980,82 @@ class Radiosonde:
 
         This returns an atmospheric profile suitable for storing in s.atmos_profile.
         """
-        # Interpolate to 6S levels
-        max_alt = np.max(altitude)
+        return cls._import_soundings(
+            [(pressure, altitude, temperature, mixing_ratio)], base_profile, [None]
+        )[0]
 
-        interp_altitudes = cls.sixs_altitudes[cls.sixs_altitudes < max_alt]
+    @classmethod
+    def _import_soundings(cls, soundings, base_profile, names):
+        """Import many radiosonde soundings at once, each given as a tuple of arrays of the pressure, altitude,
+        temperature and mixing ratio (in the units given for :meth:`_import_from_arrays`).
 
-        f_interp_pressure = interp1d(altitude, pressure, bounds_error=False, fill_value=pressure[0])
-        f_interp_temp = interp1d(
-            altitude, temperature, bounds_error=False, fill_value=temperature[0]
-        )
-        f_interp_mixrat = interp1d(
-            altitude, mixing_ratio, bounds_error=False, fill_value=mixing_ratio[0]
-        )
+        The soundings have different numbers of levels, so they are stored one after another in 1D arrays, and
+        interpolated to the 6S levels for all of the soundings at once.
 
-        int_pres = f_interp_pressure(interp_altitudes)
-        int_temp = f_interp_temp(interp_altitudes)
-        int_mixrat = f_interp_mixrat(interp_altitudes)
+        This returns a :class:`RadiosondeProfiles` instance.
+        """
+        lengths = np.array([len(sounding[0]) for sounding in soundings])
+        if (lengths < 2).any():
+            raise ParameterError(
+                "radiosonde levels", "Each radiosonde sounding must have at least two levels"
+            )
+
+        pressure, altitude, temperature, mixing_ratio = (
+            np.concatenate([np.asarray(sounding[i], dtype=np.float64) for sounding in soundings])
+            for i in range(4)
+        )
 
-        base_profile_index = base_profile - 1
+        n = len(soundings)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        ends = starts + lengths
+        ids = np.repeat(np.arange(n), lengths)
+        max_alt = np.maximum.reduceat(altitude, starts)
+
+        # Sort the levels of each sounding by altitude, and offset the altitudes of each sounding so that they
+        # are all in one sorted array, which can be searched for the 6S levels of every sounding at once
+        order = np.lexsort((altitude, ids))
+        sorted_alt = altitude[order]
+        min_alt = sorted_alt.min()
+        offset = max_alt.max() - min_alt + 1
+        keys = ids * offset + (sorted_alt - min_alt)
+
+        # The 6S levels at and above the top of each sounding are taken from the base profile,
+        # so only the levels below the top are needed
+        targets = np.minimum(cls.sixs_altitudes, max_alt[:, np.newaxis])
+        queries = np.arange(n)[:, np.newaxis] * offset + (targets - min_alt)
+
+        hi = np.clip(
+            np.searchsorted(keys, queries), starts[:, np.newaxis] + 1, ends[:, np.newaxis] - 1
+        )
+        lo = hi - 1
+        x_lo = sorted_alt[lo]
+        x_hi = sorted_alt[hi]
+        below = targets < sorted_alt[starts][:, np.newaxis]
+
+        def interpolate(values):
+            # Linear interpolation, using the first value of each sounding below its lowest altitude
+            sorted_values = values[order]
+            slope = (sorted_values[hi] - sorted_values[lo]) / (x_hi - x_lo)
+            result = slope * (targets - x_lo) + sorted_values[lo]
+            return np.where(below, values[starts][:, np.newaxis], result)
 
         # Convert units (temperature from C -> K and mixing ratio to density)
-        int_temp = cls._celsius_to_kelvin(int_temp)
-        int_water = cls._mixing_ratio_to_density(int_pres, int_temp, int_mixrat)
+        int_pres = interpolate(pressure)
+        int_temp = cls._celsius_to_kelvin(interpolate(temperature))
+        int_water = cls._mixing_ratio_to_density(int_pres, int_temp, interpolate(mixing_ratio))
 
         # Get the rest of the profile from the base profiles
-        rest_of_pres = cls.pressure_profiles[base_profile_index]
-        rest_of_pres = rest_of_pres[cls.sixs_altitudes >= max_alt]
-
-        rest_of_temp = cls.temp_profiles[base_profile_index]
-        rest_of_temp = rest_of_temp[cls.sixs_altitudes >= max_alt]
-
-        rest_of_water = cls.water_density_profiles[base_profile_index]
-        rest_of_water = rest_of_water[cls.sixs_altitudes >= max_alt]
-
-        final_pressure = np.hstack((int_pres, rest_of_pres))
-        final_temp = np.hstack((int_temp, rest_of_temp))
-        final_water = np.hstack((int_water, rest_of_water))
-        final_ozone = cls.ozone_density_profiles[base_profile_index]
-
-        params = {
-            "altitude": cls.sixs_altitudes,
-            "pressure": final_pressure,
-            "temperature": final_temp,
-            "water": final_water,
-            "ozone": final_ozone,
-        }
-
-        return AtmosProfile.RadiosondeProfile(params)
+        base_profile_index = np.broadcast_to(np.asarray(base_profile) - 1, (n,))
+        above = cls.sixs_altitudes >= max_alt[:, np.newaxis]
+
+        return RadiosondeProfiles(
+            names,
+            cls.sixs_altitudes,
+            np.where(above, cls.pressure_profiles[base_profile_index], int_pres),
+            np.where(above, cls.temp_profiles[base_profile_index], int_temp),
+            np.where(above, cls.water_density_profiles[base_profile_index], int_water),
+            cls.ozone_density_profiles[base_profile_index],
+        )
 
     @classmethod
     def import_uow_radiosonde_data(cls, url, base_profile):
@@ -1066,52 +1100,57 @@ class Radiosonde:
         if "Sorry, the server is too busy to process your request" in html:
             raise ParameterError("url", "The server is too busy")
 
-        # Extract the data inside the PRE tag (we can do it like this because it is very simple HTML)
-        regex = re.compile("<PRE>(.*?)</PRE>", re.IGNORECASE | re.DOTALL)
-        r = regex.search(html)
-        table = r.groups()[0].strip()
+        return cls._import_from_arrays(*_parse_uow(html), base_profile=base_profile)
 
-        # Remove last line as it is normally incomplete
-        spl = table.split("\n")
-        spl = spl[:-1]
-        table = "\n".join(spl)
+    @classmethod
+    def import_bas_radiosonde_data(cls, filename, base_profile):
+        """Imports a radiosonde profile from the British Antarctic Survey radiosonde format.
 
-        # Check for partly empty first line in U of W data which impacts interpolations:
-        if len(table.split("\n")[4].split()) != 11:
-            num_skip = 5
-        else:
-            num_skip = 4
+        TODO: More details here after checking with Martin
+        """
+        return cls._import_from_arrays(*_parse_bas(filename), base_profile=base_profile)
 
-        # Import to NumPy arrays
-        s = io.BytesIO(table.encode())
-        array = np.genfromtxt(
-            s, skip_header=num_skip, delimiter=7, usecols=(0, 1, 2, 5), filling_values=0
-        )
+    @classmethod
+    def import_radiosonde_archive(cls, path, base_profile, file_format="uow", n=None, executor=None):
+        """Imports all of the radiosonde soundings saved in a directory or archive, such as the soundings from a
+        station over many years.
 
-        pressure = array[:, 0]
-        altitude = array[:, 1] / 1000
-        temperature = array[:, 2]
-        mixing_ratio = array[:, 3]
+        The files are parsed in parallel, and the soundings are then interpolated to the 6S atmospheric grid and
+        converted to the units used by 6S all at once, in the same way as :meth:`import_uow_radiosonde_data` and
+        :meth:`import_bas_radiosonde_data`.
 
-        return cls._import_from_arrays(pressure, altitude, temperature, mixing_ratio, base_profile)
+        Arguments:
 
-    @classmethod
-    def import_bas_radiosonde_data(cls, filename, base_profile):
-        """Imports a radiosonde profile from the British Antarctic Survey radiosonde format.
+        * ``path`` -- The path to a directory, a zip file or a (possibly compressed) tar file. Every file in it (except
+          for hidden files, and files in sub-directories of a directory) must contain one sounding.
+        * ``base_profile`` -- One of the predefined Atmospheric Profiles to use for any parts of the profiles which the
+          radiosonde data does not cover (>40km normally), or a list giving the base profile for each file in the order
+          of :attr:`RadiosondeProfiles.names`
+        * ``file_format`` -- (Optional) The format of the files: ``'uow'`` (the default) for the pages of the University
+          of Wyoming website, saved as HTML (see :meth:`import_uow_radiosonde_data`), or ``'bas'`` for files in the British
+          Antarctic Survey radiosonde format
+        * ``n`` -- (Optional) The number of threads or processes to parse the files with. This defaults to the number of
+          CPU cores in your system.
+        * ``executor`` -- (Optional) ``'thread'`` (the default), ``'process'`` or an existing
+          :class:`concurrent.futures.Executor` instance, as for :meth:`.Wavelengths.run_wavelengths`
+
+        Return value:
+
+        A :class:`RadiosondeProfiles` instance, containing a profile for each file in the order of their names
 
-        TODO: More details here after checking with Martin
         """
-        # Import to NumPy arrays
-        array = np.loadtxt(filename, skiprows=1, usecols=(2, 3, 4, 6))
+        if file_format not in ("uow", "bas"):
+            raise ParameterError("file_format", "The file format must be 'uow' or 'bas'")
 
-        pressure = array[:, 0]
-        altitude = array[:, 1] / 1000
-        temperature = array[:, 2]
-        dewpoint = array[:, 3]
+        sources = _sounding_sources(path)
+        if not sources:
+            raise ParameterError("path", "There are no radiosonde files in %s" % path)
 
-        mixing_ratio = cls._calculate_mixing_ratio(dewpoint, pressure)
+        soundings = map_on_executor(
+            functools.partial(_read_sounding, file_format), sources, executor, n
+        )
 
-        return cls._import_from_arrays(pressure, altitude, temperature, mixing_ratio, base_profile)
+        return cls._import_soundings(soundings, base_profile, [name for name, _ in sources])
 
     @classmethod
     def _calculate_mixing_ratio(cls, dewpoint_temp, pressure):
@@ -1152,3 +1191,161 @@ class Radiosonde:
         density = mixrat * mass
 
         return density
+
+
+class RadiosondeProfiles(object):
+    """A stack of atmospheric profiles from many radiosonde soundings, as returned by
+    :meth:`Radiosonde.import_radiosonde_archive`.
+
+    Each profile can be used by indexing, either with its position or its name, which gives a value suitable for
+    assigning to ``s.atmos_profile``::
+
+      profiles = SixSHelpers.Radiosonde.import_radiosonde_archive("03808.zip", AtmosProfile.MidlatitudeWinter)
+      s.atmos_profile = profiles[0]
+
+    Attributes:
+
+    * ``names`` -- The names of the files the soundings were imported from
+    * ``altitude`` -- The altitudes of the 6S levels (km)
+    * ``pressure`` -- A 2D array of the pressure (mb) of each profile (rows) at each level (columns)
+    * ``temperature`` -- A 2D array of the temperature (K) of each profile at each level
+    * ``water`` -- A 2D array of the water vapour density (g/m^3) of each profile at each level
+    * ``ozone`` -- A 2D array of the ozone density (g/m^3) of each profile at each level
+
+    """
+
+    def __init__(self, names, altitude, pressure, temperature, water, ozone):
+        self.names = list(names)
+        self.altitude = altitude
+        self.pressure = pressure
+        self.temperature = temperature
+        self.water = water
+        self.ozone = ozone
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """Gets the profile with the given position or name, as returned by :meth:`.AtmosProfile.RadiosondeProfile`"""
+        if isinstance(index, str):
+            index = self.names.index(index)
+
+        return AtmosProfile.RadiosondeProfile(
+            {
+                "altitude": self.altitude,
+                "pressure": self.pressure[index],
+                "temperature": self.temperature[index],
+                "water": self.water[index],
+                "ozone": self.ozone[index],
+            }
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return "RadiosondeProfiles(%d profiles)" % len(self)
+
+
+def _parse_uow(html):
+    """Parses a sounding page from the University of Wyoming website, returning arrays of the pressure,
+    altitude (km), temperature and mixing ratio."""
+    # Extract the data inside the PRE tag (we can do it like this because it is very simple HTML)
+    regex = re.compile("<PRE>(.*?)</PRE>", re.IGNORECASE | re.DOTALL)
+    r = regex.search(html)
+    if r is None:
+        raise ValueError("No sounding table found")
+    table = r.groups()[0].strip()
+
+    # Remove last line as it is normally incomplete
+    spl = table.split("\n")
+    spl = spl[:-1]
+    table = "\n".join(spl)
+
+    # Check for partly empty first line in U of W data which impacts interpolations:
+    if len(table.split("\n")[4].split()) != 11:
+        num_skip = 5
+    else:
+        num_skip = 4
+
+    # Import to NumPy arrays
+    s = io.BytesIO(table.encode())
+    array = np.genfromtxt(
+        s, skip_header=num_skip, delimiter=7, usecols=(0, 1, 2, 5), filling_values=0
+    )
+
+    pressure = array[:, 0]
+    altitude = array[:, 1] / 1000
+    temperature = array[:, 2]
+    mixing_ratio = array[:, 3]
+
+    return pressure, altitude, temperature, mixing_ratio
+
+
+def _parse_bas(f):
+    """Parses a sounding in the British Antarctic Survey format from a filename or file, returning arrays of the
+    pressure, altitude (km), temperature and mixing ratio."""
+    array = np.loadtxt(f, skiprows=1, usecols=(2, 3, 4, 6))
+
+    pressure = array[:, 0]
+    altitude = array[:, 1] / 1000
+    temperature = array[:, 2]
+    dewpoint = array[:, 3]
+
+    mixing_ratio = Radiosonde._calculate_mixing_ratio(dewpoint, pressure)
+
+    return pressure, altitude, temperature, mixing_ratio
+
+
+def _sounding_sources(path):
+    """Lists the files in a directory or archive, returning a list of (name, source) tuples, where the source is
+    the path of the file or (for archives) its contents."""
+    if os.path.isdir(path):
+        names = sorted(
+            name
+            for name in os.listdir(path)
+            if not name.startswith(".") and os.path.isfile(os.path.join(path, name))
+        )
+        return [(name, os.path.join(path, name)) for name in names]
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as z:
+            infos = sorted(
+                (i for i in z.infolist() if not i.is_dir() and not _is_hidden(i.filename)),
+                key=lambda i: i.filename,
+            )
+            return [(i.filename, z.read(i)) for i in infos]
+
+    if os.path.isfile(path) and tarfile.is_tarfile(path):
+        with tarfile.open(path) as t:
+            members = sorted(
+                (m for m in t.getmembers() if m.isfile() and not _is_hidden(m.name)),
+                key=lambda m: m.name,
+            )
+            return [(m.name, t.extractfile(m).read()) for m in members]
+
+    raise ParameterError("path", "%s is not a directory, zip file or tar file" % path)
+
+
+def _is_hidden(name):
+    return posixpath.basename(name).startswith(".")
+
+
+def _read_sounding(file_format, source):
+    """Parses one sounding, given as a (name, source) tuple from :func:`_sounding_sources`."""
+    name, data = source
+
+    try:
+        if not isinstance(data, bytes):
+            with open(data, "rb") as f:
+                data = f.read()
+
+        text = data.decode("utf-8", errors="replace")
+
+        if file_format == "uow":
+            return _parse_uow(text)
+        else:
+            return _parse_bas(io.StringIO(text))
+    except (OSError, ValueError, IndexError) as e:
+        raise ParameterError("radiosonde file", "Error reading the sounding in %s: %s" % (name, e))
@@ -15,10 +15,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import json
+import os
+import posixpath
 import sys
+import tempfile
 
 import numpy as np
 
+from ..sixs_exceptions import ParameterError
+
 # Python 2/3 imports
 try:
     import urllib2
@@ -37,6 +43,16 @@ except ImportError:
         raise
 
 
+# The wavelengths that the spectra in a SpectralLibrary are resampled to: the 2.5nm spacing used for spectra in
+# the 6S input file, over the range of wavelengths 6S can simulate. They are rounded so that they are equal to
+# the wavelengths given in decimal, such as the start and end of the predefined wavelengths.
+_LIBRARY_WAVELENGTHS = np.round(np.arange(0.2, 4.0 + 0.00125, 0.0025), 4)
+_LIBRARY_WAVELENGTHS.flags.writeable = False
+
+# Changed whenever the format of the files storing a SpectralLibrary changes
+_LIBRARY_VERSION = 1
+
+
 class Spectra:
 
     """Class allowing the import of spectral libraries from various sources"""
@@ -124,3 +140,204 @@ class Spectra:
         f.close()
         npdata[:, 1] = npdata[:, 1] / 100
         return npdata
+
+
+class SpectralLibrary(object):
+    """A local store of reflectance spectra, which are read from spectral library files once and then stored in a
+    binary format, so that they can be used in many runs without reading (or downloading) the files again.
+
+    The spectra are resampled to a fixed 2.5nm grid of wavelengths from 0.2um to 4.0um (the wavelengths which can be
+    simulated by 6S, at the spacing used for ground reflectance spectra in the 6S input file) when they are added,
+    and are stored together in a single array in the library directory. The array is memory-mapped when the
+    library is opened, so getting a spectrum takes the same (short) time however many spectra the library holds.
+
+    When 6S is run for wavelengths which start on the 2.5nm grid (as most do), the reflectances in the 6S input file
+    are the same as for the original spectrum. Otherwise they are interpolated between the stored reflectances, which
+    differs from interpolating the original spectrum by less than the change in the reflectance over 2.5nm.
+
+    Example usage::
+
+      library = SpectralLibrary("spectra")
+      library.add_files(["conifer.spectrum.txt", "grass.spectrum.txt"], file_format="aster")
+
+      # Later, possibly in another Python session
+      library = SpectralLibrary("spectra")
+      wavelengths, reflectances = library["conifer.spectrum.txt"]
+      s.ground_reflectance = GroundReflectance.HomogeneousLambertian(library.spectrum("conifer.spectrum.txt"))
+
+    Attributes:
+
+    * ``directory`` -- The directory the library is stored in
+    * ``wavelengths`` -- The wavelengths (um) that the spectra are resampled to
+    * ``names`` -- The names of the spectra in the library, in the order they were added
+
+    """
+
+    def __init__(self, directory):
+        """Opens the spectral library stored in the given directory. If the directory doesn't contain a library,
+        an empty library is created when spectra are first added to it."""
+        self.directory = directory
+        self.wavelengths = _LIBRARY_WAVELENGTHS
+
+        self.names = []
+        self._rows = {}
+        self._reflectances = np.empty((0, len(self.wavelengths)))
+
+        index_filename = os.path.join(directory, "index.json")
+        if os.path.exists(index_filename):
+            with open(index_filename) as f:
+                index = json.load(f)
+
+            if index["version"] != _LIBRARY_VERSION:
+                raise ParameterError(
+                    "directory",
+                    "The spectral library in %s was created by a different version of Py6S"
+                    % directory,
+                )
+
+            self._open(index)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def __getitem__(self, name):
+        """Gets the spectrum with the given name, as a tuple of arrays of the wavelengths (um) and reflectances
+        (fraction). Reflectances outside of the range of wavelengths in the original file are NaN.
+        """
+        try:
+            row = self._rows[name]
+        except KeyError:
+            raise ParameterError("name", "There is no spectrum called %s in the library" % name)
+
+        return self.wavelengths, self._reflectances[row]
+
+    def spectrum(self, name):
+        """Gets the spectrum with the given name as an array with two columns, wavelength (um) and
+        reflectance (fraction), as returned by the functions of :class:`.Spectra` and used by
+        :class:`.GroundReflectance`.
+        """
+        return np.column_stack(self[name])
+
+    def add(self, spectra):
+        """Adds spectra to the library, replacing any existing spectra with the same names.
+
+        Arguments:
+
+        * ``spectra`` -- A dictionary mapping names to spectra, each given as an array with two columns, wavelength (um)
+          and reflectance (fraction), as returned by the functions of :class:`.Spectra`. NaN reflectances are
+          ignored, and the reflectances between them are interpolated.
+
+        """
+        reflectances = np.array(self._reflectances)
+        names = list(self.names)
+        rows = dict(self._rows)
+        new_rows = []
+
+        for name, spectrum in spectra.items():
+            resampled = _resample_to_library(np.asarray(spectrum, dtype=np.float64))
+
+            if name in rows:
+                reflectances[rows[name]] = resampled
+            else:
+                rows[name] = len(names) + len(new_rows)
+                names.append(name)
+                new_rows.append(resampled)
+
+        if new_rows:
+            reflectances = np.vstack([reflectances] + new_rows)
+
+        self._write(names, reflectances)
+
+    def add_files(self, locs, file_format, names=None):
+        """Reads spectra from spectral library files and adds them to the library.
+
+        Arguments:
+
+        * ``locs`` -- A list of the locations of the files, as given to :meth:`.Spectra.import_from_usgs` or
+          :meth:`.Spectra.import_from_aster`
+        * ``file_format`` -- The format of the files: ``'usgs'`` or ``'aster'``
+        * ``names`` -- (Optional) A list of the names to store the spectra under. This defaults to the file names
+          (the part of each location after the last ``/``).
+
+        """
+        if file_format == "usgs":
+            read = Spectra.import_from_usgs
+        elif file_format == "aster":
+            read = Spectra.import_from_aster
+        else:
+            raise ParameterError("file_format", "The file format must be 'usgs' or 'aster'")
+
+        locs = list(locs)
+        if names is None:
+            names = [posixpath.basename(loc.replace(os.sep, "/")) for loc in locs]
+
+        self.add(dict((name, read(loc)) for name, loc in zip(names, locs)))
+
+    def _open(self, index):
+        self.names = index["names"]
+        self._rows = dict((name, i) for i, name in enumerate(self.names))
+        self._reflectances = np.load(os.path.join(self.directory, index["data"]), mmap_mode="r")
+
+    def _write(self, names, reflectances):
+        os.makedirs(self.directory, exist_ok=True)
+
+        # The spectra are written to a new file each time, and the index pointing to it is replaced atomically,
+        # so that libraries opened by other processes (which keep the old file memory-mapped) are never
+        # changed while they are being read
+        fd, data_filename = tempfile.mkstemp(dir=self.directory, prefix="spectra_", suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, reflectances)
+
+        # mkstemp creates files which only their owner can read, but a library may be shared between users,
+        # so the files are given the permissions of any other new file
+        mode = _default_file_mode()
+        os.chmod(data_filename, mode)
+
+        index = {
+            "version": _LIBRARY_VERSION,
+            "data": os.path.basename(data_filename),
+            "names": names,
+        }
+
+        fd, tmp_filename = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f)
+        os.chmod(tmp_filename, mode)
+        os.replace(tmp_filename, os.path.join(self.directory, "index.json"))
+
+        # Remove the old files, which stay readable by anything which already has them open
+        for filename in os.listdir(self.directory):
+            if filename.startswith("spectra_") and filename != index["data"]:
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except OSError:
+                    pass
+
+        self._open(index)
+
+
+def _default_file_mode():
+    """Gets the permissions given to new files by the current umask"""
+    # The umask can only be read by setting it, so it is set back straight away
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _resample_to_library(spectrum):
+    """Resamples a spectrum to the wavelengths of a :class:`SpectralLibrary`, in the same way as the spectra
+    are resampled for the 6S input file."""
+    wavelengths = spectrum[:, 0]
+    reflectances = spectrum[:, 1]
+
+    valid = ~np.isnan(reflectances)
+    wavelengths = wavelengths[valid]
+    reflectances = reflectances[valid]
+
+    order = np.argsort(wavelengths, kind="mergesort")
+    return np.interp(
+        _LIBRARY_WAVELENGTHS, wavelengths[order], reflectances[order], left=np.nan, right=np.nan
+    )
@@ -16,7 +16,8 @@
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
 from . import Params, SixSHelpers
-from .outputs import Outputs
+from .cache import ResultCache
+from .outputs import Outputs, OutputsBatch
 from .Params import (  # noqa
     AeroProfile,
     Altitudes,
@@ -28,10 +29,28 @@ from .Params import (  # noqa
     Wavelength,
 )
 from .sixs import SixS
-from .sixs_exceptions import ExecutionError, OutputParsingError, ParameterError
-from .SixSHelpers import Aeronet, Angles, Radiosonde, Spectra, Wavelengths  # noqa
+from .snapshot import ParameterSnapshot
+from .sixs_exceptions import (
+    ExecutionCancelledError,
+    ExecutionError,
+    ExecutionTimeoutError,
+    OutputParsingError,
+    ParameterError,
+)
+from .SixSHelpers import (  # noqa
+    Aeronet,
+    Angles,
+    LookupTable,
+    Radiosonde,
+    Spectra,
+    SpectralLibrary,
+    Wavelengths,
+)
+from .workers import WorkerPool
 
 __all__ = ["SixS", "Outputs", "ParameterError", "OutputParsingError", "ExecutionError"]
+__all__ += ["ExecutionTimeoutError", "ExecutionCancelledError"]
+__all__ += ["OutputsBatch", "ParameterSnapshot", "ResultCache", "WorkerPool"]
 __all__ += ["Params"]
 __all__ += ["SixSHelpers"]
 
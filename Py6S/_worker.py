@@ -0,0 +1,73 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""The loop run by each worker process of a :class:`.WorkerPool`.
+
+This module only uses the standard library, and is run as a script (rather than imported from Py6S) so that
+the worker processes start quickly and don't depend on how Py6S was installed.
+
+Each request is a line of JSON giving the path of the 6S executable, the timeout and the length of the input
+file, followed by the input file itself. Each response is a line of JSON giving the return code (or an error)
+and the lengths of the stdout and stderr from 6S, followed by the stdout and stderr themselves.
+
+"""
+
+import json
+import subprocess
+import sys
+
+
+def run(request, input_file):
+    """Runs 6S for a single request, returning the response header and the stdout and stderr from 6S."""
+    try:
+        process = subprocess.run(
+            [request["sixs_path"]],
+            input=input_file,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=request["timeout"],
+        )
+    except subprocess.TimeoutExpired:
+        # subprocess.run has already killed 6S
+        return {"error": "timeout"}, b"", b""
+    except OSError as e:
+        return {"error": str(e)}, b"", b""
+
+    return {"returncode": process.returncode}, process.stdout, process.stderr
+
+
+def main():
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+
+    # An empty line means that the pool has closed our stdin, so it is time to stop
+    for line in iter(requests.readline, b""):
+        request = json.loads(line)
+        input_file = requests.read(request["length"])
+
+        response, stdout, stderr = run(request, input_file)
+        response["stdout"] = len(stdout)
+        response["stderr"] = len(stderr)
+
+        responses.write(json.dumps(response).encode("utf-8") + b"\n")
+        responses.write(stdout)
+        responses.write(stderr)
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
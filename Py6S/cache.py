@@ -0,0 +1,260 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import collections
+import hashlib
+import os
+import tempfile
+import threading
+import zlib
+
+
+class ResultCache(object):
+
+    """Caches the raw output of 6S runs, so that running exactly the same input file again doesn't need to run 6S.
+
+    Results are keyed on a hash of the 6S input file and the identity of the 6S executable (its path, size and
+    modification time), so changing any parameter - or upgrading 6S - gives a new key. The identity of each
+    executable is only found the first time the cache uses it, so call :meth:`clear` (or create a new cache) after
+    upgrading 6S part-way through a session. The raw output of 6S is stored, and an :class:`.Outputs` instance is
+    created from it each time the result is used.
+
+    There are two tiers to the cache: an in-memory tier holding the most recently used results, and an optional
+    on-disk tier which can be shared between processes and between Python sessions. When the on-disk tier grows
+    larger than its maximum size, the least recently used results are removed.
+
+    To use a cache, set the ``cache`` attribute of a :class:`.SixS` instance::
+
+      s = SixS()
+      s.cache = ResultCache(directory="/data/py6s_cache")
+      s.run()  # Runs 6S
+      s.run()  # Uses the cached result
+      print(s.cache.hits, s.cache.misses)
+
+    The same cache can be used by many SixS instances at once, and it is shared (rather than copied) when a
+    SixS instance is copied - so the helper functions in :class:`.SixSHelpers.Wavelengths` and
+    :class:`.SixSHelpers.Angles` will use it too.
+
+    Attributes:
+
+    * ``hits`` -- The number of results found in the cache (in either tier)
+    * ``memory_hits`` -- The number of results found in the in-memory tier
+    * ``disk_hits`` -- The number of results found in the on-disk tier
+    * ``misses`` -- The number of results not found in the cache
+
+    """
+
+    def __init__(self, max_entries=1024, directory=None, max_size=1024**3):
+        """Initialises the cache.
+
+        Arguments:
+
+        * ``max_entries`` -- (Optional) The maximum number of results to keep in memory (default 1024). Set to 0 to use only the on-disk tier.
+        * ``directory`` -- (Optional) The directory to store the on-disk tier in. If not given, results are only stored in memory.
+        * ``max_size`` -- (Optional) The maximum total size of the on-disk tier, in bytes (default 1GB)
+
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_size = max_size
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._exe_identities = {}
+
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._disk_size = sum(os.path.getsize(path) for path, _ in self._disk_files())
+
+    @property
+    def hits(self):
+        return self.memory_hits + self.disk_hits
+
+    def key(self, sixs_path, input_file):
+        """Calculates the key used to store the result of running the given 6S executable with the
+        given input file contents."""
+        h = hashlib.sha256()
+        h.update(self._exe_identity(sixs_path).encode("utf-8"))
+        h.update(b"\0")
+        h.update(input_file.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key):
+        """Gets the raw 6S output stored under the given key, or None if it is not in the cache."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+        stdout = self._disk_get(key)
+
+        with self._lock:
+            if stdout is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+                self._memory_put(key, stdout)
+
+        return stdout
+
+    def put(self, key, stdout):
+        """Stores the raw 6S output under the given key."""
+        with self._lock:
+            self._memory_put(key, stdout)
+
+        self._disk_put(key, stdout)
+
+    def clear(self):
+        """Removes all results from both tiers of the cache, and resets the hit and miss counts."""
+        with self._lock:
+            self._memory.clear()
+            self._exe_identities.clear()
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+            if self.directory is not None:
+                for path, _ in self._disk_files():
+                    self._remove(path)
+                self._disk_size = 0
+
+    def _exe_identity(self, sixs_path):
+        # The executable is identified by its size and modification time as well as its path,
+        # so that a new version of 6S at the same path doesn't re-use the old results. The identity
+        # is remembered for each path, so that the executable isn't stat-ed for every run.
+        identity = self._exe_identities.get(sixs_path)
+        if identity is None:
+            try:
+                st = os.stat(sixs_path)
+                identity = "%s:%d:%d" % (os.path.abspath(sixs_path), st.st_size, st.st_mtime_ns)
+            except (OSError, TypeError):
+                identity = str(sixs_path)
+            self._exe_identities[sixs_path] = identity
+
+        return identity
+
+    def _memory_put(self, key, stdout):
+        if self.max_entries <= 0:
+            return
+
+        self._memory[key] = stdout
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".6s")
+
+    def _disk_files(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".6s"):
+                    path = os.path.join(root, name)
+                    try:
+                        yield path, os.path.getmtime(path)
+                    except OSError:
+                        # Removed by another process since os.walk listed it
+                        continue
+
+    def _disk_get(self, key):
+        if self.directory is None:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Update the modification time, so that the least recently used results are evicted first
+            os.utime(path)
+        except OSError:
+            return None
+
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            # A corrupt result (eg. from a crash while writing), so remove it and treat it as a miss
+            self._remove(path)
+            return None
+
+    def _disk_put(self, key, stdout):
+        if self.directory is None:
+            return
+
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = zlib.compress(stdout)
+
+        # Write to a temporary file and then rename it, so that other processes never see a partial result
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        # The size of any result being replaced, so that it isn't counted twice
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._disk_size += len(data) - old_size
+            if self._disk_size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        files = sorted(self._disk_files(), key=lambda item: item[1])
+        # Re-calculate the total size, as other processes may be sharing the directory
+        sizes = {path: os.path.getsize(path) for path, _ in files if os.path.exists(path)}
+        self._disk_size = sum(sizes.values())
+
+        for path, _ in files:
+            if self._disk_size <= self.max_size:
+                break
+            if path in sizes:
+                self._remove(path)
+                self._disk_size -= sizes[path]
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __copy__(self):
+        # The cache is a shared resource, so copies of a SixS instance should all use the same cache
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        # When sent to another process only the settings are sent, and the other process uses
+        # the shared on-disk tier (if there is one) with its own in-memory tier
+        state = self.__dict__.copy()
+        state["_memory"] = collections.OrderedDict()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
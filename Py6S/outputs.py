@@ -15,11 +15,321 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import re
 import sys
 
+import numpy as np
+
 from .sixs_exceptions import OutputParsingError
 
 
+def _to_int(str):
+    return int(float(str))
+
+
+def _to_float(str):
+    try:
+        return float(str)
+    except ValueError:
+        return float("nan")
+
+
+def _extract_vis(data):
+    s = " ".join(data)
+    spl = s.split(":")
+    spl2 = spl[1].split()
+
+    try:
+        value = float(spl2[0])
+    except ValueError:
+        value = float("Inf")
+
+    return value
+
+
+def _extract_aot(data):
+    s = " ".join(data)
+    spl = s.split(":")
+
+    return float(spl[2])
+
+
+def _extract_polarization_direction(data):
+    return float(data.replace("polarization", ""))
+
+
+CURRENT = 0
+WHOLE_LINE = (0, 30)
+
+# fmt: off
+# The table below specifies how to extract each variable from the text output
+# of 6S.
+# The first item is the text to search for. When this is found, the line corresponding
+# to the second item is found. If this is CURRENT (ie. 0) then it is the line on which
+# the text was found, if it is 1 then it is the next line, 2 the one after that etc.
+# The next item is the index of the split line to extract the value from, and the
+# fourth item is the key to store it in in the values dictionary. The final item is the type to convert
+# it to - the type conversion function must be specified. More specific functions such as math.floor can
+# be used here if desired.
+
+#          Search Term                                Line   Index DictKey   Type
+_VALUES = [("6SV version", CURRENT, 2, "version", str),
+           ("month", CURRENT, 1, "month", _to_int),
+           ("day", CURRENT, 4, "day", _to_int),
+           ("solar zenith angle", CURRENT, 3, "solar_z", _to_int),
+           ("solar azimuthal angle", CURRENT, 8, "solar_a", _to_int),
+           ("view zenith angle", CURRENT, 3, "view_z", _to_int),
+           ("view azimuthal angle", CURRENT, 8, "view_a", _to_int),
+           ("scattering angle", CURRENT, 2, "scattering_angle", float),
+           ("azimuthal angle difference", CURRENT, 7, "azimuthal_angle_difference", float),
+           ("optical condition identity", 1, WHOLE_LINE, "visibility", _extract_vis),
+           ("optical condition", 1, WHOLE_LINE, "aot550", _extract_aot),
+           ("ground pressure", CURRENT, 3, "ground_pressure", float),
+           ("ground altitude", CURRENT, 3, "ground_altitude", float),
+
+           ("appar. rad.(w/m2/sr/mic)", CURRENT, 2, "apparent_reflectance", float),
+           ("appar. rad.", CURRENT, 5, "apparent_radiance", float),
+           ("total gaseous transmittance", CURRENT, 3, "total_gaseous_transmittance", float),
+
+           ("wv above aerosol", CURRENT, 4, "wv_above_aerosol", float),
+           ("wv mixed with aerosol", CURRENT, 10, "wv_mixed_with_aerosol", float),
+           ("wv under aerosol", CURRENT, 4, "wv_under_aerosol", float),
+
+           ("% of irradiance", 2, 0, "percent_direct_solar_irradiance", float),
+           ("% of irradiance at", 2, 1, "percent_diffuse_solar_irradiance", float),
+           ("% of irradiance at ground level", 2, 2, "percent_environmental_irradiance", float),
+           ("reflectance at satellite level", 2, 0, "atmospheric_intrinsic_reflectance", float),
+           ("reflectance at satellite lev", 2, 1, "background_reflectance", float),
+           ("reflectance at satellite l", 2, 2, "pixel_reflectance", float),
+           ("irr. at ground level", 2, 0, "direct_solar_irradiance", float),
+           ("irr. at ground level (w/", 2, 1, "diffuse_solar_irradiance", float),
+           ("irr. at ground level (w/m2/mic)", 2, 2, "environmental_irradiance", float),
+           ("rad at satel. level", 2, 0, "atmospheric_intrinsic_radiance", float),
+           ("rad at satel. level (w/m2/", 2, 1, "background_radiance", float),
+           ("rad at satel. level (w/m2/sr/mic)", 2, 2, "pixel_radiance", float),
+           ("sol. spect (in w/m2/mic)", 1, 0, "solar_spectrum", float),
+
+
+           ("measured radiance [w/m2/sr/mic]", CURRENT, 4, "measured_radiance", float),
+           ("atmospherically corrected reflectance", 1, 3, "atmos_corrected_reflectance_lambertian", float),
+           ("atmospherically corrected reflect", 2, 3, "atmos_corrected_reflectance_brdf", float),
+           ("coefficients xa", CURRENT, 5, "coef_xa", float),
+           ("coefficients xa xb", CURRENT, 6, "coef_xb", float),
+           ("coefficients xa xb xc", CURRENT, 7, "coef_xc", float),
+           ("int. funct filter (in mic)", 1, 0, 'int_funct_filt', float),
+           ("int. sol. spect (in w/m2)", 1, 1, 'int_solar_spectrum', float),
+
+           ("Foam:", CURRENT, 1, "water_component_foam", float),
+           ("Water:", CURRENT, 3, "water_component_water", float),
+           ("Glint:", CURRENT, 5, "water_component_glint", float),
+
+           ("app. polarized refl.", CURRENT, 3, "apparent_polarized_reflectance", float),
+           ("app. pol. rad.", CURRENT, 8, "apparent_polarized_radiance", float),
+           ("direction of the plane of polarization", CURRENT, -1, "direction_of_plane_of_polarization", _extract_polarization_direction),
+           ("total polarization ratio", CURRENT, 3, "total_polarization_ratio", float)
+           ]
+
+# Labels in the big grid in the middle of the output for transmittances
+_TRANSMITTANCE_EXTRACTORS = [
+    ("global gas. trans. :", "global_gas"),
+    ('water   "     "    :', "water"),
+    ('ozone   "     "    :', "ozone"),
+    ('co2     "     "    :', "co2"),
+    ('oxyg    "     "    :', "oxygen"),
+    ('no2     "     "    :', "no2"),
+    ('ch4     "     "    :', "ch4"),
+    ('co      "     "    :', "co"),
+    ("rayl.  sca. trans. :", "rayleigh_scattering"),
+    ('aeros. sca.   "    :', "aerosol_scattering"),
+    ('total  sca.   "    :', "total_scattering"),
+]
+
+# Labels in the big grid at the bottom of the output for rayleigh, aerosol and total values
+_RAYLEIGH_AEROSOL_TOTAL_EXTRACTORS = [
+    ("spherical albedo   :", "spherical_albedo"),
+    ("optical depth total:", "optical_depth_total"),
+    ("optical depth plane:", "optical_depth_plane"),
+    ("reflectance I      :", "reflectance_I"),
+    ("reflectance Q      :", "reflectance_Q"),
+    ("reflectance U      :", "reflectance_U"),
+    ("polarized reflect. :", "polarized_reflectance"),
+    # ("degree of polar.   :", "degree_of_polarization"),
+    ("dir. plane polar.  :", "direction_of_plane_polarization"),
+    ("phase function I   :", "phase_function_I"),
+    ("phase function Q   :", "phase_function_Q"),
+    ("phase function U   :", "phase_function_U"),
+    ("primary deg. of pol:", "primary_degree_of_polarization"),
+    ("sing. scat. albedo :", "single_scattering_albedo"),
+]
+# fmt: on
+
+
+def _compile_value_extractors(table):
+    # Pre-calculate everything that doesn't depend on the output being parsed: the lower-case
+    # search terms, and the start and end of the slice of the split line to pass to the function
+    extractors = []
+
+    for label, line_offset, index, key, funct in table:
+        try:
+            start, end = index
+        except TypeError:
+            start, end = index, index + 1
+
+        extractors.append((label.lower(), line_offset, start, end, key, funct))
+
+    return extractors
+
+
+_VALUE_EXTRACTORS = _compile_value_extractors(_VALUES)
+
+
+def _group_by_label_root(value_extractors, grid_extractors):
+    """Groups the extractors by a 'root' label which they contain, and compiles a regular expression
+    matching any line which contains a root.
+
+    The roots are the labels which don't contain any other label, so every label contains at least one
+    root, and only the extractors whose root is found in a line need to be checked against that line."""
+    labels = [extractor[0] for extractor in value_extractors]
+    labels += [search.lower() for search, _, _ in grid_extractors]
+
+    roots = [label for label in labels if not any(other != label and other in label for other in labels)]
+
+    by_root = {root: ([], []) for root in roots}
+    for extractor in value_extractors:
+        root = next(root for root in roots if root in extractor[0])
+        by_root[root][0].append(extractor)
+    for extractor in grid_extractors:
+        root = next(root for root in roots if root in extractor[0].lower())
+        by_root[root][1].append(extractor)
+
+    # The roots are arranged into a trie, so that the expression branches on each character in turn
+    # rather than trying every root at every position in the line
+    trie = {}
+    for root in roots:
+        node = trie
+        for ch in root:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != ""]
+        if len(branches) == 0:
+            return ""
+        elif len(branches) == 1 and "" not in node:
+            return branches[0]
+        else:
+            return "(?:%s)%s" % ("|".join(branches), "?" if "" in node else "")
+
+    return by_root, re.compile(build(trie))
+
+
+# The grid extractors are combined into one table, recording which dictionary each value goes in
+_GRID_EXTRACTORS = [(search, name, "trans") for search, name in _TRANSMITTANCE_EXTRACTORS] + [
+    (search, name, "rat") for search, name in _RAYLEIGH_AEROSOL_TOTAL_EXTRACTORS
+]
+
+# The extractors (and matching regular expression) for parsing all of the output at once, and
+# for parsing each of the sections of the output on its own when it is first needed
+_ALL_SECTIONS = ("values", "trans", "rat")
+_SECTION_EXTRACTORS = {
+    _ALL_SECTIONS: _group_by_label_root(_VALUE_EXTRACTORS, _GRID_EXTRACTORS),
+    "values": _group_by_label_root(_VALUE_EXTRACTORS, []),
+    "trans": _group_by_label_root([], [e for e in _GRID_EXTRACTORS if e[2] == "trans"]),
+    "rat": _group_by_label_root([], [e for e in _GRID_EXTRACTORS if e[2] == "rat"]),
+}
+
+# The version is checked after every run, so it can be found without parsing the rest of the output
+_VERSION_EXTRACTORS = _group_by_label_root([e for e in _VALUE_EXTRACTORS if e[4] == "version"], [])
+
+# The names of the outputs which can be found in the values and rat sections
+_VALUE_KEYS = frozenset(key for _, _, _, _, key, _ in _VALUE_EXTRACTORS)
+_RAT_KEYS = frozenset(name for _, name, grid in _GRID_EXTRACTORS if grid == "rat")
+
+
+def _parse_output(fulltext, extractors_by_root, root_regex):
+    """Parses the text output of 6S in a single pass through its lines, using the given extractors.
+
+    Returns a dictionary containing the ``values``, ``trans`` and ``rat`` dictionaries - which will only
+    contain the outputs which the given extractors extract."""
+    sections = {"values": {}, "trans": {}, "rat": {}}
+
+    # Remove all of the *'s from the text as they just make it look pretty
+    # and get in the way of analysing the output
+    fulltext = fulltext.replace("*", "")
+
+    lines = fulltext.splitlines()
+    lower_lines = fulltext.lower().splitlines()
+
+    for index, lower_line in enumerate(lower_lines):
+        # Most lines don't contain any outputs, and are skipped after a single search
+        match = root_regex.search(lower_line)
+        if match is None:
+            continue
+
+        # Find every root in the line, searching again from just after the start of each
+        # one found, as roots may overlap. No two roots can start at the same position.
+        roots = set()
+        while match is not None:
+            roots.add(match.group())
+            match = root_regex.search(lower_line, match.start() + 1)
+
+        current_line = lines[index]
+
+        for root in roots:
+            value_extractors, grid_extractors = extractors_by_root[root]
+
+            # Process most variables in the output
+            for label, line_offset, start, end, key, funct in value_extractors:
+                # If the label we're searching for is in the current line
+                if label in lower_line:
+                    # See if the data is in the current line, otherwise
+                    # work out which line to use and get it
+                    if line_offset == CURRENT:
+                        extracting_line = current_line
+                    else:
+                        extracting_line = lines[index + line_offset]
+
+                    items = extracting_line.split()
+
+                    if start == -1:
+                        data_for_func = items[start]
+                    else:
+                        data_for_func = items[start:end]
+
+                    if len(data_for_func) == 1:
+                        data_for_func = data_for_func[0]
+
+                    try:
+                        sections["values"][key] = funct(data_for_func)
+                    except Exception:
+                        sections["values"][key] = float("nan")
+
+            # Process the big grids at the bottom of the output, for transmittances
+            # and for rayleigh, aerosol and total values
+            for search, name, grid in grid_extractors:
+                if search not in current_line:
+                    continue
+
+                if grid == "trans":
+                    items = current_line.split()
+                    values = Transmittance()
+
+                    values.downward = _to_float(items[4])
+                    values.upward = _to_float(items[5])
+                    values.total = _to_float(items[6])
+                else:
+                    items = current_line.rsplit(None, 3)
+                    values = RayleighAerosolTotal()
+
+                    values.total = _to_float(items[3])
+                    values.aerosol = _to_float(items[2])
+                    values.rayleigh = _to_float(items[1])
+
+                sections[grid][name] = values
+
+    return sections
+
+
 class Outputs(object):
 
     """Stores the output from a 6S run.
@@ -28,11 +338,16 @@ class Outputs(object):
 
      * ``fulltext`` -- The full output of the 6S executable. This can be written to a file with the write_output_file method.
      * ``values`` -- The main outputs from the 6S run, stored in a dictionary. Accessible either via standard dictionary notation (``s.outputs.values['pixel_radiance']``) or as attributes (``s.outputs.pixel_radiance``)
+     * ``trans`` -- The transmittance outputs, stored in a dictionary. Accessible as attributes prefixed with ``transmittance_`` (``s.outputs.transmittance_water.downward``)
+     * ``rat`` -- The Rayleigh, aerosol and total outputs, stored in a dictionary. Accessible as attributes (``s.outputs.spherical_albedo.total``)
+
+    Each of these dictionaries is filled in from the full output the first time it is used, so only the sections of the
+    output which are actually used are parsed.
 
     Methods:
 
-     * :meth:`.__init__` -- Constructor which takes the stdout and stderr from the model and processes it into the numerical outputs.
-     * :meth:`.extract_results` -- Function called by the constructor to parse the output into individual variables
+     * :meth:`.__init__` -- Constructor which takes the stdout and stderr from the model, and checks it for errors.
+     * :meth:`.extract_results` -- Parse all of the output into individual variables at once
      * :meth:`.to_int` -- Convert a string to an int, so that it works even if passed a float.
      * :meth:`.write_output_file` -- Write the full textual output of the 6S model to a file.
 
@@ -41,23 +356,23 @@ class Outputs(object):
     # Stores the full textual output from 6S
     fulltext = ""
 
-    # Stores the numerical values extracted from the textual output as a dictionary
-
     def __init__(self, stdout, stderr):
-        """Initialise the class with the stdout output from the model, and process
-        it into the numerical outputs.
+        """Initialise the class with the stdout output from the model, ready to be processed
+        into the numerical outputs.
+
+        The output is split into three sections - the main ``values``, the ``trans`` grid of transmittances and
+        the ``rat`` grid of Rayleigh, aerosol and total values - and each section is only parsed when
+        one of its outputs is first used.
 
         Arguments:
          * ``stdout`` -- Standard output from the model run
          * ``stderr`` -- Standard error from the model run
 
-        Will raise an :class:`.OutputParsingError` if the output cannot be parsed for any reason.
+        Will raise an :class:`.OutputParsingError` if 6S returned an error or didn't return a full output.
 
         """
 
-        self.values = {}
-        self.trans = {}
-        self.rat = {}
+        self._sections = {}
 
         if len(stderr) > 0:
             # Something on standard error - so there's been an error
@@ -87,17 +402,65 @@ class Outputs(object):
         if sys.version_info[0] >= 3:
             self.fulltext = self.fulltext.decode()
 
-        self.extract_results()
+        # There should be hundreds of lines for a full 6S run - so if there are
+        # less than 10 then it suggests something has gone seriously wrong
+        if len(self.fulltext.splitlines()) < 10:
+            print(self.fulltext.replace("*", ""))
+            raise OutputParsingError(
+                "6S didn't return a full output. See raw 6S output above for "
+                "more information and check for invalid parameter inputs"
+            )
+
+    @property
+    def values(self):
+        """The main outputs from the 6S run, stored in a dictionary"""
+        return self._section("values")
+
+    @values.setter
+    def values(self, values):
+        self._sections["values"] = values
+
+    @property
+    def trans(self):
+        """The transmittance outputs, stored in a dictionary of :class:`.Transmittance` instances"""
+        return self._section("trans")
+
+    @trans.setter
+    def trans(self, trans):
+        self._sections["trans"] = trans
+
+    @property
+    def rat(self):
+        """The Rayleigh, aerosol and total outputs, stored in a dictionary of :class:`.RayleighAerosolTotal` instances"""
+        return self._section("rat")
+
+    @rat.setter
+    def rat(self, rat):
+        self._sections["rat"] = rat
+
+    def _section(self, name):
+        # Parse the section the first time it is used. If two threads do this at once then they both
+        # parse it, and get the same result, so there is no need for a lock here.
+        try:
+            return self._sections[name]
+        except KeyError:
+            extractors_by_root, root_regex = _SECTION_EXTRACTORS[name]
+            section = _parse_output(self.fulltext, extractors_by_root, root_regex)[name]
+            return self._sections.setdefault(name, section)
 
     def __getattr__(self, name):
         """Executed when an attribute is referenced and not found. This method is overridden
         to allow the user to access the outputs as ``outputs.variable`` rather than using the dictionary
         explicity"""
-        if name == "__array_struct__" or name == "__array_interface__" or name == "__array__":
-            raise AttributeError()
-
-        # If there is a key with this name in the standard variables field then use it
-        if name in self.values:
+        # Special and private attributes (such as __array__, the __getstate__ and __setstate__ methods
+        # used by pickle and copy, or _sections, which doesn't exist yet while an instance is being
+        # unpickled) must not be looked up in the outputs, otherwise this recurses forever
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        # If there is a key with this name in the standard variables field then use it. Sections which
+        # haven't been parsed yet are only parsed if they could contain an output with this name.
+        if (name in _VALUE_KEYS or "values" in self._sections) and name in self.values:
             return self.values[name]
         else:
             # If not, then split it by .'s
@@ -105,7 +468,7 @@ class Outputs(object):
             if items[0] == "transmittance":
                 return self.trans["_".join(items[1:])]
             else:
-                if name in self.rat:
+                if (name in _RAT_KEYS or "rat" in self._sections) and name in self.rat:
                     return self.rat[name]
                 else:
                     raise OutputParsingError("The specifed output variable does not exist.")
@@ -118,215 +481,38 @@ class Outputs(object):
         all_keys = list(self.values.keys()) + list(trans_keys) + list(rat_keys)
         return sorted(all_keys)
 
-    def extract_results(self):
-        """Extract the results from the text output of the model and place them in the ``values`` dictionary."""
-
-        # Remove all of the *'s from the text as they just make it look pretty
-        # and get in the way of analysing the output
-        fulltext = self.fulltext.replace("*", "")
-
-        # Split into lines
-        lines = fulltext.splitlines()
-
-        # There should be hundreds of lines for a full 6S run - so if there are
-        # less than 10 then it suggests something has gone seriously wrong
-        if len(lines) < 10:
-            print(fulltext)
-            raise OutputParsingError(
-                "6S didn't return a full output. See raw 6S output above for "
-                "more information and check for invalid parameter inputs"
-            )
-
-        CURRENT = 0
-        WHOLE_LINE = (0, 30)
-
-        # fmt: off
-        # The dictionary below specifies how to extract each variable from the text output
-        # of 6S.
-        # The dictionary key is the text to search for. When this is found, the line corresponding
-        # to the first value in the tuple is found. If this is CURRENT (ie. 0) then it is the line on which
-        # the text was found, if it is 1 then it is the next line, 2 the one after that etc.
-        # The next item in the tuple is the index of the split line to extract the value from, and the
-        # third item is the key to store it in in the values dictionary. The final item is the type to convert
-        # it to - the type conversion function must be specified. More specific functions such as math.floor can
-        # be used here if desired.
-
-        #              Search Term                                Line   Index DictKey   Type
-        extractors = {"6SV version": (CURRENT, 2, "version", str),
-                      "month": (CURRENT, 1, "month", self.to_int),
-                      "day": (CURRENT, 4, "day", self.to_int),
-                      "solar zenith angle": (CURRENT, 3, "solar_z", self.to_int),
-                      "solar azimuthal angle": (CURRENT, 8, "solar_a", self.to_int),
-                      "view zenith angle": (CURRENT, 3, "view_z", self.to_int),
-                      "view azimuthal angle": (CURRENT, 8, "view_a", self.to_int),
-                      "scattering angle": (CURRENT, 2, "scattering_angle", float),
-                      "azimuthal angle difference": (CURRENT, 7, "azimuthal_angle_difference", float),
-                      "optical condition identity": (1, WHOLE_LINE, "visibility", self.extract_vis),
-                      "optical condition": (1, WHOLE_LINE, "aot550", self.extract_aot),
-                      "ground pressure": (CURRENT, 3, "ground_pressure", float),
-                      "ground altitude": (CURRENT, 3, "ground_altitude", float),
-
-                      "appar. rad.(w/m2/sr/mic)": (CURRENT, 2, "apparent_reflectance", float),
-                      "appar. rad.": (CURRENT, 5, "apparent_radiance", float),
-                      "total gaseous transmittance": (CURRENT, 3, "total_gaseous_transmittance", float),
-
-                      "wv above aerosol": (CURRENT, 4, "wv_above_aerosol", float),
-                      "wv mixed with aerosol": (CURRENT, 10, "wv_mixed_with_aerosol", float),
-                      "wv under aerosol": (CURRENT, 4, "wv_under_aerosol", float),
-
-                      "% of irradiance": (2, 0, "percent_direct_solar_irradiance", float),
-                      "% of irradiance at": (2, 1, "percent_diffuse_solar_irradiance", float),
-                      "% of irradiance at ground level": (2, 2, "percent_environmental_irradiance", float),
-                      "reflectance at satellite level": (2, 0, "atmospheric_intrinsic_reflectance", float),
-                      "reflectance at satellite lev": (2, 1, "background_reflectance", float),
-                      "reflectance at satellite l": (2, 2, "pixel_reflectance", float),
-                      "irr. at ground level": (2, 0, "direct_solar_irradiance", float),
-                      "irr. at ground level (w/": (2, 1, "diffuse_solar_irradiance", float),
-                      "irr. at ground level (w/m2/mic)": (2, 2, "environmental_irradiance", float),
-                      "rad at satel. level": (2, 0, "atmospheric_intrinsic_radiance", float),
-                      "rad at satel. level (w/m2/": (2, 1, "background_radiance", float),
-                      "rad at satel. level (w/m2/sr/mic)": (2, 2, "pixel_radiance", float),
-                      "sol. spect (in w/m2/mic)": (1, 0, "solar_spectrum", float),
-
-
-                      "measured radiance [w/m2/sr/mic]": (CURRENT, 4, "measured_radiance", float),
-                      "atmospherically corrected reflectance": (1, 3, "atmos_corrected_reflectance_lambertian", float),
-                      "atmospherically corrected reflect": (2, 3, "atmos_corrected_reflectance_brdf", float),
-                      "coefficients xa": (CURRENT, 5, "coef_xa", float),
-                      "coefficients xa xb": (CURRENT, 6, "coef_xb", float),
-                      "coefficients xa xb xc": (CURRENT, 7, "coef_xc", float),
-                      "int. funct filter (in mic)": (1, 0, 'int_funct_filt', float),
-                      "int. sol. spect (in w/m2)": (1, 1, 'int_solar_spectrum', float),
-
-                      "Foam:": (CURRENT, 1, "water_component_foam", float),
-                      "Water:": (CURRENT, 3, "water_component_water", float),
-                      "Glint:": (CURRENT, 5, "water_component_glint", float),
-
-                      "app. polarized refl.": (CURRENT, 3, "apparent_polarized_reflectance", float),
-                      "app. pol. rad.": (CURRENT, 8, "apparent_polarized_radiance", float),
-                      "direction of the plane of polarization": (CURRENT, -1, "direction_of_plane_of_polarization", lambda x: float(x.replace("polarization", ""))),
-                      "total polarization ratio": (CURRENT, 3, "total_polarization_ratio", float)
-                      }
-        # fmt: on
-        # Process most variables in the output
-        for index in range(len(lines)):
-            current_line = lines[index]
-            for label, details in extractors.items():
-                # If the label we're searching for is in the current line
-                if label.lower() in current_line.lower():
-                    # See if the data is in the current line (as specified above)
-                    if details[0] == CURRENT:
-                        extracting_line = current_line
-                    # Otherwise, work out which line to use and get it
-                    else:
-                        extracting_line = lines[index + details[0]]
-
-                    funct = details[3]
-                    items = extracting_line.split()
-
-                    try:
-                        a = details[1][0]
-                        b = details[1][1]
-                    except Exception:
-                        a = details[1]
-                        b = details[1] + 1
-
-                    if a == -1:
-                        data_for_func = items[a]
-                    else:
-                        data_for_func = items[a:b]
-
-                    if len(data_for_func) == 1:
-                        data_for_func = data_for_func[0]
-
-                    try:
-                        self.values[details[2]] = funct(data_for_func)
-                    except Exception:
-                        self.values[details[2]] = float("nan")
-
-        # Process big grid in the middle of the output for transmittances
-        grid_extractors = {
-            "global gas. trans. :": "global_gas",
-            'water   "     "    :': "water",
-            'ozone   "     "    :': "ozone",
-            'co2     "     "    :': "co2",
-            'oxyg    "     "    :': "oxygen",
-            'no2     "     "    :': "no2",
-            'ch4     "     "    :': "ch4",
-            'co      "     "    :': "co",
-            "rayl.  sca. trans. :": "rayleigh_scattering",
-            'aeros. sca.   "    :': "aerosol_scattering",
-            'total  sca.   "    :': "total_scattering",
-        }
-
-        for index in range(len(lines)):
-            current_line = lines[index]
-            for search, name in grid_extractors.items():
-                # If the label we're searching for is in the current line
-                if search in current_line:
-                    items = current_line.split()
-                    values = Transmittance()
-
-                    try:
-                        values.downward = float(items[4])
-                    except ValueError:
-                        values.downward = float("nan")
-
-                    try:
-                        values.upward = float(items[5])
-                    except ValueError:
-                        values.upward = float("nan")
+    def _get_version(self):
+        # Gets the version of 6S which produced the output, parsing only the line containing the
+        # version unless the rest of the values have already been parsed
+        if "values" in self._sections:
+            values = self.values
+        else:
+            values = _parse_output(self.fulltext, *_VERSION_EXTRACTORS)["values"]
 
-                    try:
-                        values.total = float(items[6])
-                    except ValueError:
-                        values.total = float("nan")
-
-                    self.trans[name] = values
-
-        # Process big grid in the middle of the output for transmittances
-        bottom_grid_extractors = {
-            "spherical albedo   :": "spherical_albedo",
-            "optical depth total:": "optical_depth_total",
-            "optical depth plane:": "optical_depth_plane",
-            "reflectance I      :": "reflectance_I",
-            "reflectance Q      :": "reflectance_Q",
-            "reflectance U      :": "reflectance_U",
-            "polarized reflect. :": "polarized_reflectance",
-            # 'degree of polar.   :' : "degree_of_polarization",
-            "dir. plane polar.  :": "direction_of_plane_polarization",
-            "phase function I   :": "phase_function_I",
-            "phase function Q   :": "phase_function_Q",
-            "phase function U   :": "phase_function_U",
-            "primary deg. of pol:": "primary_degree_of_polarization",
-            "sing. scat. albedo :": "single_scattering_albedo",
-        }
-
-        for index in range(len(lines)):
-            current_line = lines[index]
-            for search, name in bottom_grid_extractors.items():
-                # If the label we're searching for is in the current line
-                if search in current_line:
-                    items = current_line.rsplit(None, 3)
+        if "version" not in values:
+            raise OutputParsingError("The specifed output variable does not exist.")
 
-                    values = RayleighAerosolTotal()
+        return values["version"]
 
-                    try:
-                        values.total = float(items[3])
-                    except ValueError:
-                        values.total = float("nan")
+    def __setstate__(self, state):
+        # Instances pickled by earlier versions of Py6S stored the parsed dictionaries directly
+        self.__dict__.update(state)
+        sections = self.__dict__.setdefault("_sections", {})
+        for name in _ALL_SECTIONS:
+            if name in self.__dict__:
+                sections[name] = self.__dict__.pop(name)
 
-                    try:
-                        values.aerosol = float(items[2])
-                    except ValueError:
-                        values.aerosol = float("nan")
+    def extract_results(self):
+        """Extract the results from the text output of the model and place them in the ``values``, ``trans`` and ``rat`` dictionaries.
 
-                    try:
-                        values.rayleigh = float(items[1])
-                    except ValueError:
-                        values.rayleigh = float("nan")
+        This parses all of the sections of the output at once, rather than parsing each section when it is first used.
+        The output is parsed in a single pass through its lines, using the tables of extractors defined at the
+        top of this module. Lines without any outputs are skipped after a single regular expression search,
+        and only the extractors which could match the remaining lines are checked.
 
-                    self.rat[name] = values
+        """
+        extractors_by_root, root_regex = _SECTION_EXTRACTORS[_ALL_SECTIONS]
+        self._sections.update(_parse_output(self.fulltext, extractors_by_root, root_regex))
 
     def to_int(self, str):
         """Converts a string to an integer.
@@ -338,27 +524,15 @@ class Outputs(object):
          * ``str`` -- The string containing the number to convert to an integer
 
         """
-        return int(float(str))
+        return _to_int(str)
 
     def extract_vis(self, data):
         """Extracts the visibility from the visibility and AOT line in the output"""
-        s = " ".join(data)
-        spl = s.split(":")
-        spl2 = spl[1].split()
-
-        try:
-            value = float(spl2[0])
-        except ValueError:
-            value = float("Inf")
-
-        return value
+        return _extract_vis(data)
 
     def extract_aot(self, data):
         """Extracts the AOT from the visibility and AOT line in the output."""
-        s = " ".join(data)
-        spl = s.split(":")
-
-        return float(spl[2])
+        return _extract_aot(data)
 
     def write_output_file(self, filename):
         """Writes the full textual output of the 6S model run to the specified filename.
@@ -406,3 +580,127 @@ class RayleighAerosolTotal(object):
             self.aerosol,
             self.total,
         )
+
+
+class OutputsBatch(object):
+
+    """Stores the numerical outputs from many 6S runs as columns, one for each output.
+
+    Each column is a NumPy array of 64-bit floats, with one element for each run, in the same order as the
+    :class:`.Outputs` instances the batch was created from. Outputs which weren't produced by a run (or couldn't
+    be parsed) are stored as NaN. Non-numerical outputs, such as the 6S version, are not stored.
+
+    The columns are named in the same way as the ``output_name`` arguments of the :class:`.SixSHelpers.Wavelengths`
+    and :class:`.SixSHelpers.Angles` functions - for example ``pixel_radiance``, ``transmittance_water.downward``
+    or ``spherical_albedo.total`` - and can be accessed either as items (``batch['pixel_radiance']``) or as
+    attributes (``batch.pixel_radiance`` or ``batch.transmittance_water.downward``), so getting an output for every run
+    doesn't need to look at each run in turn.
+
+    Example usage::
+
+      wavelengths, batch = SixSHelpers.Wavelengths.run_vnir(s, batch=True)
+      radiances = batch.pixel_radiance
+      water_transmittance = batch['transmittance_water.downward']
+
+    Attributes:
+
+     * ``columns`` -- A dictionary mapping output names to columns
+     * ``errors`` -- A dictionary mapping the index of each run which failed to the exception it raised. This is only
+       used when the helper functions are called with ``errors='return'``, and the outputs of these runs are stored as NaN.
+
+    """
+
+    def __init__(self, outputs):
+        """Creates a batch from the outputs of many 6S runs.
+
+        Arguments:
+
+        * ``outputs`` -- An iterable of :class:`.Outputs` instances, or of exceptions for runs which failed
+
+        """
+        rows = []
+        names = {}
+        self.errors = {}
+
+        for o in outputs:
+            row = {}
+
+            if isinstance(o, Exception):
+                self.errors[len(rows)] = o
+                rows.append(row)
+                continue
+
+            for key, value in o.values.items():
+                if isinstance(value, (int, float)):
+                    row[key] = value
+
+            for name, value in o.trans.items():
+                for component in ("downward", "upward", "total"):
+                    row["transmittance_%s.%s" % (name, component)] = getattr(value, component)
+
+            for name, value in o.rat.items():
+                for component in ("rayleigh", "aerosol", "total"):
+                    row["%s.%s" % (name, component)] = getattr(value, component)
+
+            rows.append(row)
+            # A dictionary is used to keep the names in the order they are first found
+            names.update(dict.fromkeys(row))
+
+        self.columns = {}
+        for name in names:
+            self.columns[name] = np.array([row.get(name, np.nan) for row in rows], dtype=np.float64)
+
+        self._length = len(rows)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Creates a batch from a dictionary mapping output names to columns, which must all be the same length."""
+        batch = cls([])
+        batch.columns = {name: np.asarray(column, dtype=np.float64) for name, column in columns.items()}
+        batch._length = len(next(iter(batch.columns.values()))) if batch.columns else 0
+        return batch
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, name):
+        """Gets the column for the output with the given name"""
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise OutputParsingError("The specifed output variable does not exist.")
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __getattr__(self, name):
+        """Allows columns to be accessed as ``batch.variable``, and the transmittance and Rayleigh/aerosol/total columns
+        to be accessed as ``batch.transmittance_water.downward``, as they would be with :class:`.Outputs`"""
+        if name.startswith("_") or name in ("columns", "errors"):
+            raise AttributeError(name)
+
+        if name in self.columns:
+            return self.columns[name]
+
+        if name.startswith("transmittance_"):
+            group = Transmittance()
+            components = ("downward", "upward", "total")
+        else:
+            group = RayleighAerosolTotal()
+            components = ("rayleigh", "aerosol", "total")
+
+        if "%s.total" % name not in self.columns:
+            raise OutputParsingError("The specifed output variable does not exist.")
+
+        for component in components:
+            setattr(group, component, self.columns["%s.%s" % (name, component)])
+
+        return group
+
+    def __dir__(self):
+        # Returns the names that can be accessed as attributes, for tab-completion in IPython
+        return sorted(set(name.split(".")[0] for name in self.columns))
+
+    def keys(self):
+        """Returns the names of the outputs stored in the batch"""
+        return self.columns.keys()
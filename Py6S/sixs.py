@@ -15,13 +15,15 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
+import hashlib
 import os
 import subprocess
 import sys
 import tempfile
+import threading
 
 import numpy as np
-from scipy.interpolate import interp1d
 
 from .outputs import Outputs
 from .Params import (
@@ -33,7 +35,8 @@ from .Params import (
     GroundReflectance,
     Wavelength,
 )
-from .sixs_exceptions import ExecutionError, ParameterError
+from .sixs_exceptions import ExecutionError, ExecutionTimeoutError, ParameterError
+from .workers import cancellable, current_pool
 
 SIXSVERSION = "1.1"
 
@@ -41,6 +44,20 @@ SIXSVERSION = "1.1"
 if sys.version_info[0] >= 3:
     basestring = str
 
+# The most recently used resampled reflectance spectra, as created by SixS._refls_to_string, keyed on the
+# hash of the spectrum and the minimum and maximum wavelengths it was resampled to. The spectra themselves,
+# ready to be resampled, are stored under the hash of the spectrum alone.
+_RESAMPLED_SPECTRA_SIZE = 1024
+_resampled_spectra = collections.OrderedDict()
+_resampled_spectra_lock = threading.Lock()
+
+
+def _spectrum_hash(arr):
+    """Hashes the contents (and shape) of a reflectance spectrum array"""
+    h = hashlib.sha1(arr.tobytes())
+    h.update(str(arr.shape).encode("ascii"))
+    return h.hexdigest()
+
 
 class SixS(object):
 
@@ -112,11 +129,28 @@ class SixS(object):
     * ``mie`` -- Optional name for a text file to save the results of the MIE subroutine. This only applies if 
     ``s.aero_profile`` is not a ``AeroProfile.User`` or ``AeroProfile.PredefinedType``. (By default, ``s.mie`` 
       is set to None) 
+
+    * ``cache`` -- An optional :class:`.ResultCache` instance. If set, the output of each run is stored in the cache and
+      re-used whenever exactly the same input file is run again, without running 6S. For example::
+
+                            s.cache = ResultCache(directory="/data/py6s_cache")
+
+    * ``timeout`` -- An optional maximum time, in seconds, for each run of 6S. A 6S process which takes longer than this
+      (for example, because it has hung on a bad set of parameters) is killed, and an :class:`.ExecutionTimeoutError` raised.
+      For example::
+
+                            s.timeout = 60
     """
 
     # Stores the outputs from 6S as an instance of the Outputs class
     outputs = None
 
+    # An optional ResultCache used to avoid re-running identical simulations
+    cache = None
+
+    # An optional maximum time for each run of 6S, in seconds
+    timeout = None
+
     min_wv = None
     max_wv = None
 
@@ -207,6 +241,10 @@ class SixS(object):
 
     def _create_aot_vis_lines(self):
         """Create the AOT or Visibility lines for the input file"""
+        return self._create_aot_vis_section(self.aot550, self.visibility)
+
+    def _create_aot_vis_section(self, aot550, visibility):
+        """Creates the AOT or Visibility lines for the input file, for the given AOT at 550nm or visibility"""
         if not isinstance(self.aero_profile, AeroProfile.UserProfile):
             # Option to save the output of the MIE subroutine:
             # only applicable for:
@@ -233,10 +271,10 @@ class SixS(object):
                     results_str = "0 no results saved\n0"
 
             # We don't need to set AOT or visibility for a UserProfile, but we do for all others
-            if self.aot550 is not None:
-                return "%s\n%f value\n" % (results_str, self.aot550)
-            elif self.visibility is not None:
-                return "%f\n" % self.visibility
+            if aot550 is not None:
+                return "%s\n%f value\n" % (results_str, aot550)
+            elif visibility is not None:
+                return "%f\n" % visibility
             else:
                 raise ParameterError(
                     "aot550",
@@ -261,41 +299,73 @@ class SixS(object):
         """Create the atmospheric correction lines for the input file"""
         return self.atmos_corr
 
-    def _refls_to_string(self, arr):
-        wavelengths = arr[:, 0]
-        reflectances = arr[:, 1]
+    def _refls_to_string(self, arr, min_wv=None, max_wv=None):
+        if min_wv is None:
+            min_wv, max_wv = self.min_wv, self.max_wv
 
-        # Remove the NaN's from the reflectances and wavelengths
-        # so that they are interpolated if necessary
-        wavelengths = wavelengths[~np.isnan(reflectances)]
-        reflectances = reflectances[~np.isnan(reflectances)]
+        # Resampling and formatting a spectrum is the slowest part of creating an input file, and sweeps
+        # over angles or AOT (or repeated sweeps over wavelength) need the same string many times, so
+        # the strings are cached using a hash of the contents of the spectrum
+        arr = np.ascontiguousarray(arr, dtype=float)
+        key = (_spectrum_hash(arr), min_wv, max_wv)
 
-        # Create an array of the wavelengths that we want to get the reflectances at
-        new_wavelengths = np.arange(self.min_wv, self.max_wv + 0.0025, 0.0025)
+        with _resampled_spectra_lock:
+            s = _resampled_spectra.get(key)
+            if s is not None:
+                _resampled_spectra.move_to_end(key)
+                return s
 
-        # We then interpolate to get the right places
-        calc_refl = interp1d(wavelengths, reflectances, bounds_error=False, fill_value=0.0)
-        new_reflectances = calc_refl(new_wavelengths)
+            spectrum = _resampled_spectra.get(key[0])
 
-        s = " ".join(map(str, new_reflectances))
+        if spectrum is None:
+            wavelengths = arr[:, 0]
+            reflectances = arr[:, 1]
 
-        return s
+            # Remove the NaN's from the reflectances and wavelengths
+            # so that they are interpolated if necessary
+            wavelengths = wavelengths[~np.isnan(reflectances)]
+            reflectances = reflectances[~np.isnan(reflectances)]
 
-    def write_input_file(self, filename=None):
-        """Generates a 6S input file from the parameters stored in the object
-        and writes it to the given filename.
+            # np.interp needs the wavelengths in increasing order
+            order = np.argsort(wavelengths, kind="mergesort")
+            spectrum = (wavelengths[order], reflectances[order])
 
-        The input file is guaranteed to be a valid 6S input file which can be run manually if required
+        wavelengths, reflectances = spectrum
 
-        """
+        # Create an array of the wavelengths that we want to get the reflectances at,
+        # and interpolate to get the reflectances at those wavelengths
+        new_wavelengths = np.arange(min_wv, max_wv + 0.0025, 0.0025)
+        new_reflectances = np.interp(new_wavelengths, wavelengths, reflectances, left=0.0, right=0.0)
 
-        input_file = self._create_geom_lines()
+        # Converting to a list first formats Python floats rather than numpy scalars, which gives the same
+        # (shortest round-trip) representation in a fraction of the time
+        s = " ".join(map(repr, new_reflectances.tolist()))
 
-        input_file += self._create_atmos_aero_lines()
+        with _resampled_spectra_lock:
+            # The spectrum is also cached with the NaNs removed, for other wavelengths
+            _resampled_spectra[key[0]] = spectrum
+            _resampled_spectra[key] = s
+            while len(_resampled_spectra) > _RESAMPLED_SPECTRA_SIZE:
+                _resampled_spectra.popitem(last=False)
 
-        input_file += self._create_aot_vis_lines()
+        return s
 
-        input_file += self._create_elevation_lines()
+    def _create_input_file_contents(self):
+        """Generates the contents of a 6S input file from the parameters stored in the object,
+        returning it as a string."""
+        return "".join(self._create_input_file_sections())
+
+    def _create_input_file_sections(self):
+        """Generates each section of a 6S input file from the parameters stored in the object, returning
+        a list of strings which are joined together to make the input file. The sections are, in order, the
+        geometry, atmosphere and aerosol, AOT or visibility, elevation, wavelength, ground reflectance and
+        atmospheric correction."""
+        sections = [
+            self._create_geom_lines(),
+            self._create_atmos_aero_lines(),
+            self._create_aot_vis_lines(),
+            self._create_elevation_lines(),
+        ]
 
         # Unlike all of the other functions here, _create_wavelength_lines
         # returns 3 values:
@@ -305,10 +375,19 @@ class SixS(object):
         #
         # If only a single wavelength is given then that wavelength is
         # given in both min_wv and max_wv - that is, they are equal.
-        input_file += self._create_wavelength_lines()[0]
-        self.min_wv = self._create_wavelength_lines()[1]
-        self.max_wv = self._create_wavelength_lines()[2]
+        wavelength_lines = self._create_wavelength_lines()
+        sections.append(wavelength_lines[0])
+        self.min_wv = wavelength_lines[1]
+        self.max_wv = wavelength_lines[2]
+
+        sections.append(self._create_ground_reflectance_section(self.min_wv, self.max_wv))
+
+        sections.append(self._create_atmos_corr_lines())
 
+        return sections
+
+    def _create_ground_reflectance_section(self, min_wv, max_wv):
+        """Creates the ground reflectance section of the input file, for the given minimum and maximum wavelengths"""
         # Do replacements of the values within the surface specification
         #
         # Some surface specifications require the wavelength to be specified there
@@ -320,13 +399,11 @@ class SixS(object):
 
         if isinstance(ground_reflectance_lines, basestring):
             str_ground_refl = str(
-                ground_reflectance_lines.replace("WV_REPLACE", "%f %f" % (self.min_wv, self.max_wv))
+                ground_reflectance_lines.replace("WV_REPLACE", "%f %f" % (min_wv, max_wv))
             )
         else:
             str_ground_refl = str(
-                ground_reflectance_lines[0].replace(
-                    "WV_REPLACE", "%f %f" % (self.min_wv, self.max_wv)
-                )
+                ground_reflectance_lines[0].replace("WV_REPLACE", "%f %f" % (min_wv, max_wv))
             )
 
         # Furthermore, to deal with spectra from spectral libraries
@@ -335,16 +412,23 @@ class SixS(object):
         # and replace the REFL_REPLACE bit of the string
 
         if "REFL_REPLACE_2" in str_ground_refl:
-            new_str = self._refls_to_string(ground_reflectance_lines[2])
+            new_str = self._refls_to_string(ground_reflectance_lines[2], min_wv, max_wv)
             str_ground_refl = str_ground_refl.replace("REFL_REPLACE_2", new_str)
 
         if "REFL_REPLACE" in str_ground_refl:
-            new_str = self._refls_to_string(ground_reflectance_lines[1])
+            new_str = self._refls_to_string(ground_reflectance_lines[1], min_wv, max_wv)
             str_ground_refl = str_ground_refl.replace("REFL_REPLACE", new_str)
 
-        input_file += str_ground_refl
+        return str_ground_refl
+
+    def write_input_file(self, filename=None):
+        """Generates a 6S input file from the parameters stored in the object
+        and writes it to the given filename.
+
+        The input file is guaranteed to be a valid 6S input file which can be run manually if required
 
-        input_file += self._create_atmos_corr_lines()
+        """
+        input_file = self._create_input_file_contents()
 
         if filename is None:
             # No filename given, so write to temporary file
@@ -365,33 +449,206 @@ class SixS(object):
 
         return name
 
-    def run(self):
+    def run(self, use_temp_file=False, timeout=None):
         """Runs the 6S model and stores the outputs in the output variable.
 
-        May raise an :class:`.ExecutionError` if the 6S executable cannot be found."""
+        By default the input file is passed straight to the 6S executable on its standard input,
+        without writing anything to disk or starting a shell.
+
+        If the ``cache`` attribute is set to a :class:`.ResultCache` then the output of 6S is taken from
+        the cache if exactly the same input file has been run before, and 6S is not run at all.
+
+        When this is called on one of the threads of a :class:`.WorkerPool` (for example, when the pool is
+        given as the ``executor`` argument of one of the :class:`.SixSHelpers.Wavelengths` functions) then
+        6S is run by the worker process belonging to that thread.
+
+        Arguments:
+
+        * ``use_temp_file`` -- (Optional) If True, write the input file to a temporary file and pass it to
+          6S through the shell, as older versions of Py6S did. This is slower, and is only needed for 6S
+          executables which can't read their standard input from a pipe.
+        * ``timeout`` -- (Optional) The maximum time, in seconds, to wait for 6S to finish. This defaults to the
+          ``timeout`` attribute, and if neither is set then 6S is allowed to run for as long as it takes.
+
+        May raise an :class:`.ExecutionError` if the 6S executable cannot be found or run, or an
+        :class:`.ExecutionTimeoutError` if 6S takes longer than the timeout (in which case it is killed)."""
 
         if self.sixs_path is None:
             raise ExecutionError("6S executable not found.")
 
-        # Create the input file as a temporary file
-        tmp_file_name = self.write_input_file()
-
-        # Run the process and get the stdout from it
-        process = subprocess.Popen(
-            "%s < %s" % (self.sixs_path, tmp_file_name),
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        outputs = process.communicate()
-        self.outputs = Outputs(outputs[0], outputs[1])
-
-        # Remove the temporary file
-        os.remove(tmp_file_name)
-
-        if self.outputs.version != SIXSVERSION:
+        input_file = self._create_input_file_contents()
+        self.outputs = self._run_input_file(input_file, use_temp_file, timeout)
+
+    def _run_input_file(self, input_file, use_temp_file=False, timeout=None):
+        """Runs 6S with the given input file contents, returning the :class:`.Outputs`.
+
+        Only the ``sixs_path``, ``cache`` and ``timeout`` attributes are used, and the object is not changed,
+        so this can be called from many threads at once."""
+        if self.sixs_path is None:
+            raise ExecutionError("6S executable not found.")
+
+        cache_key, stdout = self._get_cached_output(input_file)
+        if stdout is not None:
+            return Outputs(stdout, b"")
+
+        if timeout is None:
+            timeout = self.timeout
+
+        pool = current_pool()
+
+        if use_temp_file:
+            outputs = self._run_with_temp_file(input_file, timeout)
+        elif pool is not None:
+            outputs = pool.execute(self.sixs_path, input_file, timeout)
+        else:
+            # Run the process, passing the input file on stdin, and get the stdout from it
+            try:
+                process = subprocess.Popen(
+                    [self.sixs_path],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+            except OSError as e:
+                raise ExecutionError("Could not run 6S: %s" % e)
+
+            outputs = self._communicate(process, input_file.encode("utf-8"), timeout)
+
+        return self._create_outputs(outputs, cache_key)
+
+    async def run_async(self, timeout=None, semaphore=None):
+        """Runs the 6S model and stores the outputs in the output variable, as a coroutine for use with :mod:`asyncio`.
+
+        This works in the same way as :meth:`run`, but 6S is run with :func:`asyncio.create_subprocess_exec` so that
+        the event loop can carry on with other work (including running other simulations) while waiting for 6S to
+        finish, without needing a thread for each simulation. If the task running this coroutine is cancelled, then
+        the 6S process is killed.
+
+        Arguments:
+
+        * ``timeout`` -- (Optional) The maximum time, in seconds, to wait for 6S to finish. This defaults to the
+          ``timeout`` attribute, and if neither is set then 6S is allowed to run for as long as it takes.
+        * ``semaphore`` -- (Optional) An :class:`asyncio.Semaphore` which must be acquired while 6S is running, to
+          limit the number of 6S processes running at once.
+
+        For example::
+
+          s = SixS()
+          await s.run_async()
+          print(s.outputs.pixel_radiance)
+
+        May raise an :class:`.ExecutionError` if the 6S executable cannot be found or run, or an
+        :class:`.ExecutionTimeoutError` if 6S takes longer than the timeout (in which case it is killed)."""
+        if self.sixs_path is None:
+            raise ExecutionError("6S executable not found.")
+
+        input_file = self._create_input_file_contents()
+        self.outputs = await self._run_input_file_async(input_file, timeout, semaphore)
+
+    async def _run_input_file_async(self, input_file, timeout=None, semaphore=None):
+        """Runs 6S with the given input file contents on the event loop, returning the :class:`.Outputs`.
+        Like :meth:`_run_input_file`, this doesn't change the object."""
+        if self.sixs_path is None:
+            raise ExecutionError("6S executable not found.")
+
+        cache_key, stdout = self._get_cached_output(input_file)
+        if stdout is not None:
+            return Outputs(stdout, b"")
+
+        if timeout is None:
+            timeout = self.timeout
+
+        if semaphore is None:
+            outputs = await self._communicate_async(input_file, timeout)
+        else:
+            async with semaphore:
+                outputs = await self._communicate_async(input_file, timeout)
+
+        return self._create_outputs(outputs, cache_key)
+
+    async def _communicate_async(self, input_file, timeout):
+        """Runs 6S with the given input file contents as an asyncio subprocess, returning its stdout and stderr."""
+        import asyncio
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.sixs_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            raise ExecutionError("Could not run 6S: %s" % e)
+
+        try:
+            return await asyncio.wait_for(process.communicate(input_file.encode("utf-8")), timeout)
+        except asyncio.TimeoutError:
+            raise ExecutionTimeoutError("6S did not finish within %g seconds." % timeout, timeout)
+        finally:
+            # Kill the process if it is still running because it timed out or the task was cancelled
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    def _get_cached_output(self, input_file):
+        """Gets the key to store the output of the given input file under in the cache, and the output stored
+        under it if the input file has been run before (both are None if there is no cache)."""
+        if self.cache is None:
+            return None, None
+
+        cache_key = self.cache.key(self.sixs_path, input_file)
+        return cache_key, self.cache.get(cache_key)
+
+    def _create_outputs(self, outputs, cache_key):
+        """Creates the outputs from the stdout and stderr of 6S, storing them in the cache once they have been checked."""
+        result = Outputs(outputs[0], outputs[1])
+
+        if result._get_version() != SIXSVERSION:
             raise ExecutionError("Running unsupported 6SV version. Py6S requires 6SV1.1")
 
+        # Only store the output once it has been checked successfully
+        if cache_key is not None:
+            self.cache.put(cache_key, outputs[0])
+
+        return result
+
+    def _communicate(self, process, input_data, timeout):
+        """Sends ``input_data`` to the 6S process and returns its stdout and stderr once it has finished.
+
+        The process is killed if it takes longer than ``timeout`` seconds, or if it is cancelled because it
+        is part of a batch of runs which has been cancelled."""
+        with cancellable(process.kill):
+            try:
+                return process.communicate(input_data, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise ExecutionTimeoutError(
+                    "6S did not finish within %g seconds." % timeout, timeout
+                )
+
+    def _run_with_temp_file(self, input_file, timeout=None):
+        """Runs the 6S executable through the shell with its input redirected from a temporary file
+        containing ``input_file``, returning the stdout and stderr from it."""
+        # Create the input file as a temporary file
+        tmp_file = tempfile.NamedTemporaryFile(prefix="tmp_Py6S_input_", delete=False)
+        tmp_file.file.write(input_file.encode("utf-8"))
+        tmp_file_name = tmp_file.name
+        tmp_file.close()
+
+        try:
+            # Run the process and get the stdout from it
+            process = subprocess.Popen(
+                "%s < %s" % (self.sixs_path, tmp_file_name),
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            return self._communicate(process, None, timeout)
+        finally:
+            # Remove the temporary file
+            os.remove(tmp_file_name)
+
     def produce_debug_report(self):
         """Prints out information about the configuration of Py6S generally, and the current
         SixS object specifically, which will be useful when debugging problems."""
@@ -409,11 +666,7 @@ class SixS(object):
         self.test()
         print("---------------------")
 
-        fname = self.write_input_file()
-        with open(fname) as f:
-            contents = f.readlines()
-
-        print("".join(contents))
+        print(self._create_input_file_contents())
 
     @classmethod
     def test(cls, path=None):
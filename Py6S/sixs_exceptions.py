@@ -73,3 +73,31 @@ class ExecutionError(Error):
 
     def __str__(self):
         return self.msg
+
+
+class ExecutionTimeoutError(ExecutionError):
+    """Exception raised when a 6S run (or a batch of runs) takes longer than its timeout. The 6S
+    processes which were still running are killed.
+
+    Call as:
+
+    ExecutionTimeoutError(message, timeout)
+
+    """
+
+    def __init__(self, msg, timeout):
+        self.msg = msg
+        self.timeout = timeout
+
+
+class ExecutionCancelledError(ExecutionError):
+    """Exception raised for a 6S run which was cancelled before it finished, because another run in the
+    same batch failed or the batch took longer than its timeout.
+
+    Call as:
+
+    ExecutionCancelledError(message)
+
+    """
+
+    pass
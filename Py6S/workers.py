@@ -0,0 +1,317 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from .sixs_exceptions import ExecutionCancelledError, ExecutionError, ExecutionTimeoutError
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_worker.py")
+
+# The pool (and worker process) belonging to the current thread, if it is one of the threads of a WorkerPool,
+# and the Cancellation for the runs on the current thread, if they can be cancelled
+_local = threading.local()
+
+
+def current_pool():
+    """Gets the :class:`.WorkerPool` that the current thread belongs to, or None if it doesn't belong to one."""
+    return getattr(_local, "pool", None)
+
+
+class Cancellation(object):
+    """Allows a group of 6S runs, running on many threads, to be cancelled from another thread.
+
+    Functions called with :func:`run_cancellable` run with the cancellation set for their thread, and any 6S
+    process started inside :func:`cancellable` is killed as soon as :meth:`cancel` is called. Runs which are
+    cancelled raise an :class:`.ExecutionCancelledError`.
+
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self._kills = set()
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """Cancels the runs, killing any 6S processes which are running."""
+        with self._lock:
+            self.cancelled = True
+            kills = list(self._kills)
+            self._kills.clear()
+
+        for kill in kills:
+            kill()
+
+    def check(self):
+        """Raises an :class:`.ExecutionCancelledError` if the runs have been cancelled."""
+        if self.cancelled:
+            raise ExecutionCancelledError("The 6S run was cancelled.")
+
+
+def run_cancellable(cancellation, func, *args):
+    """Calls ``func(*args)`` with ``cancellation`` set as the :class:`Cancellation` for the current thread."""
+    previous = getattr(_local, "cancellation", None)
+    _local.cancellation = cancellation
+
+    try:
+        cancellation.check()
+        return func(*args)
+    finally:
+        _local.cancellation = previous
+
+
+def cancellable_check():
+    """Raises an :class:`.ExecutionCancelledError` if the runs on the current thread have been cancelled."""
+    cancellation = getattr(_local, "cancellation", None)
+    if cancellation is not None:
+        cancellation.check()
+
+
+@contextlib.contextmanager
+def cancellable(kill):
+    """A context manager for running a 6S process, which calls ``kill`` if the runs on the current thread are
+    cancelled while it is running and raises an :class:`.ExecutionCancelledError` afterwards."""
+    cancellation = getattr(_local, "cancellation", None)
+
+    if cancellation is None:
+        yield
+        return
+
+    with cancellation._lock:
+        cancellation.check()
+        cancellation._kills.add(kill)
+
+    try:
+        yield
+    finally:
+        with cancellation._lock:
+            cancellation._kills.discard(kill)
+
+    cancellation.check()
+
+
+class WorkerPool(ThreadPoolExecutor):
+    """A pool of long-lived worker processes which run 6S, for running many simulations in parallel.
+
+    Normally each call to :meth:`.SixS.run` starts 6S directly from the Python process, and each of the helper
+    functions in :class:`.SixSHelpers.Wavelengths` and :class:`.SixSHelpers.Angles` creates (and then destroys)
+    its own pool of threads to do this in parallel. A WorkerPool is created once and re-used: it is a
+    :class:`concurrent.futures.Executor` which can be given as the ``executor`` argument of those functions, and
+    each of its threads hands the 6S input files to its own small worker process, which runs 6S in a private
+    scratch directory and sends the raw output back to be parsed.
+
+    This doesn't make each simulation faster - 6S is still started afresh for every input file, and each run
+    also passes through the worker process - so the throughput is much the same as a pool of threads. Instead, a
+    WorkerPool gives each worker a persistent scratch directory of its own, isolates crashes and timeouts from
+    the Python process, and can be re-used by many helper functions without creating a new pool each time. A
+    worker process which crashes is restarted (and the simulation run again), and if a ``timeout`` is given then
+    a 6S run which takes longer than this is killed and the worker process restarted.
+
+    For example::
+
+      with WorkerPool() as pool:
+          wvs, results = SixSHelpers.Wavelengths.run_vnir(s, output_name="pixel_radiance", executor=pool)
+          data = SixSHelpers.Angles.run360(s, "view", output_name="pixel_reflectance", executor=pool)
+
+    Attributes:
+
+    * ``restarts`` -- The number of times a worker process has been restarted because it crashed or timed out
+
+    """
+
+    def __init__(self, n=None, timeout=None):
+        """Initialises the pool. The worker processes are started when they are first needed.
+
+        Arguments:
+
+        * ``n`` -- (Optional) The number of worker processes. This defaults to the number of CPU cores in your system.
+        * ``timeout`` -- (Optional) The maximum time, in seconds, that a single 6S run may take. If not given, 6S runs are never timed out.
+
+        """
+        if n is None:
+            n = os.cpu_count() or 1
+
+        super(WorkerPool, self).__init__(
+            n, thread_name_prefix="Py6S-worker", initializer=self._initialize_thread
+        )
+
+        self.timeout = timeout
+        self.restarts = 0
+
+        self._workers = set()
+        self._workers_lock = threading.Lock()
+
+    def _initialize_thread(self):
+        _local.pool = self
+        _local.worker = None
+
+    def execute(self, sixs_path, input_file, timeout=None):
+        """Runs the 6S executable at ``sixs_path`` with the given input file contents on the worker process
+        belonging to the current thread, returning the stdout and stderr from 6S.
+
+        This is called by :meth:`.SixS.run` when it is run on one of the threads of the pool, with the timeout
+        given to :meth:`.SixS.run` (if any) replacing the ``timeout`` of the pool.
+
+        May raise an :class:`.ExecutionError` if 6S cannot be run or if the worker process keeps crashing, an
+        :class:`.ExecutionTimeoutError` if the run takes longer than the timeout, or an
+        :class:`.ExecutionCancelledError` if the run is cancelled."""
+        if timeout is None:
+            timeout = self.timeout
+
+        # The worker processes run in their own directories, so relative paths must be made absolute
+        if os.path.dirname(sixs_path):
+            sixs_path = os.path.abspath(sixs_path)
+
+        request = {"sixs_path": sixs_path, "timeout": timeout}
+
+        # If the worker process crashes then start a new one and try again, but only once: if
+        # 6S itself is crashing the worker process then it will keep crashing
+        for _ in range(2):
+            if _local.worker is None:
+                _local.worker = self._start_worker()
+
+            # Cancelling the run kills the whole worker process, which is then restarted
+            try:
+                with cancellable(_local.worker.kill):
+                    response, stdout, stderr = _local.worker.execute(request, input_file)
+            except (OSError, EOFError, ValueError):
+                self._restart_worker()
+                cancellable_check()
+                continue
+            except ExecutionCancelledError:
+                self._restart_worker()
+                raise
+
+            if response.get("error") == "timeout":
+                # Start the next run with a fresh worker process and scratch directory
+                self._restart_worker()
+                raise ExecutionTimeoutError(
+                    "6S did not finish within %g seconds." % timeout, timeout
+                )
+            elif "error" in response:
+                raise ExecutionError("Could not run 6S: %s" % response["error"])
+
+            return stdout, stderr
+
+        raise ExecutionError("The worker process running 6S crashed.")
+
+    def _start_worker(self):
+        worker = _Worker()
+        with self._workers_lock:
+            self._workers.add(worker)
+        return worker
+
+    def _restart_worker(self):
+        with self._workers_lock:
+            self._workers.discard(_local.worker)
+            self.restarts += 1
+        _local.worker.close(kill=True)
+        _local.worker = None
+
+    def shutdown(self, wait=True, **kwargs):
+        """Shuts down the pool, stopping the worker processes and removing their scratch directories. See
+        :meth:`concurrent.futures.Executor.shutdown`."""
+        super(WorkerPool, self).shutdown(wait, **kwargs)
+
+        with self._workers_lock:
+            workers = list(self._workers)
+            self._workers.clear()
+
+        for worker in workers:
+            worker.close(wait)
+
+
+class _Worker(object):
+    """A single worker process, running the loop in ``_worker.py`` in its own scratch directory."""
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp(prefix="Py6S_worker_")
+        # On POSIX systems the worker is started in a new process group, so that it can be killed along
+        # with the 6S process it is running
+        self.process = subprocess.Popen(
+            [sys.executable, _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=self.directory,
+            start_new_session=(os.name == "posix"),
+        )
+
+        # Make sure that the process is stopped and the directory removed even if the pool isn't shut down
+        self._finalizer = weakref.finalize(self, _stop_worker, self.process, self.directory, True)
+
+    def execute(self, request, input_file):
+        data = input_file.encode("utf-8")
+        header = dict(request, length=len(data))
+
+        self.process.stdin.write(json.dumps(header).encode("utf-8") + b"\n" + data)
+        self.process.stdin.flush()
+
+        line = self.process.stdout.readline()
+        if not line:
+            raise EOFError("The worker process has stopped")
+
+        response = json.loads(line)
+        stdout = self.process.stdout.read(response["stdout"])
+        stderr = self.process.stdout.read(response["stderr"])
+
+        return response, stdout, stderr
+
+    def kill(self):
+        _kill_worker(self.process)
+
+    def close(self, wait=True, kill=False):
+        self._finalizer.detach()
+        if kill:
+            self.kill()
+        _stop_worker(self.process, self.directory, wait)
+
+
+def _kill_worker(process):
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+    else:
+        process.kill()
+
+
+def _stop_worker(process, directory, wait):
+    # Closing the worker's stdin tells it to stop once it has finished its current run
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
+
+    if wait:
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            _kill_worker(process)
+            process.wait()
+        process.stdout.close()
+
+    shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,88 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark of the time taken to import Py6S, and to use the predefined wavelengths, in a fresh Python process
+- as happens in each worker of a process pool.
+
+The filter functions for the predefined wavelengths are loaded from Py6S/Params/predefined_wavelengths.npz
+the first time each one is used, and the scipy functions used by a few parts of Py6S are imported when
+they are first used, so neither slows down ``import Py6S``.
+
+Run from the root of the repository with::
+
+  python benchmarks/bench_import_time.py
+
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+STATEMENTS = [
+    ("import numpy", "import numpy"),
+    ("import Py6S", "import Py6S"),
+    (
+        "import Py6S, use one band",
+        "import Py6S; Py6S.Wavelength(Py6S.PredefinedWavelengths.LANDSAT_OLI_B1)",
+    ),
+    (
+        "import Py6S, use every band",
+        "import Py6S; [getattr(Py6S.PredefinedWavelengths, name) for name in dir(Py6S.PredefinedWavelengths)]",
+    ),
+]
+
+
+def time_statement(statement, repeat):
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", statement], cwd=ROOT)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+def imported_modules(statement):
+    output = subprocess.check_output(
+        [sys.executable, "-c", statement + "; import sys; print(' '.join(sys.modules))"], cwd=ROOT
+    )
+    return set(output.decode().split())
+
+
+def main(repeat=10):
+    # Make sure the bytecode is up to date, so that compiling the source isn't included in the timings
+    subprocess.check_call([sys.executable, "-m", "compileall", "-q", os.path.join(ROOT, "Py6S")])
+
+    baseline = time_statement("pass", repeat)
+
+    print("Median time for a fresh Python process, minus %.1f ms for an empty one:" % (baseline * 1000))
+    for label, statement in STATEMENTS:
+        elapsed = time_statement(statement, repeat) - baseline
+        print("  %-30s %7.1f ms" % (label, elapsed * 1000))
+
+    modules = imported_modules("import Py6S")
+    print("Heavy modules imported by 'import Py6S':")
+    for name in ("scipy", "pandas", "matplotlib"):
+        print("  %-12s %s" % (name, "yes" if name in modules else "no"))
+
+
+if __name__ == "__main__":
+    main()
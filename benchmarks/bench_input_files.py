@@ -0,0 +1,97 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark of creating the 6S input files for a sweep of 10,000 simulations, comparing setting the parameters
+of a :class:`.SixS` instance and creating the complete input file for each simulation with creating the input
+files from a :class:`.ParameterSnapshot` (which creates the parts of the input file which don't change once).
+
+Run from the root of the repository with::
+
+  python benchmarks/bench_input_files.py
+
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Py6S import GroundReflectance, ParameterSnapshot, SixS, Wavelength  # noqa: E402
+
+N = 10000
+
+
+def full_input_files(s, sweep, values):
+    for value in values:
+        if sweep == "view_z":
+            s.geometry.view_z = value
+        elif sweep == "aot550":
+            s.aot550 = value
+        else:
+            s.wavelength = Wavelength(value)
+        s._create_input_file_contents()
+
+
+def snapshot_input_files(s, sweep, values):
+    snapshot = ParameterSnapshot(s)
+    for value in values:
+        if sweep == "view_z":
+            snapshot.input_file(geometry=snapshot.geometry_with_angles("view", 0, value))
+        elif sweep == "aot550":
+            snapshot.input_file(aot550=value)
+        else:
+            snapshot.input_file(wavelength=Wavelength(value))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    spectrum = np.column_stack([np.linspace(0.35, 2.5, 2000), np.random.rand(2000)])
+
+    sweeps = [
+        ("view_z", np.linspace(0, 80, N)),
+        ("aot550", np.linspace(0.01, 2, N)),
+        ("wavelength", np.linspace(0.4, 2.4, N)),
+    ]
+
+    for name, ground_reflectance in [
+        ("Lambertian reflectance", GroundReflectance.HomogeneousLambertian(0.3)),
+        ("Reflectance spectrum", GroundReflectance.HomogeneousLambertian(spectrum)),
+    ]:
+        print("%s, %d input files" % (name, N))
+
+        for sweep, values in sweeps:
+            s = SixS()
+            s.ground_reflectance = ground_reflectance
+            old = timed(full_input_files, s, sweep, values)
+
+            s = SixS()
+            s.ground_reflectance = ground_reflectance
+            new = timed(snapshot_input_files, s, sweep, values)
+
+            print("  %-10s  complete input file %.3f s, snapshot %.3f s" % (sweep, old, new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark of interpolating atmospheric correction coefficients from a lookup table for every pixel of an image,
+with LookupTable.atmospheric_correction.
+
+The lookup table has axes for AOT, water vapour, view and solar zenith angles, target altitude and band, filled with
+random values (so 6S doesn't need to be run), and the per-pixel parameters are random values within the table.
+
+Run from the root of the repository with::
+
+  python benchmarks/bench_lut_interpolation.py
+
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Py6S import LookupTable  # noqa: E402
+
+AXES = [
+    ("aot550", np.array([0.01, 0.1, 0.2, 0.4, 0.8, 1.2])),
+    ("water", np.linspace(0.5, 5, 5)),
+    ("geometry.view_z", np.linspace(0, 60, 7)),
+    ("geometry.solar_z", np.linspace(0, 70, 8)),
+    ("altitudes", np.array([0, 0.5, 1, 2.0])),
+    ("wavelength", np.array(["LANDSAT_OLI_B1", "LANDSAT_OLI_B2", "LANDSAT_OLI_B3", "LANDSAT_OLI_B4"])),
+]
+
+
+def main(n_pixels=2000000):
+    rng = np.random.default_rng(0)
+
+    shape = tuple(len(coords) for _, coords in AXES)
+    outputs = {
+        "coef_xa": rng.uniform(0.002, 0.004, shape),
+        "coef_xb": rng.uniform(0.05, 0.2, shape),
+        "coef_xc": rng.uniform(0.1, 0.3, shape),
+    }
+    lut = LookupTable(AXES, outputs)
+
+    params = {}
+    for name, coords in AXES[:-1]:
+        params[name] = rng.uniform(coords.min(), coords.max(), n_pixels)
+    params["wavelength"] = rng.integers(0, len(AXES[-1][1]), n_pixels)
+    radiance = rng.uniform(20, 100, n_pixels)
+
+    start = time.perf_counter()
+    lut.atmospheric_correction(radiance, params)
+    elapsed = time.perf_counter() - start
+
+    print("Atmospheric correction of %d pixels, with %d-dimensional lookup table:" % (n_pixels, len(AXES)))
+    print("  %.2fs (%.2f million pixels per second)" % (elapsed, n_pixels / elapsed / 1e6))
+
+    # A typical image, where the atmosphere and altitude are the same for every pixel
+    fixed = dict(params, aot550=0.2, water=1.5, altitudes=0.0)
+    start = time.perf_counter()
+    lut.atmospheric_correction(radiance, fixed)
+    elapsed = time.perf_counter() - start
+
+    print("With fixed AOT, water vapour and altitude:")
+    print("  %.2fs (%.2f million pixels per second)" % (elapsed, n_pixels / elapsed / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark comparing the table-driven 6S output parser in Py6S.outputs with the
+previous parser, which looped over every extractor for every line of the output.
+
+Run from the root of the repository with::
+
+  python benchmarks/bench_output_parsing.py
+
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Py6S.outputs import Outputs, RayleighAerosolTotal, Transmittance  # noqa: E402
+
+EXAMPLE_OUTPUT = os.path.join(os.path.dirname(__file__), "..", "tests", "example_6s_output.txt")
+
+
+def to_int(str):
+    return int(float(str))
+
+
+def extract_vis(data):
+    s = " ".join(data)
+    spl = s.split(":")
+    spl2 = spl[1].split()
+
+    try:
+        value = float(spl2[0])
+    except ValueError:
+        value = float("Inf")
+
+    return value
+
+
+def extract_aot(data):
+    s = " ".join(data)
+    spl = s.split(":")
+
+    return float(spl[2])
+
+
+def previous_extract_results(fulltext):
+    """The parser used by Outputs.extract_results before it was made table-driven, kept here for comparison"""
+    values_dict = {}
+    trans_dict = {}
+    rat_dict = {}
+
+    fulltext = fulltext.replace("*", "")
+    lines = fulltext.splitlines()
+
+    CURRENT = 0
+    WHOLE_LINE = (0, 30)
+
+    # fmt: off
+    # The dictionary below specifies how to extract each variable from the text output
+    # of 6S.
+    # The dictionary key is the text to search for. When this is found, the line corresponding
+    # to the first value in the tuple is found. If this is CURRENT (ie. 0) then it is the line on which
+    # the text was found, if it is 1 then it is the next line, 2 the one after that etc.
+    # The next item in the tuple is the index of the split line to extract the value from, and the
+    # third item is the key to store it in in the values dictionary. The final item is the type to convert
+    # it to - the type conversion function must be specified. More specific functions such as math.floor can
+    # be used here if desired.
+
+    #              Search Term                                Line   Index DictKey   Type
+    extractors = {"6SV version": (CURRENT, 2, "version", str),
+                  "month": (CURRENT, 1, "month", to_int),
+                  "day": (CURRENT, 4, "day", to_int),
+                  "solar zenith angle": (CURRENT, 3, "solar_z", to_int),
+                  "solar azimuthal angle": (CURRENT, 8, "solar_a", to_int),
+                  "view zenith angle": (CURRENT, 3, "view_z", to_int),
+                  "view azimuthal angle": (CURRENT, 8, "view_a", to_int),
+                  "scattering angle": (CURRENT, 2, "scattering_angle", float),
+                  "azimuthal angle difference": (CURRENT, 7, "azimuthal_angle_difference", float),
+                  "optical condition identity": (1, WHOLE_LINE, "visibility", extract_vis),
+                  "optical condition": (1, WHOLE_LINE, "aot550", extract_aot),
+                  "ground pressure": (CURRENT, 3, "ground_pressure", float),
+                  "ground altitude": (CURRENT, 3, "ground_altitude", float),
+
+                  "appar. rad.(w/m2/sr/mic)": (CURRENT, 2, "apparent_reflectance", float),
+                  "appar. rad.": (CURRENT, 5, "apparent_radiance", float),
+                  "total gaseous transmittance": (CURRENT, 3, "total_gaseous_transmittance", float),
+
+                  "wv above aerosol": (CURRENT, 4, "wv_above_aerosol", float),
+                  "wv mixed with aerosol": (CURRENT, 10, "wv_mixed_with_aerosol", float),
+                  "wv under aerosol": (CURRENT, 4, "wv_under_aerosol", float),
+
+                  "% of irradiance": (2, 0, "percent_direct_solar_irradiance", float),
+                  "% of irradiance at": (2, 1, "percent_diffuse_solar_irradiance", float),
+                  "% of irradiance at ground level": (2, 2, "percent_environmental_irradiance", float),
+                  "reflectance at satellite level": (2, 0, "atmospheric_intrinsic_reflectance", float),
+                  "reflectance at satellite lev": (2, 1, "background_reflectance", float),
+                  "reflectance at satellite l": (2, 2, "pixel_reflectance", float),
+                  "irr. at ground level": (2, 0, "direct_solar_irradiance", float),
+                  "irr. at ground level (w/": (2, 1, "diffuse_solar_irradiance", float),
+                  "irr. at ground level (w/m2/mic)": (2, 2, "environmental_irradiance", float),
+                  "rad at satel. level": (2, 0, "atmospheric_intrinsic_radiance", float),
+                  "rad at satel. level (w/m2/": (2, 1, "background_radiance", float),
+                  "rad at satel. level (w/m2/sr/mic)": (2, 2, "pixel_radiance", float),
+                  "sol. spect (in w/m2/mic)": (1, 0, "solar_spectrum", float),
+
+
+                  "measured radiance [w/m2/sr/mic]": (CURRENT, 4, "measured_radiance", float),
+                  "atmospherically corrected reflectance": (1, 3, "atmos_corrected_reflectance_lambertian", float),
+                  "atmospherically corrected reflect": (2, 3, "atmos_corrected_reflectance_brdf", float),
+                  "coefficients xa": (CURRENT, 5, "coef_xa", float),
+                  "coefficients xa xb": (CURRENT, 6, "coef_xb", float),
+                  "coefficients xa xb xc": (CURRENT, 7, "coef_xc", float),
+                  "int. funct filter (in mic)": (1, 0, 'int_funct_filt', float),
+                  "int. sol. spect (in w/m2)": (1, 1, 'int_solar_spectrum', float),
+
+                  "Foam:": (CURRENT, 1, "water_component_foam", float),
+                  "Water:": (CURRENT, 3, "water_component_water", float),
+                  "Glint:": (CURRENT, 5, "water_component_glint", float),
+
+                  "app. polarized refl.": (CURRENT, 3, "apparent_polarized_reflectance", float),
+                  "app. pol. rad.": (CURRENT, 8, "apparent_polarized_radiance", float),
+                  "direction of the plane of polarization": (CURRENT, -1, "direction_of_plane_of_polarization", lambda x: float(x.replace("polarization", ""))),
+                  "total polarization ratio": (CURRENT, 3, "total_polarization_ratio", float)
+                  }
+    # fmt: on
+    # Process most variables in the output
+    for index in range(len(lines)):
+        current_line = lines[index]
+        for label, details in extractors.items():
+            # If the label we're searching for is in the current line
+            if label.lower() in current_line.lower():
+                # See if the data is in the current line (as specified above)
+                if details[0] == CURRENT:
+                    extracting_line = current_line
+                # Otherwise, work out which line to use and get it
+                else:
+                    extracting_line = lines[index + details[0]]
+
+                funct = details[3]
+                items = extracting_line.split()
+
+                try:
+                    a = details[1][0]
+                    b = details[1][1]
+                except Exception:
+                    a = details[1]
+                    b = details[1] + 1
+
+                if a == -1:
+                    data_for_func = items[a]
+                else:
+                    data_for_func = items[a:b]
+
+                if len(data_for_func) == 1:
+                    data_for_func = data_for_func[0]
+
+                try:
+                    values_dict[details[2]] = funct(data_for_func)
+                except Exception:
+                    values_dict[details[2]] = float("nan")
+
+    # Process big grid in the middle of the output for transmittances
+    grid_extractors = {
+        "global gas. trans. :": "global_gas",
+        'water   "     "    :': "water",
+        'ozone   "     "    :': "ozone",
+        'co2     "     "    :': "co2",
+        'oxyg    "     "    :': "oxygen",
+        'no2     "     "    :': "no2",
+        'ch4     "     "    :': "ch4",
+        'co      "     "    :': "co",
+        "rayl.  sca. trans. :": "rayleigh_scattering",
+        'aeros. sca.   "    :': "aerosol_scattering",
+        'total  sca.   "    :': "total_scattering",
+    }
+
+    for index in range(len(lines)):
+        current_line = lines[index]
+        for search, name in grid_extractors.items():
+            # If the label we're searching for is in the current line
+            if search in current_line:
+                items = current_line.split()
+                values = Transmittance()
+
+                try:
+                    values.downward = float(items[4])
+                except ValueError:
+                    values.downward = float("nan")
+
+                try:
+                    values.upward = float(items[5])
+                except ValueError:
+                    values.upward = float("nan")
+
+                try:
+                    values.total = float(items[6])
+                except ValueError:
+                    values.total = float("nan")
+
+                trans_dict[name] = values
+
+    # Process big grid in the middle of the output for transmittances
+    bottom_grid_extractors = {
+        "spherical albedo   :": "spherical_albedo",
+        "optical depth total:": "optical_depth_total",
+        "optical depth plane:": "optical_depth_plane",
+        "reflectance I      :": "reflectance_I",
+        "reflectance Q      :": "reflectance_Q",
+        "reflectance U      :": "reflectance_U",
+        "polarized reflect. :": "polarized_reflectance",
+        # 'degree of polar.   :' : "degree_of_polarization",
+        "dir. plane polar.  :": "direction_of_plane_polarization",
+        "phase function I   :": "phase_function_I",
+        "phase function Q   :": "phase_function_Q",
+        "phase function U   :": "phase_function_U",
+        "primary deg. of pol:": "primary_degree_of_polarization",
+        "sing. scat. albedo :": "single_scattering_albedo",
+    }
+
+    for index in range(len(lines)):
+        current_line = lines[index]
+        for search, name in bottom_grid_extractors.items():
+            # If the label we're searching for is in the current line
+            if search in current_line:
+                items = current_line.rsplit(None, 3)
+
+                values = RayleighAerosolTotal()
+
+                try:
+                    values.total = float(items[3])
+                except ValueError:
+                    values.total = float("nan")
+
+                try:
+                    values.aerosol = float(items[2])
+                except ValueError:
+                    values.aerosol = float("nan")
+
+                try:
+                    values.rayleigh = float(items[1])
+                except ValueError:
+                    values.rayleigh = float("nan")
+
+                rat_dict[name] = values
+
+    return values_dict, trans_dict, rat_dict
+
+
+def as_comparable(values, trans, rat):
+    return (
+        {k: repr(v) for k, v in values.items()},
+        {k: (repr(v.downward), repr(v.upward), repr(v.total)) for k, v in trans.items()},
+        {k: (repr(v.rayleigh), repr(v.aerosol), repr(v.total)) for k, v in rat.items()},
+    )
+
+
+def main(number=2000):
+    with open(EXAMPLE_OUTPUT, "rb") as f:
+        stdout = f.read()
+    text = stdout.decode()
+
+    new = Outputs(stdout, b"")
+    if as_comparable(new.values, new.trans, new.rat) != as_comparable(
+        *previous_extract_results(text)
+    ):
+        raise AssertionError("The two parsers give different results")
+
+    previous_time = timeit.timeit(lambda: previous_extract_results(text), number=number)
+    new_time = timeit.timeit(lambda: Outputs(stdout, b"").extract_results(), number=number)
+    # The sections of the output are parsed when first used, so getting a single output only parses one section
+    single_time = timeit.timeit(lambda: Outputs(stdout, b"").pixel_radiance, number=number)
+
+    print("Parsing %d 6S outputs:" % number)
+    print("  Previous parser: %.3fs (%.1f us per output)" % (previous_time, previous_time / number * 1e6))
+    print("  Current parser:  %.3fs (%.1f us per output)" % (new_time, new_time / number * 1e6))
+    print("  Speed-up: %.1fx" % (previous_time / new_time))
+    print(
+        "  Current parser, pixel_radiance only: %.3fs (%.1f us per output)"
+        % (single_time, single_time / number * 1e6)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark of the work done for each simulation by the sweep helpers before 6S is run, comparing
+the previous approach (a deep copy of the SixS instance, which is then rendered into a complete input file)
+with a :class:`.ParameterSnapshot` (which renders the shared parts of the input file once, and replaces only
+the part being varied).
+
+Run from the root of the repository with::
+
+  python benchmarks/bench_sweep_setup.py
+
+"""
+
+import copy
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Py6S import GroundReflectance, ParameterSnapshot, SixS, Wavelength  # noqa: E402
+
+
+def deepcopy_wavelength(s, wv):
+    a = copy.deepcopy(s)
+    a.wavelength = Wavelength(wv)
+    return a._create_input_file_contents()
+
+
+def deepcopy_angles(s, azimuth, zenith):
+    a = copy.deepcopy(s)
+    a.geometry.view_a = azimuth
+    a.geometry.view_z = zenith
+    return a._create_input_file_contents()
+
+
+def main():
+    spectrum = np.column_stack([np.linspace(0.35, 2.5, 2000), np.random.rand(2000)])
+
+    cases = [
+        ("Lambertian reflectance", SixS()),
+        ("Reflectance spectrum", SixS()),
+    ]
+    cases[1][1].ground_reflectance = GroundReflectance.HomogeneousLambertian(spectrum)
+
+    n = 2000
+
+    for name, s in cases:
+        snapshot = ParameterSnapshot(s)
+
+        print(name)
+
+        old = timeit.timeit(lambda: deepcopy_wavelength(s, 0.55), number=n) / n
+        new = timeit.timeit(lambda: snapshot.input_file(wavelength=Wavelength(0.55)), number=n) / n
+        print("  Wavelength sweep: deepcopy %.1f us, snapshot %.1f us" % (old * 1e6, new * 1e6))
+
+        old = timeit.timeit(lambda: deepcopy_angles(s, 180, 30), number=n) / n
+        new = (
+            timeit.timeit(
+                lambda: snapshot.input_file(
+                    geometry=snapshot.geometry_with_angles("view", 180, 30)
+                ),
+                number=n,
+            )
+            / n
+        )
+        print("  Angle sweep:      deepcopy %.1f us, snapshot %.1f us" % (old * 1e6, new * 1e6))
+
+
+if __name__ == "__main__":
+    main()
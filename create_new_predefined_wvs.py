@@ -33,3 +33,14 @@ def process_band(df, bandid):
     values[values < 0.001] = 0.0
 
     print("%.3f, %.3f,\nnp.%s)" % (minwv / 1000.0, maxwv / 1000.0, values.__repr__()))
+
+
+def save_filter(name, values, filename="Py6S/Params/predefined_wavelengths.npz"):
+    """Adds (or replaces) the filter function for the predefined wavelength called `name` in the data file
+    used by PredefinedWavelengths. The constant itself is then added to PredefinedWavelengths as
+    `name = _PredefinedWavelength(ID, start, end)`."""
+    with np.load(filename) as f:
+        filters = dict(f)
+
+    filters[name] = np.asarray(values, dtype=np.float64)
+    np.savez_compressed(filename, **filters)
@@ -43,6 +43,7 @@ REQS = ["pysolar>=0.9", "scipy"]
 setup(
     name="Py6S",
     packages=["Py6S", "Py6S.Params", "Py6S.SixSHelpers"],
+    package_data={"Py6S.Params": ["predefined_wavelengths.npz"]},
     install_requires=REQS,
     python_requires=">=3",
     version="1.9.2",
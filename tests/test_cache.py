@@ -0,0 +1,135 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import os.path
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from Py6S import ResultCache, SixS
+
+test_dir = os.path.relpath(os.path.dirname(__file__))
+
+with open(os.path.join(test_dir, "example_6s_output.txt"), "rb") as f:
+    example_output = f.read()
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_memory_lru(self):
+        cache = ResultCache(max_entries=2)
+
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), b"3")
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+
+    def test_disk_tier(self):
+        cache = ResultCache(directory=self.directory)
+        key = cache.key("sixs", "input")
+        cache.put(key, example_output)
+
+        # A new cache using the same directory, with an empty memory tier
+        new_cache = ResultCache(directory=self.directory)
+
+        self.assertEqual(new_cache.get(key), example_output)
+        self.assertEqual(new_cache.disk_hits, 1)
+        self.assertEqual(new_cache.get(key), example_output)
+        self.assertEqual(new_cache.memory_hits, 1)
+
+    def test_disk_eviction(self):
+        cache = ResultCache(max_entries=0, directory=self.directory, max_size=1)
+
+        cache.put("aa1", example_output)
+        cache.put("aa2", example_output)
+
+        self.assertIsNone(cache.get("aa1"))
+        self.assertLessEqual(cache._disk_size, 1)
+
+    def test_disk_size_when_replaced(self):
+        cache = ResultCache(directory=self.directory)
+
+        cache.put("aa1", example_output)
+        cache.put("aa1", example_output)
+
+        self.assertEqual(cache._disk_size, os.path.getsize(cache._disk_path("aa1")))
+
+    def test_exe_identity_remembered(self):
+        cache = ResultCache()
+        exe = os.path.join(self.directory, "sixs")
+        with open(exe, "w") as f:
+            f.write("6S")
+        key = cache.key(exe, "input")
+
+        # The executable is only looked at the first time it is used, until the cache is cleared
+        with open(exe, "w") as f:
+            f.write("New 6S")
+        self.assertEqual(cache.key(exe, "input"), key)
+
+        cache.clear()
+        self.assertNotEqual(cache.key(exe, "input"), key)
+
+    def test_key_depends_on_input(self):
+        cache = ResultCache()
+
+        self.assertEqual(cache.key("sixs", "input"), cache.key("sixs", "input"))
+        self.assertNotEqual(cache.key("sixs", "input"), cache.key("sixs", "input2"))
+        self.assertNotEqual(cache.key("sixs", "input"), cache.key("sixs2", "input"))
+
+    def test_shared_between_copies(self):
+        s = SixS()
+        s.cache = ResultCache(directory=self.directory)
+
+        self.assertIs(copy.deepcopy(s).cache, s.cache)
+
+        unpickled = pickle.loads(pickle.dumps(s.cache))
+        self.assertEqual(unpickled.directory, self.directory)
+
+    def test_run_from_cache(self):
+        s = SixS()
+        # Not a real executable, so this will only work if the result comes from the cache
+        s.sixs_path = "not_a_6s_executable"
+        s.cache = ResultCache()
+        s.cache.put(s.cache.key(s.sixs_path, s._create_input_file_contents()), example_output)
+
+        s.run()
+
+        self.assertAlmostEqual(s.outputs.pixel_radiance, 85.49)
+        self.assertEqual(s.cache.hits, 1)
+
+    def test_run_stores_result(self):
+        s = SixS()
+        s.cache = ResultCache()
+
+        s.run()
+        s.run()
+
+        self.assertEqual(s.cache.misses, 1)
+        self.assertEqual(s.cache.hits, 1)
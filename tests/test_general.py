@@ -16,6 +16,7 @@
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
 import os.path
+import tempfile
 import unittest
 
 import numpy as np
@@ -30,6 +31,7 @@ from Py6S import (
     PredefinedWavelengths,
     SixS,
     Spectra,
+    SpectralLibrary,
     Wavelength,
 )
 
@@ -53,6 +55,22 @@ class SixSClassTests(unittest.TestCase):
 
         self.assertEqual(os.path.exists("test_input_file.txt"), True)
 
+    def test_run_with_temp_file(self):
+        s = SixS()
+        s.run()
+        stdin_radiance = s.outputs.apparent_radiance
+
+        s.run(use_temp_file=True)
+
+        self.assertEqual(s.outputs.apparent_radiance, stdin_radiance)
+
+    def test_input_file_matches_contents(self):
+        s = SixS()
+        s.write_input_file("test_input_file.txt")
+
+        with open("test_input_file.txt") as f:
+            self.assertEqual(f.read(), s._create_input_file_contents())
+
     def test_no_sixs_path(self):
         s = SixS()
         s.sixs_path = None
@@ -168,6 +186,73 @@ class UserDefinedSpectraTest(unittest.TestCase):
 
         self.assertAlmostEqual(s.outputs.apparent_radiance, 180.818, delta=0.002)
 
+    def test_resampled_spectrum(self):
+        s = SixS()
+        spectrum = np.array([[0.5, 0.1], [0.51, np.nan], [0.6, 0.3]])
+
+        def resampled(min_wv, max_wv):
+            return np.array(s._refls_to_string(spectrum, min_wv, max_wv).split(), dtype=float)
+
+        np.testing.assert_allclose(resampled(0.5, 0.505), [0.1, 0.105, 0.11])
+        # Wavelengths outside the spectrum have a reflectance of zero
+        self.assertTrue(np.all(resampled(0.65, 0.7) == 0))
+        # The same string is returned from the cache
+        self.assertIs(
+            s._refls_to_string(spectrum, 0.5, 0.505), s._refls_to_string(spectrum, 0.5, 0.505)
+        )
+
+        # The resampled spectrum is cached using the contents of the spectrum, so changing the
+        # spectrum in place gives a new result
+        spectrum[0, 1] = 0.2
+        np.testing.assert_allclose(resampled(0.5, 0.505), [0.2, 0.2025, 0.205])
+
+    def test_spectral_library(self):
+        with tempfile.TemporaryDirectory() as directory:
+            aster_name = "jhu.becknic.vegetation.trees.conifers.solid.conifer.spectrum.txt"
+            usgs_name = "butlerite_gds25.3947.asc"
+
+            library = SpectralLibrary(directory)
+            self.assertEqual(len(library), 0)
+            library.add_files([os.path.join(test_dir, aster_name)], "aster")
+            library.add_files([os.path.join(test_dir, usgs_name)], "usgs")
+
+            # The spectra are stored, so can be used after opening the library again
+            library = SpectralLibrary(directory)
+            self.assertEqual(library.names, [aster_name, usgs_name])
+            self.assertIn(usgs_name, library)
+
+            wavelengths, reflectances = library[aster_name]
+            np.testing.assert_allclose(wavelengths[[0, 1, -1]], [0.2, 0.2025, 4.0])
+            # The ASTER spectrum starts at 0.302um
+            self.assertTrue(np.all(np.isnan(reflectances[wavelengths < 0.302])))
+
+            # The reflectances in the 6S input file are the same as for the original spectrum
+            s = SixS()
+            original = Spectra.import_from_aster(os.path.join(test_dir, aster_name))
+            np.testing.assert_allclose(
+                np.array(s._refls_to_string(library.spectrum(aster_name), 0.5, 0.6).split(), float),
+                np.array(s._refls_to_string(original, 0.5, 0.6).split(), float),
+                atol=1e-12,
+            )
+
+            # Adding a spectrum with an existing name replaces it
+            library.add({usgs_name: np.array([[0.4, 0.1], [0.8, 0.5]])})
+            self.assertEqual(len(library), 2)
+            np.testing.assert_allclose(library[usgs_name][1][wavelengths == 0.6], 0.3)
+
+            with pytest.raises(ParameterError):
+                library["missing"]
+
+            with pytest.raises(ParameterError):
+                library.add_files([os.path.join(test_dir, usgs_name)], "csv")
+
+            # The files are given the same permissions as any other new file, so the library can be shared
+            umask = os.umask(0)
+            os.umask(umask)
+            for filename in os.listdir(directory):
+                mode = os.stat(os.path.join(directory, filename)).st_mode & 0o777
+                self.assertEqual(mode, 0o666 & ~umask)
+
 
 class GeometryTest(unittest.TestCase):
     def test_geom_from_time_and_loc_1(self):
@@ -190,6 +275,75 @@ class GeometryTest(unittest.TestCase):
         with pytest.raises(ParameterError):
             g.from_time_and_location(50, -1, "2020-99-05", 0, 30)
 
+    def test_solar_positions(self):
+        lats = [50, -33.9, 0, 71]
+        lons = [-1, 18.4, 100, -156]
+        datetimes = ["2014-05-06", "2020-01-05 13:47", "2003-09-23 06:00", "1995-06-21 22:30"]
+
+        solar_z, solar_a, day, month = Geometry.User.solar_positions(lats, lons, datetimes)
+
+        for i in range(len(lats)):
+            g = Geometry.User()
+            g.from_time_and_location(lats[i], lons[i], datetimes[i], 0, 0)
+            self.assertAlmostEqual(solar_z[i], g.solar_z, delta=0.03)
+            self.assertAlmostEqual(solar_a[i], g.solar_a, delta=0.1)
+            self.assertEqual(day[i], g.day)
+            self.assertEqual(month[i], g.month)
+
+    def test_solar_positions_accuracy(self):
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(-89, 89, 400)
+        lons = rng.uniform(-180, 180, 400)
+        datetimes = np.datetime64("1900-01-01") + rng.integers(0, 200 * 365 * 86400, 400).astype(
+            "timedelta64[s]"
+        )
+
+        solar_z, solar_a, _, _ = Geometry.User.solar_positions(lats, lons, datetimes)
+
+        for i in range(len(lats)):
+            g = Geometry.User()
+            g.from_time_and_location(lats[i], lons[i], str(datetimes[i]), 0, 0)
+            self.assertAlmostEqual(solar_z[i], g.solar_z, delta=0.03)
+
+            # Near the zenith (or the nadir) the azimuth changes quickly with the position of the sun, so the difference
+            # in position (the difference in azimuth scaled by the sine of the zenith angle) is checked there instead
+            azimuth_difference = abs((solar_a[i] - g.solar_a + 180) % 360 - 180)
+            if 10 < g.solar_z < 90:
+                self.assertLess(azimuth_difference, 0.12)
+            self.assertLess(azimuth_difference * np.sin(np.radians(g.solar_z)), 0.03)
+
+    def test_solar_positions_broadcast(self):
+        times = np.arange("2020-01-01T00", "2020-01-03T00", dtype="datetime64[h]")
+
+        solar_z, solar_a, day, month = Geometry.User.solar_positions(50, -1, times)
+
+        self.assertEqual(solar_z.shape, (48,))
+        np.testing.assert_array_equal(day, [1] * 24 + [2] * 24)
+        np.testing.assert_array_equal(month, 1)
+        # The sun is highest around midday UTC at this longitude
+        self.assertIn(int(np.argmin(solar_z[:24])), (11, 12))
+
+    def test_solar_positions_timezone(self):
+        utc = Geometry.User.solar_positions(50, -1, ["2020-06-01 12:00"])
+        local = Geometry.User.solar_positions(50, -1, ["2020-06-01T14:00+02:00"])
+
+        np.testing.assert_allclose(utc, local)
+
+    def test_solar_positions_invalid_date(self):
+        with pytest.raises(ParameterError):
+            Geometry.User.solar_positions(50, -1, ["2020-01-05", "2020-99-05"])
+
+    def test_from_times_and_locations(self):
+        geometries = Geometry.User.from_times_and_locations(
+            [50, 51], -1, "2020-01-05 13:47", view_z=[0, 10], view_a=30
+        )
+
+        self.assertEqual(len(geometries), 2)
+        self.assertEqual([g.view_z for g in geometries], [0, 10])
+        self.assertEqual([g.view_a for g in geometries], [30, 30])
+        self.assertTrue(geometries[1].solar_z > geometries[0].solar_z)
+        self.assertTrue(str(geometries[0]).endswith("0.000000 30.000000 1 5\n"))
+
 
 class AltitudesTest(unittest.TestCase):
     def test_custom_sensor_altitude(self):
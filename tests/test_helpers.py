@@ -15,14 +15,37 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 import os.path
+import shutil
+import tarfile
+import tempfile
 import unittest
 import urllib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 
-from Py6S import AtmosProfile, OutputParsingError, ParameterError, SixS, SixSHelpers
+from Py6S import (
+    AtmosProfile,
+    ExecutionError,
+    GroundReflectance,
+    OutputParsingError,
+    OutputsBatch,
+    ParameterError,
+    PredefinedWavelengths,
+    SixS,
+    SixSHelpers,
+)
+from Py6S.SixSHelpers import aeronet
+from Py6S.SixSHelpers.all_angles import _adaptive_grid
+from Py6S.SixSHelpers.all_wavelengths import (
+    _adaptive_sample,
+    _convolution_wavelengths,
+    _convolve,
+)
 
 test_dir = os.path.relpath(os.path.dirname(__file__))
 
@@ -48,6 +71,154 @@ class AllWavelengthsTests(unittest.TestCase):
         )
         np.testing.assert_allclose(a, results[1], atol=0.1)
 
+    def test_for_sensors(self):
+        s = SixS()
+        results = SixSHelpers.Wavelengths.for_sensors(
+            s, ["landsat_etm", "aqua", "terra"], output_name="apparent_radiance"
+        )
+
+        self.assertEqual(list(results), ["landsat_etm", "aqua", "terra"])
+        for name in results:
+            run = getattr(SixSHelpers.Wavelengths, "run_" + name)
+            centre_wvs, values = run(s, output_name="apparent_radiance")
+
+            np.testing.assert_allclose(results[name][0], centre_wvs)
+            np.testing.assert_allclose(results[name][1], values)
+
+    def test_for_sensors_distinct_bands(self):
+        s = SixS("not_a_6s_executable")
+
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return ThreadPoolExecutor.submit(self, *args, **kwargs)
+
+        with CountingExecutor(2) as executor:
+            results = SixSHelpers.Wavelengths.for_sensors(
+                s, ["aqua", "terra", "landsat_mss"], executor=executor, errors="return"
+            )
+
+        # Seven of the bands are the same for Aqua and Terra, so they are only run once
+        self.assertEqual(CountingExecutor.submitted, 12 + 12 + 4 - 7)
+        self.assertEqual(len(results["aqua"][1]), 12)
+        self.assertEqual(len(results["terra"][1]), 12)
+        self.assertEqual(len(results["landsat_mss"][0]), 4)
+        for result in results["terra"][1]:
+            self.assertIsInstance(result, ExecutionError)
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Wavelengths.for_sensors(s, ["landsat_tm", "not_a_sensor"])
+
+    def test_convolution_accuracy(self):
+        s = SixS()
+        accuracy = SixSHelpers.Wavelengths.convolution_accuracy(
+            s, ["probav_1", "s2a_msi"], output_name="apparent_reflectance", spacing=0.0025
+        )
+
+        for name in ["probav_1", "s2a_msi"]:
+            centre_wvs, convolved, simulated, difference = accuracy[name]
+            self.assertEqual(len(convolved), len(simulated))
+            np.testing.assert_allclose(difference, (convolved - simulated) / simulated)
+            self.assertLess(np.abs(difference).max(), 0.05)
+
+    def test_convolve(self):
+        bands = [PredefinedWavelengths.S2A_MSI_02, PredefinedWavelengths.S2A_MSI_04]
+        wavelengths = _convolution_wavelengths(bands, 0.005)
+
+        # One wavelength either side of the bands is simulated, and none in between them
+        self.assertLess(wavelengths[0], bands[0][1])
+        self.assertGreater(wavelengths[-1], bands[1][2])
+        self.assertFalse(
+            np.any((wavelengths > bands[0][2] + 0.01) & (wavelengths < bands[1][1] - 0.01))
+        )
+
+        solar_spectrum = 1000 + 100 * np.sin(wavelengths * 10)
+        batch = OutputsBatch.from_columns(
+            {
+                "solar_spectrum": solar_spectrum,
+                "apparent_radiance": wavelengths * 10,
+                "apparent_reflectance": wavelengths,
+                "solar_z": np.full(len(wavelengths), 32.0),
+            }
+        )
+        # A failed simulation for a wavelength in the first band
+        batch.columns["apparent_radiance"][
+            np.searchsorted(wavelengths, bands[0][1] + 0.01)
+        ] = np.nan
+        convolved = _convolve(wavelengths, batch, bands)
+
+        band_filter = np.asarray(bands[1][3])
+        filter_wavelengths = bands[1][1] + 0.0025 * np.arange(len(band_filter))
+        solar = np.interp(filter_wavelengths, wavelengths, solar_spectrum)
+
+        # Radiances are weighted by the filter function, and reflectances by the solar spectrum as well
+        self.assertAlmostEqual(
+            convolved["apparent_radiance"][1],
+            np.sum(band_filter * filter_wavelengths * 10) / np.sum(band_filter),
+        )
+        self.assertAlmostEqual(
+            convolved["apparent_reflectance"][1],
+            np.sum(band_filter * solar * filter_wavelengths) / np.sum(band_filter * solar),
+        )
+        self.assertAlmostEqual(
+            convolved["int_solar_spectrum"][1], np.sum(band_filter * solar) * 0.0025
+        )
+        np.testing.assert_allclose(convolved["solar_z"], [32, 32])
+
+        # The failed simulation only affects the band which uses it
+        self.assertTrue(np.isnan(convolved["apparent_radiance"][0]))
+        self.assertFalse(np.isnan(convolved["apparent_reflectance"][0]))
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Wavelengths.convolve_sensors(SixS(), ["landsat_tm"])
+
+    def test_adaptive_wavelengths(self):
+        s = SixS()
+        wavelengths, values, simulated_wavelengths, simulated_values = (
+            SixSHelpers.Wavelengths.adaptive_wavelengths(
+                s, "total_gaseous_transmittance", start=0.7, end=0.8, initial_spacing=0.02
+            )
+        )
+
+        self.assertEqual(len(wavelengths), 101)
+        self.assertLess(len(simulated_wavelengths), 101)
+
+        # The simulated wavelengths give the same results as running for them directly
+        _, direct = SixSHelpers.Wavelengths.run_wavelengths(
+            s, simulated_wavelengths, output_name="total_gaseous_transmittance"
+        )
+        np.testing.assert_allclose(simulated_values, direct)
+
+    def test_adaptive_sample(self):
+        def spectrum(wavelengths):
+            # A smooth spectrum with a narrow absorption band
+            return 0.1 * wavelengths + 1 - 0.8 * np.exp(-(((wavelengths - 0.76) / 0.003) ** 2))
+
+        calls = []
+
+        def func(wavelengths):
+            calls.append(wavelengths)
+            return list(spectrum(np.array(wavelengths)))
+
+        wavelengths, values, simulated_wavelengths, simulated_values = _adaptive_sample(
+            func, 0.2, 4.0, 0.04, 0.001, 0.01
+        )
+
+        np.testing.assert_allclose(wavelengths, np.linspace(0.2, 4.0, 3801))
+        self.assertLess(np.abs(values - spectrum(wavelengths)).max(), 0.02)
+        np.testing.assert_allclose(simulated_values, spectrum(simulated_wavelengths))
+
+        # Each wavelength is only simulated once, and far fewer are simulated than the returned spectrum
+        self.assertEqual(sum(map(len, calls)), len(simulated_wavelengths))
+        self.assertLess(len(simulated_wavelengths), 400)
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Wavelengths.adaptive_wavelengths(
+                SixS(), "pixel_radiance", initial_spacing=0.0001
+            )
+
         # def test_run_vnir(self):
         # 	s = SixS()
 
@@ -108,6 +279,143 @@ class ParallelEquivalenceTests(unittest.TestCase):
             )
             np.testing.assert_allclose(parallel_res, serial_res)
 
+    def test_wavelengths_executors(self):
+        s = SixS()
+
+        thread_res = SixSHelpers.Wavelengths.run_vnir(
+            s, spacing=0.05, output_name="apparent_radiance"
+        )
+
+        process_res = SixSHelpers.Wavelengths.run_vnir(
+            s, spacing=0.05, output_name="apparent_radiance", executor="process", n=2
+        )
+        np.testing.assert_allclose(process_res, thread_res)
+
+        with ThreadPoolExecutor(2) as ex:
+            given_res = SixSHelpers.Wavelengths.run_vnir(
+                s, spacing=0.05, output_name="apparent_radiance", executor=ex
+            )
+        np.testing.assert_allclose(given_res, thread_res)
+
+    def test_wavelengths_process_outputs(self):
+        s = SixS()
+
+        wvs, objs = SixSHelpers.Wavelengths.run_landsat_etm(s, executor="process", n=2)
+        wvs, values = SixSHelpers.Wavelengths.run_landsat_etm(s, output_name="pixel_radiance")
+
+        self.assertEqual(
+            SixSHelpers.Wavelengths.extract_output(objs, "pixel_radiance"), list(values)
+        )
+
+    def test_wavelengths_batch(self):
+        s = SixS()
+
+        wvs, batch = SixSHelpers.Wavelengths.run_landsat_etm(s, batch=True)
+        wvs, values = SixSHelpers.Wavelengths.run_landsat_etm(s, output_name="pixel_radiance")
+
+        self.assertEqual(len(batch), len(values))
+        np.testing.assert_allclose(batch.pixel_radiance, values)
+
+    def test_principal_plane_batch(self):
+        s = SixS()
+
+        zeniths, batch = SixSHelpers.Angles.run_principal_plane(s, batch=True)
+        zeniths, values = SixSHelpers.Angles.run_principal_plane(s, output_name="pixel_radiance")
+
+        np.testing.assert_allclose(
+            SixSHelpers.Angles.extract_output(batch, "pixel_radiance"), values
+        )
+
+    def test_iter_wavelengths(self):
+        s = SixS()
+        wavelengths = np.arange(0.4, 0.5, 0.01)
+
+        wvs, values = SixSHelpers.Wavelengths.run_wavelengths(
+            s, wavelengths, output_name="pixel_radiance"
+        )
+        results = list(
+            SixSHelpers.Wavelengths.iter_wavelengths(s, wavelengths, output_name="pixel_radiance")
+        )
+
+        np.testing.assert_allclose([wv for wv, _ in results], wvs)
+        np.testing.assert_allclose([value for _, value in results], values)
+
+        unordered = dict(
+            SixSHelpers.Wavelengths.iter_wavelengths(
+                s, wavelengths, output_name="pixel_radiance", ordered=False
+            )
+        )
+        np.testing.assert_allclose([unordered[wv] for wv in wavelengths], values)
+
+    def test_iter_wavelengths_window(self):
+        # Every run fails, as there is no 6S executable, so the errors are returned as the results
+        s = SixS("not_a_6s_executable")
+        taken = []
+
+        def wavelengths():
+            for wv in np.arange(0.4, 0.5, 0.01):
+                taken.append(wv)
+                yield wv
+
+        results = SixSHelpers.Wavelengths.iter_wavelengths(
+            s, wavelengths(), window=3, errors="return"
+        )
+
+        for i, (wv, result) in enumerate(results):
+            self.assertEqual(wv, taken[i])
+            self.assertIsInstance(result, ExecutionError)
+            # Wavelengths are only taken from the iterable when there is room in the window
+            self.assertLessEqual(len(taken), i + 3)
+
+        self.assertEqual(i, 9)
+
+        with self.assertRaises(ExecutionError):
+            list(SixSHelpers.Wavelengths.iter_wavelengths(s, [0.4, 0.5]))
+
+    def test_wavelengths_async(self):
+        s = SixS()
+        wavelengths = np.arange(0.4, 0.5, 0.01)
+
+        wvs, values = SixSHelpers.Wavelengths.run_wavelengths(
+            s, wavelengths, output_name="pixel_radiance"
+        )
+        async_wvs, async_values = asyncio.run(
+            SixSHelpers.Wavelengths.wavelengths_async(
+                s, wavelengths, output_name="pixel_radiance", limit=2
+            )
+        )
+
+        np.testing.assert_allclose(async_wvs, wvs)
+        np.testing.assert_allclose(async_values, values)
+
+    def test_principal_plane_async(self):
+        s = SixS()
+
+        zeniths, values = SixSHelpers.Angles.run_principal_plane(s, output_name="pixel_radiance")
+        async_zeniths, batch = asyncio.run(SixSHelpers.Angles.principal_plane_async(s, batch=True))
+
+        np.testing.assert_allclose(async_zeniths, zeniths)
+        np.testing.assert_allclose(batch.pixel_radiance, values)
+
+    def test_async_errors(self):
+        s = SixS("not_a_6s_executable")
+
+        wvs, results = asyncio.run(
+            SixSHelpers.Wavelengths.wavelengths_async(s, [0.4, 0.5], errors="return")
+        )
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIsInstance(result, ExecutionError)
+
+        with self.assertRaises(ExecutionError):
+            asyncio.run(SixSHelpers.Angles.angles360_async(s, "view", na=2, nz=2))
+
+    def test_invalid_executor(self):
+        s = SixS()
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Wavelengths.run_wavelengths(s, [0.5], executor="gpu")
+
     def test_after_prev_run(self):
         s = SixS()
         s.run()
@@ -131,6 +439,51 @@ class ParallelEquivalenceTests(unittest.TestCase):
 
 
 class AllAnglesTests(unittest.TestCase):
+    def test_adaptive360(self):
+        s = SixS()
+        s.ground_reflectance = GroundReflectance.HomogeneousWalthall(0.48, 0.50, 2.95, 0.6)
+
+        values, azimuths, zeniths, sa, sz = SixSHelpers.Angles.adaptive360(
+            s, "view", "pixel_reflectance", na=19, nz=10, initial_na=5, initial_nz=4
+        )
+        direct = SixSHelpers.Angles.run360(s, "view", na=19, nz=10, output_name="pixel_reflectance")
+
+        self.assertEqual(values.shape, (190,))
+        np.testing.assert_allclose(azimuths, direct[1])
+        np.testing.assert_allclose(zeniths, direct[2])
+        np.testing.assert_allclose(values, direct[0], atol=0.02)
+
+    def test_adaptive_grid(self):
+        na, nz = 73, 90
+        azimuths = np.linspace(0, 360, na)
+        zeniths = np.radians(np.linspace(0, 89, nz))
+
+        def surface(a, z):
+            # A smooth surface with a narrow hotspot at an azimuth of 180 degrees and a zenith of 30 degrees
+            x = z * np.sin(np.radians(a))
+            y = z * np.cos(np.radians(a))
+            return 0.2 + 0.05 * z + 0.2 * np.exp(-(x**2 + (y + np.radians(30)) ** 2) / 0.003)
+
+        sampled = []
+
+        def func(indices):
+            sampled.extend(indices)
+            return [surface(azimuths[i], zeniths[j]) for i, j in indices]
+
+        values, simulated = _adaptive_grid(func, na, nz, 13, 7, None)
+
+        self.assertEqual(values.shape, (na, nz))
+        self.assertEqual(simulated, len(sampled))
+        self.assertEqual(len(set(sampled)), len(sampled))
+        self.assertLess(simulated, na * nz / 5)
+
+        # The hotspot is found and the whole grid is interpolated accurately
+        expected = surface(azimuths[:, np.newaxis], zeniths[np.newaxis, :])
+        self.assertLess(np.abs(values - expected).max(), 0.01)
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Angles.adaptive360(SixS(), "view", "pixel_radiance", initial_na=1)
+
     def test_run360(self):
         s = SixS()
 
@@ -521,8 +874,83 @@ class AERONETImportTest(unittest.TestCase):
                 s, os.path.join(test_dir, "empty_file"), "2008-02-22"
             )
 
+    def test_match_aeronet(self):
+        filename = os.path.join(test_dir, "070101_101231_Marambio.dubovik")
+        times = ["2008-02-22", "14/02/2008 16:00", "2010-01-01"]
+
+        data = SixSHelpers.Aeronet.load_aeronet_data(filename)
+        aot550, aero_profiles = data.match(times)
+
+        np.testing.assert_allclose(aot550, [0.033791, 0.022308, 0.025655])
+        self.assertEqual(len(aero_profiles), 3)
+
+        # The same as setting the parameters for each time separately
+        for time, aot, aero_profile in zip(times, aot550, aero_profiles):
+            s = SixSHelpers.Aeronet.import_aeronet_data(SixS(), filename, time)
+            self.assertEqual(s.aot550, aot)
+            self.assertEqual(s.aero_profile, aero_profile)
+
+        # Times can also be given as a datetime64 array
+        aot550_2, aero_profiles_2 = data.match(
+            np.array(["2008-02-22", "2008-02-14T16:00", "2010-01-01"], dtype="datetime64[s]")
+        )
+        np.testing.assert_array_equal(aot550, aot550_2)
+        self.assertEqual(aero_profiles, aero_profiles_2)
+
+    def test_load_aeronet_refractive_index_wavelengths(self):
+        with open(os.path.join(test_dir, "070101_101231_Marambio.dubovik")) as f:
+            lines = f.read().splitlines()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        # Only one wavelength of refractive indices
+        single = os.path.join(directory, "single.dubovik")
+        with open(single, "w") as f:
+            for line in lines:
+                columns = line.split(",")
+                if len(columns) > 50:
+                    columns = columns[:43] + columns[46:47] + columns[50:]
+                f.write(",".join(columns) + "\n")
+
+        # No 6S wavelengths within the range of the wavelengths of the refractive indices
+        outside = os.path.join(directory, "outside.dubovik")
+        with open(outside, "w") as f:
+            for wv, new_wv in [("440", "4000"), ("673", "4500"), ("870", "5000"), ("1020", "5500")]:
+                lines[3] = lines[3].replace("REFR(%s)" % wv, "REFR(%s)" % new_wv)
+                lines[3] = lines[3].replace("REFI(%s)" % wv, "REFI(%s)" % new_wv)
+            f.write("\n".join(lines) + "\n")
+
+        for filename in [single, outside]:
+            with self.assertRaises(ParameterError):
+                SixSHelpers.Aeronet.load_aeronet_data(filename)
+
+    def test_load_aeronet_cache_dir(self):
+        filename = os.path.join(test_dir, "070101_101231_Marambio.dubovik")
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        aeronet._parsed_files.clear()
+
+        data = SixSHelpers.Aeronet.load_aeronet_data(filename, cache_dir=cache_dir)
+        # Loaded files are kept in memory
+        self.assertIs(SixSHelpers.Aeronet.load_aeronet_data(filename), data)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        aeronet._parsed_files.clear()
+        cached = SixSHelpers.Aeronet.load_aeronet_data(filename, cache_dir=cache_dir)
+
+        self.assertIsNot(cached, data)
+        np.testing.assert_array_equal(cached.model_times, data.model_times)
+        self.assertEqual(cached.match(["2008-02-22"]), data.match(["2008-02-22"]))
+
 
 class RadiosondeImportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
     def test_simple_radiosonde_import(self):
         s = SixS()
         s.altitudes.set_sensor_satellite_level()
@@ -538,3 +966,126 @@ class RadiosondeImportTest(unittest.TestCase):
             pytest.skip()
 
         self.assertAlmostEqual(s.outputs.apparent_radiance, 164.482, delta=0.02)
+
+    def _write_soundings(self, directory):
+        """Writes three soundings in the format of the University of Wyoming website, returning
+        the pressure, altitude, temperature and mixing ratio of each"""
+        soundings = []
+        for i in range(3):
+            altitude = np.arange(0, 30000 + 5000 * i, 500)
+            pressure = np.round(1013 * np.exp(-altitude / 8000.0) - i, 1)
+            temperature = np.round(15 - 0.0065 * np.minimum(altitude, 11000) - i, 1)
+            mixing_ratio = np.round(np.linspace(8, 0.01, len(altitude)) + i, 2)
+
+            lines = [
+                "-" * 77,
+                "   PRES   HGHT   TEMP   DWPT   RELH   MIXR   DRCT   SKNT   THTA   THTE   THTV",
+                "    hPa     m      C      C      %    g/kg    deg   knot     K      K      K ",
+                "-" * 77,
+            ]
+            for p, h, t, m in zip(pressure, altitude, temperature, mixing_ratio):
+                lines.append(
+                    "%7.1f%7d%7.1f%7.1f%7d%7.2f%7d%7d%7.1f%7.1f%7.1f"
+                    % (p, h, t, t - 2, 80, m, 240, 20, 280, 300, 285)
+                )
+            # The last line is normally incomplete, so it is ignored
+            lines.append("%7.1f%7d" % (5.0, 40000))
+
+            with open(os.path.join(directory, "0380%d.html" % i), "w") as f:
+                f.write("<HTML><BODY><H2>03808 Camborne</H2><PRE>\n")
+                f.write("\n".join(lines))
+                f.write("\n</PRE><H3>Station information</H3><PRE>\nStation number: 3808\n</PRE>")
+                f.write("</BODY></HTML>")
+
+            soundings.append((pressure, altitude / 1000.0, temperature, mixing_ratio))
+
+        return soundings
+
+    def test_import_radiosonde_archive(self):
+        directory = os.path.join(self.directory, "soundings")
+        os.mkdir(directory)
+        soundings = self._write_soundings(directory)
+        names = sorted(os.listdir(directory))
+
+        zip_path = os.path.join(self.directory, "soundings.zip")
+        with zipfile.ZipFile(zip_path, "w") as z:
+            for name in names:
+                z.write(os.path.join(directory, name), name)
+
+        tar_path = os.path.join(self.directory, "soundings.tar.gz")
+        with tarfile.open(tar_path, "w:gz") as t:
+            for name in names:
+                t.add(os.path.join(directory, name), name)
+
+        for path in [directory, zip_path, tar_path]:
+            profiles = SixSHelpers.Radiosonde.import_radiosonde_archive(
+                path, AtmosProfile.MidlatitudeWinter, n=2
+            )
+
+            self.assertEqual(profiles.names, names)
+            self.assertEqual(profiles.pressure.shape, (3, 34))
+
+            for i, sounding in enumerate(soundings):
+                expected = SixSHelpers.Radiosonde._import_from_arrays(
+                    *sounding, base_profile=AtmosProfile.MidlatitudeWinter
+                )
+                self.assertEqual(profiles[i], expected)
+                self.assertEqual(profiles[names[i]], expected)
+
+        # The levels above the top of each sounding come from the base profile
+        np.testing.assert_array_equal(
+            profiles.temperature[0, -4:],
+            SixSHelpers.Radiosonde.temp_profiles[AtmosProfile.MidlatitudeWinter - 1][-4:],
+        )
+
+    def test_import_radiosonde_archive_bas(self):
+        directory = self.directory
+        for i in range(2):
+            with open(os.path.join(directory, "sounding%d.txt" % i), "w") as f:
+                f.write("Date Time Pressure Height Temperature RH Dewpoint\n")
+                for h in range(0, 25000, 250):
+                    f.write(
+                        "2012-02-27 12:00 %.1f %d %.1f 80 %.1f\n"
+                        % (1013 * np.exp(-h / 8000.0), h, 15 - h / 2000.0 - i, 10 - h / 1000.0)
+                    )
+
+        profiles = SixSHelpers.Radiosonde.import_radiosonde_archive(
+            directory, [AtmosProfile.SubarcticWinter, AtmosProfile.Tropical], file_format="bas"
+        )
+
+        self.assertEqual(len(profiles), 2)
+        for name, profile, base_profile in zip(
+            profiles.names, profiles, [AtmosProfile.SubarcticWinter, AtmosProfile.Tropical]
+        ):
+            self.assertEqual(
+                profile,
+                SixSHelpers.Radiosonde.import_bas_radiosonde_data(
+                    os.path.join(directory, name), base_profile
+                ),
+            )
+
+    def test_import_radiosonde_archive_invalid(self):
+        directory = self.directory
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Radiosonde.import_radiosonde_archive(
+                directory, AtmosProfile.MidlatitudeWinter
+            )
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Radiosonde.import_radiosonde_archive(
+                os.path.join(directory, "missing.zip"), AtmosProfile.MidlatitudeWinter
+            )
+
+        with open(os.path.join(directory, "sounding.html"), "w") as f:
+            f.write("<HTML>Sorry, the server is too busy to process your request</HTML>")
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Radiosonde.import_radiosonde_archive(
+                directory, AtmosProfile.MidlatitudeWinter
+            )
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Radiosonde.import_radiosonde_archive(
+                directory, AtmosProfile.MidlatitudeWinter, file_format="csv"
+            )
@@ -0,0 +1,354 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import itertools
+import os.path
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from Py6S import (
+    ExecutionError,
+    LookupTable,
+    ParameterError,
+    PredefinedWavelengths,
+    ResultCache,
+    SixS,
+)
+from Py6S.SixSHelpers.lut import _axis_coordinates, _set_parameter
+
+test_dir = os.path.relpath(os.path.dirname(__file__))
+
+with open(os.path.join(test_dir, "example_6s_output.txt"), "rb") as f:
+    example_output = f.read()
+
+
+def cached_sixs(params):
+    """Creates a SixS instance which can only 'run' the combinations of the given parameters,
+    by getting the results from a cache rather than running 6S"""
+    s = SixS()
+    s.sixs_path = "not_a_6s_executable"
+    s.cache = ResultCache()
+
+    names = list(params)
+    for values in itertools.product(*params.values()):
+        a = copy.deepcopy(s)
+        for name, value in zip(names, values):
+            _set_parameter(a, name, value)
+        key = s.cache.key(s.sixs_path, a._create_input_file_contents())
+        s.cache.put(key, example_output)
+
+    return s
+
+
+class FailingSetter(object):
+    """A setter which fails for the given value, to simulate a crash part-way through creating a lookup table"""
+
+    def __init__(self, fail_value, exception=RuntimeError):
+        self.fail_value = fail_value
+        self.exception = exception
+
+    def __call__(self, s, value):
+        if value == self.fail_value:
+            raise self.exception("Failed")
+        s.aot550 = value
+
+
+class LookupTableTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.params = {"geometry.solar_z": [0, 20, 40], "aot550": [0.1, 0.2, 0.4, 0.8]}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_set_parameter(self):
+        s = SixS()
+        _set_parameter(s, "geometry.solar_z", 45)
+        _set_parameter(s, "aot550", 0.3)
+
+        self.assertEqual(s.geometry.solar_z, 45)
+        self.assertEqual(s.aot550, 0.3)
+
+    def test_axis_coordinates(self):
+        np.testing.assert_array_equal(_axis_coordinates([0, 10, 20]), [0.0, 10.0, 20.0])
+        self.assertEqual(
+            list(
+                _axis_coordinates(
+                    [PredefinedWavelengths.LANDSAT_OLI_B1, PredefinedWavelengths.LANDSAT_OLI_B2]
+                )
+            ),
+            ["LANDSAT_OLI_B1", "LANDSAT_OLI_B2"],
+        )
+
+        # The filter functions of the other predefined wavelengths aren't loaded
+        unused = vars(PredefinedWavelengths)["LANDSAT_OLI_B3"]
+        unused.value = None
+        _axis_coordinates([PredefinedWavelengths.LANDSAT_OLI_B1, 0.5])
+        self.assertIsNone(unused.value)
+
+        # Values which are described in the same way can't be told apart
+        with self.assertRaises(ParameterError):
+            _axis_coordinates([(0.4, 0.5), "(0.4, 0.5)"])
+
+    def test_create(self):
+        s = cached_sixs(self.params)
+        lut = LookupTable.create(s, self.params, ["pixel_radiance", "transmittance_water.downward"])
+
+        self.assertEqual(lut.axes, ["geometry.solar_z", "aot550"])
+        self.assertEqual(lut.shape, (3, 4))
+        np.testing.assert_allclose(lut["pixel_radiance"], np.full((3, 4), 85.49))
+        np.testing.assert_allclose(lut["transmittance_water.downward"], np.full((3, 4), 0.98874))
+        self.assertEqual(s.cache.hits, 12)
+
+    def test_create_leaves_sixs_unchanged(self):
+        s = cached_sixs(self.params)
+        s.outputs = example_output
+        geometry = s.geometry
+        solar_z = geometry.solar_z
+
+        # With a setter, the parameters are set on a copy of s rather than on a snapshot of it
+        lut = LookupTable.create(
+            s, self.params, ["pixel_radiance"], setters={"aot550": FailingSetter(None)}
+        )
+
+        np.testing.assert_allclose(lut["pixel_radiance"], np.full((3, 4), 85.49))
+        self.assertEqual(s.cache.hits, 12)
+        self.assertIs(s.outputs, example_output)
+        self.assertIs(s.geometry, geometry)
+        self.assertEqual(geometry.solar_z, solar_z)
+
+    def test_save_load(self):
+        lut = LookupTable(
+            [("geometry.solar_z", [0, 20]), ("wavelength", ["LANDSAT_OLI_B1", "LANDSAT_OLI_B2"])],
+            {"pixel_radiance": np.arange(4.0).reshape(2, 2)},
+        )
+        filename = os.path.join(self.directory, "lut.npz")
+        lut.save(filename)
+
+        loaded = LookupTable.load(filename)
+        self.assertEqual(loaded.axes, lut.axes)
+        np.testing.assert_array_equal(loaded.coords["wavelength"], lut.coords["wavelength"])
+        np.testing.assert_array_equal(loaded["pixel_radiance"], lut["pixel_radiance"])
+
+    def test_invalid_shape(self):
+        with self.assertRaises(ParameterError):
+            LookupTable([("aot550", [0.1, 0.2])], {"pixel_radiance": np.zeros(3)})
+
+    def test_resume(self):
+        s = cached_sixs(self.params)
+        checkpoint = os.path.join(self.directory, "checkpoint")
+
+        # The first run fails part-way through, after the first block has been completed
+        with self.assertRaises(RuntimeError):
+            LookupTable.create(
+                s,
+                self.params,
+                ["pixel_radiance"],
+                setters={"aot550": FailingSetter(0.4)},
+                checkpoint=checkpoint,
+                n=1,
+                block_size=2,
+            )
+        hits = s.cache.hits
+
+        lut = LookupTable.create(
+            s,
+            self.params,
+            ["pixel_radiance"],
+            setters={"aot550": FailingSetter(None)},
+            checkpoint=checkpoint,
+            block_size=2,
+        )
+
+        # Only the runs which weren't in the completed first block are run again
+        self.assertEqual(s.cache.hits - hits, 10)
+        np.testing.assert_allclose(lut["pixel_radiance"], np.full((3, 4), 85.49))
+
+    def test_errors_return(self):
+        s = cached_sixs(self.params)
+        checkpoint = os.path.join(self.directory, "checkpoint")
+
+        lut = LookupTable.create(
+            s,
+            self.params,
+            ["pixel_radiance"],
+            setters={"aot550": FailingSetter(0.4, ExecutionError)},
+            checkpoint=checkpoint,
+            errors="return",
+        )
+
+        expected = np.full((3, 4), 85.49)
+        expected[:, 2] = np.nan
+        np.testing.assert_allclose(lut["pixel_radiance"], expected)
+
+        # The failed runs aren't marked as done, so they are run again when resumed
+        hits = s.cache.hits
+        lut = LookupTable.create(
+            s,
+            self.params,
+            ["pixel_radiance"],
+            setters={"aot550": FailingSetter(None, ExecutionError)},
+            checkpoint=checkpoint,
+        )
+        self.assertEqual(s.cache.hits - hits, 3)
+        np.testing.assert_allclose(lut["pixel_radiance"], np.full((3, 4), 85.49))
+
+    def test_checkpoint_for_different_table(self):
+        s = cached_sixs(self.params)
+        checkpoint = os.path.join(self.directory, "checkpoint")
+        LookupTable.create(s, self.params, ["pixel_radiance"], checkpoint=checkpoint)
+
+        with self.assertRaises(ParameterError):
+            LookupTable.create(s, self.params, ["pixel_reflectance"], checkpoint=checkpoint)
+
+        # The same table, but with the parameters set differently
+        with self.assertRaises(ParameterError):
+            LookupTable.create(
+                s,
+                self.params,
+                ["pixel_radiance"],
+                setters={"aot550": FailingSetter(None)},
+                checkpoint=checkpoint,
+            )
+
+
+class LookupTableInterpolationTests(unittest.TestCase):
+    def setUp(self):
+        # A linear function of each numerical axis is interpolated exactly, so the results can be checked
+        self.aot = np.array([0.1, 0.2, 0.4, 0.8])
+        self.solar_z = np.array([60.0, 40.0, 20.0, 0.0])
+        self.bands = np.array(["LANDSAT_OLI_B1", "LANDSAT_OLI_B2"])
+        aot, solar_z, band = np.meshgrid(self.aot, self.solar_z, [0, 1], indexing="ij")
+
+        self.lut = LookupTable(
+            [("aot550", self.aot), ("geometry.solar_z", self.solar_z), ("wavelength", self.bands)],
+            {
+                "coef_xa": self.xa(aot, solar_z, band),
+                "coef_xb": 0.1 + 0.01 * band,
+                "coef_xc": 0.2 - aot * 0.1,
+            },
+        )
+
+    def xa(self, aot, solar_z, band):
+        return 0.003 + 0.001 * aot + 0.00001 * solar_z + 0.0005 * band
+
+    def test_interpolate(self):
+        aot = np.array([[0.15, 0.8], [0.1, 0.5]])
+        solar_z = np.array([[5.0, 60.0], [33.3, 0.0]])
+        band = np.array([[0, 1], [1, 0]])
+
+        res = self.lut.interpolate(
+            {"aot550": aot, "geometry.solar_z": solar_z, "wavelength": band}, ["coef_xa"]
+        )
+        np.testing.assert_allclose(res["coef_xa"], self.xa(aot, solar_z, band))
+
+        # Bands can also be given by name
+        res = self.lut.interpolate(
+            {"aot550": aot, "geometry.solar_z": solar_z, "wavelength": self.bands[band]},
+            ["coef_xa"],
+        )
+        np.testing.assert_allclose(res["coef_xa"], self.xa(aot, solar_z, band))
+
+    def test_single_values(self):
+        solar_z = np.linspace(0, 60, 7)
+        params = {"aot550": 0.3, "geometry.solar_z": solar_z, "wavelength": "LANDSAT_OLI_B2"}
+
+        res = self.lut.interpolate(params)
+        expected = self.lut.interpolate(
+            {
+                "aot550": np.full(7, 0.3),
+                "geometry.solar_z": solar_z,
+                "wavelength": np.full(7, "LANDSAT_OLI_B2"),
+            }
+        )
+
+        self.assertEqual(sorted(res), ["coef_xa", "coef_xb", "coef_xc"])
+        for name in res:
+            np.testing.assert_allclose(res[name], expected[name])
+        np.testing.assert_allclose(res["coef_xa"], self.xa(0.3, solar_z, 1))
+
+    def test_chunks(self):
+        rng = np.random.default_rng(0)
+        params = {
+            "aot550": rng.uniform(0.1, 0.8, 1000),
+            "geometry.solar_z": rng.uniform(0, 60, 1000),
+            "wavelength": rng.integers(0, 2, 1000),
+        }
+
+        whole = self.lut.interpolate(params, chunk_size=None)
+        chunked = self.lut.interpolate(params, chunk_size=64)
+        for name in whole:
+            np.testing.assert_array_equal(whole[name], chunked[name])
+
+    def test_out(self):
+        out = {
+            "coef_xa": np.lib.format.open_memmap(
+                os.path.join(tempfile.mkdtemp(), "xa.npy"), mode="w+", dtype=np.float64, shape=(5,)
+            )
+        }
+        params = {"aot550": np.linspace(0.1, 0.8, 5), "geometry.solar_z": 10, "wavelength": 0}
+
+        res = self.lut.interpolate(params, ["coef_xa"], chunk_size=2, out=out)
+
+        self.assertIs(res["coef_xa"], out["coef_xa"])
+        np.testing.assert_allclose(out["coef_xa"], self.xa(params["aot550"], 10, 0))
+        shutil.rmtree(os.path.dirname(out["coef_xa"].filename))
+
+    def test_bounds(self):
+        params = {"aot550": np.array([0.2, 0.9]), "geometry.solar_z": 10, "wavelength": 0}
+
+        with self.assertRaises(ParameterError):
+            self.lut.interpolate(params)
+        with self.assertRaises(ParameterError):
+            self.lut.interpolate(dict(params, wavelength="LANDSAT_OLI_B3"))
+        with self.assertRaises(ParameterError):
+            self.lut.interpolate(dict(params, wavelength=2))
+
+        res = self.lut.interpolate(params, ["coef_xa"], bounds_error=False)
+        np.testing.assert_allclose(res["coef_xa"], [self.xa(0.2, 10, 0), np.nan])
+
+    def test_invalid_params(self):
+        with self.assertRaises(ParameterError):
+            self.lut.interpolate({"aot550": 0.2, "wavelength": 0})
+        with self.assertRaises(ParameterError):
+            self.lut.interpolate(
+                {"aot550": 0.2, "geometry.solar_z": 10, "wavelength": 0, "water": 1}
+            )
+        with self.assertRaises(ParameterError):
+            self.lut.interpolate(
+                {"aot550": 0.2, "geometry.solar_z": 10, "wavelength": 0}, ["pixel_radiance"]
+            )
+
+    def test_atmospheric_correction(self):
+        radiance = np.array([40.0, 80.0])
+        aot = np.array([0.1, 0.6])
+        params = {"aot550": aot, "geometry.solar_z": 30, "wavelength": 1}
+
+        res = self.lut.atmospheric_correction(radiance, params)
+
+        xa = self.xa(aot, 30, 1)
+        y = xa * radiance - 0.11
+        np.testing.assert_allclose(res["coef_xa"], xa)
+        np.testing.assert_allclose(res["corrected_reflectance"], y / (1 + (0.2 - aot * 0.1) * y))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import os.path
+import pickle
+import unittest
+
+import numpy as np
+
+from Py6S import Outputs, OutputsBatch, OutputParsingError, SixSHelpers
+
+test_dir = os.path.relpath(os.path.dirname(__file__))
+
+with open(os.path.join(test_dir, "example_6s_output.txt"), "rb") as f:
+    example_output = f.read()
+
+
+class OutputsParsingTests(unittest.TestCase):
+    def test_values(self):
+        o = Outputs(example_output, b"")
+
+        self.assertEqual(o.version, "1.1")
+        self.assertEqual(o.month, 7)
+        self.assertEqual(o.day, 14)
+        self.assertEqual(o.solar_z, 32)
+        self.assertAlmostEqual(o.pixel_radiance, 85.49)
+        self.assertAlmostEqual(o.apparent_reflectance, 0.2864083)
+        self.assertAlmostEqual(o.visibility, 8.49)
+        self.assertAlmostEqual(o.aot550, 0.5)
+        self.assertAlmostEqual(o.direction_of_plane_of_polarization, 0.0)
+        self.assertEqual(len(o.values), 36)
+
+    def test_grids(self):
+        o = Outputs(example_output, b"")
+
+        self.assertAlmostEqual(o.transmittance_water.downward, 0.98874)
+        self.assertAlmostEqual(o.spherical_albedo.total, 0.11741)
+        self.assertEqual(len(o.trans), 11)
+        self.assertEqual(len(o.rat), 13)
+
+    def test_labels_case_insensitive(self):
+        o = Outputs(example_output, b"")
+        upper = Outputs(example_output.upper(), b"")
+
+        self.assertEqual(o.values.keys(), upper.values.keys())
+        self.assertAlmostEqual(o.pixel_radiance, upper.pixel_radiance)
+
+    def test_short_output(self):
+        with self.assertRaises(OutputParsingError):
+            Outputs(b"\n".join(example_output.splitlines()[:5]), b"")
+
+
+class OutputsLazyParsingTests(unittest.TestCase):
+    def test_sections_parsed_when_used(self):
+        o = Outputs(example_output, b"")
+        self.assertEqual(o._sections, {})
+
+        self.assertAlmostEqual(o.pixel_radiance, 85.49)
+        self.assertEqual(sorted(o._sections), ["values"])
+
+        self.assertAlmostEqual(o.transmittance_water.downward, 0.98874)
+        self.assertEqual(sorted(o._sections), ["trans", "values"])
+
+    def test_grid_parsed_alone(self):
+        o = Outputs(example_output, b"")
+
+        self.assertAlmostEqual(o.spherical_albedo.total, 0.11741)
+        self.assertEqual(sorted(o._sections), ["rat"])
+
+    def test_get_version(self):
+        o = Outputs(example_output, b"")
+
+        self.assertEqual(o._get_version(), "1.1")
+        self.assertEqual(o._sections, {})
+
+    def test_extract_results(self):
+        lazy = Outputs(example_output, b"")
+        eager = Outputs(example_output, b"")
+        eager.extract_results()
+
+        self.assertEqual(sorted(eager._sections), ["rat", "trans", "values"])
+        self.assertEqual(lazy.values, eager.values)
+        self.assertEqual(sorted(lazy.trans), sorted(eager.trans))
+        self.assertEqual(sorted(lazy.rat), sorted(eager.rat))
+        self.assertEqual(dir(lazy), dir(eager))
+
+    def test_pickle(self):
+        o = Outputs(example_output, b"")
+        o.pixel_radiance
+
+        unpickled = pickle.loads(pickle.dumps(o))
+        self.assertAlmostEqual(unpickled.pixel_radiance, 85.49)
+        self.assertAlmostEqual(unpickled.transmittance_water.downward, 0.98874)
+
+    def test_unpickle_parsed_dictionaries(self):
+        # Instances pickled by earlier versions store the parsed dictionaries directly
+        o = Outputs.__new__(Outputs)
+        o.__setstate__({"fulltext": "", "values": {"pixel_radiance": 1.0}, "trans": {}, "rat": {}})
+
+        self.assertEqual(o.pixel_radiance, 1.0)
+        self.assertEqual(o.trans, {})
+
+
+class OutputsBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.outputs = [Outputs(example_output, b"") for i in range(3)]
+        # Make the second run different, and missing one of the outputs
+        self.outputs[1].values = dict(self.outputs[1].values, pixel_radiance=1.5)
+        del self.outputs[1].values["aot550"]
+
+        self.batch = OutputsBatch(self.outputs)
+
+    def test_columns(self):
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch["pixel_radiance"].dtype, np.float64)
+        np.testing.assert_allclose(self.batch["pixel_radiance"], [85.49, 1.5, 85.49])
+        np.testing.assert_allclose(self.batch["aot550"], [0.5, np.nan, 0.5])
+        np.testing.assert_allclose(self.batch["transmittance_water.downward"], [0.98874] * 3)
+        np.testing.assert_allclose(self.batch["spherical_albedo.total"], [0.11741] * 3)
+        self.assertNotIn("version", self.batch)
+
+    def test_attributes(self):
+        np.testing.assert_allclose(self.batch.pixel_radiance, [85.49, 1.5, 85.49])
+        np.testing.assert_allclose(self.batch.transmittance_water.downward, [0.98874] * 3)
+        np.testing.assert_allclose(self.batch.spherical_albedo.total, [0.11741] * 3)
+        self.assertIn("transmittance_water", dir(self.batch))
+
+        with self.assertRaises(OutputParsingError):
+            self.batch.not_an_output
+
+    def test_extract_output(self):
+        for cls in (SixSHelpers.Wavelengths, SixSHelpers.Angles):
+            np.testing.assert_allclose(
+                cls.extract_output(self.batch, "pixel_radiance"),
+                cls.extract_output(self.outputs, "pixel_radiance"),
+            )
+
+        np.testing.assert_allclose(
+            SixSHelpers.Wavelengths.extract_output(self.batch, "transmittance_water.downward"),
+            SixSHelpers.Wavelengths.extract_output(self.outputs, "transmittance_water.downward"),
+        )
+
+    def test_pickle(self):
+        unpickled = pickle.loads(pickle.dumps(self.batch))
+        np.testing.assert_allclose(unpickled.pixel_radiance, self.batch.pixel_radiance)
+
+
+if __name__ == "__main__":
+    unittest.main()
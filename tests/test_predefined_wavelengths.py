@@ -15,8 +15,11 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle
 import unittest
 
+import numpy as np
+
 from Py6S import PredefinedWavelengths, SixS, Wavelength
 
 
@@ -30,3 +33,26 @@ class PredefinedWavelengthTests(unittest.TestCase):
                 print(wavelength)
                 s.wavelength = Wavelength(wv)
                 s.run()
+
+    def test_filter_functions(self):
+        for name in dir(PredefinedWavelengths):
+            wv = getattr(PredefinedWavelengths, name)
+            if type(wv) is tuple and len(wv) == 4:
+                n_values = round((wv[2] - wv[1]) / 0.0025) + 1
+                self.assertEqual(wv[3].shape, (n_values,), name)
+                self.assertEqual(wv[3].dtype, np.float64, name)
+
+    def test_predefined_wavelength_values(self):
+        wv = PredefinedWavelengths.LANDSAT_OLI_B1
+        self.assertEqual(wv[:3], (1, 0.427, 0.457))
+        self.assertAlmostEqual(wv[3][0], 7.3e-05)
+        self.assertAlmostEqual(wv[3][-1], 2.414e-03)
+
+        self.assertIs(PredefinedWavelengths.LANDSAT_OLI_B1, wv)
+        self.assertIs(PredefinedWavelengths.LANDSAT_OLI_PAN, PredefinedWavelengths.LANDSAT_OLI_B8)
+        self.assertEqual(PredefinedWavelengths.METEOSAT_VISIBLE, (-2, 0.35, 1.11))
+
+        unpickled = pickle.loads(pickle.dumps(wv))
+        np.testing.assert_array_equal(unpickled[3], wv[3])
+        self.assertEqual(Wavelength(unpickled), Wavelength(wv))
+
@@ -18,6 +18,9 @@
 import os.path
 import unittest
 
+import numpy as np
+import pytest
+
 from Py6S import AeroProfile, AtmosProfile, ParameterError, SixS
 
 
@@ -48,6 +51,51 @@ class AtmosProfileTests(unittest.TestCase):
 
         assert ap == AtmosProfile.PredefinedType(AtmosProfile.SubarcticSummer)
 
+    def test_from_lats_and_dates(self):
+        lats = np.array([53, 12, -71, 44.9, -34, 88])
+        dates = ["14/07/2015", "14/07/2015", "01/01/2015", "05/05/2015", "20/09/2015", "20/12/2015"]
+
+        types = AtmosProfile.FromLatitudesAndDates(lats, dates)
+
+        np.testing.assert_array_equal(
+            types,
+            [
+                AtmosProfile.SubarcticSummer,
+                AtmosProfile.Tropical,
+                AtmosProfile.MidlatitudeWinter,
+                AtmosProfile.SubarcticSummer,
+                AtmosProfile.MidlatitudeSummer,
+                AtmosProfile.SubarcticWinter,
+            ],
+        )
+
+        for lat, date, t in zip(lats, dates, types):
+            self.assertEqual(
+                AtmosProfile.FromLatitudeAndDate(lat, date), AtmosProfile.PredefinedType(t)
+            )
+
+    def test_from_lats_and_dates_broadcast(self):
+        lats = np.array([[80, 50], [-50, -80]])
+
+        types = AtmosProfile.FromLatitudesAndDates(lats, "14/07/2015")
+        self.assertEqual(types.shape, (2, 2))
+
+        months = np.arange("2015-01", "2016-01", dtype="datetime64[M]")
+        types = AtmosProfile.FromLatitudesAndDates(-80, months)
+        np.testing.assert_array_equal(
+            types,
+            [AtmosProfile.MidlatitudeWinter] * 6
+            + [AtmosProfile.SubarcticWinter] * 2
+            + [AtmosProfile.MidlatitudeWinter] * 4,
+        )
+
+    def test_from_lats_and_dates_invalid(self):
+        with pytest.raises(ParameterError):
+            AtmosProfile.FromLatitudesAndDates([50, 95], "14/07/2015")
+
+        with pytest.raises(ParameterError):
+            AtmosProfile.FromLatitudesAndDates([50], ["not a date"])
+
 
 class AeroProfileTests(unittest.TestCase):
     def test_aero_profile(self):
@@ -0,0 +1,152 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import os.path
+import unittest
+
+import numpy as np
+
+from Py6S import (
+    AtmosCorr,
+    GroundReflectance,
+    ParameterError,
+    ParameterSnapshot,
+    PredefinedWavelengths,
+    ResultCache,
+    SixS,
+    Wavelength,
+)
+
+test_dir = os.path.relpath(os.path.dirname(__file__))
+
+with open(os.path.join(test_dir, "example_6s_output.txt"), "rb") as f:
+    example_output = f.read()
+
+
+class ParameterSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        spectrum = np.column_stack([np.linspace(0.3, 2.5, 100), np.linspace(0.1, 0.5, 100)])
+
+        self.instances = [SixS() for _ in range(4)]
+        self.instances[1].ground_reflectance = GroundReflectance.HomogeneousLambertian(spectrum)
+        self.instances[2].ground_reflectance = GroundReflectance.HeterogeneousLambertian(
+            0.3, spectrum, GroundReflectance.GreenVegetation
+        )
+        self.instances[3].ground_reflectance = GroundReflectance.HomogeneousWalthall(
+            0.48, 0.50, 2.95, 0.6
+        )
+        self.instances[3].atmos_corr = AtmosCorr.AtmosCorrLambertianFromReflectance(0.2)
+
+    def test_wavelength(self):
+        for s in self.instances:
+            snapshot = ParameterSnapshot(s)
+            self.assertEqual(snapshot.input_file(), s._create_input_file_contents())
+
+            for wv in [
+                Wavelength(0.45),
+                Wavelength(0.5, 0.6),
+                Wavelength(PredefinedWavelengths.LANDSAT_OLI_B2),
+            ]:
+                a = copy.deepcopy(s)
+                a.wavelength = wv
+
+                self.assertEqual(
+                    snapshot.input_file(wavelength=a.wavelength), a._create_input_file_contents()
+                )
+
+    def test_angles(self):
+        for s in self.instances:
+            snapshot = ParameterSnapshot(s)
+
+            a = copy.deepcopy(s)
+            a.geometry.view_a = 120
+            a.geometry.view_z = 45
+            geometry = snapshot.geometry_with_angles("view", 120, 45)
+            self.assertEqual(
+                snapshot.input_file(geometry=geometry), a._create_input_file_contents()
+            )
+
+            a = copy.deepcopy(s)
+            a.geometry.solar_a = 10
+            a.geometry.solar_z = 60
+            geometry = snapshot.geometry_with_angles("solar", 10, 60)
+            self.assertEqual(
+                snapshot.input_file(geometry=geometry), a._create_input_file_contents()
+            )
+
+        # The geometry of the SixS instance is not changed
+        self.assertEqual(s.geometry.solar_z, 32)
+        self.assertEqual(s.geometry.view_z, 23)
+
+    def test_aot(self):
+        for s in self.instances:
+            snapshot = ParameterSnapshot(s)
+
+            a = copy.deepcopy(s)
+            a.aot550 = 0.25
+            self.assertEqual(snapshot.input_file(aot550=0.25), a._create_input_file_contents())
+
+            a.aot550 = None
+            a.visibility = 40
+            self.assertEqual(snapshot.input_file(visibility=40), a._create_input_file_contents())
+
+            a.visibility = None
+            a.aot550 = 1.5
+            a.wavelength = Wavelength(0.8)
+            a.geometry.view_z = 60
+            self.assertEqual(
+                snapshot.input_file(
+                    wavelength=Wavelength(0.8),
+                    geometry=snapshot.geometry_with_angles("view", a.geometry.view_a, 60),
+                    aot550=1.5,
+                ),
+                a._create_input_file_contents(),
+            )
+
+        with self.assertRaises(ParameterError):
+            snapshot.input_file(aot550=0.1, visibility=40)
+
+    def test_snapshot_unchanged(self):
+        s = SixS()
+        snapshot = ParameterSnapshot(s)
+        input_file = snapshot.input_file()
+
+        s.aot550 = 0.1
+        s.geometry.solar_z = 10
+
+        self.assertEqual(snapshot.input_file(), input_file)
+
+    def test_run(self):
+        s = SixS()
+        s.sixs_path = "not_a_6s_executable"
+        s.cache = ResultCache()
+        s.outputs = "previous outputs"
+
+        snapshot = ParameterSnapshot(s)
+        input_file = snapshot.input_file(wavelength=Wavelength(0.7))
+        s.cache.put(s.cache.key(s.sixs_path, input_file), example_output)
+
+        outputs = snapshot.run(wavelength=Wavelength(0.7))
+
+        self.assertAlmostEqual(outputs.apparent_radiance, 85.490)
+        # Running the snapshot doesn't change the outputs of the SixS instance
+        self.assertEqual(s.outputs, "previous outputs")
+
+
+if __name__ == "__main__":
+    unittest.main()
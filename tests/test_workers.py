@@ -0,0 +1,242 @@
+# This file is part of Py6S.
+#
+# Copyright 2012 Robin Wilson and contributors listed in the CONTRIBUTORS file.
+#
+# Py6S is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Py6S is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Py6S.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import os
+import os.path
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from Py6S import (
+    ExecutionCancelledError,
+    ExecutionError,
+    ExecutionTimeoutError,
+    ParameterError,
+    SixS,
+    SixSHelpers,
+    Wavelength,
+    WorkerPool,
+)
+
+test_dir = os.path.abspath(os.path.dirname(__file__))
+
+# A stand-in for the 6S executable, which reads an input file and prints the example output,
+# after sleeping if the input file contains the given string
+FAKE_SIXS = """#!%s
+import os, sys, time
+if %r in sys.stdin.read():
+    time.sleep(%f)
+sys.stdout.write(open(%r).read())
+sys.stdout.write("cwd " + os.getcwd() + "\\n")
+"""
+
+
+def fake_sixs(directory, delay=0, slow=""):
+    path = os.path.join(directory, "sixs_%d_%s" % (delay * 1000, slow))
+    with open(path, "w") as f:
+        f.write(
+            FAKE_SIXS
+            % (sys.executable, slow, delay, os.path.join(test_dir, "example_6s_output.txt"))
+        )
+    os.chmod(path, 0o755)
+
+    return SixS(path)
+
+
+@unittest.skipUnless(os.name == "posix", "The stand-in 6S executable is a script")
+class WorkerPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def fake_sixs(self, delay=0):
+        return fake_sixs(self.directory, delay)
+
+    def test_run_wavelengths(self):
+        s = self.fake_sixs()
+
+        with WorkerPool(2) as pool:
+            wvs, results = SixSHelpers.Wavelengths.run_wavelengths(
+                s, [0.4, 0.5, 0.6], output_name="apparent_radiance", executor=pool
+            )
+            data = SixSHelpers.Angles.run360(
+                s, "view", na=3, nz=2, output_name="apparent_radiance", executor=pool
+            )
+
+            directories = [worker.directory for worker in pool._workers]
+
+        np.testing.assert_allclose(results, 85.490)
+        np.testing.assert_allclose(data[0], 85.490)
+
+        # Each worker runs 6S in its own scratch directory, which is removed when the pool is shut down
+        self.assertTrue(1 <= len(directories) <= 2)
+        for directory in directories:
+            self.assertFalse(os.path.exists(directory))
+
+    def test_scratch_directory(self):
+        s = self.fake_sixs()
+
+        with WorkerPool(1) as pool:
+            pool.submit(s.run).result()
+            (worker,) = pool._workers
+
+            self.assertIn(
+                "cwd " + os.path.realpath(worker.directory), s.outputs.fulltext.replace("\n", " ")
+            )
+
+    def test_restart_after_crash(self):
+        s = self.fake_sixs()
+
+        with WorkerPool(1) as pool:
+            pool.submit(s.run).result()
+            (worker,) = pool._workers
+            os.kill(worker.process.pid, signal.SIGKILL)
+            worker.process.wait()
+
+            pool.submit(s.run).result()
+
+            self.assertEqual(pool.restarts, 1)
+            self.assertAlmostEqual(s.outputs.apparent_radiance, 85.490)
+
+    def test_timeout(self):
+        s = self.fake_sixs(delay=10)
+
+        with WorkerPool(1, timeout=0.5) as pool:
+            with self.assertRaises(ExecutionError):
+                pool.submit(s.run).result()
+
+            self.assertEqual(pool.restarts, 1)
+
+    def test_missing_executable(self):
+        s = SixS(os.path.join(self.directory, "not_a_6s_executable"))
+
+        with WorkerPool(1) as pool:
+            with self.assertRaises(ExecutionError):
+                pool.submit(s.run).result()
+
+
+@unittest.skipUnless(os.name == "posix", "The stand-in 6S executable is a script")
+class TimeoutTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        # Runs for a wavelength of 0.41um take a long time
+        self.s = fake_sixs(self.directory, delay=10, slow="0.410000")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_run_timeout(self):
+        self.s.wavelength = Wavelength(0.41)
+
+        start = time.time()
+        with self.assertRaises(ExecutionTimeoutError) as cm:
+            self.s.run(timeout=0.5)
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(cm.exception.timeout, 0.5)
+
+        self.s.timeout = 0.5
+        with self.assertRaises(ExecutionTimeoutError):
+            self.s.run()
+
+        self.s.wavelength = Wavelength(0.42)
+        self.s.run()
+        self.assertAlmostEqual(self.s.outputs.apparent_radiance, 85.490)
+
+    def test_missing_executable(self):
+        s = SixS(os.path.join(self.directory, "not_a_6s_executable"))
+
+        with self.assertRaises(ExecutionError):
+            s.run()
+
+        with self.assertRaises(ExecutionError):
+            asyncio.run(s.run_async())
+
+    def test_run_async(self):
+        self.s.wavelength = Wavelength(0.42)
+        asyncio.run(self.s.run_async())
+        self.assertAlmostEqual(self.s.outputs.apparent_radiance, 85.490)
+
+        self.s.wavelength = Wavelength(0.41)
+        start = time.time()
+        with self.assertRaises(ExecutionTimeoutError):
+            asyncio.run(self.s.run_async(timeout=0.5))
+        self.assertLess(time.time() - start, 5)
+
+    def test_cancel_async(self):
+        self.s.wavelength = Wavelength(0.41)
+
+        async def cancel():
+            task = asyncio.ensure_future(self.s.run_async())
+            await asyncio.sleep(0.5)
+            task.cancel()
+            await task
+
+        start = time.time()
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(cancel())
+        self.assertLess(time.time() - start, 5)
+
+    def test_batch_timeout(self):
+        for executor in ["thread", WorkerPool(2)]:
+            start = time.time()
+            with self.assertRaises(ExecutionTimeoutError):
+                SixSHelpers.Wavelengths.run_wavelengths(
+                    self.s, [0.40, 0.41, 0.42], n=2, executor=executor, timeout=0.5
+                )
+            # The run which is still going is killed, rather than left to finish
+            self.assertLess(time.time() - start, 5)
+
+            if executor != "thread":
+                executor.shutdown()
+
+    def test_return_errors(self):
+        wvs, results = SixSHelpers.Wavelengths.run_wavelengths(
+            self.s, [0.40, 0.41], output_name="apparent_radiance", timeout=1, errors="return"
+        )
+
+        self.assertAlmostEqual(results[0], 85.490)
+        self.assertIsInstance(results[1], ExecutionCancelledError)
+
+        self.s.timeout = 0.5
+        wvs, results = SixSHelpers.Wavelengths.run_wavelengths(
+            self.s, [0.41, 0.40], batch=True, errors="return"
+        )
+
+        np.testing.assert_allclose(results.apparent_radiance, [np.nan, 85.490])
+        self.assertEqual(list(results.errors), [0])
+        self.assertIsInstance(results.errors[0], ExecutionTimeoutError)
+
+    def test_first_error_raised(self):
+        self.s.timeout = 0.5
+
+        with self.assertRaises(ExecutionTimeoutError):
+            SixSHelpers.Wavelengths.run_wavelengths(self.s, [0.40, 0.41, 0.42, 0.43], n=2)
+
+        with self.assertRaises(ParameterError):
+            SixSHelpers.Wavelengths.run_wavelengths(self.s, [0.40], errors="ignore")
+
+
+if __name__ == "__main__":
+    unittest.main()